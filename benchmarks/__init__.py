@@ -0,0 +1,5 @@
+"""Offline micro-benchmarks for camctl's parsing, serialization, concurrency and display paths.
+
+Run `python -m benchmarks` from the repository root (with `src` importable);
+see `python -m benchmarks --help` for filtering, saving and comparing runs.
+"""
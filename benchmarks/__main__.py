@@ -0,0 +1,106 @@
+"""Command line for the benchmark suite: `python -m benchmarks`."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from benchmarks.runner import (
+    RunOptions,
+    SuiteResult,
+    compare,
+    print_comparison,
+    print_results,
+    regressions,
+    run_benchmark,
+    select,
+)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def load_modules() -> None:
+    """Import every `bench_*` module so its benchmarks register themselves."""
+    package = Path(__file__).resolve().parent
+    for module in pkgutil.iter_modules([str(package)]):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run camctl micro-benchmarks and store the results as JSON.",
+    )
+    parser.add_argument(
+        "-k", dest="patterns", action="append", help="Only run benchmarks whose name contains this."
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit.")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds per timed repeat (default: 0.2)."
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats (default: 5).")
+    parser.add_argument(
+        "--quick", action="store_true", help="One short repeat each, to check the suite runs."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Results file (default: benchmarks/results/<commit>.json).",
+    )
+    parser.add_argument("--no-save", action="store_true", help="Do not write a results file.")
+    parser.add_argument("--compare", type=Path, help="Baseline results file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="With --compare, exit 1 if a benchmark is slower than this ratio (default: 1.2).",
+    )
+    args = parser.parse_args(argv)
+
+    load_modules()
+    selected = select(args.patterns)
+    if args.list:
+        for bench in selected:
+            print(f"{bench.name:45} {bench.description}")
+        return 0
+    if not selected:
+        print("No benchmarks match.", file=sys.stderr)
+        return 2
+
+    options = (
+        RunOptions(min_time=0.0, repeats=1, max_loops=1)
+        if args.quick
+        else RunOptions(min_time=args.min_time, repeats=args.repeats)
+    )
+    results = []
+    for bench in selected:
+        print(f"running {bench.name} ...", file=sys.stderr, flush=True)
+        results.append(run_benchmark(bench, options))
+    suite = SuiteResult(results=results)
+    print_results(results)
+
+    if not args.no_save:
+        output = args.output or RESULTS_DIR / f"{suite.git_commit or 'working-tree'}.json"
+        suite.save(output)
+        print(f"\nSaved results to {output}", file=sys.stderr)
+
+    if args.compare:
+        comparisons = compare(SuiteResult.load(args.compare), suite)
+        print()
+        print_comparison(comparisons)
+        slower = regressions(comparisons, args.threshold)
+        if slower:
+            names = ", ".join(item.name for item in slower)
+            print(f"\nSlower than {args.threshold:.2f}x baseline: {names}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Client round trips against the in-process fake engine (no network)."""
+
+from __future__ import annotations
+
+from benchmarks.runner import benchmark
+from camctl.api.camunda.resources.tasks import TaskListParams
+from camctl.testing import FakeEngine
+
+PAGE_ITEMS = 200
+
+
+@benchmark("client.tasks_list_page", items=PAGE_ITEMS)
+def tasks_list_page():
+    """TasksAPI.list of one page: request building, routing, JSON and parsing."""
+    engine = FakeEngine.with_dataset(processes=PAGE_ITEMS).engine()
+    params = TaskListParams(first_result=0, max_results=PAGE_ITEMS)
+    return lambda: engine.tasks.list(params=params)
+
+
+@benchmark("client.tasks_count")
+def tasks_count():
+    """TasksAPI.count, the smallest request, so the time is per-request overhead."""
+    engine = FakeEngine.with_dataset(processes=PAGE_ITEMS).engine()
+    return lambda: engine.tasks.count()
+
+
+@benchmark("client.bulk_variables", items=PAGE_ITEMS)
+def bulk_variables():
+    """ProcessesAPI.bulk_variables for a page of instances via variable-instance queries."""
+    fake = FakeEngine.with_dataset(processes=PAGE_ITEMS)
+    engine = fake.engine()
+    process_ids = fake.process_ids
+    return lambda: engine.processes.bulk_variables(process_ids)
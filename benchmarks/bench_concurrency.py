@@ -0,0 +1,33 @@
+"""Per-item overhead of the thread pool helpers."""
+
+from __future__ import annotations
+
+from benchmarks.runner import benchmark
+from camctl.utils import gather, gather_iter
+
+ITEMS = 2_000
+
+
+def _identity(value: int) -> int:
+    return value
+
+
+@benchmark("concurrency.gather_noop", items=ITEMS)
+def gather_noop():
+    """gather() of a no-op function, so the time is pure scheduling overhead."""
+    items = range(ITEMS)
+    return lambda: gather(_identity, items, max_workers=8)
+
+
+@benchmark("concurrency.gather_iter_noop", items=ITEMS)
+def gather_iter_noop():
+    """gather_iter() of a no-op function with the default pending window."""
+    items = range(ITEMS)
+    return lambda: sum(1 for _ in gather_iter(_identity, items, max_workers=8))
+
+
+@benchmark("concurrency.serial_noop", items=ITEMS)
+def serial_noop():
+    """Baseline: the same calls made serially."""
+    items = range(ITEMS)
+    return lambda: [_identity(item) for item in items]
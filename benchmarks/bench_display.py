@@ -0,0 +1,48 @@
+"""Rendering of large pages to the terminal."""
+
+from __future__ import annotations
+
+import io
+from contextlib import redirect_stdout
+
+from benchmarks.payloads import page_payload, process_payloads, task_payloads
+from benchmarks.runner import benchmark
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.processes import ProcessInstance
+from camctl.api.camunda.resources.tasks import Task
+from camctl.console import display
+
+PAGE_ITEMS = 500
+
+
+def _rendered(render, *args, **kwargs):
+    """Render into a throwaway buffer; the console writes to the current stdout."""
+
+    def run() -> None:
+        with redirect_stdout(io.StringIO()):
+            render(*args, **kwargs)
+
+    return run
+
+
+@benchmark("display.print_tasks", items=PAGE_ITEMS)
+def print_tasks():
+    """display.print_tasks on a 500-row page."""
+    page = Page.from_dict(page_payload(task_payloads(PAGE_ITEMS)), item_parser=Task.from_dict)
+    return _rendered(display.print_tasks, page)
+
+
+@benchmark("display.print_processes", items=PAGE_ITEMS)
+def print_processes():
+    """display.print_processes on a 500-row page."""
+    page = Page.from_dict(
+        page_payload(process_payloads(PAGE_ITEMS)), item_parser=ProcessInstance.from_dict
+    )
+    return _rendered(display.print_processes, page)
+
+
+@benchmark("display.print_raw_json_tasks", items=PAGE_ITEMS)
+def print_raw_json_tasks():
+    """display.print_raw_json on a 500-row page (--raw)."""
+    page = Page.from_dict(page_payload(task_payloads(PAGE_ITEMS)), item_parser=Task.from_dict)
+    return _rendered(display.print_raw_json, page)
@@ -0,0 +1,39 @@
+"""Response parsing: `Resource.from_dict` and `Page.from_dict`."""
+
+from __future__ import annotations
+
+from benchmarks.payloads import page_payload, process_payloads, task_payloads
+from benchmarks.runner import benchmark
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.processes import ProcessInstance
+from camctl.api.camunda.resources.tasks import Task
+
+PAGE_ITEMS = 500
+
+
+@benchmark("resources.task_from_dict", items=PAGE_ITEMS)
+def task_from_dict():
+    """Task.from_dict over a page of full task payloads."""
+    payloads = task_payloads(PAGE_ITEMS)
+    return lambda: [Task.from_dict(payload) for payload in payloads]
+
+
+@benchmark("resources.process_from_dict", items=PAGE_ITEMS)
+def process_from_dict():
+    """ProcessInstance.from_dict over a page of process instance payloads."""
+    payloads = process_payloads(PAGE_ITEMS)
+    return lambda: [ProcessInstance.from_dict(payload) for payload in payloads]
+
+
+@benchmark("resources.task_page_from_dict", items=PAGE_ITEMS)
+def task_page_from_dict():
+    """Page.from_dict with the Task item parser."""
+    payload = page_payload(task_payloads(PAGE_ITEMS))
+    return lambda: Page.from_dict(payload, item_parser=Task.from_dict)
+
+
+@benchmark("resources.task_to_dict", items=PAGE_ITEMS)
+def task_to_dict():
+    """Task.to_dict, used by JSON output and the query cache."""
+    tasks = [Task.from_dict(payload) for payload in task_payloads(PAGE_ITEMS)]
+    return lambda: [task.to_dict() for task in tasks]
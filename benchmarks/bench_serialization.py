@@ -0,0 +1,56 @@
+"""Request serialization and JSON output helpers."""
+
+from __future__ import annotations
+
+from benchmarks.payloads import page_payload, task_payloads
+from benchmarks.runner import benchmark
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.tasks import Task, TaskListParams
+from camctl.api.http.serialize import SnakeToCamelSerializer
+from camctl.utils import dumps_json, normalize
+
+PAGE_ITEMS = 500
+
+
+def _list_params() -> TaskListParams:
+    return TaskListParams(
+        assignee_in="alice,bob,carol",
+        process_definition_key_in="invoice,order-fulfilment",
+        candidate_group="accounting",
+        created_after="2024-01-01T00:00:00.000+0000",
+        task_variables="region_eq_emea,amount_gt_1000",
+        active=True,
+        sort_by="created",
+        sort_order="desc",
+        first_result=0,
+        max_results=200,
+    )
+
+
+@benchmark("serialization.snake_to_camel_task_list_params")
+def snake_to_camel_task_list_params():
+    """SnakeToCamelSerializer.serialize on a filtered TaskListParams."""
+    serializer = SnakeToCamelSerializer()
+    params = _list_params()
+    return lambda: serializer.serialize(params)
+
+
+@benchmark("serialization.task_list_params_to_api_dict")
+def task_list_params_to_api_dict():
+    """TaskListParams.to_api_dict, the SerializeMixin path."""
+    params = _list_params()
+    return params.to_api_dict
+
+
+@benchmark("serialization.normalize_task_page", items=PAGE_ITEMS)
+def normalize_task_page():
+    """normalize() on a parsed task page."""
+    page = Page.from_dict(page_payload(task_payloads(PAGE_ITEMS)), item_parser=Task.from_dict)
+    return lambda: normalize(page)
+
+
+@benchmark("serialization.dumps_json_task_page", items=PAGE_ITEMS)
+def dumps_json_task_page():
+    """dumps_json() on a parsed task page (--raw and --output)."""
+    page = Page.from_dict(page_payload(task_payloads(PAGE_ITEMS)), item_parser=Task.from_dict)
+    return lambda: dumps_json(page)
@@ -0,0 +1,106 @@
+"""Deterministic, realistically shaped Camunda REST payloads for benchmarks."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_TASK_NAMES = ("Review invoice", "Approve order", "Check documents", "Call customer", "Escalate")
+_DEFINITION_KEYS = ("invoice", "order-fulfilment", "onboarding", "claims", "kyc-review")
+_USERS = ("alice", "bob", "carol", "dave", "erin", None)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _timestamp(rng: random.Random) -> str:
+    moment = _EPOCH + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def task_payload(rng: random.Random) -> dict[str, Any]:
+    """One `/task` item with every field the engine returns."""
+    key = rng.choice(_DEFINITION_KEYS)
+    process_instance_id = _uuid(rng)
+    return {
+        "id": _uuid(rng),
+        "name": rng.choice(_TASK_NAMES),
+        "assignee": rng.choice(_USERS),
+        "owner": None,
+        "created": _timestamp(rng),
+        "lastUpdated": _timestamp(rng),
+        "due": _timestamp(rng) if rng.random() < 0.5 else None,
+        "followUp": None,
+        "delegationState": None,
+        "description": "Generated for benchmarking." if rng.random() < 0.3 else None,
+        "executionId": process_instance_id,
+        "parentTaskId": None,
+        "priority": rng.choice((25, 50, 75)),
+        "processDefinitionId": f"{key}:{rng.randint(1, 9)}:{_uuid(rng)}",
+        "processInstanceId": process_instance_id,
+        "caseExecutionId": None,
+        "caseDefinitionId": None,
+        "caseInstanceId": None,
+        "taskDefinitionKey": f"{key}-task-{rng.randint(1, 5)}",
+        "suspended": rng.random() < 0.05,
+        "formKey": None,
+        "camundaFormRef": {"key": f"{key}-form", "binding": "latest", "version": None},
+        "tenantId": None,
+        "taskState": "Created",
+    }
+
+
+def process_payload(rng: random.Random) -> dict[str, Any]:
+    """One `/process-instance` item."""
+    key = rng.choice(_DEFINITION_KEYS)
+    return {
+        "links": [],
+        "id": _uuid(rng),
+        "definitionId": f"{key}:{rng.randint(1, 9)}:{_uuid(rng)}",
+        "definitionKey": key,
+        "businessKey": f"BK-{rng.randrange(10**6):06d}",
+        "caseInstanceId": None,
+        "ended": False,
+        "suspended": rng.random() < 0.05,
+        "tenantId": None,
+    }
+
+
+def task_payloads(count: int, *, seed: int = 42) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [task_payload(rng) for _ in range(count)]
+
+
+def process_payloads(count: int, *, seed: int = 42) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [process_payload(rng) for _ in range(count)]
+
+
+def page_payload(items: list[dict[str, Any]], *, page_size: int | None = None) -> dict[str, Any]:
+    """Wrap items the way paged endpoints (and the client) present them."""
+    size = page_size or len(items)
+    return {
+        "items": items,
+        "page": {
+            "page": 0,
+            "size": size,
+            "total": len(items),
+            "totalPages": 1,
+            "hasNext": False,
+            "hasPrevious": False,
+        },
+        "sort": {"field": "created", "direction": "desc"},
+    }
+
+
+__all__ = [
+    "page_payload",
+    "process_payload",
+    "process_payloads",
+    "task_payload",
+    "task_payloads",
+]
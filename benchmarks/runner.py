@@ -0,0 +1,305 @@
+"""Registry, timing loop and JSON results for the benchmark suite."""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+SCHEMA_VERSION = 1
+
+Factory = Callable[[], Callable[[], Any]]
+
+
+@dataclass(kw_only=True)
+class Benchmark:
+    """
+    A named micro-benchmark.
+
+    `factory` does the setup (building payloads, objects) and returns the
+    zero-argument callable that is timed. `items` is the number of logical
+    operations per call, used to report the cost per item.
+    """
+
+    name: str
+    factory: Factory
+    items: int = 1
+    description: str = ""
+
+
+@dataclass(kw_only=True)
+class BenchmarkResult:
+    """Timing summary of one benchmark, in seconds per call."""
+
+    name: str
+    items: int
+    loops: int
+    repeats: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    description: str = ""
+
+    @property
+    def per_item_ns(self) -> float:
+        return self.median / self.items * 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["per_item_ns"] = round(self.per_item_ns, 1)
+        data["items_per_second"] = round(self.items / self.median, 1) if self.median else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> BenchmarkResult:
+        names = {name for name in cls.__dataclass_fields__}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+@dataclass(kw_only=True)
+class RunOptions:
+    """How long and how often each benchmark is timed."""
+
+    min_time: float = 0.2
+    repeats: int = 5
+    max_loops: int = 1_000_000
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, items: int = 1) -> Callable[[Factory], Factory]:
+    """Register a benchmark factory under `name`."""
+
+    def register(factory: Factory) -> Factory:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark {name!r} is already registered.")
+        doc = (factory.__doc__ or "").strip().splitlines()
+        REGISTRY[name] = Benchmark(
+            name=name,
+            factory=factory,
+            items=items,
+            description=doc[0] if doc else "",
+        )
+        return factory
+
+    return register
+
+
+def select(patterns: Iterable[str] | None = None) -> list[Benchmark]:
+    """Return registered benchmarks whose name contains any of `patterns`."""
+    wanted = [pattern for pattern in patterns or [] if pattern]
+    return [
+        bench
+        for name, bench in sorted(REGISTRY.items())
+        if not wanted or any(pattern in name for pattern in wanted)
+    ]
+
+
+def run_benchmark(bench: Benchmark, options: RunOptions) -> BenchmarkResult:
+    """
+    Time one benchmark.
+
+    The loop count doubles until one repeat takes at least `min_time`, then
+    the benchmark is timed `repeats` times with the garbage collector off.
+    """
+    func = bench.factory()
+    func()  # warm caches and lazy imports outside the measurement
+
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= options.min_time or loops >= options.max_loops:
+            break
+        loops = min(loops * 2, options.max_loops)
+
+    samples = [_time_loops(func, loops) / loops for _ in range(options.repeats)]
+    return BenchmarkResult(
+        name=bench.name,
+        description=bench.description,
+        items=bench.items,
+        loops=loops,
+        repeats=options.repeats,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass(kw_only=True)
+class SuiteResult:
+    """All results of one suite run plus the environment they came from."""
+
+    results: list[BenchmarkResult]
+    created_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
+    )
+    git_commit: str | None = field(default_factory=lambda: git_commit())
+    python: str = field(default_factory=platform.python_version)
+    platform: str = field(default_factory=platform.platform)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": SCHEMA_VERSION,
+            "created_at": self.created_at,
+            "git_commit": self.git_commit,
+            "python": self.python,
+            "platform": self.platform,
+            "benchmarks": {result.name: result.to_dict() for result in self.results},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SuiteResult:
+        if data.get("schema") != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported benchmark results schema {data.get('schema')!r}.")
+        return cls(
+            results=[BenchmarkResult.from_dict(item) for item in data["benchmarks"].values()],
+            created_at=data.get("created_at", ""),
+            git_commit=data.get("git_commit"),
+            python=data.get("python", ""),
+            platform=data.get("platform", ""),
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> SuiteResult:
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass(kw_only=True)
+class Comparison:
+    """Change of one benchmark between a baseline and a current run."""
+
+    name: str
+    baseline: float | None
+    current: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+def compare(baseline: SuiteResult, current: SuiteResult) -> list[Comparison]:
+    """Pair results by name; benchmarks missing on one side have a None time."""
+    before = {result.name: result.median for result in baseline.results}
+    after = {result.name: result.median for result in current.results}
+    return [
+        Comparison(name=name, baseline=before.get(name), current=after.get(name))
+        for name in sorted(before.keys() | after.keys())
+    ]
+
+
+def regressions(comparisons: Iterable[Comparison], threshold: float) -> list[Comparison]:
+    """Return comparisons that got slower by more than `threshold` (e.g. 1.2 = 20%)."""
+    return [item for item in comparisons if item.ratio is not None and item.ratio > threshold]
+
+
+def format_seconds(value: float | None) -> str:
+    if value is None or math.isnan(value):
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+    return f"{value / 1e-9:.0f} ns"
+
+
+def git_commit() -> str | None:
+    """Return the short commit hash of the working tree, if it is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def print_results(results: Iterable[BenchmarkResult], file=None) -> None:
+    rows = [
+        (
+            result.name,
+            format_seconds(result.median),
+            f"±{result.stdev / result.median * 100:.1f}%" if result.median else "-",
+            f"{result.per_item_ns:,.0f} ns",
+            str(result.items),
+        )
+        for result in results
+    ]
+    _print_table(("benchmark", "median", "spread", "per item", "items"), rows, file)
+
+
+def print_comparison(comparisons: Iterable[Comparison], file=None) -> None:
+    rows = [
+        (
+            item.name,
+            format_seconds(item.baseline),
+            format_seconds(item.current),
+            f"{item.ratio:.2f}x" if item.ratio is not None else "-",
+        )
+        for item in comparisons
+    ]
+    _print_table(("benchmark", "baseline", "current", "ratio"), rows, file)
+
+
+def _print_table(header: tuple[str, ...], rows: list[tuple[str, ...]], file) -> None:
+    widths = [max(len(row[index]) for row in [header, *rows]) for index in range(len(header))]
+    for row in [header, *rows]:
+        cells = [
+            cell.ljust(width) if index == 0 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(row, widths))
+        ]
+        print("  ".join(cells), file=file)
+
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "REGISTRY",
+    "RunOptions",
+    "SCHEMA_VERSION",
+    "SuiteResult",
+    "benchmark",
+    "compare",
+    "format_seconds",
+    "git_commit",
+    "print_comparison",
+    "print_results",
+    "regressions",
+    "run_benchmark",
+    "select",
+]
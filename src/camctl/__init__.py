@@ -1,5 +1,20 @@
 """camctl package for Camunda CLI and API clients."""
 
-from camctl.api.camunda import CamundaClient, CamundaEngine
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from camctl.api.camunda import CamundaClient, CamundaEngine
 
 __all__ = ["CamundaClient", "CamundaEngine"]
+
+
+def __getattr__(name: str) -> Any:
+    # The API clients pull in httpx; import them on first use so the daemon
+    # thin client (camctl.daemon.client) starts without loading them.
+    if name in __all__:
+        from camctl.api import camunda
+
+        return getattr(camunda, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
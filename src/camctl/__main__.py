@@ -1,6 +1,6 @@
 """Module entrypoint for `python -m camctl`."""
 
-from camctl.console import app
+from camctl.daemon.client import main
 
 if __name__ == "__main__":
-    app()
+    main()
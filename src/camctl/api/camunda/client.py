@@ -6,11 +6,11 @@ from typing import Mapping
 
 import httpx
 
-from camctl.api.http import BaseHTTPClient, CircuitBreaker
+from camctl.api.http import BaseHTTPClient, CircuitBreaker, ClientMetrics, TimingCollector
 from camctl.api.http.serialize import SnakeToCamelSerializer
 from camctl.api.camunda.errors import CamundaAPIError, CamundaError
 
-_BASE_URL = "http://localhost:8080/engine-rest"
+DEFAULT_BASE_URL = "http://localhost:8080/engine-rest"
 _DEFAULT_TIMEOUT_SECONDS = 10.0
 _DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
 _DEFAULT_BREAKER_RECOVERY_TIMEOUT_SECONDS = 30.0
@@ -21,11 +21,15 @@ class CamundaClient(BaseHTTPClient):
     def __init__(
         self,
         *,
-        base_url: str = _BASE_URL,
+        base_url: str = DEFAULT_BASE_URL,
         timeout: float = _DEFAULT_TIMEOUT_SECONDS,
         circuit_breaker: CircuitBreaker | None = None,
         failure_threshold: int = _DEFAULT_BREAKER_FAILURE_THRESHOLD,
         recovery_timeout_seconds: float = _DEFAULT_BREAKER_RECOVERY_TIMEOUT_SECONDS,
+        client: httpx.Client | None = None,
+        transport: httpx.BaseTransport | None = None,
+        timings: TimingCollector | None = None,
+        metrics: ClientMetrics | None = None,
     ) -> None:
         resolved_breaker = circuit_breaker or CircuitBreaker(
             failure_threshold=failure_threshold,
@@ -36,9 +40,14 @@ class CamundaClient(BaseHTTPClient):
             timeout=timeout,
             serializer=SnakeToCamelSerializer(),
             circuit_breaker=resolved_breaker,
+            client=client,
+            transport=transport,
+            timings=timings,
+            metrics=metrics,
         )
 
-    def _raise_for_status(self, response: httpx.Response) -> None:
+    def raise_for_status(self, response: httpx.Response) -> None:
+        """Raise `CamundaAPIError`, with the engine's error details, for an error response."""
         if not response.is_error:
             return
         payload: Mapping[str, object] | None = None
@@ -1,23 +1,45 @@
 """Common Camunda models shared across services."""
 
-from .pagination import Page, PaginationInfo, SortInfo
+from .pagination import Page, PaginationInfo, SortInfo, iter_paged, page_offsets
+from .query import (
+    DEFAULT_MAX_IN_LIST,
+    DEFAULT_MAX_QUERY_LENGTH,
+    QuerySpec,
+    parse_variable_filters,
+    query_length,
+)
 from .resource import CamundaResource, IdentifiableResource, Resource
 from .variables import (
     Variable,
+    VariableDiff,
+    VariableInstance,
+    VariableInstanceQuery,
     VariableModificationRequest,
     VariablePayload,
     VariableValueInfo,
+    diff_variables,
 )
 
 __all__ = [
+    "DEFAULT_MAX_IN_LIST",
+    "DEFAULT_MAX_QUERY_LENGTH",
     "CamundaResource",
     "IdentifiableResource",
     "Page",
     "PaginationInfo",
+    "QuerySpec",
     "Resource",
     "SortInfo",
     "Variable",
+    "VariableDiff",
+    "VariableInstance",
+    "VariableInstanceQuery",
     "VariableModificationRequest",
     "VariablePayload",
     "VariableValueInfo",
+    "diff_variables",
+    "iter_paged",
+    "page_offsets",
+    "parse_variable_filters",
+    "query_length",
 ]
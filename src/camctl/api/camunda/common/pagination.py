@@ -7,14 +7,17 @@ from typing import (
     Any,
     Callable,
     Generic,
+    Iterator,
     Mapping,
     Sequence,
     TypeVar,
 )
 
 from camctl.api.camunda.common.resource import Resource
+from camctl.api.http.timings import phase
 
 T = TypeVar("T", bound=Resource)
+ItemT = TypeVar("ItemT")
 
 
 @dataclass(kw_only=True)
@@ -46,6 +49,7 @@ class Page(Resource, Generic[T]):
     sort: SortInfo | None = None
 
     @classmethod
+    @phase("parse")
     def from_dict(
         cls,
         data: Mapping[str, Any],
@@ -87,8 +91,55 @@ class Page(Resource, Generic[T]):
         return base
 
 
+def page_offsets(total: int, page_size: int, *, reverse: bool = False) -> Iterator[int]:
+    """
+    Yield `firstResult` offsets covering `total` items in pages of `page_size`.
+
+    With `reverse=True` the offsets run from the last page to the first, which
+    keeps earlier offsets valid while already-visited items are being removed.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    offsets = range(0, max(total, 0), page_size)
+    return reversed(offsets) if reverse else iter(offsets)
+
+
+def iter_paged(
+    fetch: Callable[[int, int], Sequence[ItemT]],
+    *,
+    page_size: int,
+    total: int | None = None,
+    reverse: bool = False,
+) -> Iterator[ItemT]:
+    """
+    Yield items from an offset-paged query, one page at a time.
+
+    `fetch(first_result, max_results)` returns a single page. Forward
+    iteration stops at the first short page; reverse iteration needs `total`
+    and walks the pages from the tail (see `page_offsets`).
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if reverse:
+        if total is None:
+            raise ValueError("total is required for reverse iteration")
+        for offset in page_offsets(total, page_size, reverse=True):
+            yield from fetch(offset, page_size)
+        return
+
+    offset = 0
+    while True:
+        items = fetch(offset, page_size)
+        yield from items
+        if len(items) < page_size:
+            return
+        offset += page_size
+
+
 __all__ = [
     "Page",
     "PaginationInfo",
     "SortInfo",
+    "iter_paged",
+    "page_offsets",
 ]
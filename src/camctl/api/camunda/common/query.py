@@ -0,0 +1,142 @@
+"""Helpers for sending filter queries as POST JSON bodies instead of query strings."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+import httpx
+
+DEFAULT_MAX_QUERY_LENGTH = 2048
+DEFAULT_MAX_IN_LIST = 1000
+
+PAGINATION_KEYS = ("firstResult", "maxResults", "page", "size")
+_UNCHUNKABLE_KEYS = (*PAGINATION_KEYS, "sortBy")
+
+
+def query_length(params: Mapping[str, Any]) -> int:
+    """Return the length of `params` encoded as a URL query string."""
+    return len(str(httpx.QueryParams(_query_values(params))))
+
+
+def parse_variable_filters(value: str) -> list[dict[str, str]]:
+    """
+    Parse the GET variable filter syntax into POST variable objects.
+
+    `status_eq_open,amount_gt_100` becomes
+    `[{"name": "status", "operator": "eq", "value": "open"}, ...]`. Values stay
+    strings, which is how the engine reads them from query strings.
+    """
+    filters: list[dict[str, str]] = []
+    for expression in value.split(","):
+        expression = expression.strip()
+        if not expression:
+            continue
+        parts = expression.split("_", 2)
+        if len(parts) != 3 or not parts[0] or not parts[1]:
+            raise ValueError(
+                f"Invalid variable filter {expression!r}; expected name_operator_value."
+            )
+        name, operator, raw_value = parts
+        filters.append({"name": name, "operator": operator, "value": raw_value})
+    return filters
+
+
+@dataclass(frozen=True, kw_only=True)
+class QuerySpec:
+    """
+    How a resource's GET query parameters map onto its POST query body.
+
+    All names are the camelCase API names. `list_fields` hold comma-separated
+    values that become JSON arrays, `variable_fields` use the variable filter
+    syntax, and `chunk_fields` are id lists that may be split across several
+    requests because every result matches exactly one id.
+    """
+
+    list_fields: frozenset[str] = field(default_factory=frozenset)
+    variable_fields: frozenset[str] = field(default_factory=frozenset)
+    chunk_fields: frozenset[str] = field(default_factory=frozenset)
+
+    def to_body(self, params: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Split API parameters into a POST JSON body and the remaining query string.
+
+        Pagination stays in the query string, as the engine expects; sorting
+        moves into a `sorting` array.
+        """
+        body: dict[str, Any] = {}
+        query: dict[str, Any] = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if key in PAGINATION_KEYS:
+                query[key] = value
+            elif key in ("sortBy", "sortOrder"):
+                continue
+            elif key in self.list_fields:
+                body[key] = _as_list(value)
+            elif key in self.variable_fields and isinstance(value, str):
+                body[key] = parse_variable_filters(value)
+            else:
+                body[key] = value
+        if params.get("sortBy"):
+            sorting = {"sortBy": params["sortBy"]}
+            if params.get("sortOrder"):
+                sorting["sortOrder"] = params["sortOrder"]
+            body["sorting"] = [sorting]
+        return body, query
+
+    def split(self, params: Mapping[str, Any], size: int) -> list[dict[str, Any]]:
+        """
+        Split the longest oversized id list into chunks of at most `size` ids.
+
+        Paginated or sorted queries are never split, since their results
+        cannot be stitched back together in order. Otherwise the chunks
+        select disjoint results, so counts add up and lists concatenate.
+        """
+        params = dict(params)
+        if any(params.get(key) is not None for key in _UNCHUNKABLE_KEYS):
+            return [params]
+        lists = {
+            key: _as_list(params[key])
+            for key in sorted(self.chunk_fields)
+            if params.get(key) is not None
+        }
+        key = max(lists, key=lambda name: len(lists[name]), default=None)
+        if key is None or len(lists[key]) <= size:
+            return [params]
+        values = lists[key]
+        return [
+            {**params, key: ",".join(str(item) for item in values[start : start + size])}
+            for start in range(0, len(values), size)
+        ]
+
+
+def _as_list(value: Any) -> list[Any]:
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    return [value]
+
+
+def _query_values(params: Mapping[str, Any]) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            values[key] = "true" if value else "false"
+        else:
+            values[key] = value
+    return values
+
+
+__all__ = [
+    "DEFAULT_MAX_IN_LIST",
+    "DEFAULT_MAX_QUERY_LENGTH",
+    "PAGINATION_KEYS",
+    "QuerySpec",
+    "parse_variable_filters",
+    "query_length",
+]
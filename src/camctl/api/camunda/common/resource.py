@@ -15,6 +15,7 @@ from typing import (
 from uuid import UUID
 
 from camctl.api.http.serialize import camel_to_snake
+from camctl.api.http.timings import phase
 
 
 def _normalize_keys(data: Mapping[str, Any]) -> dict[str, Any]:
@@ -46,6 +47,7 @@ class Resource:
     raw: Mapping[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
+    @phase("parse")
     def from_dict(cls, data: Mapping[str, Any]) -> Self:
         """Build a resource from a JSON dictionary payload."""
         normalized = _normalize_keys(data)
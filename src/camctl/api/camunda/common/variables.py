@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import Any, Mapping, Sequence
 
 from camctl.api.camunda.common import Resource
-from camctl.api.http.serialize import SerializeMixin, SnakeToCamelSerializer
+from camctl.api.http.serialize import SerializeMixin, SnakeToCamelSerializer, camel_to_snake
+
+_INT_MIN = -(2**31)
+_INT_MAX = 2**31 - 1
 
 
 @dataclass(kw_only=True)
@@ -30,6 +34,39 @@ class Variable(Resource):
     value_info: VariableValueInfo | None = None
 
 
+@dataclass(kw_only=True)
+class VariableInstance(Variable):
+    """Represents a variable instance returned by the variable-instance query."""
+
+    id: str | None = None
+    name: str | None = None
+    process_instance_id: str | None = None
+    execution_id: str | None = None
+    activity_instance_id: str | None = None
+    task_id: str | None = None
+    tenant_id: str | None = None
+    error_message: str | None = None
+
+    @property
+    def is_process_scoped(self) -> bool:
+        """Return True for variables set on the process instance itself."""
+        return (
+            self.process_instance_id is not None
+            and self.execution_id == self.process_instance_id
+            and self.task_id is None
+        )
+
+
+@dataclass(kw_only=True)
+class VariableInstanceQuery(SerializeMixin):
+    """Body for the POST variable-instance query endpoint."""
+
+    process_instance_id_in: Sequence[str] | None = None
+    variable_name: str | None = None
+    variable_name_in: Sequence[str] | None = None
+    sorting: Sequence[Mapping[str, str]] | None = None
+
+
 @dataclass(kw_only=True)
 class VariablePayload(SerializeMixin):
     """Payload used to create or update a Camunda variable."""
@@ -52,9 +89,119 @@ class VariableModificationRequest(SerializeMixin):
     deletions: Sequence[str] | None = None
 
 
+@dataclass(kw_only=True)
+class VariableDiff:
+    """Result of reducing a modification request against the stored variables."""
+
+    request: VariableModificationRequest
+    unchanged: list[str] = field(default_factory=list)
+    missing_deletions: list[str] = field(default_factory=list)
+    requested_bytes: int = 0
+    minimal_bytes: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True when nothing needs to be sent."""
+        return not (self.request.modifications or self.request.deletions)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.requested_bytes - self.minimal_bytes
+
+
+def diff_variables(
+    current: Mapping[str, Variable],
+    modifications: Mapping[str, VariablePayload] | None = None,
+    deletions: Sequence[str] | None = None,
+) -> VariableDiff:
+    """
+    Reduce requested changes to the ones that would alter the stored variables.
+
+    A modification is dropped when the variable already holds an equal value of
+    the same type (and matching valueInfo, when given). Without an explicit type
+    the type Camunda would infer from the JSON value is used, so a changed type
+    is never mistaken for a no-op. Deletions of variables that do not exist are
+    dropped too. `current` should be fetched with `deserializeValues=false` so
+    serialized Object/Json values compare as sent.
+    """
+    original = VariableModificationRequest(
+        modifications=modifications or None,
+        deletions=list(deletions) if deletions else None,
+    )
+    changed: dict[str, VariablePayload] = {}
+    unchanged: list[str] = []
+    for name, payload in (modifications or {}).items():
+        stored = current.get(name)
+        if stored is not None and _matches(stored, payload):
+            unchanged.append(name)
+        else:
+            changed[name] = payload
+    kept_deletions = [name for name in deletions or () if name in current]
+    missing = [name for name in deletions or () if name not in current]
+
+    minimal = VariableModificationRequest(
+        modifications=changed or None,
+        deletions=kept_deletions or None,
+    )
+    diff = VariableDiff(
+        request=minimal,
+        unchanged=unchanged,
+        missing_deletions=missing,
+        requested_bytes=_payload_size(original),
+    )
+    diff.minimal_bytes = 0 if diff.is_empty else _payload_size(minimal)
+    return diff
+
+
+def _matches(stored: Variable, payload: VariablePayload) -> bool:
+    requested_type = payload.type or _inferred_type(payload.value)
+    if requested_type is None or stored.type is None:
+        return False
+    if requested_type.lower() != stored.type.lower():
+        return False
+    if not _same_value(stored.value, payload.value):
+        return False
+    if payload.value_info:
+        info = payload.value_info
+        requested_info = info.raw if isinstance(info, Resource) else info
+        stored_info = stored.value_info.raw if stored.value_info else {}
+        for key, value in requested_info.items():
+            if value is not None and stored_info.get(camel_to_snake(key)) != value:
+                return False
+    return True
+
+
+def _inferred_type(value: Any) -> str | None:
+    if value is None:
+        return "Null"
+    if isinstance(value, bool):
+        return "Boolean"
+    if isinstance(value, int):
+        return "Integer" if _INT_MIN <= value <= _INT_MAX else "Long"
+    if isinstance(value, float):
+        return "Double"
+    if isinstance(value, str):
+        return "String"
+    return None
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    if isinstance(left, bool) != isinstance(right, bool):
+        return False
+    return left == right
+
+
+def _payload_size(request: VariableModificationRequest) -> int:
+    return len(json.dumps(request.to_api_dict(), separators=(",", ":")).encode("utf-8"))
+
+
 __all__ = [
     "Variable",
+    "VariableDiff",
+    "VariableInstance",
+    "VariableInstanceQuery",
     "VariablePayload",
     "VariableModificationRequest",
     "VariableValueInfo",
+    "diff_variables",
 ]
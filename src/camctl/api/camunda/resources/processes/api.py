@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
-from camctl.api.camunda.common import Page
-from camctl.api.camunda.common import Variable
-from camctl.api.camunda.service import CamSubService
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from camctl.api.camunda.common import Page, iter_paged
+from camctl.api.camunda.common import (
+    Variable,
+    VariableInstance,
+    VariableInstanceQuery,
+    VariableModificationRequest,
+)
+from camctl.api.camunda.service import DEFAULT_DOWNLOAD_CHUNK_SIZE, CamSubService
+from camctl.tracing import traced
 
 from .endpoints import ProcessEndpoint
 from .models import (
+    PROCESS_QUERY_SPEC,
     ProcessCancelResult,
     ProcessFilterParams,
     ProcessInstance,
     ProcessListParams,
+    ProcessStartRequest,
+    ProcessStartResult,
 )
 
 
@@ -20,6 +33,7 @@ class ProcessesAPI(CamSubService):
 
     URL_PREFIX = ""
 
+    @traced
     def get(self, process_id: str) -> ProcessInstance | None:
         """Fetch a single process instance by its identifier."""
         response = self._client.get(
@@ -28,38 +42,78 @@ class ProcessesAPI(CamSubService):
         )
         if response.status_code == 404:
             return None
-        self._client._raise_for_status(response)
-        return ProcessInstance.from_dict(response.json())
+        self._client.raise_for_status(response)
+        return ProcessInstance.from_dict(self._json(response))
 
+    @traced
     def list(self, *, params: ProcessListParams | None = None) -> Page[ProcessInstance]:
-        """List process instances with optional query parameters."""
-        response = self._client.get(
-            self._path(ProcessEndpoint.LIST.value),
-            params=params,
-        )
-        payload = response.json()
-        if isinstance(payload, list):
-            items = [
-                ProcessInstance.from_dict(item)
-                for item in payload
-                if isinstance(item, dict)
-            ]
-            return Page(raw={"items": payload}, items=items)
-        if not isinstance(payload, dict):
-            raise TypeError("Process list response must be a list or object.")
-        return Page.from_dict(payload, item_parser=ProcessInstance.from_dict)
+        """
+        List process instances with optional query parameters.
+
+        Long filters (for example large `processInstanceIds` lists) are sent
+        as a POST query; see `CamSubService._query`.
+        """
+        payloads = self._query(ProcessEndpoint.LIST.value, params, PROCESS_QUERY_SPEC)
+        if len(payloads) == 1 and isinstance(payloads[0], dict):
+            return Page.from_dict(payloads[0], item_parser=ProcessInstance.from_dict)
+        raw_items: list[dict] = []
+        for payload in payloads:
+            if not isinstance(payload, list):
+                raise TypeError("Process list response must be a list or object.")
+            raw_items.extend(payload)
+        items = [
+            ProcessInstance.from_dict(item)
+            for item in raw_items
+            if isinstance(item, dict)
+        ]
+        return Page(raw={"items": raw_items}, items=items)
+
+    def iterate(
+        self,
+        *,
+        params: ProcessFilterParams | None = None,
+        page_size: int = 200,
+        total: int | None = None,
+        reverse: bool = False,
+    ) -> Iterator[ProcessInstance]:
+        """
+        Yield process instances matching the filters, one page at a time.
 
+        Pages are ordered by instance id so offsets stay stable. With
+        `reverse=True` pages are walked from the tail (using `total`, or a
+        count query when omitted), which lets callers remove the instances
+        they have already seen, for example by cancelling them.
+        """
+        if reverse and total is None:
+            total = self.count(params=params)
+
+        def _fetch(first_result: int, max_results: int) -> list[ProcessInstance]:
+            page = self.list(
+                params=ProcessListParams.from_filters(
+                    params,
+                    first_result=first_result,
+                    max_results=max_results,
+                    sort_by="instanceId",
+                    sort_order="asc",
+                )
+            )
+            return list(page.items)
+
+        return iter_paged(_fetch, page_size=page_size, total=total, reverse=reverse)
+
+    @traced
     def count(self, *, params: ProcessFilterParams | None = None) -> int:
-        """Count process instances with optional query parameters."""
-        response = self._client.get(
-            self._path(ProcessEndpoint.COUNT.value),
-            params=params,
-        )
-        payload = response.json()
-        if isinstance(payload, dict) and "count" in payload:
-            return int(payload["count"])
-        raise TypeError("Process count response must be an object with a count value.")
+        """Count process instances with optional query parameters, POSTing long filters."""
+        total = 0
+        for payload in self._query(ProcessEndpoint.COUNT.value, params, PROCESS_QUERY_SPEC):
+            if not (isinstance(payload, dict) and "count" in payload):
+                raise TypeError(
+                    "Process count response must be an object with a count value."
+                )
+            total += int(payload["count"])
+        return total
 
+    @traced
     def variables(
         self,
         process_id: str,
@@ -77,8 +131,8 @@ class ProcessesAPI(CamSubService):
         )
         if response.status_code == 404:
             return None
-        self._client._raise_for_status(response)
-        payload = response.json()
+        self._client.raise_for_status(response)
+        payload = self._json(response)
         if isinstance(payload, dict):
             variables: dict[str, Variable] = {}
             for name, value in payload.items():
@@ -89,7 +143,116 @@ class ProcessesAPI(CamSubService):
             return variables
         raise TypeError("Variables response must be a JSON object.")
 
+    @traced
+    def download_variable(
+        self,
+        process_id: str,
+        var_name: str,
+        destination: Path,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int | None:
+        """
+        Stream the binary content of a File/Bytes process variable to a file.
+
+        Returns the number of bytes written, or None if the instance or
+        variable does not exist.
+        """
+        return self._download(
+            ProcessEndpoint.VARIABLE_DATA.value.format(
+                process_id=process_id, var_name=var_name
+            ),
+            destination,
+            chunk_size=chunk_size,
+        )
+
+    @traced
+    def bulk_variables(
+        self,
+        process_ids: Sequence[str],
+        *,
+        deserialize_values: bool | None = None,
+        chunk_size: int = 100,
+        page_size: int = 1000,
+    ) -> dict[str, dict[str, Variable]]:
+        """
+        Fetch process variables for many instances with variable-instance queries.
+
+        IDs are sent in chunks of `chunk_size` via `processInstanceIdIn`, each
+        chunk paged by `page_size`, and the results are regrouped per instance.
+        Only variables on the process instance scope are kept, matching what
+        `variables` returns. Instances without variables (or unknown IDs) map
+        to an empty dict.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        grouped: dict[str, dict[str, Variable]] = {
+            process_id: {} for process_id in process_ids
+        }
+        unique_ids = list(grouped)
+        for start in range(0, len(unique_ids), chunk_size):
+            query = VariableInstanceQuery(
+                process_instance_id_in=unique_ids[start:start + chunk_size],
+                sorting=[
+                    {"sortBy": "activityInstanceId", "sortOrder": "asc"},
+                    {"sortBy": "variableName", "sortOrder": "asc"},
+                ],
+            )
+            for variable in self._query_variable_instances(
+                query,
+                deserialize_values=deserialize_values,
+                page_size=page_size,
+            ):
+                if not variable.is_process_scoped or not variable.name:
+                    continue
+                instance_vars = grouped.setdefault(str(variable.process_instance_id), {})
+                instance_vars[variable.name] = variable
+        return grouped
+
+    def _query_variable_instances(
+        self,
+        query: VariableInstanceQuery,
+        *,
+        deserialize_values: bool | None,
+        page_size: int,
+    ) -> Iterator[VariableInstance]:
+        def _fetch(first_result: int, max_results: int) -> list[VariableInstance]:
+            params: dict[str, object] = {
+                "firstResult": first_result,
+                "maxResults": max_results,
+            }
+            if deserialize_values is not None:
+                params["deserializeValues"] = deserialize_values
+            response = self._client.post(
+                self._path(ProcessEndpoint.VARIABLE_INSTANCES.value),
+                params=params,
+                json=query,
+            )
+            payload = self._json(response)
+            if not isinstance(payload, list):
+                raise TypeError("Variable instance response must be a list.")
+            return [
+                VariableInstance.from_dict(item)
+                for item in payload
+                if isinstance(item, dict)
+            ]
+
+        return iter_paged(_fetch, page_size=page_size)
 
+    @traced
+    def modify_variables(
+        self,
+        process_id: str,
+        *,
+        payload: VariableModificationRequest,
+    ) -> None:
+        """Update and/or delete process instance variables in a single request."""
+        self._client.post(
+            self._path(ProcessEndpoint.VARIABLES.value.format(process_id=process_id)),
+            json=payload,
+        )
+
+    @traced
     def cancel(self, process_id: str) -> ProcessCancelResult | None:
         """Cancel a process instance by its identifier."""
         response = self._client.delete(
@@ -98,7 +261,37 @@ class ProcessesAPI(CamSubService):
         )
         if response.status_code == 404:
             return None
-        self._client._raise_for_status(response)
+        self._client.raise_for_status(response)
         if response.status_code == 204:
             return None
-        return ProcessCancelResult.from_dict(response.json())
+        return ProcessCancelResult.from_dict(self._json(response))
+
+    @traced
+    def start(
+        self,
+        key: str,
+        *,
+        payload: ProcessStartRequest,
+    ) -> ProcessStartResult:
+        """
+        Start a process instance of the latest definition with the given key.
+
+        When `payload.tenant_id` is set, the tenant-scoped start endpoint is used.
+        """
+        if payload.tenant_id:
+            path = ProcessEndpoint.START_FOR_TENANT.value.format(
+                key=key, tenant_id=payload.tenant_id
+            )
+        else:
+            path = ProcessEndpoint.START.value.format(key=key)
+        response = self._client.post(
+            self._path(path),
+            json=replace(payload, tenant_id=None),
+        )
+        data = self._json(response)
+        if not isinstance(data, dict):
+            raise TypeError("Process start response must be an object.")
+        result = ProcessStartResult.from_dict(data)
+        if result.process_instance_id is None:
+            result.process_instance_id = data.get("id")
+        return result
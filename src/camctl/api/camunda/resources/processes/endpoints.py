@@ -11,6 +11,10 @@ class ProcessEndpoint(str, Enum):
     DETAIL = "process-instance/{process_id}"
     CANCEL = "process-instance/{process_id}"
     VARIABLES = "process-instance/{process_id}/variables"
+    VARIABLE_DATA = "process-instance/{process_id}/variables/{var_name}/data"
+    VARIABLE_INSTANCES = "variable-instance"
+    START = "process-definition/key/{key}/start"
+    START_FOR_TENANT = "process-definition/key/{key}/tenant-id/{tenant_id}/start"
 
 
 __all__ = ["ProcessEndpoint"]
@@ -1,10 +1,11 @@
 """Process-related data models."""
 
-from .params import ProcessFilterParams, ProcessListParams
+from .params import PROCESS_QUERY_SPEC, ProcessFilterParams, ProcessListParams
 from .payloads import ProcessStartRequest
 from .process import ProcessCancelResult, ProcessInstance, ProcessStartResult
 
 __all__ = [
+    "PROCESS_QUERY_SPEC",
     "ProcessCancelResult",
     "ProcessInstance",
     "ProcessListParams",
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Self
 
+from camctl.api.camunda.common.query import QuerySpec
 from camctl.api.http import SerializeMixin
 
 
@@ -76,9 +77,36 @@ class ProcessFilterParams(SerializeMixin):
 class ProcessListParams(ProcessFilterParams):
     """Parameters for listing process instances."""
 
+    @classmethod
+    def from_filters(cls, filters: ProcessFilterParams | None, **kwargs: Any) -> Self:
+        """List parameters carrying over every filter from `filters`."""
+        values: dict[str, Any] = {}
+        if filters is not None:
+            values = {
+                field.name: getattr(filters, field.name)
+                for field in fields(ProcessFilterParams)
+            }
+        values.update(kwargs)
+        return cls(**values)
+
     page: int | None = None
     size: int | None = None
     first_result: int | None = None
     max_results: int | None = None
     sort_by: str | None = None
     sort_order: str | None = None
+
+
+PROCESS_QUERY_SPEC = QuerySpec(
+    list_fields=frozenset(
+        {
+            "activityIdIn",
+            "processDefinitionKeyIn",
+            "processDefinitionKeyNotIn",
+            "processInstanceIds",
+            "tenantIdIn",
+        }
+    ),
+    variable_fields=frozenset({"variables"}),
+    chunk_fields=frozenset({"processInstanceIds"}),
+)
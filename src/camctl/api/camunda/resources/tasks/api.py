@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterator, List
 
-from camctl.api.camunda.common import Page
-from camctl.api.camunda.service import CamSubService
+from camctl.api.camunda.common import Page, iter_paged
+from camctl.api.camunda.service import DEFAULT_DOWNLOAD_CHUNK_SIZE, CamSubService
+from camctl.tracing import traced
 
 from .endpoints import TaskEndpoint
 from .models import (
+    TASK_QUERY_SPEC,
     Task,
     TaskCompletionRequest,
     TaskCompletionResult,
@@ -26,6 +29,7 @@ class TasksAPI(CamSubService):
 
     URL_PREFIX = ""
 
+    @traced
     def get(self, task_id: str) -> Task | None:
         """Fetch a single task by its identifier."""
         response = self._client.get(
@@ -34,40 +38,77 @@ class TasksAPI(CamSubService):
         )
         if response.status_code == 404:
             return None
-        self._client._raise_for_status(response)
-        return Task.from_dict(response.json())
+        self._client.raise_for_status(response)
+        return Task.from_dict(self._json(response))
 
+    @traced
     def list(self, *, params: TaskListParams | None = None) -> Page[Task]:
-        """List tasks with optional query parameters."""
-        response = self._client.get(
-            self._path(TaskEndpoint.LIST.value),
-            params=params,
-        )
-        payload = response.json()
-        if isinstance(payload, list):
-            items = [Task.from_dict(item) for item in payload if isinstance(item, dict)]
-            return Page(raw={"items": payload}, items=items)
-        if not isinstance(payload, dict):
-            raise TypeError("Task list response must be a list or object.")
-        return Page.from_dict(payload, item_parser=Task.from_dict)
+        """
+        List tasks with optional query parameters.
+
+        Long filters (for example large `taskIdIn` lists) are sent as a POST
+        query; see `CamSubService._query`.
+        """
+        payloads = self._query(TaskEndpoint.LIST.value, params, TASK_QUERY_SPEC)
+        if len(payloads) == 1 and isinstance(payloads[0], dict):
+            return Page.from_dict(payloads[0], item_parser=Task.from_dict)
+        raw_items: list[Dict] = []
+        for payload in payloads:
+            if not isinstance(payload, list):
+                raise TypeError("Task list response must be a list or object.")
+            raw_items.extend(payload)
+        items = [Task.from_dict(item) for item in raw_items if isinstance(item, dict)]
+        return Page(raw={"items": raw_items}, items=items)
+
+    def iterate(
+        self,
+        *,
+        params: TaskFilterParams | None = None,
+        page_size: int = 200,
+        total: int | None = None,
+        reverse: bool = False,
+    ) -> Iterator[Task]:
+        """
+        Yield tasks matching the filters, one page at a time.
 
+        Pages are ordered by task id so offsets stay stable. With
+        `reverse=True` pages are walked from the tail (using `total`, or a
+        count query when omitted), so tasks can be completed while iterating.
+        """
+        if reverse and total is None:
+            total = self.count(params=params)
+
+        def _fetch(first_result: int, max_results: int) -> list[Task]:
+            page = self.list(
+                params=TaskListParams.from_filters(
+                    params,
+                    first_result=first_result,
+                    max_results=max_results,
+                    sort_by="id",
+                    sort_order="asc",
+                )
+            )
+            return list(page.items)
+
+        return iter_paged(_fetch, page_size=page_size, total=total, reverse=reverse)
+
+    @traced
     def count(self, *, params: TaskFilterParams | None = None) -> int:
-        """Count tasks with optional query parameters."""
-        response = self._client.get(
-            self._path(TaskEndpoint.COUNT.value),
-            params=params,
-        )
-        payload = response.json()
-        if isinstance(payload, dict) and "count" in payload:
-            return int(payload["count"])
-        raise TypeError("Task count response must be an object with a count value.")
+        """Count tasks with optional query parameters, POSTing long filters."""
+        total = 0
+        for payload in self._query(TaskEndpoint.COUNT.value, params, TASK_QUERY_SPEC):
+            if not (isinstance(payload, dict) and "count" in payload):
+                raise TypeError("Task count response must be an object with a count value.")
+            total += int(payload["count"])
+        return total
     
+    @traced
     def count_by_candidate_group(self) -> List[CountPerCandidateGroup]:
         """Count tasks grouped by candidate group."""
         response = self._client.get(
             self._path(TaskEndpoint.COUNT_BY_CANDIDATE_GROUP.value),
         )
-        payload = response.json()
+        payload = self._json(response)
         if isinstance(payload, list):
             return [
                 CountPerCandidateGroup.from_dict(item)
@@ -76,6 +117,7 @@ class TasksAPI(CamSubService):
             ]
         raise TypeError("Task count by candidate group response must be a list.")
 
+    @traced
     def list_variables(
         self,
         task_id: str,
@@ -90,7 +132,7 @@ class TasksAPI(CamSubService):
             self._path(TaskEndpoint.TASK_VARIABLES.value.format(task_id=task_id)),
             params=params or None,
         )
-        payload = response.json()
+        payload = self._json(response)
         if isinstance(payload, dict):
             variables: Dict[str, TaskVariable] = {}
             for name, value in payload.items():
@@ -101,6 +143,7 @@ class TasksAPI(CamSubService):
             return variables
         raise TypeError("Task variables response must be an object.")
 
+    @traced
     def list_local_variables(
         self,
         task_id: str,
@@ -115,7 +158,7 @@ class TasksAPI(CamSubService):
             self._path(TaskEndpoint.LOCAL_TASK_VARIABLES.value.format(task_id=task_id)),
             params=params or None,
         )
-        payload = response.json()
+        payload = self._json(response)
         if isinstance(payload, dict):
             variables: Dict[str, TaskVariable] = {}
             for name, value in payload.items():
@@ -126,6 +169,7 @@ class TasksAPI(CamSubService):
             return variables
         raise TypeError("Task local variables response must be an object.")
 
+    @traced
     def modify_local_variables(
         self,
         task_id: str,
@@ -140,6 +184,7 @@ class TasksAPI(CamSubService):
             json=payload,
         )
 
+    @traced
     def modify_variables(
         self,
         task_id: str,
@@ -152,6 +197,7 @@ class TasksAPI(CamSubService):
             json=payload,
         )
 
+    @traced
     def get_variable(
         self,
         task_id: str,
@@ -169,11 +215,12 @@ class TasksAPI(CamSubService):
             ),
             params=params or None,
         )
-        payload = response.json()
+        payload = self._json(response)
         if isinstance(payload, dict):
             return TaskVariable.from_dict(payload)
         raise TypeError("Task variable response must be an object.")
 
+    @traced
     def get_local_variable(
         self,
         task_id: str,
@@ -193,11 +240,56 @@ class TasksAPI(CamSubService):
             ),
             params=params or None,
         )
-        payload = response.json()
+        payload = self._json(response)
         if isinstance(payload, dict):
             return TaskVariable.from_dict(payload)
         raise TypeError("Task local variable response must be an object.")
 
+    @traced
+    def download_variable(
+        self,
+        task_id: str,
+        var_name: str,
+        destination: Path,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int | None:
+        """
+        Stream the binary content of a File/Bytes task variable to a file.
+
+        Returns the number of bytes written, or None if the task or variable
+        does not exist.
+        """
+        return self._download(
+            TaskEndpoint.TASK_VARIABLE_DATA.value.format(task_id=task_id, var_name=var_name),
+            destination,
+            chunk_size=chunk_size,
+        )
+
+    @traced
+    def download_local_variable(
+        self,
+        task_id: str,
+        var_name: str,
+        destination: Path,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int | None:
+        """
+        Stream the binary content of a File/Bytes local task variable to a file.
+
+        Returns the number of bytes written, or None if the task or variable
+        does not exist.
+        """
+        return self._download(
+            TaskEndpoint.LOCAL_TASK_VARIABLE_DATA.value.format(
+                task_id=task_id, var_name=var_name
+            ),
+            destination,
+            chunk_size=chunk_size,
+        )
+
+    @traced
     def update_variable(
         self,
         task_id: str,
@@ -213,6 +305,7 @@ class TasksAPI(CamSubService):
             json=payload,
         )
 
+    @traced
     def update_local_variable(
         self,
         task_id: str,
@@ -230,6 +323,7 @@ class TasksAPI(CamSubService):
             json=payload,
         )
 
+    @traced
     def delete_variable(
         self,
         task_id: str,
@@ -242,6 +336,7 @@ class TasksAPI(CamSubService):
             ),
         )
 
+    @traced
     def delete_local_variable(
         self,
         task_id: str,
@@ -256,6 +351,7 @@ class TasksAPI(CamSubService):
             ),
         )
 
+    @traced
     def complete(
         self,
         task_id: str,
@@ -270,7 +366,7 @@ class TasksAPI(CamSubService):
         )
         if response.status_code == 404:
             return None
-        self._client._raise_for_status(response)
+        self._client.raise_for_status(response)
         if response.status_code == 204:
             return None
-        return TaskCompletionResult.from_dict(response.json())
+        return TaskCompletionResult.from_dict(self._json(response))
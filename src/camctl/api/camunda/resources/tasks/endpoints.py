@@ -14,7 +14,9 @@ class TaskEndpoint(str, Enum):
     TASK_VARIABLES = "task/{task_id}/variables"
     TASK_VARIABLE = "task/{task_id}/variables/{var_name}"
     LOCAL_TASK_VARIABLES = "task/{task_id}/localVariables"
+    TASK_VARIABLE_DATA = "task/{task_id}/variables/{var_name}/data"
     LOCAL_TASK_VARIABLE = "task/{task_id}/localVariables/{var_name}"
+    LOCAL_TASK_VARIABLE_DATA = "task/{task_id}/localVariables/{var_name}/data"
     
     
 
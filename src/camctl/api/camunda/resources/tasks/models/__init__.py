@@ -1,6 +1,6 @@
 """Task-related data models."""
 
-from .params import TaskFilterParams, TaskListParams
+from .params import TASK_QUERY_SPEC, TaskFilterParams, TaskListParams
 from .payloads import (
     TaskCompletionRequest,
     TaskVariableModificationRequest,
@@ -16,6 +16,7 @@ from .task import (
 )
 
 __all__ = [
+    "TASK_QUERY_SPEC",
     "Task",
     "CamundaFormRef",
     "TaskCompletionRequest",
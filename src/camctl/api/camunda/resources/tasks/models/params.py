@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Self
 
+from camctl.api.camunda.common.query import QuerySpec
 from camctl.api.http import SerializeMixin
 
 
@@ -158,9 +159,41 @@ class TaskFilterParams(SerializeMixin):
 class TaskListParams(TaskFilterParams):
     """Parameters for listing tasks."""
 
+    @classmethod
+    def from_filters(cls, filters: TaskFilterParams | None, **kwargs: Any) -> Self:
+        """List parameters carrying over every filter from `filters`."""
+        values: dict[str, Any] = {}
+        if filters is not None:
+            values = {
+                field.name: getattr(filters, field.name)
+                for field in fields(TaskFilterParams)
+            }
+        values.update(kwargs)
+        return cls(**values)
+
     page: int | None = None
     size: int | None = None
     first_result: int | None = None
     max_results: int | None = None
     sort_by: str | None = None
     sort_order: str | None = None
+
+
+TASK_QUERY_SPEC = QuerySpec(
+    list_fields=frozenset(
+        {
+            "activityInstanceIdIn",
+            "assigneeIn",
+            "assigneeNotIn",
+            "candidateGroups",
+            "processDefinitionKeyIn",
+            "processInstanceBusinessKeyIn",
+            "processInstanceIdIn",
+            "taskDefinitionKeyIn",
+            "taskIdIn",
+            "tenantIdIn",
+        }
+    ),
+    variable_fields=frozenset({"caseInstanceVariables", "processVariables", "taskVariables"}),
+    chunk_fields=frozenset({"processInstanceIdIn", "taskIdIn"}),
+)
@@ -2,16 +2,80 @@
 
 from __future__ import annotations
 
+from http import HTTPMethod
+from pathlib import Path
+from typing import Any
+
+from camctl.api.http import SerializeMixin
 from camctl.api.http.service import SubService
 from camctl.api.camunda.client import CamundaClient
+from camctl.api.camunda.common.query import (
+    DEFAULT_MAX_IN_LIST,
+    DEFAULT_MAX_QUERY_LENGTH,
+    QuerySpec,
+    query_length,
+)
+from camctl.utils.files import write_chunks_atomic
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class CamSubService(SubService[CamundaClient]):
     """Base class for API sub-services using a shared HTTP client."""
 
+    MAX_QUERY_LENGTH = DEFAULT_MAX_QUERY_LENGTH
+    MAX_IN_LIST = DEFAULT_MAX_IN_LIST
+
     def __init__(self, client: CamundaClient) -> None:
         super().__init__(client=client)
 
+    def _query(
+        self,
+        path: str,
+        params: SerializeMixin | None,
+        spec: QuerySpec,
+    ) -> list[Any]:
+        """
+        Run a filter query and return the decoded payload of every request made.
+
+        Queries go out as GET query strings unless the encoded string would be
+        longer than `MAX_QUERY_LENGTH`, in which case the same query is POSTed
+        as a JSON body. Id lists longer than `MAX_IN_LIST` are split across
+        several requests (see `QuerySpec.split`).
+        """
+        payload = params.to_api_dict() if params is not None else {}
+        results: list[Any] = []
+        for chunk in spec.split(payload, self.MAX_IN_LIST):
+            if query_length(chunk) <= self.MAX_QUERY_LENGTH:
+                response = self._client.get(self._path(path), params=chunk or None)
+            else:
+                body, query = spec.to_body(chunk)
+                response = self._client.post(self._path(path), params=query or None, json=body)
+            results.append(self._json(response))
+        return results
+
+    def _download(
+        self,
+        path: str,
+        destination: Path,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> int | None:
+        """
+        Stream a binary endpoint into `destination` chunk by chunk.
+
+        Returns the number of bytes written, or None when the resource is not
+        found (in which case no file is written).
+        """
+        with self._client.stream(
+            HTTPMethod.GET,
+            self._path(path),
+            allow_error=True,
+        ) as response:
+            if response.status_code == 404:
+                return None
+            self._client.raise_for_status(response)
+            return write_chunks_atomic(response.iter_bytes(chunk_size), destination)
 
 
-__all__ = ["CamSubService"]
+__all__ = ["CamSubService", "DEFAULT_DOWNLOAD_CHUNK_SIZE"]
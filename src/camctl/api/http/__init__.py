@@ -1,15 +1,28 @@
 
 from .base import BaseHTTPClient, HTTPClient
+from .cassette import Cassette, CassetteMissError, RecordingTransport, Redactor, ReplayTransport
 from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from .metrics import ClientMetrics, MetricsRegistry, MetricsServer, write_textfile
 from .serialize import IdentitySerializer, SerializeMixin, Serializer, SnakeToCamelSerializer
+from .timings import TimingCollector
 
 __all__ = [
     "BaseHTTPClient",
+    "Cassette",
+    "CassetteMissError",
     "CircuitBreaker",
     "CircuitBreakerOpenError",
+    "ClientMetrics",
     "HTTPClient",
+    "RecordingTransport",
+    "Redactor",
+    "ReplayTransport",
     "IdentitySerializer",
+    "MetricsRegistry",
+    "MetricsServer",
     "SerializeMixin",
     "Serializer",
     "SnakeToCamelSerializer",
+    "TimingCollector",
+    "write_textfile",
 ]
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from http import HTTPMethod
-from typing import Any, Mapping, MutableMapping, Optional, Self
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, MutableMapping, Optional, Self
 from urllib.parse import urljoin
 
 import httpx
 
-from camctl.api.http.circuit_breaker import CircuitBreaker
+from camctl.api.http.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 from camctl.api.http.serialize import IdentitySerializer, Serializer
+from camctl.api.http.timings import RequestTiming, TimingCollector, endpoint_template
+from camctl.tracing import Span, span, traceparent
+
+if TYPE_CHECKING:
+    from camctl.api.http.metrics import ClientMetrics
 
 logger = logging.getLogger(__name__)
 
+_request_ids = itertools.count(1)
+
 class HTTPClient(ABC):
     """
     Abstract HTTP client definition.
@@ -77,6 +87,7 @@ class HTTPClient(ABC):
         self,
         path: str,
         *,
+        params: Optional[Any] = None,
         data: Optional[Any] = None,
         json: Optional[Any] = None,
         headers: Optional[Mapping[str, str]] = None,
@@ -89,6 +100,7 @@ class HTTPClient(ABC):
         return self.request(
             HTTPMethod.POST,
             path,
+            params=params,
             data=data,
             json=json,
             headers=headers,
@@ -240,26 +252,48 @@ class BaseHTTPClient(HTTPClient):
         client: Optional[httpx.Client] = None,
         serializer: Serializer | None = None,
         circuit_breaker: CircuitBreaker | None = None,
+        transport: httpx.BaseTransport | None = None,
+        timings: TimingCollector | None = None,
+        metrics: ClientMetrics | None = None,
     ) -> None:
         resolved_serializer = serializer or IdentitySerializer()
         super().__init__(base_url, timeout=timeout, serializer=resolved_serializer)
         self._circuit_breaker = circuit_breaker
+        self._timings = timings
+        self._metrics = metrics
         self._owns_client = client is None
         if client is None:
             auth = httpx.BasicAuth(*basic_auth) if basic_auth else None
-            self._client = httpx.Client(timeout=timeout, auth=auth)
+            self._client = httpx.Client(timeout=timeout, auth=auth, transport=transport)
             self._default_headers: MutableMapping[str, str] = dict(default_headers or {})
         else:
             self._client = client
             self._default_headers = dict(client.headers)
             if default_headers:
                 self._default_headers.update(default_headers)
+        if metrics is not None:
+            metrics.attach(self.base_url, breaker=circuit_breaker, client=self._client)
 
     @property
     def session(self) -> httpx.Client:
         """Return the underlying httpx client instance."""
         return self._client
 
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Return the circuit breaker guarding requests, if any."""
+        return self._circuit_breaker
+
+    @property
+    def timings(self) -> TimingCollector | None:
+        """Return the collector of per-request phase timings, if enabled."""
+        return self._timings
+
+    @property
+    def metrics(self) -> ClientMetrics | None:
+        """Return the metrics this client reports to, if any."""
+        return self._metrics
+
     def _build_url(self, path: str) -> str:
         """Return an absolute URL for the provided path."""
         return urljoin(self.base_url, path.lstrip("/"))
@@ -267,7 +301,7 @@ class BaseHTTPClient(HTTPClient):
     def _build_request_headers(
         self,
         headers: Optional[Mapping[str, str]],
-    ) -> Mapping[str, str]:
+    ) -> MutableMapping[str, str]:
         """Compose merged headers for a single request."""
         merged: MutableMapping[str, str] = dict(self._default_headers)
         if headers:
@@ -308,35 +342,191 @@ class BaseHTTPClient(HTTPClient):
         """
         url = self._build_url(path)
         request_headers = self._build_request_headers(headers)
-        if self._circuit_breaker is not None:
-            self._circuit_breaker.before_request()
-        logger.debug("HTTP %s %s", method.value, url)
+        self._before_request(method, path)
+        with self._span(method, path, url, request_headers) as current:
+            timing = self._start_timing(method, path)
+            started = time.perf_counter()
+            try:
+                response = self._client.request(
+                    method.value,
+                    url,
+                    params=self._serializer.serialize(params),
+                    data=self._serializer.serialize(data),
+                    json=self._serializer.serialize(json),
+                    headers=request_headers,
+                    timeout=timeout if timeout is not None else self.timeout,
+                    files=files,
+                    extensions={"trace": timing.trace} if timing else None,
+                )
+            except httpx.HTTPError as exc:
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure()
+                self._observe(method, path, "error")
+                self._log_request(method, url, started, error=exc)
+                raise
+            finally:
+                if timing is not None:
+                    timing.finish()
+            if current is not None:
+                current.set(**{"http.status_code": response.status_code})
+
+        self._record_response(response)
+        self._observe(method, path, response.status_code, time.perf_counter() - started)
+        self._log_request(method, url, started, status=response.status_code)
+        if not allow_error:
+            self.raise_for_status(response)
+        return response
+
+    @contextmanager
+    def stream(
+        self,
+        method: HTTPMethod,
+        path: str,
+        *,
+        params: Optional[Any] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_error: bool = False,
+    ) -> Iterator[httpx.Response]:
+        """
+        Execute a request without reading the response body up front.
+
+        The yielded response must be consumed inside the `with` block, for
+        example with `response.iter_bytes()`, so large payloads never have to
+        fit in memory. Error responses are read before raising so error
+        details stay available.
+
+        The circuit breaker, metrics and debug log record the outcome once
+        the body has been read, so a connection dropped mid-body counts as
+        one failure.
+        """
+        url = self._build_url(path)
+        request_headers = self._build_request_headers(headers)
+        self._before_request(method, path)
+        with self._span(method, path, url, request_headers) as current:
+            timing = self._start_timing(method, path)
+            started = time.perf_counter()
+            response: httpx.Response | None = None
+            error: httpx.HTTPError | None = None
+            try:
+                with self._client.stream(
+                    method.value,
+                    url,
+                    params=self._serializer.serialize(params),
+                    headers=request_headers,
+                    timeout=timeout if timeout is not None else self.timeout,
+                    extensions={"trace": timing.trace} if timing else None,
+                ) as response:
+                    if current is not None:
+                        current.set(**{"http.status_code": response.status_code})
+                    if response.is_error:
+                        response.read()
+                        if not allow_error:
+                            self.raise_for_status(response)
+                    yield response
+            except httpx.HTTPStatusError:
+                raise
+            except httpx.HTTPError as exc:
+                error = exc
+                raise
+            finally:
+                if timing is not None:
+                    timing.finish()
+                if error is not None:
+                    if self._circuit_breaker is not None:
+                        self._circuit_breaker.record_failure()
+                    self._observe(method, path, "error")
+                    self._log_request(method, url, started, error=error)
+                elif response is not None:
+                    self._record_response(response)
+                    self._observe(
+                        method, path, response.status_code, time.perf_counter() - started
+                    )
+                    self._log_request(method, url, started, status=response.status_code)
+
+    @contextmanager
+    def _span(
+        self,
+        method: HTTPMethod,
+        path: str,
+        url: str,
+        headers: MutableMapping[str, str],
+    ) -> Iterator[Span | None]:
+        """Trace the request and send its W3C trace context to the server."""
+        with span(
+            f"HTTP {method.value} {endpoint_template(path)}",
+            **{"http.method": method.value, "http.url": url},
+        ) as current:
+            header = traceparent()
+            if header is not None:
+                headers["traceparent"] = header
+            yield current
+
+    def _before_request(self, method: HTTPMethod, path: str) -> None:
+        """Let the circuit breaker refuse the request before anything is sent."""
+        if self._circuit_breaker is None:
+            return
         try:
-            response = self._client.request(
-                method.value,
-                url,
-                params=self._serializer.serialize(params),
-                data=self._serializer.serialize(data),
-                json=self._serializer.serialize(json),
-                headers=request_headers,
-                timeout=timeout if timeout is not None else self.timeout,
-                files=files,
-            )
-        except httpx.HTTPError:
-            if self._circuit_breaker is not None:
-                self._circuit_breaker.record_failure()
+            self._circuit_breaker.before_request()
+        except CircuitBreakerOpenError:
+            self._observe(method, path, "rejected")
             raise
 
-        if self._circuit_breaker is not None:
-            if response.status_code >= 500:
-                self._circuit_breaker.record_failure()
-            else:
-                self._circuit_breaker.record_success()
-        if not allow_error:
-            self._raise_for_status(response)
-        return response
+    def _observe(
+        self,
+        method: HTTPMethod,
+        path: str,
+        status: int | str,
+        seconds: float | None = None,
+    ) -> None:
+        """Report a request outcome to the attached metrics, if any."""
+        if self._metrics is not None:
+            self._metrics.observe(method.value, path, status, seconds)
+
+    def _log_request(
+        self,
+        method: HTTPMethod,
+        url: str,
+        started: float,
+        *,
+        status: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Log a finished request at debug level, with structured fields for JSON logs."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        fields: dict[str, Any] = {
+            "request_id": next(_request_ids),
+            "method": method.value,
+            "url": url,
+            "status_code": status,
+            "duration_ms": duration_ms,
+        }
+        if error is not None:
+            fields["error"] = type(error).__name__
+            logger.debug("HTTP %s %s failed: %s", method.value, url, fields["error"], extra=fields)
+            return
+        logger.debug(
+            "HTTP %s %s -> %s in %.1f ms", method.value, url, status, duration_ms, extra=fields
+        )
+
+    def _start_timing(self, method: HTTPMethod, path: str) -> RequestTiming | None:
+        """Begin timing a request when a `TimingCollector` is attached."""
+        if self._timings is None:
+            return None
+        return self._timings.start(method.value, path)
+
+    def _record_response(self, response: httpx.Response) -> None:
+        """Report the response outcome to the circuit breaker."""
+        if self._circuit_breaker is None:
+            return
+        if response.status_code >= 500:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
 
-    def _raise_for_status(self, response: httpx.Response) -> None:
+    def raise_for_status(self, response: httpx.Response) -> None:
         """Raise an exception for an error response."""
         response.raise_for_status()
 
@@ -0,0 +1,401 @@
+"""Record HTTP traffic to a cassette file and replay it without a server.
+
+`RecordingTransport` wraps a real httpx transport and captures every
+request/response pair with its timing. `ReplayTransport` answers requests
+from a saved `Cassette`, optionally sleeping for the recorded response time
+(scaled by `speed`), so a CLI run can be repeated and profiled offline with
+the same traffic shape.
+
+Cassettes are JSON Lines (gzip-compressed when the file name ends in `.gz`):
+a header line followed by one line per interaction. JSON bodies are stored
+as JSON rather than escaped strings. Request headers are never stored, and
+values under sensitive keys (passwords, tokens, secrets, ...) in query
+strings and JSON bodies, including the `value` of `{"name": ..., "value":
+...}` variable entries with a sensitive name, are replaced before anything
+is written.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import IO, Any, Callable, Mapping
+
+import httpx
+
+CASSETTE_VERSION = 1
+REDACTED = "***"
+DEFAULT_SENSITIVE_KEYS = r"pass(word)?|secret|token|api[-_]?key|credential|authori[sz]ation|cookie"
+
+# Headers that describe the body on the wire; recorded responses carry the
+# decoded body, so these no longer apply to it.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(httpx.TransportError):
+    """Raised on replay when the cassette holds no response for a request."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class Redactor:
+    """
+    Masks values stored under sensitive keys.
+
+    `pattern` is matched (case-insensitively, anywhere in the key) against
+    query parameter names and JSON object keys at any depth. JSON objects
+    with a sensitive `name`, such as `{"name": "password", "value": "..."}`
+    variable entries and filters, also have their `value` masked.
+    """
+
+    pattern: str = DEFAULT_SENSITIVE_KEYS
+
+    @cached_property
+    def _regex(self) -> re.Pattern[str]:
+        return re.compile(self.pattern, re.IGNORECASE)
+
+    def is_sensitive(self, key: str) -> bool:
+        return bool(self._regex.search(key))
+
+    def url(self, url: httpx.URL) -> str:
+        params = [
+            (key, REDACTED if self.is_sensitive(key) else value)
+            for key, value in url.params.multi_items()
+        ]
+        return str(url.copy_with(params=params or None))
+
+    def json(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            name = value.get("name")
+            named_secret = isinstance(name, str) and self.is_sensitive(name)
+            return {
+                key: (
+                    REDACTED
+                    if self.is_sensitive(str(key)) or (named_secret and key == "value")
+                    else self.json(item)
+                )
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self.json(item) for item in value]
+        return value
+
+
+@dataclass(kw_only=True)
+class Interaction:
+    """One recorded request and its response (or transport error)."""
+
+    method: str
+    url: str
+    status: int = 0
+    request_body: dict[str, Any] | None = None
+    response_body: dict[str, Any] | None = None
+    content_type: str | None = None
+    error: str | None = None
+    started: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return request_key(self.method, self.url, self.request_body)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "t": round(self.started, 6),
+            "elapsed": round(self.elapsed, 6),
+            "method": self.method,
+            "url": self.url,
+        }
+        if self.request_body is not None:
+            data["request"] = self.request_body
+        if self.error is not None:
+            data["error"] = self.error
+        else:
+            data["status"] = self.status
+            if self.content_type:
+                data["content_type"] = self.content_type
+            if self.response_body is not None:
+                data["response"] = self.response_body
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Interaction:
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status=data.get("status", 0),
+            request_body=data.get("request"),
+            response_body=data.get("response"),
+            content_type=data.get("content_type"),
+            error=data.get("error"),
+            started=data.get("t", 0.0),
+            elapsed=data.get("elapsed", 0.0),
+        )
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        headers = {"content-type": self.content_type} if self.content_type else None
+        return httpx.Response(
+            self.status,
+            headers=headers,
+            content=_decode_body(self.response_body),
+            request=request,
+        )
+
+
+@dataclass(kw_only=True)
+class Cassette:
+    """
+    Interactions in the order their responses arrived.
+
+    Several `RecordingTransport`s (one per client) can share a cassette;
+    request start times are offsets from the first request any of them saw.
+    """
+
+    interactions: list[Interaction] = field(default_factory=list)
+    recorded_at: str = field(default_factory=lambda: datetime.now().astimezone().isoformat())
+    redact: str = DEFAULT_SENSITIVE_KEYS
+    _origin: float | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def offset(self, now: float) -> float:
+        """Return `now` relative to the first request recorded."""
+        with self._lock:
+            if self._origin is None:
+                self._origin = now
+            return now - self._origin
+
+    def append(self, interaction: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            interactions = list(self.interactions)
+        with _open(path, "wt") as handle:
+            header = {
+                "cassette": CASSETTE_VERSION,
+                "recorded_at": self.recorded_at,
+                "redact": self.redact,
+                "interactions": len(interactions),
+            }
+            handle.write(_dumps(header) + "\n")
+            for interaction in interactions:
+                handle.write(_dumps(interaction.to_dict()) + "\n")
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        with _open(path, "rt") as handle:
+            lines = [line for line in handle if line.strip()]
+        if not lines:
+            raise ValueError(f"{path} is empty.")
+        header = json.loads(lines[0])
+        if header.get("cassette") != CASSETTE_VERSION:
+            raise ValueError(f"{path} is not a version {CASSETTE_VERSION} cassette.")
+        return cls(
+            interactions=[Interaction.from_dict(json.loads(line)) for line in lines[1:]],
+            recorded_at=header.get("recorded_at", ""),
+            redact=header.get("redact", DEFAULT_SENSITIVE_KEYS),
+        )
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """
+    Transport that forwards to `transport` and records every exchange.
+
+    Response bodies are read in full so they can be stored; the returned
+    response carries the same, already decoded, content. Transport errors
+    are recorded by class name and re-raised.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport | None = None,
+        *,
+        cassette: Cassette | None = None,
+        redactor: Redactor | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._transport = transport or httpx.HTTPTransport()
+        self.redactor = redactor or Redactor()
+        self.cassette = cassette or Cassette(redact=self.redactor.pattern)
+        self._clock = clock
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = self._clock()
+        interaction = Interaction(
+            method=request.method,
+            url=self.redactor.url(request.url),
+            request_body=_encode_body(request.read(), request.headers, self.redactor),
+            started=self.cassette.offset(started),
+        )
+        try:
+            response = self._transport.handle_request(request)
+            content = response.read()
+        except httpx.TransportError as exc:
+            interaction.error = type(exc).__name__
+            self._append(interaction, started)
+            raise
+        interaction.status = response.status_code
+        interaction.content_type = response.headers.get("content-type")
+        interaction.response_body = _encode_body(content, response.headers, self.redactor)
+        self._append(interaction, started)
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _WIRE_HEADERS
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def _append(self, interaction: Interaction, started: float) -> None:
+        interaction.elapsed = self._clock() - started
+        self.cassette.append(interaction)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    Transport that answers requests from a cassette.
+
+    Requests are matched on method, URL and body (after the same redaction
+    used when recording). Repeated identical requests get their recorded
+    responses in order; once those run out the last one is served again, or
+    `CassetteMissError` is raised when `repeat_last` is False.
+
+    `speed` scales the recorded response times: 1 replays at recorded speed,
+    10 ten times faster, and 0 answers immediately.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        speed: float = 1.0,
+        repeat_last: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        self.speed = speed
+        self.repeat_last = repeat_last
+        self.redactor = Redactor(pattern=cassette.redact)
+        self._sleep = sleep
+        self._queues: dict[str, deque[Interaction]] = defaultdict(deque)
+        self._last: dict[str, Interaction] = {}
+        self._lock = threading.Lock()
+        for interaction in cassette.interactions:
+            self._queues[interaction.key].append(interaction)
+
+    @classmethod
+    def from_file(cls, path: Path, **options: Any) -> ReplayTransport:
+        return cls(Cassette.load(path), **options)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(
+            request.method,
+            self.redactor.url(request.url),
+            _encode_body(request.read(), request.headers, self.redactor),
+        )
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            elif self.repeat_last and key in self._last:
+                interaction = self._last[key]
+            else:
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url}", request=request
+                )
+        if self.speed and interaction.elapsed > 0:
+            self._sleep(interaction.elapsed / self.speed)
+        if interaction.error is not None:
+            raise _transport_error(interaction.error)(
+                f"Recorded {interaction.error}", request=request
+            )
+        return interaction.to_response(request)
+
+
+def request_key(method: str, url: str, body: Mapping[str, Any] | None) -> str:
+    """Identify a request by method, URL (sorted query) and body digest."""
+    parsed = httpx.URL(url)
+    query = sorted(parsed.params.multi_items())
+    target = parsed.copy_with(params=query or None)
+    digest = ""
+    if body is not None:
+        digest = hashlib.sha1(_dumps(body, sort_keys=True).encode()).hexdigest()[:16]
+    return f"{method.upper()} {target} {digest}".rstrip()
+
+
+def _encode_body(
+    content: bytes, headers: httpx.Headers, redactor: Redactor
+) -> dict[str, Any] | None:
+    if not content:
+        return None
+    if "json" in headers.get("content-type", ""):
+        try:
+            return {"json": redactor.json(json.loads(content))}
+        except ValueError:
+            pass
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: Mapping[str, Any] | None) -> bytes:
+    if not body:
+        return b""
+    if "json" in body:
+        return json.dumps(body["json"]).encode()
+    if "text" in body:
+        return body["text"].encode("utf-8")
+    return base64.b64decode(body["base64"])
+
+
+def _transport_error(name: str) -> type[httpx.TransportError]:
+    error_class = getattr(httpx, name, None)
+    if isinstance(error_class, type) and issubclass(error_class, httpx.TransportError):
+        return error_class
+    return httpx.TransportError
+
+
+def _dumps(value: Any, *, sort_keys: bool = False) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode.replace("t", ""), encoding="utf-8")
+
+
+__all__ = [
+    "CASSETTE_VERSION",
+    "Cassette",
+    "CassetteMissError",
+    "DEFAULT_SENSITIVE_KEYS",
+    "Interaction",
+    "REDACTED",
+    "RecordingTransport",
+    "Redactor",
+    "ReplayTransport",
+    "request_key",
+]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from time import monotonic
+from typing import Callable
 
 
 class CircuitBreakerOpenError(RuntimeError):
@@ -23,10 +24,12 @@ class CircuitBreaker:
 
     The breaker opens after `failure_threshold` consecutive failures. After
     `recovery_timeout_seconds`, one trial request is permitted in half-open.
+    `on_state_change(old, new)` is called on every state transition.
     """
 
     failure_threshold: int = 5
     recovery_timeout_seconds: float = 30.0
+    on_state_change: Callable[[str, str], None] | None = None
 
     def __post_init__(self) -> None:
         if self.failure_threshold < 1:
@@ -36,11 +39,17 @@ class CircuitBreaker:
         self._failure_count = 0
         self._state = "closed"
         self._opened_at = 0.0
+        self._trips = 0
 
     @property
     def state(self) -> str:
         return self._state
 
+    @property
+    def trips(self) -> int:
+        """Number of times the breaker has opened."""
+        return self._trips
+
     def before_request(self) -> None:
         """Check whether a request is allowed and update state if needed."""
         if self._state != "open":
@@ -48,14 +57,14 @@ class CircuitBreaker:
         now = monotonic()
         elapsed = now - self._opened_at
         if elapsed >= self.recovery_timeout_seconds:
-            self._state = "half-open"
+            self._set_state("half-open")
             return
         raise CircuitBreakerOpenError(self.recovery_timeout_seconds - elapsed)
 
     def record_success(self) -> None:
         """Record a successful call and close/reset the breaker."""
         self._failure_count = 0
-        self._state = "closed"
+        self._set_state("closed")
 
     def record_failure(self) -> None:
         """Record a failed call and open/keep-open the breaker if needed."""
@@ -67,8 +76,14 @@ class CircuitBreaker:
             self._open()
 
     def _open(self) -> None:
-        self._state = "open"
+        self._set_state("open")
         self._opened_at = monotonic()
+        self._trips += 1
+
+    def _set_state(self, state: str) -> None:
+        previous, self._state = self._state, state
+        if previous != state and self.on_state_change is not None:
+            self.on_state_change(previous, state)
 
 
 __all__ = [
@@ -0,0 +1,502 @@
+"""Client-side metrics in the Prometheus text exposition format.
+
+A `MetricsRegistry` holds counters, gauges and histograms. `ClientMetrics`
+defines the standard engine-client metrics on a registry. Attach it to
+`BaseHTTPClient` (or `CamundaClient`) with `metrics=`, and every request
+records:
+
+- `camctl_http_requests_total{method,endpoint,status}`, where status is the
+  HTTP status code, `error` for transport failures or `rejected` when the
+  circuit breaker refused the request,
+- `camctl_http_request_duration_seconds{method,endpoint}`,
+- `camctl_circuit_breaker_transitions_total{target,from,to}` and the current
+  `camctl_circuit_breaker_state{target,state}`,
+- `camctl_http_pool_connections{target,state}` (active/idle connections),
+- `camctl_query_cache_requests_total{result}` from the CLI query cache.
+
+Endpoints are path templates (see `timings.endpoint_template`), so label
+cardinality stays bounded by the API surface.
+
+Updates take no lock: each thread writes its own cells, and the cells are
+summed when the registry is collected. Expose the registry with
+`MetricsServer` (a local `/metrics` endpoint) or `write_textfile` (for the
+node_exporter textfile collector).
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Self, Sequence
+
+from camctl.api.http.timings import endpoint_template
+
+if TYPE_CHECKING:
+    import httpx
+
+    from camctl.api.http.circuit_breaker import CircuitBreaker
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+BREAKER_STATES = ("closed", "open", "half-open")
+
+
+class _Cells:
+    """
+    A fixed-size row of numbers updated without locking.
+
+    Each thread gets its own row the first time it writes (registering it
+    is the only locked step); `totals` adds the rows up. Rows of threads
+    that have exited are folded into a base row so short-lived worker
+    threads do not accumulate.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._rows: list[tuple[weakref.ref[threading.Thread], list[float]]] = []
+        self._retired = [0.0] * size
+
+    def row(self) -> list[float]:
+        row = getattr(self._local, "row", None)
+        if row is None:
+            row = [0.0] * self._size
+            with self._lock:
+                self._rows.append((weakref.ref(threading.current_thread()), row))
+            self._local.row = row
+        return row
+
+    def totals(self) -> list[float]:
+        with self._lock:
+            live = []
+            for thread_ref, row in self._rows:
+                thread = thread_ref()
+                if thread is None or not thread.is_alive():
+                    self._retired = [a + b for a, b in zip(self._retired, row)]
+                else:
+                    live.append((thread_ref, row))
+            self._rows = live
+            totals = list(self._retired)
+            rows = [row for _, row in live]
+        for row in rows:
+            for index, value in enumerate(row):
+                totals[index] += value
+        return totals
+
+
+class Metric:
+    """
+    A metric family: one child per combination of label values.
+
+    Children are created on first use of a label combination; later lookups
+    are a plain dict read.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any, **named: Any) -> Any:
+        """Return the child for the given label values (positional or by name)."""
+        if named:
+            values = tuple(named[name] for name in self.label_names)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """Yield `(sample name, labels, value)` for every child."""
+        for key, child in list(self._children.items()):
+            labels = dict(zip(self.label_names, key))
+            yield from child.samples(self.name, labels)
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self._cells = _Cells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        self._cells.row()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._cells.totals()[0]
+
+    def samples(self, name: str, labels: dict[str, str]):
+        yield name, labels, self.value
+
+
+class Counter(Metric):
+    """Monotonic count; by convention its name ends in `_total`."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class _GaugeChild:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from `function` at collection time instead."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return float(self._function()) if self._function is not None else self._value
+
+    def samples(self, name: str, labels: dict[str, str]):
+        yield name, labels, self.value
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or be computed when collected."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class _HistogramChild:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        # One cell per bucket, then +Inf, sum and count.
+        self._cells = _Cells(len(buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        row = self._cells.row()
+        row[bisect.bisect_left(self._buckets, value)] += 1
+        row[-2] += value
+        row[-1] += 1
+
+    def samples(self, name: str, labels: dict[str, str]):
+        totals = self._cells.totals()
+        cumulative = 0.0
+        for bound, count in zip([*self._buckets, math.inf], totals):
+            cumulative += count
+            yield f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+        yield f"{name}_sum", labels, totals[-2]
+        yield f"{name}_count", labels, totals[-1]
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative `le` buckets, plus sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in the text exposition format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets=buckets))
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _register(self, metric: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or (
+                    existing.label_names != metric.label_names
+                ):
+                    raise ValueError(f"Metric {metric.name} is already registered differently.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+class ClientMetrics:
+    """
+    The standard engine-client metrics, shared by any number of clients.
+
+    Clients constructed with `metrics=` report requests through `observe`
+    and register their circuit breaker and connection pool with `attach`.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        self.requests = self.registry.counter(
+            "camctl_http_requests_total",
+            "Engine REST requests by endpoint and response status.",
+            ("method", "endpoint", "status"),
+        )
+        self.duration = self.registry.histogram(
+            "camctl_http_request_duration_seconds",
+            "Engine REST request duration, from sending to receiving the response.",
+            ("method", "endpoint"),
+        )
+        self.breaker_transitions = self.registry.counter(
+            "camctl_circuit_breaker_transitions_total",
+            "Circuit breaker state changes.",
+            ("target", "from", "to"),
+        )
+        self.breaker_state = self.registry.gauge(
+            "camctl_circuit_breaker_state",
+            "1 for the circuit breaker's current state, 0 for the others.",
+            ("target", "state"),
+        )
+        self.pool_connections = self.registry.gauge(
+            "camctl_http_pool_connections",
+            "HTTP connections held by the client's pool.",
+            ("target", "state"),
+        )
+        self.cache_requests = self.registry.counter(
+            "camctl_query_cache_requests_total",
+            "Query cache lookups by result (hit or miss).",
+            ("result",),
+        )
+
+    def observe(self, method: str, path: str, status: int | str, seconds: float | None) -> None:
+        """Count one request and record its duration when it got a response."""
+        endpoint = endpoint_template(path)
+        self.requests.labels(method, endpoint, status).inc()
+        if seconds is not None:
+            self.duration.labels(method, endpoint).observe(seconds)
+
+    def cache_lookup(self, *, hit: bool) -> None:
+        self.cache_requests.labels("hit" if hit else "miss").inc()
+
+    def attach(
+        self,
+        target: str,
+        *,
+        breaker: CircuitBreaker | None = None,
+        client: httpx.Client | None = None,
+    ) -> None:
+        """Export `breaker` state and `client` pool usage under the `target` label."""
+        if breaker is not None:
+            for state in BREAKER_STATES:
+                self.breaker_state.labels(target, state).set_function(
+                    lambda state=state: float(breaker.state == state)
+                )
+
+            def on_state_change(old: str, new: str) -> None:
+                self.breaker_transitions.labels(target, old, new).inc()
+
+            breaker.on_state_change = on_state_change
+        if client is not None:
+            for state in ("active", "idle"):
+                self.pool_connections.labels(target, state).set_function(
+                    lambda state=state: _pool_connections(client)[state]
+                )
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: _MetricsHTTPServer
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        content = self.server.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], registry: MetricsRegistry) -> None:
+        super().__init__(address, _MetricsHandler)
+        self.registry = registry
+
+
+class MetricsServer:
+    """
+    Serve a registry at `/metrics` from a background thread.
+
+    Binds to localhost by default; `port=0` picks a free port (see `url`).
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, *, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self._server = _MetricsHTTPServer((host, port), registry)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="camctl-metrics",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def write_textfile(registry: MetricsRegistry, path: Path) -> None:
+    """
+    Write the registry for the node_exporter textfile collector.
+
+    The file is replaced atomically so the collector never reads a partial
+    file; point it at a `*.prom` file in the collector's directory.
+    """
+    # Imported here: camctl.utils loads the API models, which import this package.
+    from camctl.utils.files import write_chunks_atomic
+
+    write_chunks_atomic([registry.render().encode()], path)
+
+
+def _pool_connections(client: httpx.Client) -> dict[str, float]:
+    # httpx does not expose its pool; read httpcore's when it is the default transport.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    counts = {"active": 0.0, "idle": 0.0}
+    for connection in getattr(pool, "connections", ()):
+        counts["idle" if connection.is_idle() else "active"] += 1
+    return counts
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+__all__ = [
+    "BREAKER_STATES",
+    "CONTENT_TYPE",
+    "ClientMetrics",
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Gauge",
+    "Histogram",
+    "Metric",
+    "MetricsRegistry",
+    "MetricsServer",
+    "write_textfile",
+]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
+
+import httpx
 
 from camctl.api.http import HTTPClient
+from camctl.api.http.timings import phase
 
 ClientT = TypeVar("ClientT", bound=HTTPClient)
 
@@ -27,5 +30,10 @@ class SubService(Generic[ClientT]):
             return f"{self.URL_PREFIX}/{suffix}"
         return suffix
 
+    def _json(self, response: httpx.Response) -> Any:
+        """Decode a JSON response body, timed as the `decode` phase."""
+        with phase("decode"):
+            return response.json()
+
 
 __all__ = ["SubService"]
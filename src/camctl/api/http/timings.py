@@ -0,0 +1,200 @@
+"""Per-request phase timings aggregated into per-endpoint histograms.
+
+A `TimingCollector` attached to a `BaseHTTPClient` times every request in
+phases:
+
+- `queue`: from the client call until the connection is ready to use
+  (request building plus waiting for a pooled connection),
+- `connect` and `tls`: opening a new connection, when one was needed,
+- `send`: writing the request headers and body,
+- `wait`: server time to first byte, until the response headers arrive,
+- `read`: reading the response body,
+- `decode`: JSON decoding, and `parse`: building models from it.
+
+Network phases come from the httpcore trace hooks, so transports that do
+not emit them (mock or replay transports) only report `total`, `decode`
+and `parse`. `decode` and `parse` run after the client call returns; they
+are attributed to the last request made in the same thread through a
+context variable (see `phase`).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from camctl.utils.stats import Histogram
+
+NETWORK_PHASES = ("queue", "connect", "tls", "send", "wait", "read")
+PHASES = (*NETWORK_PHASES, "decode", "parse")
+TOTAL = "total"
+
+_ID_SEGMENT = re.compile(r"\d")
+
+_current: ContextVar[RequestTiming | None] = ContextVar("camctl_request_timing", default=None)
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Collapse identifiers in a request path, e.g. `task/4f2a.../variables`.
+
+    Any path segment containing a digit is treated as an identifier and
+    replaced with `{id}`, so requests for different resources share one
+    histogram.
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    return "/".join("{id}" if _ID_SEGMENT.search(segment) else segment for segment in segments)
+
+
+@dataclass(kw_only=True)
+class RequestTiming:
+    """Phase durations (in seconds) for one request, until committed."""
+
+    collector: TimingCollector
+    endpoint: str
+    started: float
+    total: float | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    _marks: dict[str, float] = field(default_factory=dict, repr=False)
+    _active: set[str] = field(default_factory=set, repr=False)
+    _committed: bool = field(default=False, repr=False)
+
+    def trace(self, event: str, info: Mapping[str, Any]) -> None:
+        """httpcore trace hook: remember when each connection event happened."""
+        name = event.split(".", 1)[-1]
+        self._marks.setdefault(name, self.collector.clock())
+
+    def finish(self) -> None:
+        """Close the network part of the request; `decode`/`parse` may follow."""
+        self.total = self.collector.clock() - self.started
+        marks = self._marks
+        ready = marks.get("connect_tcp.started", marks.get("send_request_headers.started"))
+        spans = {
+            "queue": (self.started, ready),
+            "connect": (marks.get("connect_tcp.started"), marks.get("connect_tcp.complete")),
+            "tls": (marks.get("start_tls.started"), marks.get("start_tls.complete")),
+            "send": (
+                marks.get("send_request_headers.started"),
+                marks.get("send_request_body.complete"),
+            ),
+            "wait": (
+                marks.get("send_request_body.complete"),
+                marks.get("receive_response_headers.complete"),
+            ),
+            "read": (
+                marks.get("receive_response_body.started"),
+                marks.get("receive_response_body.complete"),
+            ),
+        }
+        for name, (start, end) in spans.items():
+            if start is not None and end is not None:
+                self.phases[name] = end - start
+
+    def commit(self) -> None:
+        """Add this request to the collector's histograms (once)."""
+        self.collector._commit(self)
+
+
+class TimingCollector:
+    """
+    Thread-safe per-endpoint histograms of request phase timings.
+
+    Endpoints are keyed as `"METHOD template"` (see `endpoint_template`).
+    A request is added to the histograms when the next request starts in
+    the same thread, or when `histograms` is read.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._timings: dict[int, RequestTiming] = {}
+        self._histograms: dict[str, dict[str, Histogram]] = {}
+
+    def start(self, method: str, path: str) -> RequestTiming:
+        """Begin timing a request and make it the target of `phase`."""
+        previous = _current.get()
+        if previous is not None:
+            previous.commit()
+        timing = RequestTiming(
+            collector=self,
+            endpoint=f"{method} {endpoint_template(path)}",
+            started=self.clock(),
+        )
+        with self._lock:
+            self._timings[id(timing)] = timing
+        _current.set(timing)
+        return timing
+
+    def histograms(self) -> dict[str, dict[str, Histogram]]:
+        """Return `{endpoint: {phase: Histogram}}` with phases in milliseconds."""
+        with self._lock:
+            pending = list(self._timings.values())
+        for timing in pending:
+            timing.commit()
+        with self._lock:
+            return {endpoint: dict(phases) for endpoint, phases in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+            self._histograms.clear()
+
+    def _commit(self, timing: RequestTiming) -> None:
+        # Imported here: camctl.utils loads the API models, which import this module.
+        from camctl.utils.stats import Histogram
+
+        with self._lock:
+            if timing._committed or self._timings.pop(id(timing), None) is None:
+                return
+            timing._committed = True
+            phases = self._histograms.setdefault(timing.endpoint, {})
+            if timing.total is not None:
+                phases.setdefault(TOTAL, Histogram()).record(timing.total * 1000)
+            for name, seconds in timing.phases.items():
+                phases.setdefault(name, Histogram()).record(seconds * 1000)
+
+
+def current_timing() -> RequestTiming | None:
+    """Return the timing of the last request made in this context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time the block as phase `name` of the current request.
+
+    Does nothing when timings are off. Nested uses of the same phase (for
+    example models parsing nested models) are only counted once, by the
+    outermost block. Also usable as a decorator.
+    """
+    timing = _current.get()
+    if timing is None or timing._committed or name in timing._active:
+        yield
+        return
+    timing._active.add(name)
+    started = timing.collector.clock()
+    try:
+        yield
+    finally:
+        elapsed = timing.collector.clock() - started
+        timing._active.discard(name)
+        timing.phases[name] = timing.phases.get(name, 0.0) + elapsed
+
+
+__all__ = [
+    "NETWORK_PHASES",
+    "PHASES",
+    "RequestTiming",
+    "TOTAL",
+    "TimingCollector",
+    "current_timing",
+    "endpoint_template",
+    "phase",
+]
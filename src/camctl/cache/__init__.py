@@ -0,0 +1,19 @@
+"""Persistent cache of engine query results."""
+
+from .store import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    CacheEntry,
+    QueryCache,
+    cache_key,
+    query_cache_path,
+)
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "CacheEntry",
+    "QueryCache",
+    "cache_key",
+    "query_cache_path",
+]
@@ -0,0 +1,198 @@
+"""SQLite-backed cache of engine query results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Self
+
+from camctl.config.paths import cache_dir
+
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at);
+"""
+
+
+@dataclass(kw_only=True)
+class CacheEntry:
+    """A cached query result and its age."""
+
+    value: Any
+    created_at: float
+    expires_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.created_at)
+
+
+def query_cache_path() -> Path:
+    """Return the query cache database path."""
+    return cache_dir() / "queries.sqlite3"
+
+
+def cache_key(
+    base_url: str,
+    query: str,
+    params: Mapping[str, Any] | None = None,
+) -> str:
+    """
+    Build a cache key for a query against an engine.
+
+    `params` are the serialized API parameters, so filters that produce the
+    same request share an entry regardless of how they were spelled on the
+    command line.
+    """
+    material = json.dumps(
+        {"base_url": base_url.rstrip("/"), "query": query, "params": params or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class QueryCache:
+    """
+    Persistent, size-bounded cache of JSON-serializable query results.
+
+    Values are stored as zlib-compressed JSON with an absolute expiry, so each
+    command picks its own TTL when writing. When the cache grows past
+    `max_entries` or `max_bytes`, expired entries go first and then the least
+    recently read ones.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the live entry for `key`, or None when missing or expired."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at, expires_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+        return CacheEntry(
+            value=json.loads(zlib.decompress(value)),
+            created_at=created_at,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, value: Any, *, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds and enforce the size bounds."""
+        if ttl <= 0:
+            return
+        blob = zlib.compress(
+            json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+        )
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO entries (key, value, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "size = excluded.size, created_at = excluded.created_at, "
+                "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (key, blob, len(blob), now, now + ttl, now),
+            )
+            self._evict(now)
+
+    def clear(self) -> int:
+        """Remove every entry and return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM entries")
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of entries and their total compressed size."""
+        with self._lock:
+            entries, size = self._totals()
+        return {"entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _evict(self, now: float) -> None:
+        entries, size = self._totals()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        entries, size = self._totals()
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        doomed: list[str] = []
+        for key, entry_size in rows:
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            doomed.append(key)
+            entries -= 1
+            size -= entry_size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in doomed])
+
+    def _totals(self) -> tuple[int, int]:
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return int(row[0]), int(row[1])
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "CacheEntry",
+    "QueryCache",
+    "cache_key",
+    "query_cache_path",
+]
@@ -1,5 +1,6 @@
 """Configuration helpers for camctl."""
 
-from .settings import Settings
+from .paths import cache_dir, config_file, engine_slug
+from .settings import EngineProfile, Settings
 
-__all__ = ["Settings"]
+__all__ = ["EngineProfile", "Settings", "cache_dir", "config_file", "engine_slug"]
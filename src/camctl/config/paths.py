@@ -0,0 +1,49 @@
+"""Filesystem locations used by camctl."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = "CAMCTL_CACHE_DIR"
+CONFIG_ENV = "CAMCTL_CONFIG"
+
+
+def cache_dir() -> Path:
+    """
+    Return the camctl cache directory.
+
+    `CAMCTL_CACHE_DIR` wins, then `$XDG_CACHE_HOME/camctl`, then
+    `~/.cache/camctl`. The directory is not created.
+    """
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    xdg = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "camctl"
+
+
+def config_file() -> Path:
+    """
+    Return the settings file path.
+
+    `CAMCTL_CONFIG` wins, then `$XDG_CONFIG_HOME/camctl/config.yaml`, then
+    `~/.config/camctl/config.yaml`. The file may not exist.
+    """
+    override = os.getenv(CONFIG_ENV)
+    if override:
+        return Path(override).expanduser()
+    xdg = os.getenv("XDG_CONFIG_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".config"
+    return base / "camctl" / "config.yaml"
+
+
+def engine_slug(base_url: str) -> str:
+    """Return a short, filesystem-safe identifier for an engine base URL."""
+    normalized = base_url.rstrip("/").lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+__all__ = ["CACHE_DIR_ENV", "CONFIG_ENV", "cache_dir", "config_file", "engine_slug"]
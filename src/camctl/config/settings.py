@@ -8,10 +8,32 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
-import yaml
-
 _ENV_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
+DEFAULT_ENGINE_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass(kw_only=True)
+class EngineProfile:
+    """A named Camunda engine that commands can target."""
+
+    name: str
+    base_url: str
+    timeout: float = DEFAULT_ENGINE_TIMEOUT_SECONDS
+
+    @classmethod
+    def from_value(cls, name: str, value: Any) -> "EngineProfile":
+        """Build a profile from a base URL string or a mapping with `base_url`."""
+        if isinstance(value, str):
+            return cls(name=name, base_url=value)
+        if isinstance(value, Mapping) and value.get("base_url"):
+            return cls(
+                name=name,
+                base_url=str(value["base_url"]),
+                timeout=float(value.get("timeout", DEFAULT_ENGINE_TIMEOUT_SECONDS)),
+            )
+        raise ValueError(f"Engine {name!r} must be a base URL or a mapping with base_url.")
+
 
 @dataclass(kw_only=True)
 class Settings:
@@ -19,11 +41,15 @@ class Settings:
 
     authority: str = "uat"
     scopes: list[str] = field(default_factory=list)
+    engines: dict[str, EngineProfile] = field(default_factory=dict)
+    default_engine: str | None = None
     config_path: Path | None = None
 
     @classmethod
     def from_yaml(cls, path: Path | str) -> "Settings":
         """Load settings from a YAML file, resolving environment variables."""
+        import yaml
+
         config_path = Path(path)
         data = config_path.read_text(encoding="utf-8")
         parsed = yaml.safe_load(data) or {}
@@ -40,9 +66,15 @@ class Settings:
         source = data.get("auth") if isinstance(data.get("auth"), Mapping) else data
         authority = str(source.get("authority", "uat"))
         scopes = _normalize_scopes(source.get("scopes") or source.get("scope"))
+        engines = _parse_engines(data.get("engines"))
+        default_engine = data.get("default_engine")
+        if default_engine is not None and str(default_engine) not in engines:
+            raise ValueError(f"Default engine {default_engine!r} is not defined under engines.")
         return cls(
             authority=authority,
             scopes=scopes,
+            engines=engines,
+            default_engine=None if default_engine is None else str(default_engine),
         )
 
 
@@ -69,6 +101,17 @@ def _replace_env(raw: str) -> str:
     return _ENV_PATTERN.sub(_replace, raw)
 
 
+def _parse_engines(value: Any) -> dict[str, EngineProfile]:
+    if value is None:
+        return {}
+    if not isinstance(value, Mapping):
+        raise ValueError("Engines must be a mapping of profile names to engines.")
+    return {
+        str(name): EngineProfile.from_value(str(name), item)
+        for name, item in value.items()
+    }
+
+
 def _normalize_scopes(value: Any) -> list[str]:
     if value is None:
         return []
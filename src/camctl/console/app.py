@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import httpx
+import sys
+from pathlib import Path
+
 import typer
-from rich.console import Console
 
-from camctl.console.logging import configure_logging
+from camctl.config import Settings, config_file
+from camctl.config.paths import CONFIG_ENV
+from camctl.console.logging import LogFormat, configure_logging, stop_logging
 from camctl.console.context import CLIContext
-from camctl.console.commands.processes import processes_app
-from camctl.console.commands.tasks import tasks_app
+from camctl.console.lazy import LazyCommand, lazy_typer
+from camctl.console.profiling import PSTATS_SUFFIXES, ProfileMode
+
+_COMMANDS = "camctl.console.commands"
 
 
 class CamctlApp(typer.Typer):
@@ -18,18 +23,85 @@ class CamctlApp(typer.Typer):
     def __call__(self, *args, **kwargs):
         try:
             return super().__call__(*args, **kwargs)
-        except (httpx.ConnectError, httpx.ConnectTimeout):
-            console = Console(stderr=True)
-            console.print(
-                "[red][!][/red] Camunda server is not reachable. "
-                "Check the server URL and that it is running."
-            )
-            return 1
+        except Exception as exc:
+            if is_unreachable(exc):
+                print_unreachable()
+                return 1
+            if is_cassette_miss(exc):
+                print_cassette_miss(exc)
+                return 1
+            raise
+
+
+def is_unreachable(exc: BaseException) -> bool:
+    """Return True for httpx connection failures, without importing httpx."""
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def is_cassette_miss(exc: BaseException) -> bool:
+    """Return True when `--replay` has no recorded response for a request."""
+    cassette = sys.modules.get("camctl.api.http.cassette")
+    return cassette is not None and isinstance(exc, cassette.CassetteMissError)
+
+
+def print_cassette_miss(exc: BaseException) -> None:
+    from rich.console import Console
 
+    console = Console(stderr=True)
+    console.print(
+        f"[red][!][/red] {exc}. The cassette was recorded for a different command; "
+        "record it again with --record."
+    )
 
-app = CamctlApp(
+
+def print_unreachable() -> None:
+    """Tell the user the Camunda server could not be reached."""
+    from rich.console import Console
+
+    console = Console(stderr=True)
+    console.print(
+        "[red][!][/red] Camunda server is not reachable. "
+        "Check the server URL and that it is running."
+    )
+
+
+app = lazy_typer(
+    [
+        LazyCommand(
+            name="sync", target=f"{_COMMANDS}.sync:sync_command", help="Sync the local mirror."
+        ),
+        LazyCommand(
+            name="counts",
+            target=f"{_COMMANDS}.counts:counts_command",
+            help="Run a dashboard of counts.",
+        ),
+        LazyCommand(
+            name="bench",
+            target=f"{_COMMANDS}.bench:bench_command",
+            help="Load-test the engine REST API.",
+        ),
+        LazyCommand(
+            name="tasks", target=f"{_COMMANDS}.tasks:tasks_app", help="Manage Camunda tasks."
+        ),
+        LazyCommand(
+            name="processes",
+            target=f"{_COMMANDS}.processes:processes_app",
+            help="Manage Camunda processes.",
+        ),
+        LazyCommand(
+            name="daemon",
+            target=f"{_COMMANDS}.daemon:daemon_app",
+            help="Run a background daemon that keeps camctl and engine connections warm.",
+        ),
+    ],
+    app_class=CamctlApp,
     help="Camunda CLI for interacting with task and process services.",
-    epilog="Env vars: CAMCTL_AUTHORITY.",
+    epilog=(
+        "Env vars: CAMCTL_AUTHORITY, CAMCTL_CONFIG, CAMCTL_ENGINE, CAMCTL_LOG_FILE, "
+        "CAMCTL_LOG_FORMAT, CAMCTL_LOG_SAMPLE, CAMCTL_METRICS_FILE, CAMCTL_METRICS_PORT, "
+        "CAMCTL_RECORD, CAMCTL_REPLAY, CAMCTL_TRACE."
+    ),
     no_args_is_help=True,
 )
 
@@ -51,13 +123,179 @@ def main(
         count=True,
         help="Increase logging verbosity (-v for info, -vv for debug).",
     ),
+    log_format: LogFormat = typer.Option(
+        LogFormat.TEXT,
+        "--log-format",
+        envvar="CAMCTL_LOG_FORMAT",
+        help="Log as text or as JSON lines (to stderr) with request ids, statuses and durations.",
+        case_sensitive=False,
+    ),
+    log_file: Path | None = typer.Option(
+        None,
+        "--log-file",
+        envvar="CAMCTL_LOG_FILE",
+        help="Append log records to this file; the terminal then only shows warnings.",
+        dir_okay=False,
+    ),
+    log_sample: float = typer.Option(
+        1.0,
+        "--log-sample",
+        envvar="CAMCTL_LOG_SAMPLE",
+        help="Fraction of debug records to keep per message (0.1 = one in ten, 0 = first only).",
+        min=0.0,
+        max=1.0,
+    ),
+    config: Path | None = typer.Option(
+        None,
+        "--config",
+        envvar=CONFIG_ENV,
+        help="Settings file (default: ~/.config/camctl/config.yaml when present).",
+        dir_okay=False,
+    ),
+    authority: str | None = typer.Option(
+        None,
+        "--authority",
+        envvar="CAMCTL_AUTHORITY",
+        help="Authority to authenticate against (overrides the settings file).",
+    ),
+    engine: str | None = typer.Option(
+        None,
+        "--engine",
+        "-e",
+        envvar="CAMCTL_ENGINE",
+        help="Engine profile from the settings file to run commands against.",
+    ),
+    record: Path | None = typer.Option(
+        None,
+        "--record",
+        envvar="CAMCTL_RECORD",
+        help="Record engine HTTP traffic (redacted) to a cassette file (.jsonl or .jsonl.gz).",
+        dir_okay=False,
+    ),
+    replay: Path | None = typer.Option(
+        None,
+        "--replay",
+        envvar="CAMCTL_REPLAY",
+        help="Answer engine requests from a recorded cassette instead of the network.",
+        exists=True,
+        dir_okay=False,
+    ),
+    replay_speed: float = typer.Option(
+        1.0,
+        "--replay-speed",
+        help="Replay speed-up: 1 = recorded response times, 10 = ten times faster, 0 = instant.",
+        min=0.0,
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print a per-endpoint breakdown of request phase timings at exit.",
+    ),
+    metrics_port: int | None = typer.Option(
+        None,
+        "--metrics-port",
+        envvar="CAMCTL_METRICS_PORT",
+        help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics while running.",
+        min=0,
+        max=65535,
+    ),
+    metrics_file: Path | None = typer.Option(
+        None,
+        "--metrics-file",
+        envvar="CAMCTL_METRICS_FILE",
+        help="Write Prometheus metrics to this file at exit (node_exporter textfile collector).",
+        dir_okay=False,
+    ),
+    trace: Path | None = typer.Option(
+        None,
+        "--trace",
+        envvar="CAMCTL_TRACE",
+        help="Write a Chrome trace (JSON) of API calls, HTTP requests and worker threads.",
+        dir_okay=False,
+    ),
+    profile: ProfileMode | None = typer.Option(
+        None,
+        "--profile",
+        help="Profile the command: cpu (cProfile) or mem (tracemalloc); report to stderr.",
+        case_sensitive=False,
+    ),
+    profile_output: Path | None = typer.Option(
+        None,
+        "--profile-output",
+        help="Write the --profile report to this file; .pstats or .prof saves raw cpu stats.",
+        dir_okay=False,
+    ),
 ) -> None:
     """Configure shared CLI state used by all commands."""
-    configure_logging(verbose)
+    try:
+        configure_logging(verbose, log_format=log_format, log_file=log_file, sample_rate=log_sample)
+    except OSError as exc:
+        raise typer.BadParameter(
+            f"Cannot open log file {log_file}: {exc}", param_hint="--log-file"
+        ) from exc
+    # Registered first so it runs last: records logged by the other exit hooks
+    # are written out before the command returns.
+    ctx.call_on_close(stop_logging)
+    if record and replay:
+        raise typer.BadParameter(
+            "Use either --record or --replay, not both.", param_hint="--record"
+        )
+    if profile_output and profile is None:
+        raise typer.BadParameter("Requires --profile.", param_hint="--profile-output")
+    if profile_output and profile_output.suffix in PSTATS_SUFFIXES and profile is ProfileMode.MEM:
+        raise typer.BadParameter(
+            f"{profile_output.suffix} files hold cpu profiles only.", param_hint="--profile-output"
+        )
+    if not isinstance(ctx.obj, CLIContext):
+        settings = _load_settings(config)
+        ctx.obj = CLIContext(
+            authority=authority or settings.authority,
+            scopes=settings.scopes,
+            settings=settings,
+            engine=engine,
+            record=record,
+            replay=replay,
+            replay_speed=replay_speed,
+            timings=timings,
+            metrics_port=metrics_port,
+            metrics_file=metrics_file,
+            trace=trace,
+            profile=profile,
+            profile_output=profile_output,
+        )
+        if engine:
+            ctx.obj.engine_profile()
+        if record:
+            ctx.call_on_close(ctx.obj.save_recording)
+        if timings:
+            ctx.call_on_close(ctx.obj.print_timings)
+        if trace:
+            ctx.obj.start_trace(ctx.invoked_subcommand)
+            ctx.call_on_close(ctx.obj.finish_trace)
+        if metrics_port is not None or metrics_file:
+            ctx.obj.start_metrics()
+            ctx.call_on_close(ctx.obj.stop_metrics)
+        if profile:
+            # Started last so it stops first: the other exit reports are not profiled.
+            ctx.obj.start_profile()
+            ctx.call_on_close(ctx.obj.finish_profile)
     if ctx.invoked_subcommand is None:
+        from rich.console import Console
+
         Console().print(f"[bold cyan]{_BANNER}[/bold cyan]")
 
 
-app.add_typer(tasks_app, name="tasks")
-app.add_typer(processes_app, name="processes")
+def _load_settings(path: Path | None) -> Settings:
+    """Load the settings file, falling back to defaults when none exists."""
+    resolved = path or config_file()
+    if path is None and not resolved.exists():
+        return Settings()
+    import yaml
 
+    try:
+        return Settings.from_yaml(resolved)
+    except (OSError, ValueError, TypeError, yaml.YAMLError) as exc:
+        raise typer.BadParameter(
+            f"Cannot load settings from {resolved}: {exc}",
+            param_hint="--config",
+        ) from exc
@@ -0,0 +1,148 @@
+"""Shared progress, journaling and summary helpers for batch commands."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, TypeVar
+
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+
+from camctl.console.display import print_batch_results, print_json, print_summary
+from camctl.utils import JsonLinesWriter, gather_iter, write_json
+
+T = TypeVar("T")
+
+BatchResult = dict[str, Any]
+
+
+def run_batch(
+    func: Callable[[T], BatchResult],
+    items: Iterable[T],
+    *,
+    total: int | None,
+    id_key: str,
+    item_label: Callable[[T], str] = str,
+    active_label: str,
+    done_label: str,
+    max_workers: int,
+    journal: Path | None = None,
+) -> list[BatchResult]:
+    """
+    Run a batch operation concurrently with a progress bar and optional journal.
+
+    Args:
+        func: Worker returning a result mapping; failures use status "error".
+        items: Work items, consumed lazily so producers can stream pages.
+        total: Expected number of items for the ETA, or None when unknown.
+        id_key: Result key holding the item identifier.
+        item_label: Label shown in the progress line when an item starts.
+        active_label: Verb shown while an item runs (for example "Cancelling").
+        done_label: Verb shown once an item succeeds (for example "Cancelled").
+        max_workers: Maximum number of concurrent requests.
+        journal: Optional JSON-lines file receiving each result as it completes.
+
+    Returns:
+        Results in completion order.
+    """
+    results: list[BatchResult] = []
+    writer = JsonLinesWriter(journal) if journal else None
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[dim]{task.completed}/{task.total}[/dim]"),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+        ) as progress:
+            task_id = progress.add_task("Preparing...", total=total)
+            lock = threading.Lock()
+
+            def _on_start(item: T) -> None:
+                with lock:
+                    progress.update(
+                        task_id,
+                        description=f"{active_label} {item_label(item)}...",
+                    )
+
+            for result in gather_iter(
+                func,
+                items,
+                max_workers=max_workers,
+                on_start=_on_start,
+            ):
+                results.append(result)
+                if writer:
+                    writer.write(result)
+                status = "Failed" if result.get("status") == "error" else done_label
+                with lock:
+                    progress.advance(task_id, 1)
+                    progress.update(
+                        task_id,
+                        description=f"{status} {result.get(id_key)}",
+                    )
+    finally:
+        if writer:
+            writer.close()
+    return results
+
+
+def report_batch(
+    results: list[BatchResult],
+    *,
+    title: str,
+    id_key: str,
+    success_status: str,
+    noun: str,
+    output: Path | None = None,
+    journal: Path | None = None,
+    extra: Mapping[str, Any] | None = None,
+    show_results: bool = True,
+) -> dict[str, Any]:
+    """
+    Print the summary, result table and JSON payload for a finished batch.
+
+    `extra` entries are added to the payload ahead of the per-item results.
+    With `show_results=False` only the summary lines are printed, which keeps
+    very large runs from spending their time rendering tables.
+    """
+    success_count = sum(1 for result in results if result.get("status") == success_status)
+    failure_count = len(results) - success_count
+
+    payload: dict[str, Any] = {
+        "total": len(results),
+        success_status: success_count,
+        "failed": failure_count,
+    }
+    if extra:
+        payload.update(extra)
+    payload["results"] = results
+
+    if journal:
+        print_summary(f"Journaled results to {journal}", style="blue")
+
+    if output:
+        write_json(payload, output)
+        print_summary(f"Saved output to {output}", style="blue")
+
+    summary_style = "green" if failure_count == 0 else "yellow"
+    print_summary(
+        f"{success_status.title()} {success_count} {noun}, {failure_count} failed.",
+        style=summary_style,
+    )
+    if not show_results:
+        return payload
+    print_batch_results(f"{title} Results", payload["results"], id_key=id_key)
+    print_json(payload, title=f"{title} Summary")
+    return payload
+
+
+__all__ = ["BatchResult", "report_batch", "run_batch"]
@@ -0,0 +1,182 @@
+"""Load-test the engine REST API with a weighted mix of task and process calls."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+from camctl.console.context import require_context
+from camctl.console.display import print_raw_json, print_summary
+from camctl.console.loadgen import (
+    DEFAULT_MIX,
+    OPERATIONS,
+    histogram_table,
+    operations_table,
+    parse_mix,
+    run_load,
+    sample_target,
+)
+from camctl.utils import write_json
+
+
+def bench_command(
+    ctx: typer.Context,
+    mix: str = typer.Option(
+        DEFAULT_MIX,
+        "--mix",
+        "-m",
+        help=(
+            "Weighted operations as op=weight, comma separated. Operations: "
+            + ", ".join(OPERATIONS)
+            + "."
+        ),
+    ),
+    duration: float = typer.Option(
+        30.0,
+        "--duration",
+        "-d",
+        help="Seconds to run (0 = until --requests have been sent).",
+        min=0.0,
+    ),
+    requests: int = typer.Option(
+        0,
+        "--requests",
+        "-n",
+        help="Stop after this many requests (0 = no limit).",
+        min=0,
+    ),
+    concurrency: int = typer.Option(
+        8,
+        "--concurrency",
+        "-c",
+        help="Number of concurrent workers.",
+        min=1,
+    ),
+    rps: float = typer.Option(
+        0.0,
+        "--rps",
+        help="Target requests per second across all workers (0 = as fast as possible).",
+        min=0.0,
+    ),
+    page_size: int = typer.Option(
+        50,
+        "--page-size",
+        help="Page size of list operations.",
+        min=1,
+    ),
+    sample: int = typer.Option(
+        200,
+        "--sample",
+        help="Task and process IDs to sample up front for get, variables and complete.",
+        min=1,
+    ),
+    seed: int | None = typer.Option(
+        None,
+        "--seed",
+        help="Seed for the operation sequence, for repeatable runs.",
+    ),
+    allow_writes: bool = typer.Option(
+        False,
+        "--allow-writes",
+        help="Allow operations that change engine state (tasks.complete).",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the report to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print the report as plain JSON instead of tables.",
+    ),
+) -> None:
+    """
+    Drive a weighted mix of API calls at a target rate or concurrency.
+
+    Reports throughput, error rates by kind, latency percentiles (p50 to
+    p99.9), a latency histogram and circuit breaker trips. With --rps the
+    latency is measured from each request's scheduled start, so queueing
+    behind a saturated engine shows up in the percentiles.
+    """
+    try:
+        weights = parse_mix(mix)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--mix") from exc
+    writes = [name for name in weights if OPERATIONS[name].writes]
+    if writes and not allow_writes:
+        raise typer.BadParameter(
+            f"{', '.join(writes)} changes engine state; pass --allow-writes to include it.",
+            param_hint="--mix",
+        )
+    if not duration and not requests:
+        raise typer.BadParameter("Set --duration, --requests or both.")
+
+    context = require_context(ctx)
+    with context.build_engine() as engine:
+        target = sample_target(engine, weights, sample=sample, page_size=page_size)
+        for name in weights:
+            needs = OPERATIONS[name].needs
+            pool = target.task_ids if needs == "tasks" else target.process_ids
+            if needs and not pool:
+                raise typer.BadParameter(
+                    f"{name} needs existing {needs}, but none were found to sample.",
+                    param_hint="--mix",
+                )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("[dim]{task.completed} requests, {task.fields[errors]} errors[/dim]"),
+            TimeElapsedColumn(),
+            console=Console(stderr=True),
+            disable=raw,
+        ) as progress:
+            task_id = progress.add_task("Running load", total=requests or None, errors=0)
+            errors = 0
+
+            def on_request(_name: str, error: Exception | None) -> None:
+                nonlocal errors
+                errors += error is not None
+                progress.update(task_id, advance=1, errors=errors)
+
+            report = run_load(
+                engine,
+                weights,
+                target,
+                concurrency=concurrency,
+                duration=duration or None,
+                requests=requests or None,
+                rps=rps or None,
+                seed=seed,
+                on_request=on_request,
+            )
+
+    payload = report.to_dict()
+    if raw:
+        print_raw_json(payload)
+    else:
+        console = Console()
+        console.print(operations_table(report))
+        console.print(histogram_table(report))
+        summary = payload["summary"]
+        print_summary(
+            f"{summary['requests']} requests in {report.elapsed_seconds:.1f}s "
+            f"({summary['throughput_rps']:.1f} rps), {summary['errors']} errors, "
+            f"{report.breaker_trips} circuit breaker trips.",
+            style="red" if summary["errors"] else "green",
+        )
+
+    if output:
+        write_json(payload, output)
+        if not raw:
+            print_summary(f"Saved output to {output}", style="blue")
+
+
+__all__ = ["bench_command"]
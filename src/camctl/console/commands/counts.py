@@ -0,0 +1,144 @@
+"""Run a dashboard of named task and process counts in one invocation."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import typer
+from rich.live import Live
+
+from camctl.console.context import require_context
+from camctl.console.dashboard import counts_table, load_count_spec, run_counts
+from camctl.console.display import OutputFormat, print_json, print_raw_json, print_summary
+from camctl.utils import write_json
+
+
+def counts_command(
+    ctx: typer.Context,
+    spec: Path = typer.Option(
+        ...,
+        "--spec",
+        "-s",
+        help="YAML file mapping query names to a resource and filters.",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    repeat: int = typer.Option(
+        1,
+        "--repeat",
+        "-r",
+        help="Number of times to run the queries, refreshing in place (0 = until Ctrl+C).",
+        min=0,
+    ),
+    interval: float = typer.Option(
+        10.0,
+        "--interval",
+        "-n",
+        help="Seconds between refreshes when repeating.",
+        min=0.0,
+    ),
+    max_workers: int = typer.Option(
+        8,
+        "--max-workers",
+        help="Maximum number of concurrent count requests.",
+        min=1,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the latest results to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    format: OutputFormat = typer.Option(
+        OutputFormat.TABLE,
+        "--format",
+        help="Output format for count results.",
+        case_sensitive=False,
+    ),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print one raw JSON document per run instead of a table.",
+    ),
+) -> None:
+    """
+    Run every count in a spec file concurrently over one pooled client.
+
+    A failing query is reported in its row without stopping the others,
+    and the command then exits with status 1.
+    With --repeat the table refreshes in place and shows the change since
+    the previous run.
+    """
+    try:
+        queries = load_count_spec(spec)
+    except (OSError, ValueError, TypeError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--spec") from exc
+
+    context = require_context(ctx)
+    live_table = format is OutputFormat.TABLE and not raw
+    previous: dict[str, int | None] | None = None
+    payload: dict[str, Any] = {}
+    runs = 0
+    with context.build_engine() as engine:
+        live = Live(auto_refresh=False) if live_table else None
+        try:
+            if live:
+                live.start()
+            while repeat == 0 or runs < repeat:
+                if runs:
+                    time.sleep(interval)
+                started = time.perf_counter()
+                results = run_counts(engine, queries, max_workers=max_workers)
+                elapsed = time.perf_counter() - started
+                runs += 1
+                stamp = datetime.now().strftime("%H:%M:%S")
+                payload = {
+                    "spec": str(spec),
+                    "run": runs,
+                    "timestamp": datetime.now().astimezone().isoformat(),
+                    "elapsed_seconds": round(elapsed, 4),
+                    "results": [result.to_dict() for result in results],
+                }
+                if live:
+                    live.update(
+                        counts_table(
+                            results,
+                            title=f"Counts ({spec.name})",
+                            previous=previous,
+                            caption=(
+                                f"Run {runs} at {stamp}: {len(results)} queries "
+                                f"in {elapsed:.2f}s"
+                            ),
+                        ),
+                        refresh=True,
+                    )
+                elif raw:
+                    print_raw_json(payload)
+                else:
+                    print_json(payload, title=f"Counts ({stamp})")
+                previous = {result.name: result.count for result in results}
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if live:
+                live.stop()
+
+    if output and payload:
+        write_json(payload, output)
+        if live_table:
+            print_summary(f"Saved output to {output}", style="blue")
+
+    failed = [result for result in payload.get("results", []) if result["error"]]
+    if failed:
+        if live_table:
+            print_summary(f"{len(failed)} of {len(queries)} queries failed.", style="red")
+        raise typer.Exit(1)
+
+
+__all__ = ["counts_command"]
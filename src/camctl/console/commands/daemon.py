@@ -0,0 +1,145 @@
+"""Start, stop and inspect the background camctl daemon."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, NoReturn
+
+import typer
+
+from camctl.config import cache_dir
+from camctl.console.display import print_json, print_raw_json, print_summary
+from camctl.daemon.client import request
+from camctl.daemon.protocol import (
+    DAEMON_ENV,
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    UnsafeSocketError,
+    socket_path,
+)
+
+START_TIMEOUT_SECONDS = 10.0
+
+daemon_app = typer.Typer(
+    help="Run a background daemon that keeps camctl and engine connections warm.",
+    epilog=(
+        "While the daemon runs, read-only `tasks` and `processes` queries are "
+        f"forwarded to it. Set {DAEMON_ENV}=0 to always run commands locally."
+    ),
+    no_args_is_help=True,
+)
+
+
+@daemon_app.command("start")
+def start_command(
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Serve in this process instead of detaching.",
+    ),
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT_SECONDS,
+        "--idle-timeout",
+        help="Exit after this many idle seconds (0 keeps the daemon running).",
+        min=0,
+    ),
+) -> None:
+    """Start the daemon unless one is already listening."""
+    path = socket_path()
+    status = _request({"op": "status"}, path=path, timeout=2.0)
+    if status is not None:
+        print_summary(
+            f"Daemon already running (pid {status.get('pid')}) on {path}.", style="yellow"
+        )
+        return
+
+    if foreground:
+        from camctl.daemon.server import serve
+
+        print_summary(f"Serving on {path}; press Ctrl+C to stop.", style="green")
+        try:
+            serve(path, idle_timeout=idle_timeout)
+        except UnsafeSocketError as exc:
+            _fail(exc)
+        return
+
+    log_path = cache_dir() / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [
+        sys.executable,
+        "-m",
+        "camctl.daemon.server",
+        "--socket",
+        str(path),
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    with log_path.open("ab") as log:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            env={**os.environ, DAEMON_ENV: "0"},
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        status = _request({"op": "status"}, path=path, timeout=2.0)
+        if status is not None:
+            print_summary(f"Daemon started (pid {status.get('pid')}) on {path}.", style="green")
+            return
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+    print_summary(f"Daemon did not start; see {log_path}.", style="red")
+    raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def stop_command() -> None:
+    """Ask the running daemon to shut down."""
+    reply = _request({"op": "shutdown"}, path=socket_path(), timeout=5.0)
+    if reply is None:
+        print_summary("No daemon is running.", style="yellow")
+        return
+    print_summary(f"Stopping daemon (pid {reply.get('pid')}).", style="green")
+
+
+@daemon_app.command("status")
+def status_command(
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print plain JSON without formatting.",
+    ),
+) -> None:
+    """Show whether the daemon is running and what it has served."""
+    path = socket_path()
+    status = _request({"op": "status"}, path=path, timeout=5.0)
+    if status is None:
+        print_summary(f"No daemon is listening on {path}.", style="yellow")
+        raise typer.Exit(code=1)
+    if raw:
+        print_raw_json(status)
+    else:
+        print_json(status, title="camctl daemon")
+
+
+def _request(message: dict[str, Any], *, path: Path, timeout: float) -> dict[str, Any] | None:
+    try:
+        return request(message, path=path, timeout=timeout)
+    except UnsafeSocketError as exc:
+        _fail(exc)
+
+
+def _fail(error: UnsafeSocketError) -> NoReturn:
+    print_summary(str(error), style="red")
+    raise typer.Exit(code=1) from error
+
+
+__all__ = ["daemon_app"]
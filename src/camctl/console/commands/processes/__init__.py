@@ -1,17 +1,47 @@
-"""Process-related CLI commands."""
+"""Process-related CLI commands.
 
-import typer
+Command modules register themselves on `processes_app` when imported; the
+lazy group imports them only when their command runs.
+"""
 
-processes_app = typer.Typer(
+from camctl.console.lazy import LazyCommand, lazy_typer
+
+_PACKAGE = "camctl.console.commands.processes"
+
+processes_app = lazy_typer(
+    [
+        LazyCommand(
+            name="get", target=f"{_PACKAGE}.get", help="Fetch a process instance by ID."
+        ),
+        LazyCommand(name="list", target=f"{_PACKAGE}.list", help="List process instances."),
+        LazyCommand(
+            name="cancel",
+            target=f"{_PACKAGE}.cancel",
+            help="Cancel multiple process instances.",
+        ),
+        LazyCommand(
+            name="variables", target=f"{_PACKAGE}.variables", help="Get process variables."
+        ),
+        LazyCommand(
+            name="modify-variables",
+            target=f"{_PACKAGE}.modify",
+            help="Modify process variables.",
+        ),
+        LazyCommand(name="count", target=f"{_PACKAGE}.count", help="Count process instances."),
+        LazyCommand(
+            name="start",
+            target=f"{_PACKAGE}.start",
+            help="Start one or more process instances.",
+        ),
+        LazyCommand(
+            name="watch",
+            target=f"{_PACKAGE}.watch",
+            help="Watch process instances for changes.",
+        ),
+    ],
     help="Manage Camunda processes.",
     epilog="Use `camctl processes COMMAND --help` for command-specific options.",
     no_args_is_help=True,
 )
 
-from . import get  # noqa: E402,F401
-from . import list  # noqa: E402,F401
-from . import cancel  # noqa: E402,F401
-from . import variables  # noqa: E402,F401
-from . import count  # noqa: E402,F401
-
 __all__ = ["processes_app"]
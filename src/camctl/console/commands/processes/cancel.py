@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
-import threading
+from typing import Any, Iterable, Iterator
 
 import typer
 
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.resources.processes import ProcessFilterParams
 from camctl.console.commands.processes import processes_app
+from camctl.console.commands.processes import filters as process_filters
+from camctl.console.batch import report_batch, run_batch
 from camctl.console.context import require_context
-from camctl.console.display import print_batch_results, print_json, print_summary
-from camctl.utils import gather, load_id_file, parse_id_list, write_json
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from camctl.console.display import print_summary
+from camctl.utils import load_id_file, parse_id_list
 
 
 @processes_app.command(
     "cancel",
-    help="Cancel process instances by ID using concurrent requests.",
+    help=(
+        "Cancel process instances by ID, or every instance matching the filters, "
+        "using concurrent requests."
+    ),
     short_help="Cancel multiple process instances.",
 )
 def cancel_processes(
@@ -36,6 +41,49 @@ def cancel_processes(
         dir_okay=False,
         resolve_path=True,
     ),
+    process_instance_ids: str | None = process_filters.PROCESS_INSTANCE_IDS,
+    business_key: str | None = process_filters.BUSINESS_KEY,
+    business_key_like: str | None = process_filters.BUSINESS_KEY_LIKE,
+    case_instance_id: str | None = process_filters.CASE_INSTANCE_ID,
+    process_definition_id: str | None = process_filters.PROCESS_DEFINITION_ID,
+    process_definition_key: str | None = process_filters.PROCESS_DEFINITION_KEY,
+    process_definition_key_in: str | None = process_filters.PROCESS_DEFINITION_KEY_IN,
+    process_definition_key_not_in: str | None = process_filters.PROCESS_DEFINITION_KEY_NOT_IN,
+    deployment_id: str | None = process_filters.DEPLOYMENT_ID,
+    super_process_instance: str | None = process_filters.SUPER_PROCESS_INSTANCE,
+    sub_process_instance: str | None = process_filters.SUB_PROCESS_INSTANCE,
+    super_case_instance: str | None = process_filters.SUPER_CASE_INSTANCE,
+    sub_case_instance: str | None = process_filters.SUB_CASE_INSTANCE,
+    active: bool = process_filters.ACTIVE,
+    suspended: bool = process_filters.SUSPENDED,
+    with_incident: bool = process_filters.WITH_INCIDENT,
+    incident_id: str | None = process_filters.INCIDENT_ID,
+    incident_type: str | None = process_filters.INCIDENT_TYPE,
+    incident_message: str | None = process_filters.INCIDENT_MESSAGE,
+    incident_message_like: str | None = process_filters.INCIDENT_MESSAGE_LIKE,
+    tenant_id_in: str | None = process_filters.TENANT_ID_IN,
+    without_tenant_id: bool = process_filters.WITHOUT_TENANT_ID,
+    process_definition_without_tenant_id: bool = (
+        process_filters.PROCESS_DEFINITION_WITHOUT_TENANT_ID
+    ),
+    activity_id_in: str | None = process_filters.ACTIVITY_ID_IN,
+    root_process_instances: bool = process_filters.ROOT_PROCESS_INSTANCES,
+    leaf_process_instances: bool = process_filters.LEAF_PROCESS_INSTANCES,
+    variables: str | None = process_filters.VARIABLES,
+    variable_names_ignore_case: bool = process_filters.VARIABLE_NAMES_IGNORE_CASE,
+    variable_values_ignore_case: bool = process_filters.VARIABLE_VALUES_IGNORE_CASE,
+    page_size: int = typer.Option(
+        200,
+        "--page-size",
+        help="Number of matching instances fetched per page in filter mode.",
+        min=1,
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip the confirmation prompt in filter mode.",
+    ),
     max_workers: int = typer.Option(
         5,
         "--max-workers",
@@ -43,6 +91,14 @@ def cancel_processes(
         help="Maximum number of concurrent cancel requests.",
         min=1,
     ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append each cancel result to a JSON-lines file as it completes.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
     output: Path | None = typer.Option(
         None,
         "--output",
@@ -53,28 +109,50 @@ def cancel_processes(
     ),
 ) -> None:
     """
-    Cancel multiple process instances by ID.
+    Cancel multiple process instances by ID or by filter.
 
-    Provide IDs via --ids or load them from --file (supports JSON, comma, or newline).
+    Provide IDs via --ids or load them from --file (supports JSON, comma, or newline),
+    or pass process filters to cancel every matching instance. In filter mode the
+    matching instances are counted first for confirmation, then streamed page by
+    page into the cancel workers.
     """
-    if bool(ids) == bool(file):
-        raise typer.BadParameter("Provide either --ids or --file.")
-
-    try:
-        if file:
-            process_ids = load_id_file(file)
-            print_summary(f"Loaded {len(process_ids)} process IDs from {file}", style="blue")
-        else:
-            process_ids = parse_id_list(ids or "")
-            print_summary(f"Parsed {len(process_ids)} process IDs from --ids", style="blue")
-    except ValueError as exc:
-        raise typer.BadParameter(str(exc)) from exc
-
-    if not process_ids:
-        raise typer.BadParameter("No process IDs provided.")
+    filter_kwargs = process_filters.build_process_filter_kwargs(locals())
+    filters = process_filters.build_process_filters(filter_kwargs)
+    has_filters = bool(filter_kwargs)
+    sources = sum([bool(ids), bool(file), has_filters])
+    if sources != 1:
+        raise typer.BadParameter("Provide exactly one of --ids, --file, or process filters.")
+
+    process_ids: list[str] = []
+    if not has_filters:
+        try:
+            if file:
+                process_ids = load_id_file(file)
+                print_summary(f"Loaded {len(process_ids)} process IDs from {file}", style="blue")
+            else:
+                process_ids = parse_id_list(ids or "")
+                print_summary(f"Parsed {len(process_ids)} process IDs from --ids", style="blue")
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+        if not process_ids:
+            raise typer.BadParameter("No process IDs provided.")
 
     context = require_context(ctx)
     with context.build_engine() as engine:
+        source: Iterable[str]
+        if has_filters:
+            total = engine.processes.count(params=filters)
+            print_summary(f"{total} process instance(s) match the filters.", style="blue")
+            if total == 0:
+                return
+            if not yes:
+                typer.confirm(f"Cancel {total} process instance(s)?", abort=True)
+            source = _matching_ids(engine, filters, page_size=page_size, total=total)
+        else:
+            total = len(process_ids)
+            source = process_ids
+
         def _cancel(process_id: str) -> dict[str, Any]:
             try:
                 response = engine.processes.cancel(process_id)
@@ -90,54 +168,41 @@ def cancel_processes(
                     "error": str(exc),
                 }
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            TextColumn("[dim]{task.completed}/{task.total}[/dim]"),
-        ) as progress:
-            task_id = progress.add_task("Preparing cancellations...", total=len(process_ids))
-            lock = threading.Lock()
-
-            def _on_start(process_id: str) -> None:
-                with lock:
-                    progress.update(task_id, description=f"Cancelling {process_id}...")
-
-            def _on_complete(process_id: str, result: Any) -> None:
-                with lock:
-                    progress.advance(task_id, 1)
-                    status = "cancelled"
-                    if isinstance(result, dict) and result.get("status") == "error":
-                        status = "failed"
-                    progress.update(task_id, description=f"{status.title()} {process_id}")
-
-            results = gather(
-                _cancel,
-                process_ids,
-                max_workers=max_workers,
-                on_start=_on_start,
-                on_complete=_on_complete,
-            )
-
-    success_count = sum(
-        1 for result in results if isinstance(result, dict) and result.get("status") == "cancelled"
+        results = run_batch(
+            _cancel,
+            source,
+            total=total,
+            id_key="process_id",
+            active_label="Cancelling",
+            done_label="Cancelled",
+            max_workers=max_workers,
+            journal=journal,
+        )
+
+    report_batch(
+        results,
+        title="Cancel",
+        id_key="process_id",
+        success_status="cancelled",
+        noun="process(es)",
+        output=output,
+        journal=journal,
     )
-    failure_count = len(results) - success_count
 
-    payload = {
-        "total": len(process_ids),
-        "cancelled": success_count,
-        "failed": failure_count,
-        "results": results,
-    }
 
-    if output:
-        write_json(payload, output)
-        print_summary(f"Saved output to {output}", style="blue")
-
-    summary_style = "green" if failure_count == 0 else "yellow"
-    print_summary(
-        f"Cancelled {success_count} process(es), {failure_count} failed.",
-        style=summary_style,
-    )
-    print_batch_results("Cancel Results", payload["results"], id_key="process_id")
-    print_json(payload, title="Cancel Summary")
+def _matching_ids(
+    engine: CamundaEngine,
+    filters: ProcessFilterParams,
+    *,
+    page_size: int,
+    total: int,
+) -> Iterator[str]:
+    """Stream IDs of matching instances from the tail so cancellations keep offsets valid."""
+    for proc in engine.processes.iterate(
+        params=filters,
+        page_size=page_size,
+        total=total,
+        reverse=True,
+    ):
+        if proc.id:
+            yield str(proc.id)
@@ -6,10 +6,13 @@ from pathlib import Path
 
 import typer
 
+from camctl.console import fanout, grouping, query_cache
 from camctl.console.commands.processes import processes_app
 from camctl.console.commands.processes import filters as process_filters
 from camctl.console.context import require_context
 from camctl.console.display import OutputFormat, print_json, print_raw_json, print_summary
+from camctl.console.inputs import parse_comma_list
+from camctl.console.mirror import LOCAL_OPTION_HELP, open_mirror, synced_at_note
 from camctl.utils import write_json
 
 
@@ -70,12 +73,136 @@ def count_processes(
         "--raw",
         help="Print raw JSON instead of a summary.",
     ),
+    local: bool = typer.Option(False, "--local", help=LOCAL_OPTION_HELP),
+    cache: bool = query_cache.CACHE,
+    refresh: bool = query_cache.REFRESH,
+    cache_ttl: float | None = query_cache.CACHE_TTL,
+    group_by: str | None = typer.Option(
+        None,
+        "--group-by",
+        help=(
+            "Count per value of a column: "
+            f"{', '.join(grouping.PROCESS_GROUP_COLUMNS)}."
+        ),
+    ),
+    values: list[str] | None = grouping.GROUP_VALUES,
+    max_workers: int = grouping.GROUP_MAX_WORKERS,
+    page_size: int = grouping.GROUP_PAGE_SIZE,
+    engines: str | None = fanout.ENGINES,
 ) -> None:
     """Count process instances with filters."""
+    filter_kwargs = process_filters.build_process_filter_kwargs(locals())
     filters = process_filters.build_process_filters(locals())
     context = require_context(ctx)
-    with context.build_engine() as engine:
-        count = engine.processes.count(params=filters)
+    if engines:
+        if local or group_by:
+            raise typer.BadParameter("--engines cannot be combined with --local or --group-by.")
+        results = fanout.fan_out(
+            context,
+            context.engine_names(engines),
+            lambda engine: query_cache.cached_query(
+                engine,
+                "processes.count",
+                filters,
+                lambda: engine.processes.count(params=filters),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.COUNT_TTL_SECONDS if cache_ttl is None else cache_ttl,
+            ).value,
+        )
+        fanout.emit_merged_count(
+            results,
+            title="Process Count",
+            noun="process instance(s)",
+            output=output,
+            format=format,
+            raw=raw,
+        )
+        return
+
+    if group_by:
+        column = grouping.resolve_group_option(
+            group_by, grouping.PROCESS_GROUP_COLUMNS, values
+        )
+        if local:
+            with open_mirror(context) as store:
+                try:
+                    groups = store.count_processes_by(column.attribute, filter_kwargs)
+                except ValueError as exc:
+                    raise typer.BadParameter(str(exc)) from exc
+                note = synced_at_note(store, "processes")
+            grouping.print_group_result(
+                grouping.GroupCounts(
+                    column=column.attribute,
+                    strategy=grouping.STRATEGY_LOCAL,
+                    groups=grouping.restrict_groups(column, groups, parse_comma_list(values)),
+                ),
+                title=f"Process Instances by {column.attribute}",
+                noun="process instance(s)",
+                format=format,
+                raw=raw,
+                output=output,
+                note=note,
+            )
+            return
+        with context.build_engine() as engine:
+            cached = query_cache.cached_query(
+                engine,
+                f"processes.count.group_by.{column.attribute}:{','.join(values or [])}",
+                filters,
+                lambda: grouping.count_groups(
+                    column,
+                    filters,
+                    count=lambda params: engine.processes.count(params=params),
+                    scan=lambda params: engine.processes.iterate(
+                        params=params, page_size=page_size
+                    ),
+                    values=values,
+                    max_workers=max_workers,
+                ),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.COUNT_TTL_SECONDS if cache_ttl is None else cache_ttl,
+                encode=grouping.GroupCounts.to_dict,
+                decode=grouping.GroupCounts.from_dict,
+            )
+        grouping.print_group_result(
+            cached.value,
+            title=f"Process Instances by {column.attribute}",
+            noun="process instance(s)",
+            format=format,
+            raw=raw,
+            output=output,
+            note=(
+                f"Served from the query cache ({cached.age_seconds:.0f}s old)."
+                if cached.from_cache
+                else None
+            ),
+        )
+        return
+
+    note: str | None = None
+    if local:
+        with open_mirror(context) as store:
+            try:
+                count = store.count_processes(filter_kwargs)
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+            note = synced_at_note(store, "processes")
+    else:
+        with context.build_engine() as engine:
+            result = query_cache.cached_query(
+                engine,
+                "processes.count",
+                filters,
+                lambda: engine.processes.count(params=filters),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.COUNT_TTL_SECONDS if cache_ttl is None else cache_ttl,
+            )
+        count = result.value
+        if result.from_cache:
+            note = f"Served from the query cache ({result.age_seconds:.0f}s old)."
 
     payload = {"count": count}
     if output:
@@ -90,3 +217,5 @@ def count_processes(
         return
 
     print_summary(f"{count} process instance(s)")
+    if note:
+        print_summary(note, style="dim")
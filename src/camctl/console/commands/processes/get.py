@@ -6,6 +6,7 @@ from pathlib import Path
 
 import typer
 
+from camctl.console import fanout
 from camctl.console.commands.processes import processes_app
 from camctl.console.context import require_context
 from camctl.console.display import print_json, print_summary
@@ -31,13 +32,23 @@ def get_process(
         dir_okay=False,
         resolve_path=True,
     ),
+    engines: str | None = fanout.ENGINES,
 ) -> None:
     """
     Retrieve a process instance by its ID and print the JSON response.
 
-    Use --output to persist the response to a JSON file.
+    Use --output to persist the response to a JSON file. With --engines the
+    ID is looked up on every listed engine at once.
     """
     context = require_context(ctx)
+    if engines:
+        results = fanout.fan_out(
+            context,
+            context.engine_names(engines),
+            lambda engine: engine.processes.get(process_id),
+        )
+        fanout.emit_merged_get(results, title="Process", output=output)
+        return
     with context.build_engine() as engine:
         payload = engine.processes.get(process_id)
     if payload is None:
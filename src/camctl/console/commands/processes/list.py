@@ -6,7 +6,9 @@ from pathlib import Path
 
 import typer
 
-from camctl.api.camunda.resources.processes import ProcessListParams
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.processes import ProcessInstance, ProcessListParams
+from camctl.console import fanout, query_cache
 from camctl.console.commands.processes import processes_app
 from camctl.console.commands.processes import filters as process_filters
 from camctl.console.context import require_context
@@ -15,6 +17,7 @@ from camctl.console.display import (
     print_json,
     print_processes,
     print_raw_json,
+    print_summary,
     process_column_names,
 )
 from camctl.console.inputs import parse_comma_list
@@ -106,6 +109,10 @@ def list_processes(
         "--ids-only",
         help="Print only process IDs (one per line) for shell piping/chaining.",
     ),
+    cache: bool = query_cache.CACHE,
+    refresh: bool = query_cache.REFRESH,
+    cache_ttl: float | None = query_cache.CACHE_TTL,
+    engines: str | None = fanout.ENGINES,
 ) -> None:
     """List process instances with filters and pagination."""
     filter_kwargs = process_filters.build_process_filter_kwargs(locals())
@@ -119,8 +126,48 @@ def list_processes(
         sort_order=sort_order,
     )
     context = require_context(ctx)
+    if engines:
+        results = fanout.fan_out(
+            context,
+            context.engine_names(engines),
+            lambda engine: query_cache.cached_query(
+                engine,
+                "processes.list",
+                params,
+                lambda: engine.processes.list(params=params),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.LIST_TTL_SECONDS if cache_ttl is None else cache_ttl,
+                encode=lambda page: dict(page.raw),
+                decode=lambda data: Page.from_dict(data, item_parser=ProcessInstance.from_dict),
+            ).value,
+        )
+        fanout.emit_merged_list(
+            results,
+            title="Processes",
+            noun="process instance(s)",
+            printer=print_processes,
+            columns=parse_comma_list(columns),
+            output=output,
+            format=format,
+            raw=raw,
+            ids_only=ids_only,
+        )
+        return
+
     with context.build_engine() as engine:
-        page_result = engine.processes.list(params=params)
+        result = query_cache.cached_query(
+            engine,
+            "processes.list",
+            params,
+            lambda: engine.processes.list(params=params),
+            enabled=cache,
+            refresh=refresh,
+            ttl=query_cache.LIST_TTL_SECONDS if cache_ttl is None else cache_ttl,
+            encode=lambda page: dict(page.raw),
+            decode=lambda data: Page.from_dict(data, item_parser=ProcessInstance.from_dict),
+        )
+    page_result = result.value
 
     if output:
         write_json(page_result, output)
@@ -144,3 +191,8 @@ def list_processes(
         print_processes(page_result, columns=selected_columns)
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
+    if result.from_cache:
+        print_summary(
+            f"Served from the query cache ({result.age_seconds:.0f}s old).",
+            style="dim",
+        )
@@ -0,0 +1,255 @@
+"""Modify variables of process instances, singly or in batch."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import typer
+
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.common import VariableModificationRequest
+from camctl.api.camunda.resources.processes import ProcessFilterParams
+from camctl.console.commands.processes import processes_app
+from camctl.console.commands.processes import filters as process_filters
+from camctl.console.context import require_context
+from camctl.console.display import print_summary
+from camctl.console.modifications import (
+    ModificationTarget,
+    VariableChanges,
+    coalesce_records,
+    load_modifications,
+    run_modification_batch,
+)
+from camctl.utils import iter_records, parse_id_list
+
+_PROCESS_ID_KEYS = ("process_id", "process_instance_id", "processInstanceId", "id")
+
+
+@processes_app.command(
+    "modify-variables",
+    help=(
+        "Update and delete process instance variables in a single request, or apply "
+        "the changes to many instances concurrently from --ids, a record --file, "
+        "or process filters."
+    ),
+    short_help="Modify process variables.",
+)
+def modify_process_variables(
+    ctx: typer.Context,
+    process_id: str | None = typer.Argument(
+        None,
+        help="Process instance identifier (omit when using --ids, --file, or filters).",
+    ),
+    modifications: str | None = typer.Option(
+        None,
+        "--modifications",
+        help="JSON object of variable modifications.",
+    ),
+    modifications_file: Path | None = typer.Option(
+        None,
+        "--modifications-file",
+        help="Path to a JSON file with variable modifications.",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    delete: list[str] | None = typer.Option(
+        None,
+        "--delete",
+        help="Variable names to delete (repeatable).",
+    ),
+    ids: str | None = typer.Option(
+        None,
+        "--ids",
+        help="Comma-separated process instance IDs to apply the modifications to.",
+    ),
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help=(
+            "NDJSON or CSV file of {process_id, modifications, deletions} or "
+            "{process_id, name, value, type} records. Records for the same instance "
+            "are coalesced into one request, on top of the shared modifications."
+        ),
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    process_instance_ids: str | None = process_filters.PROCESS_INSTANCE_IDS,
+    business_key: str | None = process_filters.BUSINESS_KEY,
+    business_key_like: str | None = process_filters.BUSINESS_KEY_LIKE,
+    case_instance_id: str | None = process_filters.CASE_INSTANCE_ID,
+    process_definition_id: str | None = process_filters.PROCESS_DEFINITION_ID,
+    process_definition_key: str | None = process_filters.PROCESS_DEFINITION_KEY,
+    process_definition_key_in: str | None = process_filters.PROCESS_DEFINITION_KEY_IN,
+    process_definition_key_not_in: str | None = process_filters.PROCESS_DEFINITION_KEY_NOT_IN,
+    deployment_id: str | None = process_filters.DEPLOYMENT_ID,
+    super_process_instance: str | None = process_filters.SUPER_PROCESS_INSTANCE,
+    sub_process_instance: str | None = process_filters.SUB_PROCESS_INSTANCE,
+    super_case_instance: str | None = process_filters.SUPER_CASE_INSTANCE,
+    sub_case_instance: str | None = process_filters.SUB_CASE_INSTANCE,
+    active: bool = process_filters.ACTIVE,
+    suspended: bool = process_filters.SUSPENDED,
+    with_incident: bool = process_filters.WITH_INCIDENT,
+    incident_id: str | None = process_filters.INCIDENT_ID,
+    incident_type: str | None = process_filters.INCIDENT_TYPE,
+    incident_message: str | None = process_filters.INCIDENT_MESSAGE,
+    incident_message_like: str | None = process_filters.INCIDENT_MESSAGE_LIKE,
+    tenant_id_in: str | None = process_filters.TENANT_ID_IN,
+    without_tenant_id: bool = process_filters.WITHOUT_TENANT_ID,
+    process_definition_without_tenant_id: bool = (
+        process_filters.PROCESS_DEFINITION_WITHOUT_TENANT_ID
+    ),
+    activity_id_in: str | None = process_filters.ACTIVITY_ID_IN,
+    root_process_instances: bool = process_filters.ROOT_PROCESS_INSTANCES,
+    leaf_process_instances: bool = process_filters.LEAF_PROCESS_INSTANCES,
+    variables: str | None = process_filters.VARIABLES,
+    variable_names_ignore_case: bool = process_filters.VARIABLE_NAMES_IGNORE_CASE,
+    variable_values_ignore_case: bool = process_filters.VARIABLE_VALUES_IGNORE_CASE,
+    page_size: int = typer.Option(
+        200,
+        "--page-size",
+        help="Number of matching instances fetched per page in filter mode.",
+        min=1,
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip the confirmation prompt in filter mode.",
+    ),
+    max_workers: int = typer.Option(
+        5,
+        "--max-workers",
+        "-w",
+        help="Maximum number of concurrent modification requests in batch mode.",
+        min=1,
+    ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append each modification result to a JSON-lines file as it completes.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the batch modification results to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+) -> None:
+    """
+    Modify process instance variables with a bulk request.
+
+    In batch mode every target instance receives exactly one modification
+    request. Filter mode counts the matching instances for confirmation and then
+    streams them page by page into the workers.
+    """
+    filter_kwargs = process_filters.build_process_filter_kwargs(locals())
+    has_filters = bool(filter_kwargs)
+    sources = sum([bool(process_id), bool(ids), bool(file), has_filters])
+    if sources != 1:
+        raise typer.BadParameter(
+            "Provide exactly one of PROCESS_ID, --ids, --file, or process filters."
+        )
+
+    try:
+        modifications_payload = load_modifications(modifications, modifications_file)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    shared = VariableChanges()
+    shared.update(modifications_payload, delete)
+    if not shared and not file:
+        raise typer.BadParameter("Provide modifications or delete at least one variable.")
+
+    context = require_context(ctx)
+    if process_id:
+        with context.build_engine() as engine:
+            engine.processes.modify_variables(process_id, payload=shared.to_request())
+
+        print_summary("Variable updates applied.")
+        return
+
+    targets: Iterable[ModificationTarget] = []
+    total: int | None = None
+    if file:
+        try:
+            grouped = coalesce_records(
+                iter_records(file),
+                id_keys=_PROCESS_ID_KEYS,
+                base=shared,
+            )
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        total = len(grouped)
+        print_summary(
+            f"Coalesced {file} into {total} process instance modification(s)",
+            style="blue",
+        )
+        targets = [(target, changes.to_request()) for target, changes in grouped.items()]
+    elif ids:
+        process_ids = parse_id_list(ids)
+        if not process_ids:
+            raise typer.BadParameter("No process IDs provided.")
+        total = len(process_ids)
+        request = shared.to_request()
+        targets = [(item, request) for item in process_ids]
+
+    with context.build_engine() as engine:
+        if has_filters:
+            filters = process_filters.build_process_filters(filter_kwargs)
+            total = engine.processes.count(params=filters)
+            print_summary(f"{total} process instance(s) match the filters.", style="blue")
+            if total == 0:
+                return
+            if not yes:
+                typer.confirm(
+                    f"Modify variables of {total} process instance(s)?",
+                    abort=True,
+                )
+            targets = _matching_targets(
+                engine,
+                filters,
+                shared.to_request(),
+                page_size=page_size,
+                total=total,
+            )
+
+        run_modification_batch(
+            lambda target, request: engine.processes.modify_variables(
+                target, payload=request
+            ),
+            targets,
+            total=total,
+            id_key="process_id",
+            noun="process instance(s)",
+            max_workers=max_workers,
+            journal=journal,
+            output=output,
+        )
+
+
+def _matching_targets(
+    engine: CamundaEngine,
+    filters: ProcessFilterParams,
+    request: VariableModificationRequest,
+    *,
+    page_size: int,
+    total: int,
+) -> Iterator[ModificationTarget]:
+    """Stream matching instances from the tail so instances leaving the filter keep offsets valid."""
+    for proc in engine.processes.iterate(
+        params=filters,
+        page_size=page_size,
+        total=total,
+        reverse=True,
+    ):
+        if proc.id:
+            yield str(proc.id), request
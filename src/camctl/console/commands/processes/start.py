@@ -0,0 +1,246 @@
+"""Start process instances, singly or in bulk from a record file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Mapping
+
+import typer
+
+from camctl.api.camunda.resources.processes import ProcessStartRequest
+from camctl.console.batch import BatchResult, report_batch, run_batch
+from camctl.console.commands.processes import processes_app
+from camctl.console.context import require_context
+from camctl.console.display import print_json, print_summary
+from camctl.console.inputs import merge_mappings, parse_json_mapping, parse_key_value_pairs
+from camctl.utils import count_records, iter_records, summarize_latencies, throughput, write_json
+
+StartRecord = tuple[int, Mapping[str, Any]]
+
+
+@processes_app.command(
+    "start",
+    help=(
+        "Start a process instance by definition key, or start many instances "
+        "concurrently from an NDJSON/CSV --file with throughput reporting."
+    ),
+    short_help="Start one or more process instances.",
+)
+def start_processes(
+    ctx: typer.Context,
+    key: str | None = typer.Option(
+        None,
+        "--key",
+        "-k",
+        help="Process definition key (default for records without one).",
+    ),
+    business_key: str | None = typer.Option(
+        None,
+        "--business-key",
+        help="Business key (default for records without one).",
+    ),
+    tenant_id: str | None = typer.Option(
+        None,
+        "--tenant-id",
+        help="Tenant id of the process definition (default for records without one).",
+    ),
+    variables: str | None = typer.Option(
+        None,
+        "--variables",
+        help="JSON object with process variables (shared by every record).",
+    ),
+    variables_file: Path | None = typer.Option(
+        None,
+        "--variables-file",
+        help="Path to a JSON file with process variables.",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    var: list[str] = typer.Option(
+        None,
+        "--var",
+        help="Variables as key=value (repeatable).",
+    ),
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help=(
+            "NDJSON or CSV file of {process_definition_key, business_key, tenant_id, "
+            "variables} records. Record values override the shared options."
+        ),
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    max_workers: int = typer.Option(
+        8,
+        "--max-workers",
+        "-w",
+        help="Maximum number of concurrent start requests.",
+        min=1,
+    ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append each start result to a JSON-lines file as it completes.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    summary_only: bool = typer.Option(
+        False,
+        "--summary-only",
+        help="Skip the per-instance result table (recommended for large files).",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the start response (or batch results) to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+) -> None:
+    """
+    Start process instances and report throughput.
+
+    Without --file a single instance of --key is started. With --file every
+    record starts one instance; the run reports instances per second and
+    request latency percentiles.
+    """
+    try:
+        file_vars = parse_json_mapping(None, variables_file)
+        json_vars = parse_json_mapping(variables, None)
+        kv_vars = parse_key_value_pairs(var or [])
+        shared = merge_mappings(file_vars, json_vars, kv_vars)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    defaults = {
+        "process_definition_key": key,
+        "business_key": business_key,
+        "tenant_id": tenant_id,
+    }
+    context = require_context(ctx)
+
+    if file is None:
+        if not key:
+            raise typer.BadParameter("Provide --key or a --file of start records.")
+        try:
+            definition_key, payload = build_start_request({}, defaults, shared)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        with context.build_engine() as engine:
+            response = engine.processes.start(definition_key, payload=payload)
+        if output:
+            write_json(response, output)
+            print_summary(f"Saved output to {output}", style="blue")
+        print_json(response, title="Process Start")
+        return
+
+    try:
+        total = count_records(file)
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    print_summary(f"Found {total} start record(s) in {file}", style="blue")
+
+    with context.build_engine() as engine:
+        def _start(item: StartRecord) -> BatchResult:
+            index, record = item
+            result: BatchResult = {"record": index, "process_instance_id": None}
+            try:
+                definition_key, payload = build_start_request(record, defaults, shared)
+                result["key"] = definition_key
+                result["business_key"] = payload.business_key
+                started = perf_counter()
+                response = engine.processes.start(definition_key, payload=payload)
+                result["latency_ms"] = (perf_counter() - started) * 1000.0
+                result["process_instance_id"] = response.process_instance_id
+                result["status"] = "started"
+            except Exception as exc:
+                result["status"] = "error"
+                result["error"] = str(exc)
+            return result
+
+        started_at = perf_counter()
+        results = run_batch(
+            _start,
+            enumerate(iter_records(file), start=1),
+            total=total,
+            id_key="process_instance_id",
+            item_label=lambda item: f"record {item[0]}",
+            active_label="Starting",
+            done_label="Started",
+            max_workers=max_workers,
+            journal=journal,
+        )
+        elapsed = perf_counter() - started_at
+
+    started_count = sum(1 for result in results if result.get("status") == "started")
+    latency = summarize_latencies(
+        result["latency_ms"] for result in results if result.get("status") == "started"
+    )
+    stats = {
+        "elapsed_seconds": round(elapsed, 3),
+        "instances_per_second": round(throughput(started_count, elapsed), 2),
+        "latency_ms": {name: round(value, 2) for name, value in latency.items()},
+    }
+    report_batch(
+        results,
+        title="Start",
+        id_key="process_instance_id",
+        success_status="started",
+        noun="process instance(s)",
+        output=output,
+        journal=journal,
+        extra={"throughput": stats},
+        show_results=not summary_only,
+    )
+    print_summary(
+        f"Throughput: {stats['instances_per_second']} instances/s over "
+        f"{stats['elapsed_seconds']}s; latency p50 {latency['p50']:.1f} ms, "
+        f"p90 {latency['p90']:.1f} ms, p99 {latency['p99']:.1f} ms.",
+        style="cyan",
+    )
+
+
+def build_start_request(
+    record: Mapping[str, Any],
+    defaults: Mapping[str, Any],
+    shared_variables: Mapping[str, Any],
+) -> tuple[str, ProcessStartRequest]:
+    """Build the definition key and start payload for a record."""
+    definition_key = _field(record, "process_definition_key", "processDefinitionKey", "key")
+    definition_key = definition_key or defaults.get("process_definition_key")
+    if not definition_key:
+        raise ValueError("Start record is missing a process_definition_key.")
+
+    raw_variables = record.get("variables")
+    if isinstance(raw_variables, str):
+        record_variables = parse_json_mapping(raw_variables, None)
+    elif isinstance(raw_variables, Mapping):
+        record_variables = raw_variables
+    elif raw_variables is None:
+        record_variables = {}
+    else:
+        raise ValueError("Start record variables must be a JSON object.")
+
+    payload = ProcessStartRequest(
+        variables=merge_mappings(shared_variables, record_variables),
+        business_key=(
+            _field(record, "business_key", "businessKey") or defaults.get("business_key")
+        ),
+        tenant_id=_field(record, "tenant_id", "tenantId") or defaults.get("tenant_id"),
+    )
+    return str(definition_key), payload
+
+
+def _field(record: Mapping[str, Any], *names: str) -> Any:
+    for name in names:
+        value = record.get(name)
+        if value not in (None, ""):
+            return value
+    return None
@@ -1,4 +1,4 @@
-"""Fetch variables for a process instance."""
+"""Fetch variables for one or many process instances."""
 
 from __future__ import annotations
 
@@ -9,17 +9,49 @@ import typer
 from camctl.console.commands.processes import processes_app
 from camctl.console.context import require_context
 from camctl.console.display import print_json, print_raw_json, print_summary
-from camctl.utils import write_json
+from camctl.utils import load_id_file, parse_id_list, write_json
 
 
 @processes_app.command(
     "variables",
-    help="Fetch variables for a process instance.",
+    help=(
+        "Fetch variables for a process instance, or for many instances from --ids "
+        "or --file using batched variable-instance queries."
+    ),
     short_help="Get process variables.",
 )
 def get_variables(
     ctx: typer.Context,
-    process_id: str = typer.Argument(..., help="Process instance identifier."),
+    process_id: str | None = typer.Argument(
+        None,
+        help="Process instance identifier (omit when using --ids or --file).",
+    ),
+    ids: str | None = typer.Option(
+        None,
+        "--ids",
+        help="Comma-separated process instance IDs to fetch variables for.",
+    ),
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="File containing process IDs (newline, comma, or JSON list).",
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    chunk_size: int = typer.Option(
+        100,
+        "--chunk-size",
+        help="Number of process IDs sent per variable-instance query.",
+        min=1,
+    ),
+    page_size: int = typer.Option(
+        1000,
+        "--page-size",
+        help="Number of variables fetched per page of each query.",
+        min=1,
+    ),
     deserialize_values: bool | None = typer.Option(
         None,
         "--deserialize-values/--no-deserialize-values",
@@ -39,17 +71,50 @@ def get_variables(
         help="Print raw JSON for piping (no Rich formatting).",
     ),
 ) -> None:
-    """Retrieve variables for a process instance and print the JSON response."""
+    """
+    Retrieve variables for process instances and print the JSON response.
+
+    With --ids or --file the result maps each process instance ID to its
+    variables; instances without variables map to an empty object.
+    """
+    sources = sum([bool(process_id), bool(ids), bool(file)])
+    if sources != 1:
+        raise typer.BadParameter("Provide exactly one of PROCESS_ID, --ids, or --file.")
+
     context = require_context(ctx)
-    with context.build_engine() as engine:
-        payload = engine.processes.variables(
-            process_id,
-            deserialize_values=deserialize_values,
-        )
+    if process_id:
+        with context.build_engine() as engine:
+            payload = engine.processes.variables(
+                process_id,
+                deserialize_values=deserialize_values,
+            )
+
+        if payload is None:
+            print_summary("Process not found.", style="yellow")
+            return
+        title = "Process Variables"
+    else:
+        try:
+            process_ids = load_id_file(file) if file else parse_id_list(ids or "")
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        if not process_ids:
+            raise typer.BadParameter("No process IDs provided.")
 
-    if payload is None:
-        print_summary("Process not found.", style="yellow")
-        return
+        with context.build_engine() as engine:
+            payload = engine.processes.bulk_variables(
+                process_ids,
+                deserialize_values=deserialize_values,
+                chunk_size=chunk_size,
+                page_size=page_size,
+            )
+        if not raw:
+            with_variables = sum(1 for variables in payload.values() if variables)
+            print_summary(
+                f"Fetched variables for {with_variables} of {len(payload)} process instance(s).",
+                style="blue",
+            )
+        title = "Process Variables (Bulk)"
 
     if output:
         write_json(payload, output)
@@ -58,4 +123,4 @@ def get_variables(
     if raw:
         print_raw_json(payload)
     else:
-        print_json(payload, title="Process Variables")
+        print_json(payload, title=title)
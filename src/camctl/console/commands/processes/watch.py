@@ -0,0 +1,130 @@
+"""Watch process instances for inserts, updates and removals."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from camctl.console.commands.processes import processes_app
+from camctl.console.commands.processes import filters as process_filters
+from camctl.console.context import require_context
+from camctl.console.watch import run_watch
+from camctl.sync import ProcessWatcher
+from camctl.utils import AdaptiveInterval
+
+
+@processes_app.command(
+    "watch",
+    help=(
+        "Poll process instances matching the filters over one connection and "
+        "print only inserted, updated and removed instances."
+    ),
+    short_help="Watch process instances for changes.",
+)
+def watch_processes(
+    ctx: typer.Context,
+    process_instance_ids: str | None = process_filters.PROCESS_INSTANCE_IDS,
+    business_key: str | None = process_filters.BUSINESS_KEY,
+    business_key_like: str | None = process_filters.BUSINESS_KEY_LIKE,
+    case_instance_id: str | None = process_filters.CASE_INSTANCE_ID,
+    process_definition_id: str | None = process_filters.PROCESS_DEFINITION_ID,
+    process_definition_key: str | None = process_filters.PROCESS_DEFINITION_KEY,
+    process_definition_key_in: str | None = process_filters.PROCESS_DEFINITION_KEY_IN,
+    process_definition_key_not_in: str | None = process_filters.PROCESS_DEFINITION_KEY_NOT_IN,
+    deployment_id: str | None = process_filters.DEPLOYMENT_ID,
+    super_process_instance: str | None = process_filters.SUPER_PROCESS_INSTANCE,
+    sub_process_instance: str | None = process_filters.SUB_PROCESS_INSTANCE,
+    super_case_instance: str | None = process_filters.SUPER_CASE_INSTANCE,
+    sub_case_instance: str | None = process_filters.SUB_CASE_INSTANCE,
+    active: bool = process_filters.ACTIVE,
+    suspended: bool = process_filters.SUSPENDED,
+    with_incident: bool = process_filters.WITH_INCIDENT,
+    incident_id: str | None = process_filters.INCIDENT_ID,
+    incident_type: str | None = process_filters.INCIDENT_TYPE,
+    incident_message: str | None = process_filters.INCIDENT_MESSAGE,
+    incident_message_like: str | None = process_filters.INCIDENT_MESSAGE_LIKE,
+    tenant_id_in: str | None = process_filters.TENANT_ID_IN,
+    without_tenant_id: bool = process_filters.WITHOUT_TENANT_ID,
+    process_definition_without_tenant_id: bool = (
+        process_filters.PROCESS_DEFINITION_WITHOUT_TENANT_ID
+    ),
+    activity_id_in: str | None = process_filters.ACTIVITY_ID_IN,
+    root_process_instances: bool = process_filters.ROOT_PROCESS_INSTANCES,
+    leaf_process_instances: bool = process_filters.LEAF_PROCESS_INSTANCES,
+    variables: str | None = process_filters.VARIABLES,
+    variable_names_ignore_case: bool = process_filters.VARIABLE_NAMES_IGNORE_CASE,
+    variable_values_ignore_case: bool = process_filters.VARIABLE_VALUES_IGNORE_CASE,
+    interval: float = typer.Option(
+        2.0,
+        "--interval",
+        "-n",
+        help="Seconds between polls while instances are changing.",
+        min=0.1,
+    ),
+    max_interval: float = typer.Option(
+        30.0,
+        "--max-interval",
+        help="Upper bound the poll interval backs off to while nothing changes.",
+        min=0.1,
+    ),
+    iterations: int | None = typer.Option(
+        None,
+        "--iterations",
+        help="Stop after this many polls (default: until interrupted).",
+        min=1,
+    ),
+    page_size: int = typer.Option(
+        500,
+        "--page-size",
+        help="Page size used when reloading the instance list.",
+        min=1,
+    ),
+    full_every: int = typer.Option(
+        5,
+        "--full-every",
+        help="Reload the instances every N polls even if the count is unchanged.",
+        min=1,
+    ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append every change event to a JSON-lines file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    raw: bool = typer.Option(
+        False,
+        "--raw",
+        help="Print one JSON event per line instead of coloured lines.",
+    ),
+) -> None:
+    """
+    Watch process instances until interrupted.
+
+    The runtime API exposes no update timestamp, so polls start with a count
+    and only reload the instances when it moved or every --full-every polls.
+    """
+    filters = process_filters.build_process_filters(locals())
+    try:
+        backoff = AdaptiveInterval(minimum=interval, maximum=max(interval, max_interval))
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    context = require_context(ctx)
+    with context.build_engine() as engine:
+        watcher = ProcessWatcher(
+            engine,
+            filters=filters,
+            page_size=page_size,
+            full_every=full_every,
+        )
+        run_watch(
+            watcher,
+            noun="process instance(s)",
+            label=lambda record: record.get("business_key") or record.get("definition_id"),
+            interval=backoff,
+            iterations=iterations,
+            raw=raw,
+            journal=journal,
+        )
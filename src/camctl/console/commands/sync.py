@@ -0,0 +1,82 @@
+"""Sync tasks and process instances into the local SQLite mirror."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from pathlib import Path
+
+import typer
+
+from camctl.console.context import require_context
+from camctl.console.display import print_summary
+from camctl.sync import LocalStore, mirror_path, sync_processes, sync_tasks
+from camctl.utils import write_json
+
+
+def sync_command(
+    ctx: typer.Context,
+    tasks: bool = typer.Option(
+        True,
+        "--tasks/--no-tasks",
+        help="Sync tasks.",
+    ),
+    processes: bool = typer.Option(
+        True,
+        "--processes/--no-processes",
+        help="Sync process instances.",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Reload every task instead of fetching changes since the last sync.",
+    ),
+    page_size: int = typer.Option(
+        500,
+        "--page-size",
+        help="Page size used while fetching from the engine.",
+        min=1,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the sync reports to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+) -> None:
+    """
+    Bring the local mirror up to date.
+
+    Tasks are synced incrementally after the first run; process instances are
+    re-scanned but only changed rows are written. `tasks list --local`,
+    `tasks count --local` and `processes count --local` read from the mirror.
+    """
+    if not tasks and not processes:
+        raise typer.BadParameter("Nothing to sync; enable --tasks or --processes.")
+
+    context = require_context(ctx)
+    reports = []
+    with context.build_engine() as engine:
+        path = mirror_path(engine.client.base_url)
+        with LocalStore(path) as store:
+            if tasks:
+                reports.append(sync_tasks(engine, store, full=full, page_size=page_size))
+            if processes:
+                reports.append(sync_processes(engine, store, page_size=page_size))
+
+    for report in reports:
+        print_summary(
+            f"{report.resource}: {report.mode} sync fetched {report.fetched}, "
+            f"changed {report.changed}, removed {report.removed}; "
+            f"{report.total} mirrored in {report.elapsed_seconds:.2f}s.",
+            style="green",
+        )
+    print_summary(f"Mirror: {path}", style="dim")
+
+    if output:
+        write_json({"mirror": str(path), "reports": [asdict(r) for r in reports]}, output)
+        print_summary(f"Saved output to {output}", style="blue")
+
+
+__all__ = ["sync_command"]
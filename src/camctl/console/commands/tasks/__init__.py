@@ -1,19 +1,31 @@
-"""Task-related CLI commands."""
+"""Task-related CLI commands.
 
-import typer
+Command modules register themselves on `tasks_app` when imported; the lazy
+group imports them only when their command runs.
+"""
 
-tasks_app = typer.Typer(
+from camctl.console.lazy import LazyCommand, lazy_typer
+
+_PACKAGE = "camctl.console.commands.tasks"
+
+tasks_app = lazy_typer(
+    [
+        LazyCommand(name="get", target=f"{_PACKAGE}.get", help="Fetch a task by ID."),
+        LazyCommand(name="list", target=f"{_PACKAGE}.list", help="List tasks."),
+        LazyCommand(
+            name="complete", target=f"{_PACKAGE}.complete", help="Complete one or more tasks."
+        ),
+        LazyCommand(name="count", target=f"{_PACKAGE}.count", help="Count tasks."),
+        LazyCommand(name="watch", target=f"{_PACKAGE}.watch", help="Watch tasks for changes."),
+        LazyCommand(
+            name="variables",
+            target=f"{_PACKAGE}.variables:variables_app",
+            help="Manage task variables.",
+        ),
+    ],
     help="Manage Camunda tasks.",
     epilog="Use `camctl tasks COMMAND --help` for command-specific options.",
     no_args_is_help=True,
 )
 
-from .variables import variables_app  # noqa: E402
-tasks_app.add_typer(variables_app, name="variables")
-
-from . import get  # noqa: E402,F401
-from . import list  # noqa: E402,F401
-from . import complete  # noqa: E402,F401
-from . import count  # noqa: E402,F401
-
 __all__ = ["tasks_app"]
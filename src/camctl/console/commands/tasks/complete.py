@@ -1,31 +1,43 @@
-"""Complete a task using variables and optional comments."""
+"""Complete tasks using variables and optional comments, singly or in batch."""
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Iterable, Mapping
 
 import typer
 
-from camctl.api.camunda.resources.tasks import TaskCompletionRequest
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.resources.tasks import TaskCompletionRequest, TaskFilterParams
+from camctl.console.batch import BatchResult, report_batch, run_batch
 from camctl.console.commands.tasks import tasks_app
+from camctl.console.commands.tasks import filters as task_filters
 from camctl.console.context import require_context
 from camctl.console.display import print_json, print_summary
 from camctl.console.inputs import merge_mappings, parse_json_mapping, parse_key_value_pairs
-from camctl.utils import write_json
+from camctl.utils import count_records, iter_records, parse_id_list, write_json
+
+_TASK_ID_KEYS = ("task_id", "taskId", "id")
 
 
 @tasks_app.command(
     "complete",
-    help="Complete a task with variables and an optional comment.",
-    short_help="Complete a task.",
+    help=(
+        "Complete a task with variables and an optional comment, or complete many "
+        "tasks concurrently from --ids, a record --file, or task filters."
+    ),
+    short_help="Complete one or more tasks.",
 )
 def complete_task(
     ctx: typer.Context,
-    task_id: str = typer.Argument(..., help="Task identifier."),
+    task_id: str | None = typer.Argument(
+        None,
+        help="Task identifier (omit when using --ids, --file, or filters).",
+    ),
     variables: str | None = typer.Option(
         None,
         "--variables",
-        help="JSON object with task variables.",
+        help="JSON object with task variables (shared by every task in batch mode).",
     ),
     variables_file: Path | None = typer.Option(
         None,
@@ -45,16 +57,171 @@ def complete_task(
         "--comment",
         help="Optional completion comment.",
     ),
+    ids: str | None = typer.Option(
+        None,
+        "--ids",
+        help="Comma-separated task IDs to complete with the shared variables.",
+    ),
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help=(
+            "NDJSON or CSV file of {task_id, variables, comment} records. "
+            "Record variables override the shared ones."
+        ),
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    task_id_in: str | None = task_filters.TASK_ID_IN,
+    process_instance_id: str | None = task_filters.PROCESS_INSTANCE_ID,
+    process_instance_id_in: str | None = task_filters.PROCESS_INSTANCE_ID_IN,
+    process_instance_business_key: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY,
+    process_instance_business_key_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_EXPRESSION,
+    process_instance_business_key_in: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_IN,
+    process_instance_business_key_like: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE,
+    process_instance_business_key_like_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE_EXPRESSION,
+    process_definition_id: str | None = task_filters.PROCESS_DEFINITION_ID,
+    process_definition_key: str | None = task_filters.PROCESS_DEFINITION_KEY,
+    process_definition_key_in: str | None = task_filters.PROCESS_DEFINITION_KEY_IN,
+    process_definition_name: str | None = task_filters.PROCESS_DEFINITION_NAME,
+    process_definition_name_like: str | None = task_filters.PROCESS_DEFINITION_NAME_LIKE,
+    execution_id: str | None = task_filters.EXECUTION_ID,
+    case_instance_id: str | None = task_filters.CASE_INSTANCE_ID,
+    case_instance_business_key: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY,
+    case_instance_business_key_like: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY_LIKE,
+    case_definition_id: str | None = task_filters.CASE_DEFINITION_ID,
+    case_definition_key: str | None = task_filters.CASE_DEFINITION_KEY,
+    case_definition_name: str | None = task_filters.CASE_DEFINITION_NAME,
+    case_definition_name_like: str | None = task_filters.CASE_DEFINITION_NAME_LIKE,
+    case_execution_id: str | None = task_filters.CASE_EXECUTION_ID,
+    activity_instance_id_in: str | None = task_filters.ACTIVITY_INSTANCE_ID_IN,
+    tenant_id_in: str | None = task_filters.TENANT_ID_IN,
+    without_tenant_id: bool = task_filters.WITHOUT_TENANT_ID,
+    assignee: str | None = task_filters.ASSIGNEE,
+    assignee_expression: str | None = task_filters.ASSIGNEE_EXPRESSION,
+    assignee_like: str | None = task_filters.ASSIGNEE_LIKE,
+    assignee_like_expression: str | None = task_filters.ASSIGNEE_LIKE_EXPRESSION,
+    assignee_in: str | None = task_filters.ASSIGNEE_IN,
+    assignee_not_in: str | None = task_filters.ASSIGNEE_NOT_IN,
+    owner: str | None = task_filters.OWNER,
+    owner_expression: str | None = task_filters.OWNER_EXPRESSION,
+    candidate_group: str | None = task_filters.CANDIDATE_GROUP,
+    candidate_group_like: str | None = task_filters.CANDIDATE_GROUP_LIKE,
+    candidate_group_expression: str | None = task_filters.CANDIDATE_GROUP_EXPRESSION,
+    candidate_user: str | None = task_filters.CANDIDATE_USER,
+    candidate_user_expression: str | None = task_filters.CANDIDATE_USER_EXPRESSION,
+    include_assigned_tasks: bool = task_filters.INCLUDE_ASSIGNED_TASKS,
+    involved_user: str | None = task_filters.INVOLVED_USER,
+    involved_user_expression: str | None = task_filters.INVOLVED_USER_EXPRESSION,
+    assigned: bool = task_filters.ASSIGNED,
+    unassigned: bool = task_filters.UNASSIGNED,
+    task_definition_key: str | None = task_filters.TASK_DEFINITION_KEY,
+    task_definition_key_in: str | None = task_filters.TASK_DEFINITION_KEY_IN,
+    task_definition_key_like: str | None = task_filters.TASK_DEFINITION_KEY_LIKE,
+    name: str | None = task_filters.NAME,
+    name_not_equal: str | None = task_filters.NAME_NOT_EQUAL,
+    name_like: str | None = task_filters.NAME_LIKE,
+    name_not_like: str | None = task_filters.NAME_NOT_LIKE,
+    description: str | None = task_filters.DESCRIPTION,
+    description_like: str | None = task_filters.DESCRIPTION_LIKE,
+    priority: int | None = task_filters.PRIORITY,
+    max_priority: int | None = task_filters.MAX_PRIORITY,
+    min_priority: int | None = task_filters.MIN_PRIORITY,
+    due_date: str | None = task_filters.DUE_DATE,
+    due_date_expression: str | None = task_filters.DUE_DATE_EXPRESSION,
+    due_after: str | None = task_filters.DUE_AFTER,
+    due_after_expression: str | None = task_filters.DUE_AFTER_EXPRESSION,
+    due_before: str | None = task_filters.DUE_BEFORE,
+    due_before_expression: str | None = task_filters.DUE_BEFORE_EXPRESSION,
+    without_due_date: bool = task_filters.WITHOUT_DUE_DATE,
+    follow_up_date: str | None = task_filters.FOLLOW_UP_DATE,
+    follow_up_date_expression: str | None = task_filters.FOLLOW_UP_DATE_EXPRESSION,
+    follow_up_after: str | None = task_filters.FOLLOW_UP_AFTER,
+    follow_up_after_expression: str | None = task_filters.FOLLOW_UP_AFTER_EXPRESSION,
+    follow_up_before: str | None = task_filters.FOLLOW_UP_BEFORE,
+    follow_up_before_expression: str | None = task_filters.FOLLOW_UP_BEFORE_EXPRESSION,
+    follow_up_before_or_not_existent: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT,
+    follow_up_before_or_not_existent_expression: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT_EXPRESSION,
+    created_on: str | None = task_filters.CREATED_ON,
+    created_on_expression: str | None = task_filters.CREATED_ON_EXPRESSION,
+    created_after: str | None = task_filters.CREATED_AFTER,
+    created_after_expression: str | None = task_filters.CREATED_AFTER_EXPRESSION,
+    created_before: str | None = task_filters.CREATED_BEFORE,
+    created_before_expression: str | None = task_filters.CREATED_BEFORE_EXPRESSION,
+    updated_after: str | None = task_filters.UPDATED_AFTER,
+    updated_after_expression: str | None = task_filters.UPDATED_AFTER_EXPRESSION,
+    delegation_state: str | None = task_filters.DELEGATION_STATE,
+    candidate_groups: str | None = task_filters.CANDIDATE_GROUPS,
+    candidate_groups_expression: str | None = task_filters.CANDIDATE_GROUPS_EXPRESSION,
+    with_candidate_groups: bool = task_filters.WITH_CANDIDATE_GROUPS,
+    without_candidate_groups: bool = task_filters.WITHOUT_CANDIDATE_GROUPS,
+    with_candidate_users: bool = task_filters.WITH_CANDIDATE_USERS,
+    without_candidate_users: bool = task_filters.WITHOUT_CANDIDATE_USERS,
+    active: bool = task_filters.ACTIVE,
+    suspended: bool = task_filters.SUSPENDED,
+    task_variables: str | None = task_filters.TASK_VARIABLES,
+    process_variables: str | None = task_filters.PROCESS_VARIABLES,
+    case_instance_variables: str | None = task_filters.CASE_INSTANCE_VARIABLES,
+    variable_names_ignore_case: bool = task_filters.VARIABLE_NAMES_IGNORE_CASE,
+    variable_values_ignore_case: bool = task_filters.VARIABLE_VALUES_IGNORE_CASE,
+    parent_task_id: str | None = task_filters.PARENT_TASK_ID,
+    with_comment_attachment_info: bool = task_filters.WITH_COMMENT_ATTACHMENT_INFO,
+    status: str | None = task_filters.STATUS,
+    page_size: int = typer.Option(
+        200,
+        "--page-size",
+        help="Number of matching tasks fetched per page in filter mode.",
+        min=1,
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip the confirmation prompt in filter mode.",
+    ),
+    max_workers: int = typer.Option(
+        5,
+        "--max-workers",
+        "-w",
+        help="Maximum number of concurrent completion requests in batch mode.",
+        min=1,
+    ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append each completion result to a JSON-lines file as it completes.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
     output: Path | None = typer.Option(
         None,
         "--output",
         "-o",
-        help="Write the completion response to a JSON file.",
+        help="Write the completion response (or batch results) to a JSON file.",
         dir_okay=False,
         resolve_path=True,
     ),
 ) -> None:
-    """Complete a task and print the response."""
+    """
+    Complete a task and print the response.
+
+    In batch mode, tasks come from --ids, a --file of records, or task filters.
+    Filter mode snapshots the matching task IDs for confirmation and completes
+    exactly that set, so tasks created by the completions are left alone.
+    """
+    filter_kwargs = task_filters.build_task_filter_kwargs(
+        {name: value for name, value in locals().items() if name != "task_id"}
+    )
+    has_filters = bool(filter_kwargs)
+    sources = sum([bool(task_id), bool(ids), bool(file), has_filters])
+    if sources != 1:
+        raise typer.BadParameter(
+            "Provide exactly one of TASK_ID, --ids, --file, or task filters."
+        )
+
     try:
         file_vars = parse_json_mapping(None, variables_file)
         json_vars = parse_json_mapping(variables, None)
@@ -63,17 +230,134 @@ def complete_task(
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
 
-    payload = TaskCompletionRequest(variables=merged, comment=comment)
-
     context = require_context(ctx)
-    with context.build_engine() as engine:
-        response = engine.tasks.complete(task_id, payload=payload)
+    if task_id:
+        payload = TaskCompletionRequest(variables=merged, comment=comment)
+        with context.build_engine() as engine:
+            response = engine.tasks.complete(task_id, payload=payload)
+
+        if response is None:
+            print_summary("Task not found or no content returned.", style="yellow")
+            return
 
-    if response is None:
-        print_summary("Task not found or no content returned.", style="yellow")
+        if output:
+            write_json(response, output)
+
+        print_json(response, title="Task Completion")
         return
 
-    if output:
-        write_json(response, output)
+    records: Iterable[Mapping[str, Any]] = []
+    total: int | None = None
+    if file:
+        try:
+            total = count_records(file)
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        print_summary(f"Found {total} completion record(s) in {file}", style="blue")
+        records = iter_records(file)
+    elif ids:
+        task_ids = parse_id_list(ids)
+        if not task_ids:
+            raise typer.BadParameter("No task IDs provided.")
+        total = len(task_ids)
+        records = [{"task_id": item} for item in task_ids]
+
+    with context.build_engine() as engine:
+        if has_filters:
+            filters = task_filters.build_task_filters(filter_kwargs)
+            task_ids = _matching_task_ids(engine, filters, page_size=page_size)
+            total = len(task_ids)
+            print_summary(f"{total} task(s) match the filters.", style="blue")
+            if total == 0:
+                return
+            if not yes:
+                typer.confirm(f"Complete {total} task(s)?", abort=True)
+            records = [{"task_id": item} for item in task_ids]
+
+        def _complete(record: Mapping[str, Any]) -> BatchResult:
+            record_id = _record_task_id(record)
+            try:
+                target, request = build_completion(record, merged, comment)
+                response = engine.tasks.complete(target, payload=request)
+                return {
+                    "task_id": target,
+                    "status": "completed",
+                    "response": response,
+                }
+            except Exception as exc:
+                return {
+                    "task_id": record_id,
+                    "status": "error",
+                    "error": str(exc),
+                }
+
+        results = run_batch(
+            _complete,
+            records,
+            total=total,
+            id_key="task_id",
+            item_label=_record_task_id,
+            active_label="Completing",
+            done_label="Completed",
+            max_workers=max_workers,
+            journal=journal,
+        )
+
+    report_batch(
+        results,
+        title="Completion",
+        id_key="task_id",
+        success_status="completed",
+        noun="task(s)",
+        output=output,
+        journal=journal,
+    )
+
+
+def build_completion(
+    record: Mapping[str, Any],
+    shared_variables: Mapping[str, Any],
+    default_comment: str | None,
+) -> tuple[str, TaskCompletionRequest]:
+    """Build the task ID and completion payload for a batch record."""
+    task_id = _record_task_id(record)
+    if not task_id:
+        raise ValueError("Completion record is missing a task_id.")
+    raw_variables = record.get("variables")
+    if isinstance(raw_variables, str):
+        record_variables = parse_json_mapping(raw_variables, None)
+    elif isinstance(raw_variables, Mapping):
+        record_variables = raw_variables
+    elif raw_variables is None:
+        record_variables = {}
+    else:
+        raise ValueError(f"Variables for task {task_id!r} must be a JSON object.")
+    comment = record.get("comment", default_comment)
+    return task_id, TaskCompletionRequest(
+        variables=merge_mappings(shared_variables, record_variables),
+        comment=comment,
+    )
+
+
+def _record_task_id(record: Mapping[str, Any]) -> str:
+    for key in _TASK_ID_KEYS:
+        value = record.get(key)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _matching_task_ids(
+    engine: CamundaEngine,
+    filters: TaskFilterParams,
+    *,
+    page_size: int,
+) -> list[str]:
+    """
+    Snapshot the IDs of the matching tasks before any of them is completed.
 
-    print_json(response, title="Task Completion")
+    Completing a task can create the next task of its process, which may match
+    the same filters and shift later pages, so every page is read up front.
+    """
+    task_ids = (str(task.id) for task in engine.tasks.iterate(params=filters, page_size=page_size))
+    return list(dict.fromkeys(item for item in task_ids if item))
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import typer
 
+from camctl.api.camunda.resources.tasks import TaskFilterParams
+from camctl.console import fanout, grouping, query_cache
 from camctl.console.commands.tasks import tasks_app
 from camctl.console.commands.tasks import filters as task_filters
-from camctl.console.context import require_context
-from camctl.console.display import OutputFormat, print_json, print_raw_json, print_summary
+from camctl.console.context import CLIContext, require_context
+from camctl.console.display import (
+    OutputFormat,
+    print_json,
+    print_raw_json,
+    print_summary,
+)
+from camctl.console.inputs import parse_comma_list
+from camctl.console.mirror import LOCAL_OPTION_HELP, open_mirror, synced_at_note
 from camctl.utils import write_json
 
 
@@ -24,20 +34,27 @@ def count_tasks(
     task_id_in: str | None = task_filters.TASK_ID_IN,
     process_instance_id: str | None = task_filters.PROCESS_INSTANCE_ID,
     process_instance_id_in: str | None = task_filters.PROCESS_INSTANCE_ID_IN,
-    process_instance_business_key: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY,
-    process_instance_business_key_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_EXPRESSION,
-    process_instance_business_key_in: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_IN,
-    process_instance_business_key_like: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE,
-    process_instance_business_key_like_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE_EXPRESSION,
+    process_instance_business_key: str
+    | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY,
+    process_instance_business_key_expression: str
+    | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_EXPRESSION,
+    process_instance_business_key_in: str
+    | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_IN,
+    process_instance_business_key_like: str
+    | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE,
+    process_instance_business_key_like_expression: str
+    | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE_EXPRESSION,
     process_definition_id: str | None = task_filters.PROCESS_DEFINITION_ID,
     process_definition_key: str | None = task_filters.PROCESS_DEFINITION_KEY,
     process_definition_key_in: str | None = task_filters.PROCESS_DEFINITION_KEY_IN,
     process_definition_name: str | None = task_filters.PROCESS_DEFINITION_NAME,
-    process_definition_name_like: str | None = task_filters.PROCESS_DEFINITION_NAME_LIKE,
+    process_definition_name_like: str
+    | None = task_filters.PROCESS_DEFINITION_NAME_LIKE,
     execution_id: str | None = task_filters.EXECUTION_ID,
     case_instance_id: str | None = task_filters.CASE_INSTANCE_ID,
     case_instance_business_key: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY,
-    case_instance_business_key_like: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY_LIKE,
+    case_instance_business_key_like: str
+    | None = task_filters.CASE_INSTANCE_BUSINESS_KEY_LIKE,
     case_definition_id: str | None = task_filters.CASE_DEFINITION_ID,
     case_definition_key: str | None = task_filters.CASE_DEFINITION_KEY,
     case_definition_name: str | None = task_filters.CASE_DEFINITION_NAME,
@@ -89,8 +106,10 @@ def count_tasks(
     follow_up_after_expression: str | None = task_filters.FOLLOW_UP_AFTER_EXPRESSION,
     follow_up_before: str | None = task_filters.FOLLOW_UP_BEFORE,
     follow_up_before_expression: str | None = task_filters.FOLLOW_UP_BEFORE_EXPRESSION,
-    follow_up_before_or_not_existent: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT,
-    follow_up_before_or_not_existent_expression: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT_EXPRESSION,
+    follow_up_before_or_not_existent: str
+    | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT,
+    follow_up_before_or_not_existent_expression: str
+    | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT_EXPRESSION,
     created_on: str | None = task_filters.CREATED_ON,
     created_on_expression: str | None = task_filters.CREATED_ON_EXPRESSION,
     created_after: str | None = task_filters.CREATED_AFTER,
@@ -135,12 +154,99 @@ def count_tasks(
         "--raw",
         help="Print raw JSON instead of a summary.",
     ),
+    local: bool = typer.Option(False, "--local", help=LOCAL_OPTION_HELP),
+    cache: bool = query_cache.CACHE,
+    refresh: bool = query_cache.REFRESH,
+    cache_ttl: float | None = query_cache.CACHE_TTL,
+    group_by: str | None = typer.Option(
+        None,
+        "--group-by",
+        help=(
+            f"Count per value of a column: {', '.join(grouping.TASK_GROUP_COLUMNS)}."
+        ),
+    ),
+    values: list[str] | None = grouping.GROUP_VALUES,
+    max_workers: int = grouping.GROUP_MAX_WORKERS,
+    page_size: int = grouping.GROUP_PAGE_SIZE,
+    engines: str | None = fanout.ENGINES,
 ) -> None:
     """Count tasks with filters."""
-    filters = task_filters.build_task_filters(locals())
     context = require_context(ctx)
-    with context.build_engine() as engine:
-        count = engine.tasks.count(params=filters)
+    if engines:
+        if local or group_by:
+            raise typer.BadParameter(
+                "--engines cannot be combined with --local or --group-by."
+            )
+        filters = task_filters.build_task_filters(locals())
+        results = fanout.fan_out(
+            context,
+            context.engine_names(engines),
+            lambda engine: (
+                query_cache.cached_query(
+                    engine,
+                    "tasks.count",
+                    filters,
+                    lambda: engine.tasks.count(params=filters),
+                    enabled=cache,
+                    refresh=refresh,
+                    ttl=query_cache.COUNT_TTL_SECONDS
+                    if cache_ttl is None
+                    else cache_ttl,
+                ).value
+            ),
+        )
+        fanout.emit_merged_count(
+            results,
+            title="Task Count",
+            noun="task(s)",
+            output=output,
+            format=format,
+            raw=raw,
+        )
+        return
+
+    if group_by:
+        _count_task_groups(
+            context,
+            group_by=group_by,
+            filter_kwargs=task_filters.build_task_filter_kwargs(locals()),
+            values=values,
+            max_workers=max_workers,
+            page_size=page_size,
+            local=local,
+            cache=cache,
+            refresh=refresh,
+            cache_ttl=cache_ttl,
+            output=output,
+            format=format,
+            raw=raw,
+        )
+        return
+
+    note: str | None = None
+    if local:
+        filter_kwargs = task_filters.build_task_filter_kwargs(locals())
+        with open_mirror(context) as store:
+            try:
+                count = store.count_tasks(filter_kwargs)
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+            note = synced_at_note(store, "tasks")
+    else:
+        filters = task_filters.build_task_filters(locals())
+        with context.build_engine() as engine:
+            result = query_cache.cached_query(
+                engine,
+                "tasks.count",
+                filters,
+                lambda: engine.tasks.count(params=filters),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.COUNT_TTL_SECONDS if cache_ttl is None else cache_ttl,
+            )
+        count = result.value
+        if result.from_cache:
+            note = f"Served from the query cache ({result.age_seconds:.0f}s old)."
 
     payload = {"count": count}
     if output:
@@ -155,4 +261,76 @@ def count_tasks(
         return
 
     print_summary(f"{count} task(s)")
+    if note:
+        print_summary(note, style="dim")
+
+
+def _count_task_groups(
+    context: CLIContext,
+    *,
+    group_by: str,
+    filter_kwargs: dict[str, Any],
+    values: list[str] | None,
+    max_workers: int,
+    page_size: int,
+    local: bool,
+    cache: bool,
+    refresh: bool,
+    cache_ttl: float | None,
+    output: Path | None,
+    format: OutputFormat,
+    raw: bool,
+) -> None:
+    column = grouping.resolve_group_option(
+        group_by, grouping.TASK_GROUP_COLUMNS, values
+    )
+
+    note: str | None = None
+    if local:
+        with open_mirror(context) as store:
+            try:
+                groups = store.count_tasks_by(column.attribute, filter_kwargs)
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+            note = synced_at_note(store, "tasks")
+        result = grouping.GroupCounts(
+            column=column.attribute,
+            strategy=grouping.STRATEGY_LOCAL,
+            groups=grouping.restrict_groups(column, groups, parse_comma_list(values)),
+        )
+    else:
+        filters = TaskFilterParams(**filter_kwargs)
+        with context.build_engine() as engine:
+            cached = query_cache.cached_query(
+                engine,
+                f"tasks.count.group_by.{column.attribute}:{','.join(values or [])}",
+                filters,
+                lambda: grouping.count_groups(
+                    column,
+                    filters,
+                    count=lambda params: engine.tasks.count(params=params),
+                    scan=lambda params: engine.tasks.iterate(
+                        params=params, page_size=page_size
+                    ),
+                    values=values,
+                    max_workers=max_workers,
+                ),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.COUNT_TTL_SECONDS if cache_ttl is None else cache_ttl,
+                encode=grouping.GroupCounts.to_dict,
+                decode=grouping.GroupCounts.from_dict,
+            )
+        result = cached.value
+        if cached.from_cache:
+            note = f"Served from the query cache ({cached.age_seconds:.0f}s old)."
 
+    grouping.print_group_result(
+        result,
+        title=f"Tasks by {column.attribute}",
+        noun="task(s)",
+        format=format,
+        raw=raw,
+        output=output,
+        note=note,
+    )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import fields
-from typing import Any, Mapping, get_args
+from typing import Any, Mapping, get_args, get_type_hints
 
 import typer
 
@@ -19,7 +19,7 @@ def _is_optional_bool(annotation: Any) -> bool:
 _FILTER_FIELDS = [field.name for field in fields(TaskFilterParams)]
 _BOOL_FIELDS = {
     name
-    for name, annotation in TaskFilterParams.__annotations__.items()
+    for name, annotation in get_type_hints(TaskFilterParams).items()
     if _is_optional_bool(annotation)
 }
 
@@ -6,7 +6,9 @@ from pathlib import Path
 
 import typer
 
-from camctl.api.camunda.resources.tasks import TaskListParams
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.tasks import Task, TaskListParams
+from camctl.console import fanout, query_cache
 from camctl.console.commands.tasks import tasks_app
 from camctl.console.commands.tasks import filters as task_filters
 from camctl.console.context import require_context
@@ -14,10 +16,12 @@ from camctl.console.display import (
     OutputFormat,
     print_json,
     print_raw_json,
+    print_summary,
     print_tasks,
     task_column_names,
 )
 from camctl.console.inputs import parse_comma_list
+from camctl.console.mirror import LOCAL_OPTION_HELP, open_mirror, synced_at_note
 from camctl.utils import write_json
 
 
@@ -171,6 +175,11 @@ def list_tasks(
         "--ids-only",
         help="Print only task IDs (one per line) for shell piping/chaining.",
     ),
+    local: bool = typer.Option(False, "--local", help=LOCAL_OPTION_HELP),
+    cache: bool = query_cache.CACHE,
+    refresh: bool = query_cache.REFRESH,
+    cache_ttl: float | None = query_cache.CACHE_TTL,
+    engines: str | None = fanout.ENGINES,
 ) -> None:
     """List tasks with filters and pagination."""
     filter_kwargs = task_filters.build_task_filter_kwargs(locals())
@@ -184,8 +193,73 @@ def list_tasks(
         sort_order=sort_order,
     )
     context = require_context(ctx)
-    with context.build_engine() as engine:
-        page_result = engine.tasks.list(params=params)
+    if engines:
+        if local:
+            raise typer.BadParameter("--engines cannot be combined with --local.")
+        results = fanout.fan_out(
+            context,
+            context.engine_names(engines),
+            lambda engine: query_cache.cached_query(
+                engine,
+                "tasks.list",
+                params,
+                lambda: engine.tasks.list(params=params),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.LIST_TTL_SECONDS if cache_ttl is None else cache_ttl,
+                encode=lambda page: dict(page.raw),
+                decode=lambda data: Page.from_dict(data, item_parser=Task.from_dict),
+            ).value,
+        )
+        fanout.emit_merged_list(
+            results,
+            title="Tasks",
+            noun="task(s)",
+            printer=print_tasks,
+            columns=parse_comma_list(columns),
+            output=output,
+            format=format,
+            raw=raw,
+            ids_only=ids_only,
+        )
+        return
+
+    note: str | None = None
+    if local:
+        if page is not None or size is not None:
+            raise typer.BadParameter(
+                "--page/--size are not supported with --local; "
+                "use --first-result/--max-results."
+            )
+        with open_mirror(context) as store:
+            try:
+                tasks = store.query_tasks(
+                    filter_kwargs,
+                    first_result=first_result,
+                    max_results=max_results,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                )
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+            note = synced_at_note(store, "tasks")
+        page_result = Page(raw={"items": [task.to_dict() for task in tasks]}, items=tasks)
+    else:
+        with context.build_engine() as engine:
+            result = query_cache.cached_query(
+                engine,
+                "tasks.list",
+                params,
+                lambda: engine.tasks.list(params=params),
+                enabled=cache,
+                refresh=refresh,
+                ttl=query_cache.LIST_TTL_SECONDS if cache_ttl is None else cache_ttl,
+                encode=lambda page: dict(page.raw),
+                decode=lambda data: Page.from_dict(data, item_parser=Task.from_dict),
+            )
+        page_result = result.value
+        if result.from_cache:
+            note = f"Served from the query cache ({result.age_seconds:.0f}s old)."
 
     if output:
         write_json(page_result, output)
@@ -209,3 +283,5 @@ def list_tasks(
         print_tasks(page_result, columns=selected_columns)
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
+    if note:
+        print_summary(note, style="dim")
@@ -2,27 +2,26 @@
 
 from __future__ import annotations
 
-import typer
+from camctl.console.lazy import LazyCommand, lazy_typer
 
-variables_app = typer.Typer(
+_PACKAGE = "camctl.console.commands.tasks.variables"
+
+variables_app = lazy_typer(
+    [
+        LazyCommand(name="list", target=f"{_PACKAGE}.list", help="List variables."),
+        LazyCommand(name="get", target=f"{_PACKAGE}.get", help="Get a variable."),
+        LazyCommand(name="update", target=f"{_PACKAGE}.update", help="Update a variable."),
+        LazyCommand(name="delete", target=f"{_PACKAGE}.delete", help="Delete a variable."),
+        LazyCommand(name="modify", target=f"{_PACKAGE}.modify", help="Modify variables."),
+        LazyCommand(
+            name="local",
+            target=f"{_PACKAGE}.local:local_app",
+            help="Manage local task variables.",
+        ),
+    ],
     help="Manage task variables.",
     epilog="Use `camctl tasks variables COMMAND --help` for command-specific options.",
     no_args_is_help=True,
 )
 
-from .local import local_app  # noqa: E402
-
-variables_app.add_typer(local_app, name="local")
-
-from . import list  # noqa: E402,F401
-from . import get  # noqa: E402,F401
-from . import update  # noqa: E402,F401
-from . import delete  # noqa: E402,F401
-from . import modify  # noqa: E402,F401
-from .local import list  # noqa: E402,F401
-from .local import get  # noqa: E402,F401
-from .local import update  # noqa: E402,F401
-from .local import delete  # noqa: E402,F401
-from .local import modify  # noqa: E402,F401
-
 __all__ = ["variables_app"]
@@ -39,9 +39,29 @@ def get_variable(
         "--raw",
         help="Print raw JSON for piping (no Rich formatting).",
     ),
+    download: Path | None = typer.Option(
+        None,
+        "--download",
+        "-d",
+        help=(
+            "Stream the binary content of a File/Bytes variable to this path "
+            "instead of printing its JSON."
+        ),
+        dir_okay=False,
+        resolve_path=True,
+    ),
 ) -> None:
     """Retrieve a single task variable and print the JSON response."""
     context = require_context(ctx)
+    if download:
+        with context.build_engine() as engine:
+            written = engine.tasks.download_variable(task_id, var_name, download)
+        if written is None:
+            print_summary("Variable not found.", style="yellow")
+            return
+        print_summary(f"Downloaded {written} bytes to {download}", style="blue")
+        return
+
     with context.build_engine() as engine:
         payload = engine.tasks.get_variable(
             task_id,
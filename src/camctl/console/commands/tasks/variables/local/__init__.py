@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import typer
+from camctl.console.lazy import LazyCommand, lazy_typer
 
-local_app = typer.Typer(
+_PACKAGE = "camctl.console.commands.tasks.variables.local"
+
+local_app = lazy_typer(
+    [
+        LazyCommand(name="list", target=f"{_PACKAGE}.list", help="List local variables."),
+        LazyCommand(name="get", target=f"{_PACKAGE}.get", help="Get a local variable."),
+        LazyCommand(name="update", target=f"{_PACKAGE}.update", help="Update a local variable."),
+        LazyCommand(name="delete", target=f"{_PACKAGE}.delete", help="Delete a local variable."),
+        LazyCommand(name="modify", target=f"{_PACKAGE}.modify", help="Modify local variables."),
+    ],
     help="Manage local task variables.",
     epilog="Use `camctl tasks variables local COMMAND --help` for command-specific options.",
     no_args_is_help=True,
 )
 
-from . import list  # noqa: E402,F401
-from . import get  # noqa: E402,F401
-from . import update  # noqa: E402,F401
-from . import delete  # noqa: E402,F401
-from . import modify  # noqa: E402,F401
-
 __all__ = ["local_app"]
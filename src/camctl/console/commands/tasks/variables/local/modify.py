@@ -6,11 +6,12 @@ from pathlib import Path
 
 import typer
 
+from camctl.api.camunda.common import diff_variables
 from camctl.api.camunda.resources.tasks import TaskVariableModificationRequest
-from camctl.console.commands.tasks.variables.common import load_modifications
 from camctl.console.commands.tasks.variables.local import local_app
 from camctl.console.context import require_context
 from camctl.console.display import print_summary
+from camctl.console.modifications import load_modifications, print_diff_summary
 
 
 @local_app.command(
@@ -39,6 +40,19 @@ def modify_local_variables(
         "--delete",
         help="Variable names to delete (repeatable).",
     ),
+    diff: bool = typer.Option(
+        False,
+        "--diff",
+        help=(
+            "Fetch the current variables first and send only the changes that "
+            "differ from them."
+        ),
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the diff-reduced request and bytes saved without sending it (implies --diff).",
+    ),
 ) -> None:
     """Modify local task variables with a bulk request."""
     try:
@@ -57,6 +71,16 @@ def modify_local_variables(
 
     context = require_context(ctx)
     with context.build_engine() as engine:
+        if diff or dry_run:
+            current = engine.tasks.list_local_variables(task_id, deserialize_values=False)
+            result = diff_variables(current, payload.modifications, payload.deletions)
+            print_diff_summary(result, dry_run=dry_run)
+            if dry_run:
+                return
+            if result.is_empty:
+                print_summary("Local variables already up to date.")
+                return
+            payload = result.request
         engine.tasks.modify_local_variables(task_id, payload=payload)
 
     print_summary("Local variable updates applied.")
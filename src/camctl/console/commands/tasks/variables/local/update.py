@@ -6,11 +6,13 @@ from pathlib import Path
 
 import typer
 
+from camctl.api.camunda.common import diff_variables
 from camctl.api.camunda.resources.tasks import TaskVariablePayload
 from camctl.console.commands.tasks.variables.common import parse_value, parse_value_info
 from camctl.console.commands.tasks.variables.local import local_app
 from camctl.console.context import require_context
 from camctl.console.display import print_summary
+from camctl.console.modifications import print_diff_summary
 
 
 @local_app.command(
@@ -45,6 +47,16 @@ def update_local_variable(
         dir_okay=False,
         resolve_path=True,
     ),
+    diff: bool = typer.Option(
+        False,
+        "--diff",
+        help="Fetch the current variables first and skip the update if the value already matches.",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show whether the update would be sent and the bytes saved (implies --diff).",
+    ),
 ) -> None:
     """Update a local task variable by name."""
     try:
@@ -61,6 +73,15 @@ def update_local_variable(
 
     context = require_context(ctx)
     with context.build_engine() as engine:
+        if diff or dry_run:
+            current = engine.tasks.list_local_variables(task_id, deserialize_values=False)
+            result = diff_variables(current, {var_name: payload})
+            print_diff_summary(result, dry_run=dry_run)
+            if dry_run:
+                return
+            if result.is_empty:
+                print_summary(f"Local variable {var_name} already up to date.")
+                return
         engine.tasks.update_local_variable(task_id, var_name, payload=payload)
 
     print_summary(f"Updated local variable {var_name}.")
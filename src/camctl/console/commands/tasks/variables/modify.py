@@ -1,26 +1,50 @@
-"""Modify task variables."""
+"""Modify task variables, singly or in batch."""
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 import typer
 
-from camctl.api.camunda.resources.tasks import TaskVariableModificationRequest
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.common import diff_variables
+from camctl.api.camunda.resources.tasks import (
+    TaskFilterParams,
+    TaskVariableModificationRequest,
+)
+from camctl.console.commands.tasks import filters as task_filters
 from camctl.console.commands.tasks.variables import variables_app
-from camctl.console.commands.tasks.variables.common import load_modifications
 from camctl.console.context import require_context
 from camctl.console.display import print_summary
+from camctl.console.modifications import (
+    ModificationTarget,
+    VariableChanges,
+    coalesce_records,
+    load_modifications,
+    modify_with_diff,
+    print_diff_summary,
+    run_modification_batch,
+)
+from camctl.utils import iter_records, parse_id_list
+
+_TASK_ID_KEYS = ("task_id", "taskId", "id")
 
 
 @variables_app.command(
     "modify",
-    help="Update and delete task variables in a single request.",
+    help=(
+        "Update and delete task variables in a single request, or apply the changes "
+        "to many tasks concurrently from --ids, a record --file, or task filters."
+    ),
     short_help="Modify variables.",
 )
 def modify_variables(
     ctx: typer.Context,
-    task_id: str = typer.Argument(..., help="Task identifier."),
+    task_id: str | None = typer.Argument(
+        None,
+        help="Task identifier (omit when using --ids, --file, or filters).",
+    ),
     modifications: str | None = typer.Option(
         None,
         "--modifications",
@@ -39,24 +63,300 @@ def modify_variables(
         "--delete",
         help="Variable names to delete (repeatable).",
     ),
+    ids: str | None = typer.Option(
+        None,
+        "--ids",
+        help="Comma-separated task IDs to apply the modifications to.",
+    ),
+    file: Path | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help=(
+            "NDJSON or CSV file of {task_id, modifications, deletions} or "
+            "{task_id, name, value, type} records. Records for the same task are "
+            "coalesced into one request, on top of the shared modifications."
+        ),
+        exists=True,
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    task_id_in: str | None = task_filters.TASK_ID_IN,
+    process_instance_id: str | None = task_filters.PROCESS_INSTANCE_ID,
+    process_instance_id_in: str | None = task_filters.PROCESS_INSTANCE_ID_IN,
+    process_instance_business_key: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY,
+    process_instance_business_key_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_EXPRESSION,
+    process_instance_business_key_in: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_IN,
+    process_instance_business_key_like: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE,
+    process_instance_business_key_like_expression: str | None = task_filters.PROCESS_INSTANCE_BUSINESS_KEY_LIKE_EXPRESSION,
+    process_definition_id: str | None = task_filters.PROCESS_DEFINITION_ID,
+    process_definition_key: str | None = task_filters.PROCESS_DEFINITION_KEY,
+    process_definition_key_in: str | None = task_filters.PROCESS_DEFINITION_KEY_IN,
+    process_definition_name: str | None = task_filters.PROCESS_DEFINITION_NAME,
+    process_definition_name_like: str | None = task_filters.PROCESS_DEFINITION_NAME_LIKE,
+    execution_id: str | None = task_filters.EXECUTION_ID,
+    case_instance_id: str | None = task_filters.CASE_INSTANCE_ID,
+    case_instance_business_key: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY,
+    case_instance_business_key_like: str | None = task_filters.CASE_INSTANCE_BUSINESS_KEY_LIKE,
+    case_definition_id: str | None = task_filters.CASE_DEFINITION_ID,
+    case_definition_key: str | None = task_filters.CASE_DEFINITION_KEY,
+    case_definition_name: str | None = task_filters.CASE_DEFINITION_NAME,
+    case_definition_name_like: str | None = task_filters.CASE_DEFINITION_NAME_LIKE,
+    case_execution_id: str | None = task_filters.CASE_EXECUTION_ID,
+    activity_instance_id_in: str | None = task_filters.ACTIVITY_INSTANCE_ID_IN,
+    tenant_id_in: str | None = task_filters.TENANT_ID_IN,
+    without_tenant_id: bool = task_filters.WITHOUT_TENANT_ID,
+    assignee: str | None = task_filters.ASSIGNEE,
+    assignee_expression: str | None = task_filters.ASSIGNEE_EXPRESSION,
+    assignee_like: str | None = task_filters.ASSIGNEE_LIKE,
+    assignee_like_expression: str | None = task_filters.ASSIGNEE_LIKE_EXPRESSION,
+    assignee_in: str | None = task_filters.ASSIGNEE_IN,
+    assignee_not_in: str | None = task_filters.ASSIGNEE_NOT_IN,
+    owner: str | None = task_filters.OWNER,
+    owner_expression: str | None = task_filters.OWNER_EXPRESSION,
+    candidate_group: str | None = task_filters.CANDIDATE_GROUP,
+    candidate_group_like: str | None = task_filters.CANDIDATE_GROUP_LIKE,
+    candidate_group_expression: str | None = task_filters.CANDIDATE_GROUP_EXPRESSION,
+    candidate_user: str | None = task_filters.CANDIDATE_USER,
+    candidate_user_expression: str | None = task_filters.CANDIDATE_USER_EXPRESSION,
+    include_assigned_tasks: bool = task_filters.INCLUDE_ASSIGNED_TASKS,
+    involved_user: str | None = task_filters.INVOLVED_USER,
+    involved_user_expression: str | None = task_filters.INVOLVED_USER_EXPRESSION,
+    assigned: bool = task_filters.ASSIGNED,
+    unassigned: bool = task_filters.UNASSIGNED,
+    task_definition_key: str | None = task_filters.TASK_DEFINITION_KEY,
+    task_definition_key_in: str | None = task_filters.TASK_DEFINITION_KEY_IN,
+    task_definition_key_like: str | None = task_filters.TASK_DEFINITION_KEY_LIKE,
+    name: str | None = task_filters.NAME,
+    name_not_equal: str | None = task_filters.NAME_NOT_EQUAL,
+    name_like: str | None = task_filters.NAME_LIKE,
+    name_not_like: str | None = task_filters.NAME_NOT_LIKE,
+    description: str | None = task_filters.DESCRIPTION,
+    description_like: str | None = task_filters.DESCRIPTION_LIKE,
+    priority: int | None = task_filters.PRIORITY,
+    max_priority: int | None = task_filters.MAX_PRIORITY,
+    min_priority: int | None = task_filters.MIN_PRIORITY,
+    due_date: str | None = task_filters.DUE_DATE,
+    due_date_expression: str | None = task_filters.DUE_DATE_EXPRESSION,
+    due_after: str | None = task_filters.DUE_AFTER,
+    due_after_expression: str | None = task_filters.DUE_AFTER_EXPRESSION,
+    due_before: str | None = task_filters.DUE_BEFORE,
+    due_before_expression: str | None = task_filters.DUE_BEFORE_EXPRESSION,
+    without_due_date: bool = task_filters.WITHOUT_DUE_DATE,
+    follow_up_date: str | None = task_filters.FOLLOW_UP_DATE,
+    follow_up_date_expression: str | None = task_filters.FOLLOW_UP_DATE_EXPRESSION,
+    follow_up_after: str | None = task_filters.FOLLOW_UP_AFTER,
+    follow_up_after_expression: str | None = task_filters.FOLLOW_UP_AFTER_EXPRESSION,
+    follow_up_before: str | None = task_filters.FOLLOW_UP_BEFORE,
+    follow_up_before_expression: str | None = task_filters.FOLLOW_UP_BEFORE_EXPRESSION,
+    follow_up_before_or_not_existent: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT,
+    follow_up_before_or_not_existent_expression: str | None = task_filters.FOLLOW_UP_BEFORE_OR_NOT_EXISTENT_EXPRESSION,
+    created_on: str | None = task_filters.CREATED_ON,
+    created_on_expression: str | None = task_filters.CREATED_ON_EXPRESSION,
+    created_after: str | None = task_filters.CREATED_AFTER,
+    created_after_expression: str | None = task_filters.CREATED_AFTER_EXPRESSION,
+    created_before: str | None = task_filters.CREATED_BEFORE,
+    created_before_expression: str | None = task_filters.CREATED_BEFORE_EXPRESSION,
+    updated_after: str | None = task_filters.UPDATED_AFTER,
+    updated_after_expression: str | None = task_filters.UPDATED_AFTER_EXPRESSION,
+    delegation_state: str | None = task_filters.DELEGATION_STATE,
+    candidate_groups: str | None = task_filters.CANDIDATE_GROUPS,
+    candidate_groups_expression: str | None = task_filters.CANDIDATE_GROUPS_EXPRESSION,
+    with_candidate_groups: bool = task_filters.WITH_CANDIDATE_GROUPS,
+    without_candidate_groups: bool = task_filters.WITHOUT_CANDIDATE_GROUPS,
+    with_candidate_users: bool = task_filters.WITH_CANDIDATE_USERS,
+    without_candidate_users: bool = task_filters.WITHOUT_CANDIDATE_USERS,
+    active: bool = task_filters.ACTIVE,
+    suspended: bool = task_filters.SUSPENDED,
+    task_variables: str | None = task_filters.TASK_VARIABLES,
+    process_variables: str | None = task_filters.PROCESS_VARIABLES,
+    case_instance_variables: str | None = task_filters.CASE_INSTANCE_VARIABLES,
+    variable_names_ignore_case: bool = task_filters.VARIABLE_NAMES_IGNORE_CASE,
+    variable_values_ignore_case: bool = task_filters.VARIABLE_VALUES_IGNORE_CASE,
+    parent_task_id: str | None = task_filters.PARENT_TASK_ID,
+    with_comment_attachment_info: bool = task_filters.WITH_COMMENT_ATTACHMENT_INFO,
+    status: str | None = task_filters.STATUS,
+    diff: bool = typer.Option(
+        False,
+        "--diff",
+        help=(
+            "Fetch the current variables first and send only the changes that "
+            "differ from them."
+        ),
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the diff-reduced request and bytes saved without sending it (implies --diff).",
+    ),
+    page_size: int = typer.Option(
+        200,
+        "--page-size",
+        help="Number of matching tasks fetched per page in filter mode.",
+        min=1,
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip the confirmation prompt in filter mode.",
+    ),
+    max_workers: int = typer.Option(
+        5,
+        "--max-workers",
+        "-w",
+        help="Maximum number of concurrent modification requests in batch mode.",
+        min=1,
+    ),
+    journal: Path | None = typer.Option(
+        None,
+        "--journal",
+        "-j",
+        help="Append each modification result to a JSON-lines file as it completes.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the batch modification results to a JSON file.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
 ) -> None:
-    """Modify task variables with a bulk request."""
+    """
+    Modify task variables with a bulk request.
+
+    In batch mode every target task receives at most one modification request;
+    with --diff, tasks whose variables already match are skipped.
+    Filter mode counts the matching tasks for confirmation and then streams them
+    page by page into the workers.
+    """
+    filter_kwargs = task_filters.build_task_filter_kwargs(
+        {name: value for name, value in locals().items() if name != "task_id"}
+    )
+    has_filters = bool(filter_kwargs)
+    sources = sum([bool(task_id), bool(ids), bool(file), has_filters])
+    if sources != 1:
+        raise typer.BadParameter(
+            "Provide exactly one of TASK_ID, --ids, --file, or task filters."
+        )
+
     try:
         modifications_payload = load_modifications(modifications, modifications_file)
     except ValueError as exc:
         raise typer.BadParameter(str(exc)) from exc
 
-    deletions = delete or None
-    if not modifications_payload and not deletions:
+    shared = VariableChanges()
+    shared.update(modifications_payload, delete)
+    if not shared and not file:
         raise typer.BadParameter("Provide modifications or delete at least one variable.")
 
-    payload = TaskVariableModificationRequest(
-        modifications=modifications_payload,
-        deletions=deletions,
-    )
+    if dry_run and not task_id:
+        raise typer.BadParameter("--dry-run is only supported with a single TASK_ID.")
 
     context = require_context(ctx)
+    if task_id:
+        payload = TaskVariableModificationRequest(
+            modifications=modifications_payload,
+            deletions=delete or None,
+        )
+        with context.build_engine() as engine:
+            if diff or dry_run:
+                current = engine.tasks.list_variables(task_id, deserialize_values=False)
+                result = diff_variables(current, payload.modifications, payload.deletions)
+                print_diff_summary(result, dry_run=dry_run)
+                if dry_run:
+                    return
+                if result.is_empty:
+                    print_summary("Variables already up to date.")
+                    return
+                payload = result.request
+            engine.tasks.modify_variables(task_id, payload=payload)
+
+        print_summary("Variable updates applied.")
+        return
+
+    targets: Iterable[ModificationTarget] = []
+    total: int | None = None
+    if file:
+        try:
+            grouped = coalesce_records(
+                iter_records(file),
+                id_keys=_TASK_ID_KEYS,
+                base=shared,
+            )
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        total = len(grouped)
+        print_summary(f"Coalesced {file} into {total} task modification(s)", style="blue")
+        targets = [(target, changes.to_request()) for target, changes in grouped.items()]
+    elif ids:
+        task_ids = parse_id_list(ids)
+        if not task_ids:
+            raise typer.BadParameter("No task IDs provided.")
+        total = len(task_ids)
+        request = shared.to_request()
+        targets = [(item, request) for item in task_ids]
+
     with context.build_engine() as engine:
-        engine.tasks.modify_variables(task_id, payload=payload)
+        if has_filters:
+            filters = task_filters.build_task_filters(filter_kwargs)
+            total = engine.tasks.count(params=filters)
+            print_summary(f"{total} task(s) match the filters.", style="blue")
+            if total == 0:
+                return
+            if not yes:
+                typer.confirm(f"Modify variables of {total} task(s)?", abort=True)
+            targets = _matching_targets(
+                engine,
+                filters,
+                shared.to_request(),
+                page_size=page_size,
+                total=total,
+            )
+
+        def _modify(target: str, request: TaskVariableModificationRequest) -> Any:
+            if diff:
+                return modify_with_diff(
+                    lambda target_id: engine.tasks.list_variables(
+                        target_id, deserialize_values=False
+                    ),
+                    lambda target_id, minimal: engine.tasks.modify_variables(
+                        target_id, payload=minimal
+                    ),
+                    target,
+                    request,
+                )
+            return engine.tasks.modify_variables(target, payload=request)
+
+        run_modification_batch(
+            _modify,
+            targets,
+            total=total,
+            id_key="task_id",
+            noun="task(s)",
+            max_workers=max_workers,
+            journal=journal,
+            output=output,
+        )
+
 
-    print_summary("Variable updates applied.")
+def _matching_targets(
+    engine: CamundaEngine,
+    filters: TaskFilterParams,
+    request: TaskVariableModificationRequest,
+    *,
+    page_size: int,
+    total: int,
+) -> Iterator[ModificationTarget]:
+    """Stream matching tasks from the tail so tasks leaving the filter keep offsets valid."""
+    for task in engine.tasks.iterate(
+        params=filters,
+        page_size=page_size,
+        total=total,
+        reverse=True,
+    ):
+        if task.id:
+            yield str(task.id), request
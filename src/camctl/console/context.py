@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import typer
 
-from camctl.api.camunda import CamundaEngine
+from camctl.config import EngineProfile, Settings
+from camctl.console.inputs import parse_comma_list
+
+if TYPE_CHECKING:
+    import httpx
+
+    from camctl.api.camunda import CamundaEngine
+    from camctl.api.http import ClientMetrics, MetricsServer, TimingCollector
+    from camctl.api.http.cassette import Cassette, ReplayTransport
+    from camctl.console.profiling import ProfileMode, Profiler
+    from camctl.daemon.pool import EnginePool
+    from camctl.tracing import Tracer
+
+ALL_ENGINES = "all"
+
+_engine_pool: EnginePool | None = None
+
+
+def use_engine_pool(pool: EnginePool | None) -> None:
+    """Make `CLIContext.build_engine` hand out pooled engines (used by the daemon)."""
+    global _engine_pool
+    _engine_pool = pool
 
 
 @dataclass
@@ -16,10 +39,201 @@ class CLIContext:
 
     authority: str
     scopes: Optional[Sequence[str]] = None
+    settings: Settings = field(default_factory=Settings)
+    engine: Optional[str] = None
+    record: Optional[Path] = None
+    replay: Optional[Path] = None
+    replay_speed: float = 1.0
+    timings: bool = False
+    metrics_port: Optional[int] = None
+    metrics_file: Optional[Path] = None
+    trace: Optional[Path] = None
+    profile: Optional[ProfileMode] = None
+    profile_output: Optional[Path] = None
+    _cassette: Optional[Cassette] = field(default=None, init=False, repr=False)
+    _replay: Optional[ReplayTransport] = field(default=None, init=False, repr=False)
+    _timings: Optional[TimingCollector] = field(default=None, init=False, repr=False)
+    _metrics: Optional[ClientMetrics] = field(default=None, init=False, repr=False)
+    _metrics_server: Optional[MetricsServer] = field(default=None, init=False, repr=False)
+    _tracer: Optional[Tracer] = field(default=None, init=False, repr=False)
+    _trace_scope: ExitStack = field(default_factory=ExitStack, init=False, repr=False)
+    _profiler: Optional[Profiler] = field(default=None, init=False, repr=False)
+
+    def engine_profile(self, name: str | None = None) -> EngineProfile | None:
+        """
+        Return the engine profile to use, or None for the built-in default engine.
+
+        `name` wins over `--engine`, which wins over `default_engine` in the
+        settings file.
+        """
+        selected = name or self.engine or self.settings.default_engine
+        if selected is None:
+            return None
+        profile = self.settings.engines.get(selected)
+        if profile is None:
+            raise typer.BadParameter(_unknown_engine_message(selected, self.settings))
+        return profile
+
+    def engine_names(self, value: str | Sequence[str]) -> list[str]:
+        """Resolve an `--engines` value (comma list or `all`) to profile names."""
+        names = parse_comma_list([value] if isinstance(value, str) else list(value)) or []
+        if names == [ALL_ENGINES]:
+            names = list(self.settings.engines)
+        if not names:
+            raise typer.BadParameter(
+                "No engines selected; define profiles under `engines` in the config file."
+            )
+        for name in names:
+            if name not in self.settings.engines:
+                raise typer.BadParameter(_unknown_engine_message(name, self.settings))
+        return names
+
+    def build_engine(self, name: str | None = None) -> CamundaEngine:
+        """Instantiate a Camunda engine for a profile, or the default engine."""
+        from camctl.api.camunda import CamundaClient, CamundaEngine
+
+        profile = self.engine_profile(name)
+        transport = self.http_transport()
+        timings = self.timing_collector()
+        metrics = self.client_metrics()
+        if _engine_pool is not None and transport is None and timings is None and metrics is None:
+            return _engine_pool.lease(profile)
+        options = {"transport": transport, "timings": timings, "metrics": metrics}
+        if profile is None:
+            return CamundaEngine(CamundaClient(**options))
+        return CamundaEngine(
+            CamundaClient(base_url=profile.base_url, timeout=profile.timeout, **options)
+        )
+
+    def http_transport(self) -> httpx.BaseTransport | None:
+        """
+        Return the transport for `--record` or `--replay`, or None for the network.
+
+        Every engine built during one invocation records into the same
+        cassette (see `save_recording`) or replays from the same one.
+        """
+        if self.replay is not None:
+            if self._replay is None:
+                from camctl.api.http.cassette import ReplayTransport
+
+                try:
+                    self._replay = ReplayTransport.from_file(self.replay, speed=self.replay_speed)
+                except (OSError, ValueError) as exc:
+                    raise typer.BadParameter(
+                        f"Cannot load cassette {self.replay}: {exc}", param_hint="--replay"
+                    ) from exc
+            return self._replay
+        if self.record is not None:
+            from camctl.api.http.cassette import Cassette, RecordingTransport
+
+            if self._cassette is None:
+                self._cassette = Cassette()
+            return RecordingTransport(cassette=self._cassette)
+        return None
+
+    def timing_collector(self) -> TimingCollector | None:
+        """Return the collector shared by every engine when `--timings` is on."""
+        if self.timings and self._timings is None:
+            from camctl.api.http import TimingCollector
+
+            self._timings = TimingCollector()
+        return self._timings
+
+    def print_timings(self) -> None:
+        """Print the `--timings` breakdown, if any engine was built."""
+        if self._timings is not None:
+            from camctl.console.timings import print_timings
+
+            print_timings(self._timings)
 
-    def build_engine(self) -> CamundaEngine:
-        """Instantiate a Camunda engine based on the CLI configuration."""
-        return CamundaEngine()
+    def client_metrics(self) -> ClientMetrics | None:
+        """Return the metrics shared by every engine when metrics export is on."""
+        if (self.metrics_port is not None or self.metrics_file) and self._metrics is None:
+            from camctl.api.http import ClientMetrics
+
+            self._metrics = ClientMetrics()
+        return self._metrics
+
+    def start_metrics(self) -> None:
+        """Serve `/metrics` on `--metrics-port` for the rest of the invocation."""
+        metrics = self.client_metrics()
+        if metrics is None or self.metrics_port is None or self._metrics_server is not None:
+            return
+        from camctl.api.http import MetricsServer
+
+        try:
+            self._metrics_server = MetricsServer(metrics.registry, port=self.metrics_port)
+        except OSError as exc:
+            raise typer.BadParameter(
+                f"Cannot serve metrics on port {self.metrics_port}: {exc}",
+                param_hint="--metrics-port",
+            ) from exc
+        self._metrics_server.start()
+
+    def stop_metrics(self) -> None:
+        """Write `--metrics-file` and stop the metrics endpoint."""
+        if self._metrics is not None and self.metrics_file is not None:
+            from camctl.api.http import write_textfile
+
+            write_textfile(self._metrics.registry, self.metrics_file)
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
+    def start_trace(self, command: str | None) -> None:
+        """Trace the rest of the invocation under a root span named after `command`."""
+        if self.trace is None or self._tracer is not None:
+            return
+        from camctl.tracing import Tracer, span, use_tracer
+
+        self._tracer = Tracer()
+        use_tracer(self._tracer)
+        self._trace_scope.enter_context(span(f"camctl {command or ''}".strip()))
+
+    def finish_trace(self) -> None:
+        """End the root span and write the `--trace` file."""
+        if self._tracer is None or self.trace is None:
+            return
+        from rich.console import Console
+
+        from camctl.tracing import use_tracer
+
+        self._trace_scope.close()
+        use_tracer(None)
+        self._tracer.write_chrome_trace(self.trace)
+        Console(stderr=True).print(
+            f"Trace with {len(self._tracer.spans)} spans written to {self.trace} "
+            "(open it in https://ui.perfetto.dev or chrome://tracing)."
+        )
+
+    def start_profile(self) -> None:
+        """Profile the rest of the invocation with `--profile`."""
+        if self.profile is None or self._profiler is not None:
+            return
+        from camctl.console.profiling import Profiler
+
+        self._profiler = Profiler(self.profile)
+        self._profiler.start()
+
+    def finish_profile(self) -> None:
+        """Stop profiling and print the report, or write it to `--profile-output`."""
+        if self._profiler is None:
+            return
+        import sys
+
+        from rich.console import Console
+
+        self._profiler.stop()
+        if self.profile_output is None:
+            sys.stderr.write(self._profiler.report())
+            return
+        self._profiler.save(self.profile_output)
+        Console(stderr=True).print(f"Profile written to {self.profile_output}.")
+
+    def save_recording(self) -> None:
+        """Write the traffic captured with `--record`, if any requests were made."""
+        if self.record is not None and self._cassette is not None:
+            self._cassette.save(self.record)
 
 
 def require_context(ctx: typer.Context) -> CLIContext:
@@ -27,3 +241,8 @@ def require_context(ctx: typer.Context) -> CLIContext:
     if isinstance(ctx.obj, CLIContext):
         return ctx.obj
     raise typer.BadParameter("Missing CLI context; check global options.")
+
+
+def _unknown_engine_message(name: str, settings: Settings) -> str:
+    known = ", ".join(sorted(settings.engines)) or "none configured"
+    return f"Unknown engine {name!r}. Known engines: {known}."
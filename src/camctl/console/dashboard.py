@@ -0,0 +1,179 @@
+"""Named count queries loaded from a spec file and run concurrently."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+import yaml
+from rich.table import Table
+
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.resources.processes import ProcessFilterParams
+from camctl.api.camunda.resources.tasks import TaskFilterParams
+from camctl.api.http import SerializeMixin
+from camctl.utils import gather
+
+_FILTER_CLASSES: dict[str, type[SerializeMixin]] = {
+    "tasks": TaskFilterParams,
+    "processes": ProcessFilterParams,
+}
+
+
+@dataclass(kw_only=True)
+class CountQuery:
+    """A named count against one resource with fixed filters."""
+
+    name: str
+    resource: str
+    filters: SerializeMixin
+
+    def run(self, engine: CamundaEngine) -> int:
+        api = engine.tasks if self.resource == "tasks" else engine.processes
+        return api.count(params=self.filters)
+
+
+@dataclass(kw_only=True)
+class CountResult:
+    """The outcome of one count query."""
+
+    name: str
+    resource: str
+    count: int | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "resource": self.resource,
+            "count": self.count,
+            "error": self.error,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+        }
+
+
+def load_count_spec(path: Path) -> list[CountQuery]:
+    """
+    Load named count queries from a YAML spec.
+
+    The spec maps query names to a `resource` (`tasks` or `processes`) and
+    `filters` using the snake_case names of the count command options, for
+    example::
+
+        queries:
+          unassigned:
+            resource: tasks
+            filters: {unassigned: true, candidate_group: ops}
+
+    List values are joined with commas, as on the command line.
+    """
+    parsed = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    if not isinstance(parsed, Mapping) or not isinstance(parsed.get("queries"), Mapping):
+        raise ValueError("Count spec must contain a `queries` mapping.")
+    queries = [
+        _parse_query(str(name), entry) for name, entry in parsed["queries"].items()
+    ]
+    if not queries:
+        raise ValueError("Count spec does not define any queries.")
+    return queries
+
+
+def run_counts(
+    engine: CamundaEngine,
+    queries: Sequence[CountQuery],
+    *,
+    max_workers: int = 8,
+    clock: Callable[[], float] = time.perf_counter,
+) -> list[CountResult]:
+    """Run every query concurrently over the engine's client; failures become errors."""
+
+    def _run(query: CountQuery) -> CountResult:
+        started = clock()
+        result = CountResult(name=query.name, resource=query.resource)
+        try:
+            result.count = query.run(engine)
+        except Exception as exc:
+            result.error = str(exc) or type(exc).__name__
+        result.elapsed_seconds = clock() - started
+        return result
+
+    return gather(_run, queries, max_workers=max_workers)
+
+
+def counts_table(
+    results: Sequence[CountResult],
+    *,
+    title: str,
+    previous: Mapping[str, int | None] | None = None,
+    caption: str | None = None,
+) -> Table:
+    """Build the result table; `previous` counts by name add a change column."""
+    table = Table(title=title, caption=caption, header_style="bold magenta")
+    table.add_column("Query")
+    table.add_column("Resource", style="dim")
+    table.add_column("Count", justify="right")
+    if previous is not None:
+        table.add_column("Change", justify="right")
+    table.add_column("Time", justify="right", style="dim")
+    table.add_column("Error", style="red", overflow="fold")
+
+    for result in results:
+        row = [
+            result.name,
+            result.resource,
+            "" if result.count is None else str(result.count),
+        ]
+        if previous is not None:
+            row.append(_change(result.count, previous.get(result.name)))
+        row.extend([f"{result.elapsed_seconds * 1000:.0f} ms", result.error or ""])
+        table.add_row(*row)
+    return table
+
+
+def _parse_query(name: str, entry: Any) -> CountQuery:
+    if not isinstance(entry, Mapping):
+        raise ValueError(f"Query {name!r} must be a mapping.")
+    resource = str(entry.get("resource", "tasks"))
+    params_class = _FILTER_CLASSES.get(resource)
+    if params_class is None:
+        raise ValueError(
+            f"Query {name!r} has unknown resource {resource!r}; "
+            f"use one of {', '.join(_FILTER_CLASSES)}."
+        )
+    raw_filters = entry.get("filters") or {}
+    if not isinstance(raw_filters, Mapping):
+        raise ValueError(f"Filters of query {name!r} must be a mapping.")
+
+    known = {field.name for field in fields(params_class)}
+    kwargs: dict[str, Any] = {}
+    for key, value in raw_filters.items():
+        option = str(key).replace("-", "_")
+        if option not in known:
+            raise ValueError(f"Query {name!r} uses unknown {resource} filter {key!r}.")
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(item) for item in value)
+        kwargs[option] = value
+    return CountQuery(name=name, resource=resource, filters=params_class(**kwargs))
+
+
+def _change(current: int | None, before: int | None) -> str:
+    if current is None or before is None:
+        return ""
+    delta = current - before
+    if delta > 0:
+        return f"[red]+{delta}[/red]"
+    if delta < 0:
+        return f"[green]{delta}[/green]"
+    return "[dim]0[/dim]"
+
+
+__all__ = [
+    "CountQuery",
+    "CountResult",
+    "counts_table",
+    "load_count_spec",
+    "run_counts",
+]
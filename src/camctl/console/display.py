@@ -21,6 +21,12 @@ from camctl.utils import dumps_json, normalize
 _console = Console()
 
 
+def reset_console() -> None:
+    """Rebuild the shared console so it detects the current terminal and environment."""
+    global _console
+    _console = Console()
+
+
 class OutputFormat(str, Enum):
     """Output formats supported by list commands."""
 
@@ -125,16 +131,23 @@ def print_raw_json(payload: Any) -> None:
     typer.echo(dumps_json(payload))
 
 
-def print_tasks(page: Page[Task], *, columns: Sequence[str] | None = None) -> None:
-    """Render a task page as a Rich table."""
+def print_tasks(
+    page: Page[Task],
+    *,
+    columns: Sequence[str] | None = None,
+    engines: Sequence[str] | None = None,
+) -> None:
+    """Render a task page as a Rich table, with an engine column when `engines` is given."""
     column_keys = _resolve_columns(columns, _TASK_COLUMN_SPECS, _TASK_DEFAULT_COLUMNS)
     table = Table(title="Tasks", header_style="bold cyan")
+    if engines is not None:
+        table.add_column("Engine", style="blue")
     for key in column_keys:
         label, _getter, column_kwargs = _TASK_COLUMN_SPECS[key]
         table.add_column(label, **column_kwargs)
 
-    for task in page.items:
-        row = []
+    for index, task in enumerate(page.items):
+        row = [engines[index]] if engines is not None else []
         for key in column_keys:
             _label, getter, _column_kwargs = _TASK_COLUMN_SPECS[key]
             row.append(_string(getter(task)))
@@ -148,16 +161,19 @@ def print_processes(
     page: Page[ProcessInstance],
     *,
     columns: Sequence[str] | None = None,
+    engines: Sequence[str] | None = None,
 ) -> None:
-    """Render a process page as a Rich table."""
+    """Render a process page as a Rich table, with an engine column when `engines` is given."""
     column_keys = _resolve_columns(columns, _PROCESS_COLUMN_SPECS, _PROCESS_DEFAULT_COLUMNS)
     table = Table(title="Processes", header_style="bold green")
+    if engines is not None:
+        table.add_column("Engine", style="blue")
     for key in column_keys:
         label, _getter, column_kwargs = _PROCESS_COLUMN_SPECS[key]
         table.add_column(label, **column_kwargs)
 
-    for proc in page.items:
-        row = []
+    for index, proc in enumerate(page.items):
+        row = [engines[index]] if engines is not None else []
         for key in column_keys:
             _label, getter, _column_kwargs = _PROCESS_COLUMN_SPECS[key]
             row.append(_string(getter(proc)))
@@ -189,6 +205,23 @@ def print_batch_results(
     _console.print(table)
 
 
+def print_group_counts(
+    title: str,
+    column: str,
+    groups: Iterable[tuple[Any, int]],
+) -> None:
+    """Render per-value counts as a table with a total row."""
+    table = Table(title=title, header_style="bold magenta", show_footer=True)
+    rows = list(groups)
+    table.add_column(column, footer="Total")
+    table.add_column("Count", justify="right", footer=str(sum(count for _, count in rows)))
+
+    for value, count in rows:
+        table.add_row("(none)" if value is None else _string(value), str(count))
+
+    _console.print(table)
+
+
 def print_summary(message: str, *, style: str = "green") -> None:
     """Print a highlighted summary line."""
     _console.print(f"[{style}]{message}[/{style}]")
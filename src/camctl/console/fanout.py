@@ -0,0 +1,248 @@
+"""Run read commands against several engine profiles concurrently."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Mapping, Sequence, TypeVar
+
+import typer
+from rich.markup import escape
+
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.common import Page, Resource
+from camctl.console.context import CLIContext
+from camctl.console.display import OutputFormat, print_json, print_raw_json, print_summary
+from camctl.utils import gather, write_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R", bound=Resource)
+
+ENGINES = typer.Option(
+    None,
+    "--engines",
+    help=(
+        "Comma-separated engine profiles (or `all`) to query concurrently. "
+        "Results are merged with an engine column; exits with 1 if any engine fails."
+    ),
+)
+
+
+@dataclass(kw_only=True)
+class EngineResult(Generic[T]):
+    """What one engine returned, or why it failed, and how long it took."""
+
+    engine: str
+    base_url: str | None = None
+    value: T | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def report(self, value: Callable[[T], Mapping[str, Any]] | None = None) -> dict[str, Any]:
+        data = {
+            "engine": self.engine,
+            "base_url": self.base_url,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "error": self.error,
+        }
+        if value is not None and self.value is not None:
+            data.update(value(self.value))
+        return data
+
+
+def fan_out(
+    context: CLIContext,
+    names: Sequence[str],
+    func: Callable[[CamundaEngine], T],
+    *,
+    clock: Callable[[], float] = time.perf_counter,
+) -> list[EngineResult[T]]:
+    """
+    Call `func` with an engine for each profile in `names`, all at once.
+
+    Each engine gets its own client, so the slowest engine bounds the total
+    latency. Failures are captured per engine instead of aborting the others;
+    results keep the order of `names`.
+    """
+
+    def _run(name: str) -> EngineResult[T]:
+        result: EngineResult[T] = EngineResult(engine=name)
+        started = clock()
+        try:
+            with context.build_engine(name) as engine:
+                result.base_url = engine.client.base_url
+                result.value = func(engine)
+        except Exception as exc:
+            logger.debug("Engine %s failed", name, exc_info=True)
+            result.error = str(exc) or type(exc).__name__
+        result.elapsed_seconds = clock() - started
+        return result
+
+    return gather(_run, names, max_workers=max(1, len(names)))
+
+
+def merge_pages(results: Sequence[EngineResult[Page[R]]]) -> tuple[Page[R], list[str]]:
+    """Concatenate the pages of successful engines; returns the page and each item's engine."""
+    items: list[R] = []
+    engines: list[str] = []
+    for result in results:
+        if result.value is None:
+            continue
+        items.extend(result.value.items)
+        engines.extend(result.engine for _ in result.value.items)
+    page = Page(raw={"items": [item.to_dict() for item in items]}, items=items)
+    return page, engines
+
+
+def merged_payload(
+    results: Sequence[EngineResult[T]],
+    value: Callable[[T], Mapping[str, Any]] | None = None,
+    **data: Any,
+) -> dict[str, Any]:
+    """Build the JSON document for a fan-out: `data` plus one report per engine."""
+    return {**data, "engines": [result.report(value) for result in results]}
+
+
+def emit_merged_list(
+    results: Sequence[EngineResult[Page[R]]],
+    *,
+    title: str,
+    noun: str,
+    printer: Callable[..., None],
+    columns: Sequence[str] | None,
+    output: Path | None,
+    format: OutputFormat,
+    raw: bool,
+    ids_only: bool,
+) -> None:
+    """Write and render the merged pages of a list fan-out, then exit on failures."""
+    page, engines = merge_pages(results)
+    payload = merged_payload(
+        results,
+        lambda result: {"items": len(result.items)},
+        items=[
+            {"engine": engine, **item.to_dict()}
+            for engine, item in zip(engines, page.items)
+        ],
+    )
+    if output:
+        write_json(payload, output)
+
+    if ids_only:
+        for engine, item in zip(engines, page.items):
+            if item.id:
+                typer.echo(f"{engine}\t{item.id}")
+    elif raw:
+        print_raw_json(payload)
+    elif format is OutputFormat.JSON:
+        print_json(payload, title=title)
+    else:
+        try:
+            printer(page, columns=columns, engines=engines)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        print_engine_results(results, lambda result: f"{len(result.items)} {noun}")
+    exit_on_failure(results)
+
+
+def emit_merged_count(
+    results: Sequence[EngineResult[int]],
+    *,
+    title: str,
+    noun: str,
+    output: Path | None,
+    format: OutputFormat,
+    raw: bool,
+) -> None:
+    """Write and render per-engine counts and their total, then exit on failures."""
+    total = sum(result.value for result in results if result.value is not None)
+    payload = merged_payload(results, lambda count: {"count": count}, count=total)
+    if output:
+        write_json(payload, output)
+
+    if raw:
+        print_raw_json(payload)
+    elif format is OutputFormat.JSON:
+        print_json(payload, title=title)
+    else:
+        print_engine_results(results, lambda count: f"{count} {noun}")
+        failed = sum(1 for result in results if not result.ok)
+        suffix = f" ({failed} engine(s) failed)" if failed else ""
+        print_summary(f"{total} {noun} across {len(results)} engine(s){suffix}")
+    exit_on_failure(results)
+
+
+def emit_merged_get(
+    results: Sequence[EngineResult[R | None]],
+    *,
+    title: str,
+    output: Path | None,
+) -> None:
+    """Print the resource from every engine that has it, then exit on failures."""
+    found = [result for result in results if result.value is not None]
+    if output and found:
+        payload = merged_payload(
+            results,
+            lambda item: {"found": True},
+            items=[{"engine": result.engine, **result.value.to_dict()} for result in found],
+        )
+        write_json(payload, output)
+        print_summary(f"Saved output to {output}", style="blue")
+    for result in found:
+        print_json(result.value, title=f"{title} ({result.engine})")
+    if not found:
+        print_summary(f"{title} not found on any engine.", style="yellow")
+    print_engine_results(
+        results,
+        lambda item: "found" if item is not None else "not found",
+    )
+    exit_on_failure(results)
+
+
+def print_engine_results(
+    results: Sequence[EngineResult[T]],
+    describe: Callable[[T], str],
+) -> None:
+    """Print one line per engine with its outcome and timing."""
+    for result in results:
+        if result.ok:
+            print_summary(
+                f"{result.engine}: {describe(result.value)} in {result.elapsed_seconds:.2f}s",
+                style="dim",
+            )
+        else:
+            print_summary(
+                escape(
+                    f"{result.engine}: failed after {result.elapsed_seconds:.2f}s: "
+                    f"{result.error}"
+                ),
+                style="red",
+            )
+
+
+def exit_on_failure(results: Sequence[EngineResult[Any]]) -> None:
+    """Exit with status 1 when any engine failed, after everything was printed."""
+    if any(not result.ok for result in results):
+        raise typer.Exit(1)
+
+
+__all__ = [
+    "ENGINES",
+    "EngineResult",
+    "emit_merged_count",
+    "emit_merged_get",
+    "emit_merged_list",
+    "exit_on_failure",
+    "fan_out",
+    "merge_pages",
+    "merged_payload",
+    "print_engine_results",
+]
@@ -0,0 +1,354 @@
+"""Client-side group-by aggregation for task and process instance counts."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, TypeVar
+
+import typer
+
+from camctl.api.http import SerializeMixin
+from camctl.console.display import (
+    OutputFormat,
+    print_group_counts,
+    print_json,
+    print_raw_json,
+    print_summary,
+)
+from camctl.console.inputs import parse_comma_list
+from camctl.utils import gather, write_json
+
+F = TypeVar("F", bound=SerializeMixin)
+
+MAX_PER_VALUE_COUNTS = 50
+
+STRATEGY_COUNT = "count"
+STRATEGY_SCAN = "scan"
+STRATEGY_LOCAL = "local"
+
+_STRATEGY_NOTES = {
+    STRATEGY_COUNT: "one count request per value",
+    STRATEGY_SCAN: "tallied from a streamed scan",
+    STRATEGY_LOCAL: "grouped in the local mirror",
+}
+
+GROUP_VALUES = typer.Option(
+    None,
+    "--values",
+    help=(
+        "Comma-separated group values to count (repeatable). A short list is "
+        "counted with one request per value instead of a full scan."
+    ),
+)
+GROUP_MAX_WORKERS = typer.Option(
+    8,
+    "--max-workers",
+    help="Maximum concurrent count requests when grouping per value.",
+    min=1,
+)
+GROUP_PAGE_SIZE = typer.Option(
+    500,
+    "--page-size",
+    help="Records fetched per request when grouping requires a scan.",
+    min=1,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GroupColumn:
+    """
+    A column that counts can be grouped by.
+
+    `value_filter` turns one group value into filter arguments selecting it,
+    which allows one `count` request per value. `in_filter` names the filter
+    whose comma-separated values, when given, are the complete set of groups.
+    `fixed_values` lists every possible value for enumerable columns, and
+    `parse` converts a value given on the command line to the model's type.
+    """
+
+    attribute: str
+    value_filter: Callable[[str], dict[str, Any]] | None = None
+    in_filter: str | None = None
+    fixed_values: tuple[str, ...] = ()
+    parse: Callable[[str], Any] = str
+
+
+@dataclass(kw_only=True)
+class GroupCounts:
+    """Counts per group value and how they were computed."""
+
+    column: str
+    strategy: str
+    groups: dict[Any, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.groups.values())
+
+    def sorted_groups(self) -> list[tuple[Any, int]]:
+        """Groups ordered by count (descending), then value."""
+        return sorted(self.groups.items(), key=lambda item: (-item[1], str(item[0])))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group_by": self.column,
+            "strategy": self.strategy,
+            "total": self.total,
+            "groups": [{"value": value, "count": count} for value, count in self.sorted_groups()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> GroupCounts:
+        return cls(
+            column=data["group_by"],
+            strategy=data["strategy"],
+            groups={item["value"]: int(item["count"]) for item in data.get("groups", ())},
+        )
+
+
+def _flag(value: str) -> dict[str, Any]:
+    return {"suspended": True} if _parse_flag(value) else {"active": True}
+
+
+def _parse_flag(value: str) -> bool:
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+TASK_GROUP_COLUMNS: dict[str, GroupColumn] = {
+    "assignee": GroupColumn(
+        attribute="assignee",
+        value_filter=lambda value: {"assignee": value},
+        in_filter="assignee_in",
+    ),
+    "owner": GroupColumn(attribute="owner", value_filter=lambda value: {"owner": value}),
+    "name": GroupColumn(attribute="name", value_filter=lambda value: {"name": value}),
+    "priority": GroupColumn(
+        attribute="priority",
+        value_filter=lambda value: {"priority": int(value)},
+        parse=int,
+    ),
+    "task_definition_key": GroupColumn(
+        attribute="task_definition_key",
+        value_filter=lambda value: {"task_definition_key": value},
+        in_filter="task_definition_key_in",
+    ),
+    "tenant_id": GroupColumn(
+        attribute="tenant_id",
+        value_filter=lambda value: {"tenant_id_in": value},
+        in_filter="tenant_id_in",
+    ),
+    "process_instance_id": GroupColumn(
+        attribute="process_instance_id",
+        value_filter=lambda value: {"process_instance_id": value},
+        in_filter="process_instance_id_in",
+    ),
+    "process_definition_id": GroupColumn(
+        attribute="process_definition_id",
+        value_filter=lambda value: {"process_definition_id": value},
+    ),
+    "delegation_state": GroupColumn(attribute="delegation_state"),
+    "suspended": GroupColumn(
+        attribute="suspended",
+        value_filter=_flag,
+        fixed_values=("true", "false"),
+        parse=_parse_flag,
+    ),
+}
+
+PROCESS_GROUP_COLUMNS: dict[str, GroupColumn] = {
+    "definition_id": GroupColumn(
+        attribute="definition_id",
+        value_filter=lambda value: {"process_definition_id": value},
+    ),
+    "definition_key": GroupColumn(
+        attribute="definition_key",
+        value_filter=lambda value: {"process_definition_key": value},
+        in_filter="process_definition_key_in",
+    ),
+    "business_key": GroupColumn(
+        attribute="business_key",
+        value_filter=lambda value: {"business_key": value},
+    ),
+    "tenant_id": GroupColumn(
+        attribute="tenant_id",
+        value_filter=lambda value: {"tenant_id_in": value},
+        in_filter="tenant_id_in",
+    ),
+    "suspended": GroupColumn(
+        attribute="suspended",
+        value_filter=_flag,
+        fixed_values=("true", "false"),
+        parse=_parse_flag,
+    ),
+}
+
+
+def resolve_group_column(name: str, columns: Mapping[str, GroupColumn]) -> GroupColumn:
+    """Return the group column called `name` or raise a ValueError listing the choices."""
+    column = columns.get(name.strip().lower().replace("-", "_"))
+    if column is None:
+        raise ValueError(
+            f"Cannot group by {name!r}. Choose from {', '.join(sorted(columns))}."
+        )
+    return column
+
+
+def resolve_group_option(
+    name: str,
+    columns: Mapping[str, GroupColumn],
+    values: Iterable[str] | None = None,
+) -> GroupColumn:
+    """Resolve `--group-by` and check `--values`, raising BadParameter on bad input."""
+    try:
+        column = resolve_group_column(name, columns)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--group-by") from exc
+    for value in parse_comma_list(list(values or [])) or []:
+        try:
+            column.parse(value)
+        except ValueError as exc:
+            raise typer.BadParameter(
+                f"Invalid {column.attribute} value {value!r}.",
+                param_hint="--values",
+            ) from exc
+    return column
+
+
+def known_values(
+    column: GroupColumn,
+    filters: SerializeMixin,
+    values: Iterable[str] | None = None,
+) -> list[str] | None:
+    """
+    Return the complete set of group values, when it is known up front.
+
+    Explicit `values` win, then the values of the column's `*In` filter, then
+    the column's fixed values. Returns None when the set is unknown.
+    """
+    explicit = parse_comma_list(list(values or []))
+    if explicit:
+        return explicit
+    if column.in_filter:
+        listed = getattr(filters, column.in_filter, None)
+        if listed:
+            return parse_comma_list([listed])
+    if column.fixed_values:
+        return list(column.fixed_values)
+    return None
+
+
+def count_groups(
+    column: GroupColumn,
+    filters: F,
+    *,
+    count: Callable[[F], int],
+    scan: Callable[[F], Iterable[Any]],
+    values: Iterable[str] | None = None,
+    max_workers: int = 8,
+    max_per_value: int = MAX_PER_VALUE_COUNTS,
+) -> GroupCounts:
+    """
+    Count records matching `filters` per value of `column`, choosing the cheaper strategy.
+
+    When the value set is known and at most `max_per_value` long, one `count`
+    request per value runs concurrently. Otherwise the matching records are
+    streamed through `scan` and tallied in a hash map, which also captures
+    records without a value.
+    """
+    group_values = known_values(column, filters, values)
+    if (
+        group_values is not None
+        and column.value_filter is not None
+        and len(group_values) <= max_per_value
+    ):
+        overrides: dict[str, Any] = {column.in_filter: None} if column.in_filter else {}
+
+        def _count(value: str) -> int:
+            return count(replace(filters, **overrides, **column.value_filter(value)))
+
+        counts = gather(_count, group_values, max_workers=max_workers)
+        groups = {
+            column.parse(value): int(result)
+            for value, result in zip(group_values, counts)
+        }
+        return GroupCounts(column=column.attribute, strategy=STRATEGY_COUNT, groups=groups)
+
+    return GroupCounts(
+        column=column.attribute,
+        strategy=STRATEGY_SCAN,
+        groups=restrict_groups(column, _tally(column, scan(filters)), group_values),
+    )
+
+
+def restrict_groups(
+    column: GroupColumn,
+    groups: Mapping[Any, int],
+    values: Iterable[str] | None,
+) -> dict[Any, int]:
+    """Keep only the requested group values, reporting missing ones as zero."""
+    if values is None:
+        return dict(groups)
+    wanted = [column.parse(value) for value in values]
+    return {value: groups.get(value, 0) for value in wanted}
+
+
+def print_group_result(
+    result: GroupCounts,
+    *,
+    title: str,
+    noun: str,
+    format: OutputFormat,
+    raw: bool,
+    output: Path | None = None,
+    note: str | None = None,
+) -> None:
+    """Write and render grouped counts the way the count commands render totals."""
+    payload = result.to_dict()
+    if output:
+        write_json(payload, output)
+
+    if raw:
+        print_raw_json(payload)
+        return
+
+    if format is OutputFormat.JSON:
+        print_json(payload, title=title)
+        return
+
+    print_group_counts(title, result.column, result.sorted_groups())
+    print_summary(
+        f"{result.total} {noun} in {len(result.groups)} group(s); "
+        f"{_STRATEGY_NOTES[result.strategy]}.",
+        style="dim",
+    )
+    if note:
+        print_summary(note, style="dim")
+
+
+def _tally(column: GroupColumn, records: Iterable[Any]) -> Counter[Any]:
+    return Counter(
+        getattr(record, column.attribute, None) for record in records
+    )
+
+
+__all__ = [
+    "GROUP_MAX_WORKERS",
+    "GROUP_PAGE_SIZE",
+    "GROUP_VALUES",
+    "GroupColumn",
+    "GroupCounts",
+    "MAX_PER_VALUE_COUNTS",
+    "PROCESS_GROUP_COLUMNS",
+    "STRATEGY_COUNT",
+    "STRATEGY_LOCAL",
+    "STRATEGY_SCAN",
+    "TASK_GROUP_COLUMNS",
+    "count_groups",
+    "known_values",
+    "print_group_result",
+    "resolve_group_column",
+    "resolve_group_option",
+    "restrict_groups",
+]
@@ -0,0 +1,132 @@
+"""Command groups that import their command modules on first use.
+
+Importing every command module up front pulls in httpx, Rich renderables,
+YAML and the API models before any command runs. A lazy group only knows the
+names and one-line help of its subcommands; the module behind a subcommand is
+imported when that subcommand is invoked, completed or asked for `--help`.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from difflib import get_close_matches
+from typing import Any, ClassVar, Mapping, Sequence
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True, kw_only=True)
+class LazyCommand:
+    """
+    A subcommand resolved by importing `target`.
+
+    `target` is either `package.module`, whose import registers the command
+    on the owning Typer app with a decorator, or `package.module:attribute`
+    naming a sub-Typer app (mounted as a group) or a command function.
+    `help` is the one-line summary shown in the parent's command list.
+    """
+
+    name: str
+    target: str
+    help: str
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves `lazy_commands` on demand (see `lazy_typer`)."""
+
+    lazy_commands: ClassVar[Mapping[str, LazyCommand]] = {}
+    typer_app: ClassVar[typer.Typer | None] = None
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._listing = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = list(self.lazy_commands)
+        return names + [name for name in super().list_commands(ctx) if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return None
+        if self._listing:
+            # Help listings only need the name and summary line.
+            return click.Command(spec.name, help=spec.help, short_help=spec.help)
+        command = self._load(spec)
+        self.add_command(command, spec.name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError as exc:
+            if self.suggest_commands and args and "Did you mean" not in exc.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(repr(match) for match in matches)
+                    exc.message = f"{exc.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+
+    def _load(self, spec: LazyCommand) -> click.Command:
+        module_name, _, attribute = spec.target.partition(":")
+        module = importlib.import_module(module_name)
+        app = self.typer_app
+        if not attribute:
+            if app is not None:
+                for info in app.registered_commands:
+                    if info.name == spec.name:
+                        return _convert(app, info)
+            raise LookupError(f"{module_name} did not register a {spec.name!r} command.")
+
+        target = getattr(module, attribute)
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+            command.name = spec.name
+            return command
+        if app is None:
+            raise LookupError(f"Cannot register {spec.target} without a Typer app.")
+        app.command(spec.name, short_help=spec.help)(target)
+        return _convert(app, app.registered_commands[-1])
+
+
+def lazy_typer(
+    commands: Sequence[LazyCommand],
+    *,
+    app_class: type[typer.Typer] = typer.Typer,
+    **options: Any,
+) -> typer.Typer:
+    """Create a Typer app whose `commands` are imported on first use."""
+    group_class = type(
+        "LazyTyperGroup",
+        (LazyGroup,),
+        {"lazy_commands": {spec.name: spec for spec in commands}},
+    )
+    app = app_class(cls=group_class, **options)
+    group_class.typer_app = app
+    return app
+
+
+def _convert(app: typer.Typer, info: typer.models.CommandInfo) -> click.Command:
+    return typer.main.get_command_from_info(
+        info,
+        pretty_exceptions_short=app.pretty_exceptions_short,
+        rich_markup_mode=app.rich_markup_mode,
+    )
+
+
+__all__ = ["LazyCommand", "LazyGroup", "lazy_typer"]
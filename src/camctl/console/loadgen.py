@@ -0,0 +1,438 @@
+"""Closed- and open-loop load generation against the engine REST API."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Mapping, Sequence
+
+import httpx
+from rich.table import Table
+
+from camctl.api.camunda import CamundaEngine
+from camctl.api.camunda.errors import CamundaAPIError
+from camctl.api.camunda.resources.processes import ProcessListParams
+from camctl.api.camunda.resources.tasks import TaskCompletionRequest, TaskListParams
+from camctl.api.http import CircuitBreakerOpenError
+from camctl.utils import gather, latency_histogram, summarize_latencies, throughput
+
+PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0, 99.9)
+
+DEFAULT_MIX = "tasks.list=4,tasks.count=2,tasks.get=2,processes.list=1,processes.count=1"
+
+
+class SampleExhaustedError(RuntimeError):
+    """Raised when an operation needs an ID but the sampled pool is empty."""
+
+
+@dataclass(kw_only=True)
+class LoadTarget:
+    """IDs sampled from the engine before the run, shared by all workers."""
+
+    task_ids: list[str] = field(default_factory=list)
+    process_ids: list[str] = field(default_factory=list)
+    page_size: int = 50
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def pick(self, pool: Sequence[str], rng: random.Random) -> str:
+        if not pool:
+            raise SampleExhaustedError("No sampled IDs left for this operation.")
+        return rng.choice(pool)
+
+    def take_task(self) -> str:
+        """Remove and return a task ID; completed tasks cannot be reused."""
+        with self._lock:
+            if not self.task_ids:
+                raise SampleExhaustedError("Every sampled task has been completed.")
+            return self.task_ids.pop()
+
+
+@dataclass(frozen=True, kw_only=True)
+class Operation:
+    """One kind of API call the load generator can issue."""
+
+    name: str
+    call: Callable[[CamundaEngine, LoadTarget, random.Random], Any]
+    needs: str | None = None
+    writes: bool = False
+
+
+OPERATIONS: dict[str, Operation] = {
+    op.name: op
+    for op in (
+        Operation(
+            name="tasks.get",
+            needs="tasks",
+            call=lambda engine, target, rng: engine.tasks.get(target.pick(target.task_ids, rng)),
+        ),
+        Operation(
+            name="tasks.list",
+            call=lambda engine, target, rng: engine.tasks.list(
+                params=TaskListParams(first_result=0, max_results=target.page_size)
+            ),
+        ),
+        Operation(name="tasks.count", call=lambda engine, target, rng: engine.tasks.count()),
+        Operation(
+            name="tasks.variables",
+            needs="tasks",
+            call=lambda engine, target, rng: engine.tasks.list_variables(
+                target.pick(target.task_ids, rng)
+            ),
+        ),
+        Operation(
+            name="tasks.complete",
+            needs="tasks",
+            writes=True,
+            call=lambda engine, target, rng: engine.tasks.complete(
+                target.take_task(), payload=TaskCompletionRequest()
+            ),
+        ),
+        Operation(
+            name="processes.get",
+            needs="processes",
+            call=lambda engine, target, rng: engine.processes.get(
+                target.pick(target.process_ids, rng)
+            ),
+        ),
+        Operation(
+            name="processes.list",
+            call=lambda engine, target, rng: engine.processes.list(
+                params=ProcessListParams(first_result=0, max_results=target.page_size)
+            ),
+        ),
+        Operation(
+            name="processes.count", call=lambda engine, target, rng: engine.processes.count()
+        ),
+        Operation(
+            name="processes.variables",
+            needs="processes",
+            call=lambda engine, target, rng: engine.processes.variables(
+                target.pick(target.process_ids, rng)
+            ),
+        ),
+    )
+}
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Parse `op=weight,...` into operation weights.
+
+    A bare operation name has weight 1. Raises ValueError for unknown
+    operations or non-positive weights.
+    """
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight_text = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            known = ", ".join(OPERATIONS)
+            raise ValueError(f"Unknown operation {name!r}. Known operations: {known}.")
+        try:
+            weight = float(weight_text) if weight_text.strip() else 1.0
+        except ValueError as exc:
+            raise ValueError(f"Invalid weight for {name!r}: {weight_text!r}.") from exc
+        if weight <= 0:
+            raise ValueError(f"Weight for {name!r} must be positive.")
+        mix[name] = mix.get(name, 0.0) + weight
+    if not mix:
+        raise ValueError("The mix must name at least one operation.")
+    return mix
+
+
+def sample_target(
+    engine: CamundaEngine, mix: Mapping[str, float], *, sample: int, page_size: int
+) -> LoadTarget:
+    """Fetch up to `sample` task and process IDs for the operations that need them."""
+    needs = {OPERATIONS[name].needs for name in mix}
+    target = LoadTarget(page_size=page_size)
+    if "tasks" in needs:
+        page = engine.tasks.list(params=TaskListParams(first_result=0, max_results=sample))
+        target.task_ids = [task.id for task in page.items if task.id]
+    if "processes" in needs:
+        page = engine.processes.list(params=ProcessListParams(first_result=0, max_results=sample))
+        target.process_ids = [process.id for process in page.items if process.id]
+    return target
+
+
+def error_kind(exc: Exception) -> str:
+    """Short label used to group errors in the report."""
+    if isinstance(exc, CircuitBreakerOpenError):
+        return "breaker open"
+    if isinstance(exc, CamundaAPIError):
+        return f"HTTP {exc.status_code}"
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.TransportError):
+        return "connection"
+    return type(exc).__name__
+
+
+@dataclass(kw_only=True)
+class OperationStats:
+    """Latency samples (ms) and error counts for one operation."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def to_dict(self, elapsed_seconds: float) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.error_count,
+            "error_rate": round(self.error_count / self.requests, 4) if self.requests else 0.0,
+            "error_kinds": dict(self.errors.most_common()),
+            "throughput_rps": round(throughput(self.requests, elapsed_seconds), 2),
+            "latency_ms": _rounded(summarize_latencies(self.latencies_ms, percentiles=PERCENTILES)),
+        }
+
+
+@dataclass(kw_only=True)
+class LoadReport:
+    """Outcome of a load run."""
+
+    mix: dict[str, float]
+    concurrency: int
+    target_rps: float | None
+    elapsed_seconds: float = 0.0
+    started_at: str = ""
+    breaker_trips: int = 0
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+
+    def overall(self) -> OperationStats:
+        merged = OperationStats()
+        for stats in self.operations.values():
+            merged.latencies_ms.extend(stats.latencies_ms)
+            merged.errors.update(stats.errors)
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        overall = self.overall()
+        return {
+            "started_at": self.started_at,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "concurrency": self.concurrency,
+            "target_rps": self.target_rps,
+            "mix": self.mix,
+            "breaker_trips": self.breaker_trips,
+            "summary": overall.to_dict(self.elapsed_seconds),
+            "histogram_ms": [
+                {"le": bound, "count": count}
+                for bound, count in latency_histogram(overall.latencies_ms)
+            ],
+            "operations": {
+                name: stats.to_dict(self.elapsed_seconds)
+                for name, stats in sorted(self.operations.items())
+            },
+        }
+
+
+class _Schedule:
+    """Hands out request slots until the request budget or deadline runs out."""
+
+    def __init__(
+        self,
+        *,
+        rps: float | None,
+        requests: int | None,
+        deadline: float | None,
+        clock: Callable[[], float],
+    ) -> None:
+        self._interval = 1.0 / rps if rps else None
+        self._remaining = requests
+        self._deadline = deadline
+        self._clock = clock
+        self._first: float | None = None
+        self._issued = 0
+        self._lock = threading.Lock()
+
+    def next_slot(self) -> float | None:
+        """Return the intended start time of the next request, or None to stop."""
+        with self._lock:
+            now = self._clock()
+            if self._remaining is not None:
+                if self._remaining <= 0:
+                    return None
+                self._remaining -= 1
+            if self._interval is None:
+                slot = now
+            else:
+                # Offsets from the first slot, so rounding does not drift the rate.
+                if self._first is None:
+                    self._first = now
+                slot = self._first + self._issued * self._interval
+                self._issued += 1
+            if self._deadline is not None and slot >= self._deadline:
+                return None
+            return slot
+
+
+def run_load(
+    engine: CamundaEngine,
+    mix: Mapping[str, float],
+    target: LoadTarget,
+    *,
+    concurrency: int,
+    duration: float | None = None,
+    requests: int | None = None,
+    rps: float | None = None,
+    seed: int | None = None,
+    on_request: Callable[[str, Exception | None], None] | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> LoadReport:
+    """
+    Issue requests drawn from `mix` from `concurrency` workers.
+
+    The run stops after `duration` seconds or `requests` requests, whichever
+    comes first. Without `rps` each worker sends its next request as soon as
+    the previous one returns. With `rps` requests are scheduled at a fixed
+    rate and latency is measured from the scheduled start, so time spent
+    queued behind a slow engine counts against it instead of being hidden
+    (coordinated omission).
+    """
+    if duration is None and requests is None:
+        raise ValueError("Set a duration, a request count or both.")
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    report = LoadReport(
+        mix=dict(mix),
+        concurrency=concurrency,
+        target_rps=rps,
+        started_at=datetime.now().astimezone().isoformat(),
+        operations={name: OperationStats() for name in names},
+    )
+    breaker = engine.client.circuit_breaker
+    trips_before = breaker.trips if breaker else 0
+    lock = threading.Lock()
+    started = clock()
+    schedule = _Schedule(
+        rps=rps,
+        requests=requests,
+        deadline=started + duration if duration else None,
+        clock=clock,
+    )
+
+    def worker(index: int) -> None:
+        rng = random.Random(None if seed is None else seed + index)
+        while True:
+            slot = schedule.next_slot()
+            if slot is None:
+                return
+            delay = slot - clock()
+            if delay > 0:
+                sleep(delay)
+            name = rng.choices(names, weights)[0]
+            began = slot if rps else clock()
+            error: Exception | None = None
+            try:
+                OPERATIONS[name].call(engine, target, rng)
+            except Exception as exc:
+                error = exc
+            latency_ms = (clock() - began) * 1000.0
+            with lock:
+                stats = report.operations[name]
+                stats.latencies_ms.append(latency_ms)
+                if error is not None:
+                    stats.errors[error_kind(error)] += 1
+            if on_request:
+                on_request(name, error)
+
+    gather(worker, range(concurrency), max_workers=concurrency)
+    report.elapsed_seconds = clock() - started
+    report.breaker_trips = (breaker.trips if breaker else 0) - trips_before
+    return report
+
+
+def operations_table(report: LoadReport) -> Table:
+    """Per-operation throughput, errors and latency percentiles."""
+    table = Table(title="Load test", header_style="bold cyan", show_footer=True)
+    data = report.to_dict()
+    summary = data["summary"]
+    table.add_column("Operation", footer="Total", no_wrap=True)
+    for label, key in (("Requests", "requests"), ("Errors", "errors")):
+        table.add_column(label, justify="right", footer=str(summary[key]))
+    table.add_column("Error %", justify="right", footer=_percent(summary["error_rate"]))
+    table.add_column("RPS", justify="right", footer=f"{summary['throughput_rps']:.1f}")
+    for percentile in PERCENTILES:
+        key = f"p{percentile:g}"
+        table.add_column(key, justify="right", footer=_ms(summary["latency_ms"][key]))
+    table.add_column("Max", justify="right", footer=_ms(summary["latency_ms"]["max"]))
+
+    for name, stats in data["operations"].items():
+        latency = stats["latency_ms"]
+        table.add_row(
+            name,
+            str(stats["requests"]),
+            str(stats["errors"]),
+            _percent(stats["error_rate"]),
+            f"{stats['throughput_rps']:.1f}",
+            *(_ms(latency[f"p{percentile:g}"]) for percentile in PERCENTILES),
+            _ms(latency["max"]),
+        )
+    return table
+
+
+def histogram_table(report: LoadReport, *, width: int = 40) -> Table:
+    """Latency histogram of every request, one row per non-empty bucket."""
+    buckets = latency_histogram(report.overall().latencies_ms)
+    peak = max((count for _, count in buckets), default=0)
+    table = Table(title="Latency histogram", header_style="bold cyan")
+    table.add_column("≤ ms", justify="right")
+    table.add_column("Count", justify="right")
+    table.add_column("")
+    for bound, count in buckets:
+        if not count:
+            continue
+        bar = "█" * max(1, round(count / peak * width)) if peak else ""
+        table.add_row("∞" if bound is None else f"{bound:g}", str(count), f"[blue]{bar}[/blue]")
+    return table
+
+
+def _rounded(summary: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        key: round(value, 3) if isinstance(value, float) else value
+        for key, value in summary.items()
+    }
+
+
+def _ms(value: float) -> str:
+    return f"{value:.1f}"
+
+
+def _percent(rate: float) -> str:
+    return f"{rate * 100:.2f}"
+
+
+__all__ = [
+    "DEFAULT_MIX",
+    "LoadReport",
+    "LoadTarget",
+    "OPERATIONS",
+    "Operation",
+    "OperationStats",
+    "PERCENTILES",
+    "SampleExhaustedError",
+    "error_kind",
+    "histogram_table",
+    "operations_table",
+    "parse_mix",
+    "run_load",
+    "sample_target",
+]
@@ -1,12 +1,31 @@
-"""Logging configuration for the camctl CLI."""
+"""Logging configuration for the camctl CLI.
+
+With `-v` or `--log-file`, records are handed to a queue in the thread
+that logs them and written by one listener thread, so `gather` workers
+logging at `-vv` do not wait on the terminal or a log file. The level,
+`camctl` and sampling filters run before a record is queued, so dropped
+records cost next to nothing.
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
-from typing import Mapping
+import sys
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
 
 import typer
 
+if TYPE_CHECKING:
+    import queue
+    from logging.handlers import QueueListener
+
 _CAMCTL_FILTER = logging.Filter(name="camctl")
 
 _LEVEL_COLORS: Mapping[int, str] = {
@@ -17,6 +36,22 @@ _LEVEL_COLORS: Mapping[int, str] = {
     logging.CRITICAL: "red",
 }
 
+# Attributes every LogRecord has; anything else was passed with `extra=`.
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+_listener: QueueListener | None = None
+_queue_handler: _QueueHandler | None = None
+_atexit_registered = False
+
+
+class LogFormat(str, Enum):
+    """Log record formats for `--log-format`."""
+
+    TEXT = "text"
+    JSON = "json"
+
 
 class TyperHandler(logging.Handler):
     """Logging handler that writes to the terminal using Typer."""
@@ -32,12 +67,122 @@ class TyperHandler(logging.Handler):
             self.handleError(record)
 
 
-def configure_logging(verbosity: int) -> None:
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as JSON lines.
+
+    Each line has `time` (UTC, ISO 8601), `level`, `logger`, `thread` and
+    `message`, followed by the record's `extra` fields, such as the
+    `request_id`, `status_code` and `duration_ms` of engine requests.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(data, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of records at or below `level` (debug by default).
+
+    Sampling is counted per logging call site, so a rare debug message is
+    not drowned out by a frequent one; the first record from each site is
+    always kept, so a rate of 0 keeps exactly one. Records above `level`
+    always pass.
+    """
+
+    def __init__(self, rate: float, *, level: int = logging.DEBUG) -> None:
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate must be between 0 and 1, got {rate}")
+        self.rate = rate
+        self.level = level
+        self._credit: dict[tuple[str, int], float] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level or self.rate >= 1.0:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            credit = self._credit.get(key, 1.0 - self.rate) + self.rate
+            keep = credit >= 1.0
+            self._credit[key] = credit - 1.0 if keep else credit
+        return keep
+
+
+class _QueueHandler(logging.Handler):
+    """
+    Queue records without formatting them in the logging thread.
+
+    Only what depends on the logging thread is resolved before queueing:
+    the message arguments, exception text and, while tracing, the current
+    trace and span ids.
+    """
+
+    _exceptions = logging.Formatter()
+
+    def __init__(self, records: queue.SimpleQueue[logging.LogRecord]) -> None:
+        super().__init__()
+        self.queue = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exceptions.formatException(record.exc_info)
+            record.exc_info = None
+        tracing = sys.modules.get("camctl.tracing")
+        current = tracing.current_span() if tracing is not None else None
+        if current is not None:
+            record.trace_id = current.trace_id
+            record.span_id = current.span_id
+        return record
+
+
+def configure_logging(
+    verbosity: int,
+    *,
+    log_format: LogFormat = LogFormat.TEXT,
+    log_file: Path | None = None,
+    sample_rate: float = 1.0,
+) -> None:
     """
     Configure logging for CLI runs.
 
     Args:
         verbosity: 0 = warnings only, 1 = info, 2+ = debug.
+        log_format: Text for people or JSON lines for tools.
+        log_file: Append records to this file; the terminal then only
+            shows warnings and errors.
+        sample_rate: Fraction of debug records to keep.
+
+    Raises:
+        OSError: When `log_file` cannot be opened.
     """
     level = logging.WARNING
     if verbosity >= 2:
@@ -45,18 +190,99 @@ def configure_logging(verbosity: int) -> None:
     elif verbosity == 1:
         level = logging.INFO
 
-    handler = TyperHandler()
-    if verbosity >= 2:
-        formatter = logging.Formatter("%(levelname)s %(name)s: %(message)s")
+    terminal: logging.Handler
+    if log_format is LogFormat.JSON:
+        # JSON lines go to stderr so they never mix with command output.
+        terminal = logging.StreamHandler(sys.stderr)
+        terminal.setFormatter(JsonFormatter())
     else:
-        formatter = logging.Formatter("%(message)s")
-    handler.setFormatter(formatter)
+        terminal = TyperHandler()
+        terminal.setFormatter(_text_formatter(verbosity))
+    handlers = [terminal]
+    if log_file is not None:
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        if log_format is LogFormat.JSON:
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler.setFormatter(
+                logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+            )
+        handlers.append(file_handler)
+        terminal.setLevel(logging.WARNING)
 
+    filters: list[logging.Filter] = []
     if verbosity < 2:
-        handler.addFilter(_CAMCTL_FILTER)
+        filters.append(_CAMCTL_FILTER)
+    if sample_rate < 1.0:
+        filters.append(SamplingFilter(sample_rate))
 
+    stop_logging()
     root = logging.getLogger()
+    for handler in root.handlers:
+        handler.close()
     root.handlers.clear()
     root.setLevel(level)
-    root.addHandler(handler)
     logging.captureWarnings(True)
+
+    if verbosity == 0 and log_file is None:
+        # Warnings only: too few records to be worth a listener thread.
+        for handler in handlers:
+            _add_handler(root, handler, filters)
+        return
+
+    import queue
+    from logging.handlers import QueueListener
+
+    global _listener, _queue_handler, _atexit_registered
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _QueueHandler(records)
+    for log_filter in filters:
+        _queue_handler.addFilter(log_filter)
+    root.addHandler(_queue_handler)
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(stop_logging)
+        _atexit_registered = True
+
+
+def stop_logging() -> None:
+    """
+    Write out queued records and stop the listener thread.
+
+    Later records are written synchronously by the same handlers, so
+    logging keeps working, for example in the daemon between commands.
+    """
+    global _listener, _queue_handler
+    listener, queued = _listener, _queue_handler
+    _listener = _queue_handler = None
+    if listener is None or queued is None:
+        return
+    listener.stop()
+    root = logging.getLogger()
+    if queued in root.handlers:
+        root.removeHandler(queued)
+        for handler in listener.handlers:
+            _add_handler(root, handler, queued.filters)
+
+
+def _text_formatter(verbosity: int) -> logging.Formatter:
+    if verbosity >= 2:
+        return logging.Formatter("%(levelname)s %(name)s: %(message)s")
+    return logging.Formatter("%(message)s")
+
+
+def _add_handler(logger: logging.Logger, handler: logging.Handler, filters: list[Any]) -> None:
+    for log_filter in filters:
+        handler.addFilter(log_filter)
+    logger.addHandler(handler)
+
+
+__all__ = [
+    "JsonFormatter",
+    "LogFormat",
+    "SamplingFilter",
+    "TyperHandler",
+    "configure_logging",
+    "stop_logging",
+]
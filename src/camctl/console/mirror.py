@@ -0,0 +1,39 @@
+"""Helpers for commands that read from the local SQLite mirror."""
+
+from __future__ import annotations
+
+import typer
+
+from camctl.console.context import CLIContext
+from camctl.sync import LocalStore, mirror_path
+
+LOCAL_OPTION_HELP = (
+    "Query the local mirror maintained by `camctl sync` instead of the engine. "
+    "Supports a subset of the filters."
+)
+
+
+def open_mirror(context: CLIContext) -> LocalStore:
+    """Open the local mirror for the context's engine or fail with a CLI error."""
+    profile = context.engine_profile()
+    if profile is not None:
+        base_url = profile.base_url
+    else:
+        from camctl.api.camunda.client import DEFAULT_BASE_URL
+
+        base_url = DEFAULT_BASE_URL
+    try:
+        return LocalStore.open_existing(mirror_path(base_url))
+    except FileNotFoundError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+def synced_at_note(store: LocalStore, resource: str) -> str:
+    """Describe when a mirrored resource was last synced."""
+    state = store.get_state(resource)
+    if state is None:
+        return f"Local mirror has never synced {resource}; run `camctl sync`."
+    return f"Local mirror of {resource} synced at {state.synced_at} ({state.mode})."
+
+
+__all__ = ["LOCAL_OPTION_HELP", "open_mirror", "synced_at_note"]
@@ -0,0 +1,310 @@
+"""Helpers for applying variable modifications to many targets in batch."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from camctl.api.camunda.common import (
+    Variable,
+    VariableDiff,
+    VariableModificationRequest,
+    VariablePayload,
+    diff_variables,
+)
+from camctl.console.batch import BatchResult, report_batch, run_batch
+from camctl.console.display import print_json, print_summary
+from camctl.console.inputs import merge_mappings, parse_comma_list, parse_json_mapping
+
+ModificationTarget = tuple[str, VariableModificationRequest]
+
+
+@dataclass(kw_only=True)
+class VariableChanges:
+    """
+    Accumulated modifications and deletions for a single target.
+
+    Changes are applied in order: a later modification of a name cancels an
+    earlier deletion of it and vice versa, so the coalesced request matches
+    what applying every change one by one would have produced.
+    """
+
+    modifications: dict[str, VariablePayload] = field(default_factory=dict)
+    deletions: list[str] = field(default_factory=list)
+
+    def update(
+        self,
+        modifications: Mapping[str, VariablePayload] | None = None,
+        deletions: Sequence[str] | None = None,
+    ) -> None:
+        for name, payload in (modifications or {}).items():
+            if name in self.deletions:
+                self.deletions.remove(name)
+            self.modifications[name] = payload
+        for name in deletions or ():
+            self.modifications.pop(name, None)
+            if name not in self.deletions:
+                self.deletions.append(name)
+
+    def copy(self) -> VariableChanges:
+        return VariableChanges(
+            modifications=dict(self.modifications),
+            deletions=list(self.deletions),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.modifications or self.deletions)
+
+    def to_request(self) -> VariableModificationRequest:
+        return VariableModificationRequest(
+            modifications=dict(self.modifications) or None,
+            deletions=list(self.deletions) or None,
+        )
+
+
+def build_modifications(
+    mapping: Mapping[str, Any],
+) -> Mapping[str, VariablePayload]:
+    """Build variable payloads from a `{name: {value, type, valueInfo}}` mapping."""
+    modifications: dict[str, VariablePayload] = {}
+    for name, payload in mapping.items():
+        if not isinstance(payload, Mapping):
+            raise ValueError(
+                f"Modification for {name!r} must be an object with a value key."
+            )
+        if "value" not in payload:
+            raise ValueError(
+                f"Modification for {name!r} must include a value key."
+            )
+        value_info = payload.get("valueInfo") or payload.get("value_info")
+        modifications[name] = VariablePayload(
+            value=payload["value"],
+            type=payload.get("type"),
+            value_info=value_info,
+        )
+    return modifications
+
+
+def load_modifications(
+    modifications: str | None,
+    modifications_file: Path | None,
+) -> Mapping[str, VariablePayload] | None:
+    """Load modifications from a JSON string and/or file; the string wins on conflicts."""
+    file_mods = parse_json_mapping(None, modifications_file)
+    raw_mods = parse_json_mapping(modifications, None)
+    merged = merge_mappings(file_mods, raw_mods)
+    if not merged:
+        return None
+    return build_modifications(merged)
+
+
+def record_changes(record: Mapping[str, Any]) -> VariableChanges:
+    """
+    Parse the changes described by one modification record.
+
+    Records carry either a `modifications` object (a mapping or a JSON string,
+    as in CSV files) or a single variable via `name`/`value`/`type`/`value_info`,
+    plus optional `deletions` as a list or comma-separated string.
+    """
+    changes = VariableChanges()
+    raw_mods = record.get("modifications")
+    if isinstance(raw_mods, str):
+        raw_mods = parse_json_mapping(raw_mods, None)
+    elif raw_mods is not None and not isinstance(raw_mods, Mapping):
+        raise ValueError("Record modifications must be a JSON object.")
+    mods = dict(raw_mods or {})
+
+    name = record.get("name")
+    if name:
+        mods[str(name)] = {
+            key: record[key]
+            for key in ("value", "type", "valueInfo", "value_info")
+            if key in record
+        }
+
+    raw_deletions = record.get("deletions")
+    if isinstance(raw_deletions, str):
+        deletions = parse_comma_list([raw_deletions])
+    elif raw_deletions is None or isinstance(raw_deletions, Sequence):
+        deletions = [str(item) for item in raw_deletions or ()]
+    else:
+        raise ValueError("Record deletions must be a list or comma-separated string.")
+
+    changes.update(build_modifications(mods), deletions)
+    return changes
+
+
+def coalesce_records(
+    records: Iterable[Mapping[str, Any]],
+    *,
+    id_keys: Sequence[str],
+    base: VariableChanges | None = None,
+) -> dict[str, VariableChanges]:
+    """
+    Group modification records by target, merging them into one change set each.
+
+    Args:
+        records: Modification records, applied in order.
+        id_keys: Record keys checked (in order) for the target identifier.
+        base: Shared changes applied to every target before its own records.
+
+    Returns:
+        Changes keyed by target ID, in order of first appearance.
+
+    Raises:
+        ValueError: If a record has no target ID or invalid changes.
+    """
+    grouped: dict[str, VariableChanges] = {}
+    for index, record in enumerate(records, start=1):
+        target = record_target(record, id_keys)
+        if not target:
+            raise ValueError(f"Modification record {index} is missing a target ID.")
+        try:
+            changes = record_changes(record)
+        except ValueError as exc:
+            raise ValueError(f"Modification record {index}: {exc}") from exc
+        if target not in grouped:
+            grouped[target] = base.copy() if base else VariableChanges()
+        grouped[target].update(changes.modifications, changes.deletions)
+    return grouped
+
+
+def record_target(record: Mapping[str, Any], id_keys: Sequence[str]) -> str:
+    """Return the first non-empty identifier found under `id_keys`."""
+    for key in id_keys:
+        value = record.get(key)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def modify_with_diff(
+    fetch_current: Callable[[str], Mapping[str, Variable]],
+    modify: Callable[[str, VariableModificationRequest], Any],
+    target: str,
+    request: VariableModificationRequest,
+) -> dict[str, Any]:
+    """
+    Send only the changes that differ from the target's stored variables.
+
+    The request is skipped entirely when nothing would change. Returns batch
+    result fields describing what was sent and what was skipped.
+    """
+    diff = diff_variables(fetch_current(target), request.modifications, request.deletions)
+    if not diff.is_empty:
+        modify(target, diff.request)
+    return diff_result_fields(diff)
+
+
+def diff_result_fields(diff: VariableDiff) -> dict[str, Any]:
+    """Summarize a diff as batch result fields."""
+    return {
+        "modified": sorted(diff.request.modifications or {}),
+        "deleted": list(diff.request.deletions or ()),
+        "unchanged": diff.unchanged,
+        "bytes_saved": diff.bytes_saved,
+    }
+
+
+def print_diff_summary(diff: VariableDiff, *, dry_run: bool) -> None:
+    """Print what a diff-reduced modification sends and how much it saves."""
+    modifications = len(diff.request.modifications or {})
+    deletions = len(diff.request.deletions or ())
+    verb = "Would send" if dry_run else "Sending"
+    print_summary(
+        f"{verb} {modifications} modification(s) and {deletions} deletion(s); "
+        f"skipped {len(diff.unchanged)} unchanged value(s) and "
+        f"{len(diff.missing_deletions)} missing deletion(s).",
+        style="blue",
+    )
+    print_summary(
+        f"Payload {diff.minimal_bytes} bytes instead of {diff.requested_bytes} "
+        f"({diff.bytes_saved} bytes saved).",
+        style="blue",
+    )
+    if dry_run:
+        print_json(
+            {
+                "request": diff.request.to_api_dict(),
+                "unchanged": diff.unchanged,
+                "missing_deletions": diff.missing_deletions,
+                "requested_bytes": diff.requested_bytes,
+                "minimal_bytes": diff.minimal_bytes,
+                "bytes_saved": diff.bytes_saved,
+            },
+            title="Dry Run",
+        )
+
+
+def run_modification_batch(
+    modify: Callable[[str, VariableModificationRequest], Any],
+    targets: Iterable[ModificationTarget],
+    *,
+    total: int | None,
+    id_key: str,
+    noun: str,
+    max_workers: int,
+    journal: Path | None = None,
+    output: Path | None = None,
+) -> dict[str, Any]:
+    """
+    Send one modification request per target concurrently and report the results.
+
+    Each result records the modified and deleted variable names; a mapping
+    returned by `modify` (for example from `modify_with_diff`) overrides them.
+    Results are streamed to `journal` as they complete.
+    """
+
+    def _apply(target: ModificationTarget) -> BatchResult:
+        target_id, request = target
+        result: BatchResult = {
+            id_key: target_id,
+            "modified": sorted(request.modifications or {}),
+            "deleted": list(request.deletions or ()),
+        }
+        try:
+            outcome = modify(target_id, request)
+            if isinstance(outcome, Mapping):
+                result.update(outcome)
+            result["status"] = "modified"
+        except Exception as exc:
+            result["status"] = "error"
+            result["error"] = str(exc)
+        return result
+
+    results = run_batch(
+        _apply,
+        targets,
+        total=total,
+        id_key=id_key,
+        item_label=lambda target: target[0],
+        active_label="Modifying",
+        done_label="Modified",
+        max_workers=max_workers,
+        journal=journal,
+    )
+    return report_batch(
+        results,
+        title="Modification",
+        id_key=id_key,
+        success_status="modified",
+        noun=noun,
+        output=output,
+        journal=journal,
+    )
+
+
+__all__ = [
+    "ModificationTarget",
+    "VariableChanges",
+    "build_modifications",
+    "coalesce_records",
+    "diff_result_fields",
+    "load_modifications",
+    "modify_with_diff",
+    "print_diff_summary",
+    "record_changes",
+    "record_target",
+    "run_modification_batch",
+]
@@ -0,0 +1,175 @@
+"""CPU and memory profiling of one CLI invocation (`--profile cpu|mem`).
+
+`cpu` runs the command under cProfile. Threads started while profiling
+(such as `gather` workers) get a profiler of their own, and their stats are
+merged into one report at exit, so work fanned out to a thread pool is not
+hidden behind the main thread waiting on it.
+
+`mem` traces allocations with tracemalloc and reports the peak, the memory
+still allocated at exit and the source lines that allocated it.
+
+The report goes to stderr, or to `--profile-output`; a `.pstats` or `.prof`
+output file receives raw cProfile stats instead, for snakeviz, gprof2dot or
+`python -m pstats`.
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import cProfile
+    import tracemalloc
+
+DEFAULT_LIMIT = 25
+PSTATS_SUFFIXES = (".pstats", ".prof")
+TRACEMALLOC_FRAMES = 10
+
+
+class ProfileMode(str, Enum):
+    """What `--profile` measures."""
+
+    CPU = "cpu"
+    MEM = "mem"
+
+
+class Profiler:
+    """
+    Profile everything between `start` and `stop`.
+
+    The profilers are imported on `start`, so runs without `--profile` do
+    not pay for loading them.
+    """
+
+    def __init__(self, mode: ProfileMode, *, limit: int = DEFAULT_LIMIT) -> None:
+        self.mode = mode
+        self.limit = limit
+        self._profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._traced_memory = (0, 0)
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        if self.mode is ProfileMode.CPU:
+            threading.setprofile(self._profile_thread)
+            self._new_profile().enable()
+        else:
+            import tracemalloc
+
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self.mode is ProfileMode.CPU:
+            threading.setprofile(None)  # type: ignore[arg-type]
+            self._profiles[0].disable()
+        else:
+            import tracemalloc
+
+            self._traced_memory = tracemalloc.get_traced_memory()
+            self._snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    def save(self, path: Path) -> None:
+        """Write the report to `path`, or raw pstats for a `.pstats`/`.prof` file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix in PSTATS_SUFFIXES:
+            if self.mode is not ProfileMode.CPU:
+                raise ValueError(f"{path.suffix} files hold CPU profiles only")
+            self._stats().dump_stats(str(path))
+            return
+        path.write_text(self.report(), encoding="utf-8")
+
+    def report(self) -> str:
+        if self.mode is ProfileMode.CPU:
+            return self._cpu_report()
+        return self._memory_report()
+
+    def _new_profile(self) -> cProfile.Profile:
+        import cProfile
+
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def _profile_thread(self, frame: Any, event: str, arg: Any) -> None:
+        # Installed for new threads by threading.setprofile; replaces itself with
+        # a profiler owned by the thread on the thread's first call.
+        sys.setprofile(None)
+        self._new_profile().enable()
+
+    def _stats(self) -> Any:
+        import pstats
+
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def _cpu_report(self) -> str:
+        stream = io.StringIO()
+        stats = self._stats()
+        stats.stream = stream
+        with self._lock:
+            threads = len(self._profiles)
+        stream.write(f"CPU profile of {threads} thread(s)\n")
+        for key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            stream.write(f"\nTop {self.limit} functions by {title}:\n")
+            stats.sort_stats(key).print_stats(self.limit)
+        return stream.getvalue()
+
+    def _memory_report(self) -> str:
+        import tracemalloc
+
+        if self._baseline is None or self._snapshot is None:
+            return "No memory profile was taken.\n"
+        current, peak = self._traced_memory
+        ignored = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+        snapshot = self._snapshot.filter_traces(ignored)
+        baseline = self._baseline.filter_traces(ignored)
+        growth = [diff for diff in snapshot.compare_to(baseline, "lineno") if diff.size_diff > 0]
+        lines = [
+            f"Peak traced memory: {_mib(peak)}; still allocated at exit: {_mib(current)}",
+            "",
+            f"Top {self.limit} allocation sites by memory held at exit:",
+            f"{'Size':>12} {'Blocks':>9}  Location",
+        ]
+        for diff in growth[: self.limit]:
+            frame = diff.traceback[0]
+            lines.append(
+                f"{diff.size_diff / 1024:9.1f} KiB {diff.count_diff:+9d}  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _mib(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+__all__ = ["DEFAULT_LIMIT", "PSTATS_SUFFIXES", "ProfileMode", "Profiler"]
@@ -0,0 +1,119 @@
+"""Options and helpers for serving list/count commands from the query cache."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+import typer
+
+from camctl.api.camunda import CamundaEngine
+from camctl.api.http import SerializeMixin
+from camctl.cache import QueryCache, cache_key, query_cache_path
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+QUERY_CACHE_ENV = "CAMCTL_QUERY_CACHE"
+COUNT_TTL_SECONDS = 30.0
+LIST_TTL_SECONDS = 10.0
+
+CACHE = typer.Option(
+    False,
+    "--cache/--no-cache",
+    envvar=QUERY_CACHE_ENV,
+    help=f"Serve repeated queries from the on-disk query cache (default: ${QUERY_CACHE_ENV}).",
+)
+REFRESH = typer.Option(
+    False,
+    "--refresh",
+    help="Ignore any cached result and cache a fresh one (implies --cache).",
+)
+CACHE_TTL = typer.Option(
+    None,
+    "--cache-ttl",
+    help="Seconds a cached result stays valid (default depends on the command).",
+    min=0.0,
+)
+
+
+@dataclass(kw_only=True)
+class CachedResult(Generic[T]):
+    """A query result and, when it came from the cache, its age."""
+
+    value: T
+    age_seconds: float | None = None
+
+    @property
+    def from_cache(self) -> bool:
+        return self.age_seconds is not None
+
+
+def cached_query(
+    engine: CamundaEngine,
+    query: str,
+    params: SerializeMixin | None,
+    fetch: Callable[[], T],
+    *,
+    enabled: bool,
+    refresh: bool = False,
+    ttl: float,
+    encode: Callable[[T], Any] = lambda value: value,
+    decode: Callable[[Any], T] = lambda value: value,
+) -> CachedResult[T]:
+    """
+    Run `fetch`, reusing a cached result for the same engine, query and params.
+
+    Nothing is cached unless `enabled` or `refresh` is set; `refresh` skips
+    the lookup but stores the fresh result. Cache failures are logged and the
+    query is sent to the engine as if caching were off.
+    """
+    if not (enabled or refresh):
+        return CachedResult(value=fetch())
+
+    key = cache_key(
+        engine.client.base_url,
+        query,
+        params.to_api_dict() if params is not None else None,
+    )
+    try:
+        cache = QueryCache(query_cache_path())
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Query cache unavailable: %s", exc)
+        return CachedResult(value=fetch())
+
+    with cache:
+        if not refresh:
+            try:
+                entry = cache.get(key)
+            except sqlite3.Error as exc:
+                logger.warning("Query cache read failed: %s", exc)
+                entry = None
+            metrics = getattr(engine.client, "metrics", None)
+            if metrics is not None:
+                metrics.cache_lookup(hit=entry is not None)
+            if entry is not None:
+                logger.info("Query cache hit for %s (%.1fs old)", query, entry.age_seconds)
+                return CachedResult(value=decode(entry.value), age_seconds=entry.age_seconds)
+
+        value = fetch()
+        try:
+            cache.set(key, encode(value), ttl=ttl)
+        except sqlite3.Error as exc:
+            logger.warning("Query cache write failed: %s", exc)
+        return CachedResult(value=value)
+
+
+__all__ = [
+    "CACHE",
+    "CACHE_TTL",
+    "COUNT_TTL_SECONDS",
+    "CachedResult",
+    "LIST_TTL_SECONDS",
+    "QUERY_CACHE_ENV",
+    "REFRESH",
+    "cached_query",
+]
@@ -0,0 +1,82 @@
+"""Render per-endpoint request phase timings collected with `--timings`."""
+
+from __future__ import annotations
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from camctl.api.http.timings import PHASES, TOTAL, TimingCollector
+from camctl.utils.stats import Histogram
+
+PERCENTILES: tuple[float, ...] = (50.0, 99.0)
+
+
+def timings_table(collector: TimingCollector) -> Table:
+    """
+    One row per endpoint: mean milliseconds per request for each phase,
+    then percentiles of the request total (network phases only).
+    """
+    endpoints = collector.histograms()
+    overall: dict[str, Histogram] = {}
+    for phases in endpoints.values():
+        for name, histogram in phases.items():
+            overall.setdefault(name, Histogram()).merge(histogram)
+    shown = [name for name in PHASES if name in overall]
+
+    table = Table(
+        title="Request timings (mean ms per request)",
+        header_style="bold cyan",
+        show_footer=True,
+        box=box.SIMPLE_HEAD,
+        padding=0,
+    )
+    table.add_column("Endpoint", footer="All", overflow="fold")
+    table.add_column("Reqs", justify="right", no_wrap=True, footer=str(_requests(overall)))
+    for name in shown:
+        table.add_column(name, justify="right", no_wrap=True, footer=_mean(overall, name))
+    total = overall.get(TOTAL, Histogram())
+    for q in PERCENTILES:
+        table.add_column(f"p{q:g}", justify="right", no_wrap=True, footer=_ms(total.percentile(q)))
+    table.add_column("Max", justify="right", no_wrap=True, footer=_ms(total.max))
+
+    for endpoint, phases in sorted(endpoints.items()):
+        total = phases.get(TOTAL, Histogram())
+        table.add_row(
+            endpoint,
+            str(_requests(phases)),
+            *(_mean(phases, name) for name in shown),
+            *(_ms(total.percentile(q)) for q in PERCENTILES),
+            _ms(total.max),
+        )
+    return table
+
+
+def print_timings(collector: TimingCollector) -> None:
+    """Print the timings table to stderr, keeping stdout clean for command output."""
+    console = Console(stderr=True)
+    if not collector.histograms():
+        console.print("[yellow]No engine requests were made.[/yellow]")
+        return
+    console.print(timings_table(collector))
+
+
+def _requests(phases: dict[str, Histogram]) -> int:
+    histogram = phases.get(TOTAL)
+    return histogram.count if histogram else 0
+
+
+def _mean(phases: dict[str, Histogram], name: str) -> str:
+    """Phase time averaged over every request, so the columns add up."""
+    histogram = phases.get(name)
+    requests = _requests(phases)
+    if histogram is None or not requests:
+        return "-"
+    return _ms(histogram.total / requests)
+
+
+def _ms(value: float) -> str:
+    return f"{value:.1f}"
+
+
+__all__ = ["PERCENTILES", "print_timings", "timings_table"]
@@ -0,0 +1,117 @@
+"""Polling loop and rendering shared by the watch commands."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Mapping, Protocol
+
+import typer
+from rich.markup import escape
+
+from camctl.console.display import print_summary
+from camctl.sync import WatchEvent
+from camctl.utils import AdaptiveInterval, JsonLinesWriter, normalize
+
+_EVENT_STYLES = {
+    "inserted": ("+", "green"),
+    "updated": ("~", "yellow"),
+    "removed": ("-", "red"),
+}
+
+
+class Watcher(Protocol):
+    snapshot: Mapping[str, Any]
+
+    def load(self) -> int: ...
+
+    def poll(self) -> list[WatchEvent]: ...
+
+
+def run_watch(
+    watcher: Watcher,
+    *,
+    noun: str,
+    label: Callable[[Mapping[str, Any]], Any],
+    interval: AdaptiveInterval,
+    iterations: int | None = None,
+    raw: bool = False,
+    journal: Path | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Counter[str]:
+    """
+    Load the initial snapshot, then poll until interrupted and render each change.
+
+    The delay between polls adapts to activity (see `AdaptiveInterval`). With
+    `raw` every event is printed as one JSON line and the status lines are
+    suppressed. Returns the number of events seen per kind.
+    """
+    total = watcher.load()
+    if not raw:
+        print_summary(
+            f"Watching {total} {noun}; polling every {interval.minimum:g}-"
+            f"{interval.maximum:g}s. Press Ctrl+C to stop.",
+            style="blue",
+        )
+
+    counts: Counter[str] = Counter()
+    polls = 0
+    writer = JsonLinesWriter(journal) if journal else nullcontext()
+    with writer:
+        try:
+            while iterations is None or polls < iterations:
+                sleep(interval.current)
+                events = watcher.poll()
+                polls += 1
+                for event in events:
+                    counts[event.kind] += 1
+                    if journal:
+                        writer.write(event.to_dict())
+                    if raw:
+                        typer.echo(dumps_json_line(event))
+                    else:
+                        print_watch_event(event, label=label(event.record))
+                interval.record(bool(events))
+        except KeyboardInterrupt:
+            pass
+
+    if not raw:
+        print_summary(
+            f"{polls} poll(s): {counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['removed']} removed; {len(watcher.snapshot)} {noun} watched.",
+            style="blue",
+        )
+    return counts
+
+
+def print_watch_event(event: WatchEvent, *, label: Any = None) -> None:
+    """Print one watch event as a single coloured line."""
+    symbol, style = _EVENT_STYLES.get(event.kind, ("?", "white"))
+    stamp = datetime.now().strftime("%H:%M:%S")
+    line = f"{symbol} {stamp} {event.kind} {event.id}"
+    if label:
+        line += f" {label}"
+    if event.changes:
+        changes = ", ".join(
+            f"{name}: {_short(old)} -> {_short(new)}"
+            for name, (old, new) in event.changes.items()
+        )
+        line += f" ({changes})"
+    print_summary(escape(line), style=style)
+
+
+def dumps_json_line(event: WatchEvent) -> str:
+    """Serialize an event as compact JSON for line-oriented consumers."""
+    return json.dumps(normalize(event.to_dict()), ensure_ascii=True, separators=(",", ":"))
+
+
+def _short(value: Any, limit: int = 40) -> str:
+    text = "null" if value is None else str(value)
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+__all__ = ["Watcher", "dumps_json_line", "print_watch_event", "run_watch"]
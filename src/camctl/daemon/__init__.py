@@ -0,0 +1,23 @@
+"""Persistent daemon that runs camctl commands in a warm process.
+
+Only the lightweight protocol and thin client are exported here; import
+`camctl.daemon.server` or `camctl.daemon.pool` explicitly, since they load the
+full CLI.
+"""
+
+from .client import DaemonReply, command_path, forward, main, request, should_forward
+from .protocol import DAEMON_ENV, SOCKET_ENV, ProtocolError, UnsafeSocketError, socket_path
+
+__all__ = [
+    "DAEMON_ENV",
+    "DaemonReply",
+    "ProtocolError",
+    "SOCKET_ENV",
+    "UnsafeSocketError",
+    "command_path",
+    "forward",
+    "main",
+    "request",
+    "should_forward",
+    "socket_path",
+]
@@ -0,0 +1,214 @@
+"""Thin `camctl` entry point that forwards read commands to a running daemon.
+
+Only standard library modules are imported until the command has to run
+locally, so forwarded invocations skip loading Typer, Rich and httpx.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from camctl.daemon.protocol import (
+    DAEMON_ENV,
+    ProtocolError,
+    UnsafeSocketError,
+    check_socket_directory,
+    forwarded_environment,
+    recv_message,
+    send_message,
+    socket_path,
+)
+
+FORWARDED_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("tasks", "get"),
+    ("tasks", "list"),
+    ("tasks", "count"),
+    ("tasks", "variables", "get"),
+    ("tasks", "variables", "list"),
+    ("tasks", "variables", "local", "get"),
+    ("tasks", "variables", "local", "list"),
+    ("processes", "get"),
+    ("processes", "list"),
+    ("processes", "count"),
+)
+
+_GLOBAL_FLAGS = {"-v", "-vv", "-vvv", "--verbose", "--timings"}
+# Every option of the `camctl` callback that takes a value; kept in step with
+# camctl.console.app by tests/unit/daemon/test_client.py.
+GLOBAL_VALUE_OPTIONS = frozenset(
+    {
+        "--authority",
+        "--config",
+        "--engine",
+        "-e",
+        "--log-file",
+        "--log-format",
+        "--log-sample",
+        "--metrics-file",
+        "--metrics-port",
+        "--profile",
+        "--profile-output",
+        "--record",
+        "--replay",
+        "--replay-speed",
+        "--trace",
+    }
+)
+# Options that measure this process, so the command must not run in the daemon.
+_LOCAL_OPTIONS = ("--profile",)
+
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+
+@dataclass(kw_only=True)
+class DaemonReply:
+    """Captured output and exit code of a command run by the daemon."""
+
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+
+
+def command_path(argv: Sequence[str]) -> tuple[str, ...]:
+    """Return the subcommand words of `argv`, skipping global options."""
+    words: list[str] = []
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if not words and arg in _GLOBAL_FLAGS:
+            index += 1
+            continue
+        if not words and arg in GLOBAL_VALUE_OPTIONS:
+            index += 2
+            continue
+        if arg.startswith("-"):
+            if words:
+                break
+            index += 1
+            continue
+        words.append(arg)
+        index += 1
+    return tuple(words)
+
+
+def should_forward(argv: Sequence[str]) -> bool:
+    """
+    Decide whether a command line may run in the daemon.
+
+    Only read-only query commands are forwarded; anything that prompts, reads
+    stdin (`-`), streams output, asks for help or is profiled runs locally.
+    """
+    if os.getenv(DAEMON_ENV, "1").lower() in ("0", "false", "no", "off"):
+        return False
+    if any(arg in ("-", "--help", "--install-completion", "--show-completion") for arg in argv):
+        return False
+    if any(arg.split("=", 1)[0] in _LOCAL_OPTIONS for arg in argv):
+        return False
+    path = command_path(argv)
+    return any(path[: len(command)] == command for command in FORWARDED_COMMANDS)
+
+
+def request(
+    message: dict[str, Any],
+    *,
+    path: Path | None = None,
+    timeout: float | None = None,
+) -> dict[str, Any] | None:
+    """
+    Send one request to the daemon; returns None when no daemon answers.
+
+    Raises:
+        UnsafeSocketError: When the socket's directory is not private to
+            the current user.
+    """
+    target = path or socket_path()
+    if not target.exists():
+        return None
+    check_socket_directory(target.parent)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+        try:
+            sock.connect(str(target))
+        except OSError:
+            return None
+        sock.settimeout(timeout)
+        send_message(sock, message)
+        return recv_message(sock)
+    except (OSError, ProtocolError):
+        return None
+    finally:
+        sock.close()
+
+
+def forward(
+    argv: Sequence[str],
+    *,
+    path: Path | None = None,
+    timeout: float | None = None,
+) -> DaemonReply | None:
+    """
+    Run `argv` in the daemon and return its output.
+
+    Returns None when no daemon is listening, so the caller can run the
+    command locally instead. Only the environment variables the command
+    reads (`CAMCTL_*`, terminal and color settings) are sent.
+    """
+    reply = request(
+        {
+            "op": "run",
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": forwarded_environment(os.environ),
+            "tty": sys.stdout.isatty(),
+            "columns": shutil.get_terminal_size().columns,
+        },
+        path=path,
+        timeout=timeout,
+    )
+    if reply is None or "exit_code" not in reply:
+        return None
+    return DaemonReply(
+        exit_code=int(reply["exit_code"]),
+        stdout=str(reply.get("stdout", "")),
+        stderr=str(reply.get("stderr", "")),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Console entry point: forward to the daemon when possible, else run locally."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    if should_forward(args):
+        try:
+            reply = forward(args)
+        except UnsafeSocketError as exc:
+            sys.stderr.write(f"Not using the camctl daemon: {exc}\n")
+            reply = None
+        if reply is not None:
+            sys.stdout.write(reply.stdout)
+            sys.stderr.write(reply.stderr)
+            sys.stdout.flush()
+            raise SystemExit(reply.exit_code)
+
+    from camctl.console.app import app
+
+    raise SystemExit(app(args=args, prog_name="camctl"))
+
+
+__all__ = [
+    "CONNECT_TIMEOUT_SECONDS",
+    "DaemonReply",
+    "FORWARDED_COMMANDS",
+    "GLOBAL_VALUE_OPTIONS",
+    "command_path",
+    "forward",
+    "main",
+    "request",
+    "should_forward",
+]
@@ -0,0 +1,67 @@
+"""Long-lived engines shared by the commands the daemon runs."""
+
+from __future__ import annotations
+
+import threading
+from typing import Self
+
+from camctl.api.camunda import CamundaClient, CamundaEngine
+from camctl.config import EngineProfile
+
+
+class PooledEngine(CamundaEngine):
+    """
+    Engine whose client outlives the command using it.
+
+    Commands open engines with `with context.build_engine() as engine:`; for
+    a pooled engine entering and leaving that block keeps the connection
+    pool open. `EnginePool.close` closes the client for real.
+    """
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class EnginePool:
+    """One warm engine per distinct engine profile, created on first use."""
+
+    def __init__(self) -> None:
+        self._engines: dict[tuple[str | None, float | None], PooledEngine] = {}
+        self._lock = threading.Lock()
+
+    def lease(self, profile: EngineProfile | None) -> PooledEngine:
+        """Return the shared engine for `profile` (None means the default engine)."""
+        key = (profile.base_url, profile.timeout) if profile else (None, None)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                client = (
+                    CamundaClient(base_url=profile.base_url, timeout=profile.timeout)
+                    if profile
+                    else CamundaClient()
+                )
+                engine = PooledEngine(client)
+                self._engines[key] = engine
+        return engine
+
+    def base_urls(self) -> list[str]:
+        """Return the base URLs of the engines currently held open."""
+        with self._lock:
+            return [engine.client.base_url for engine in self._engines.values()]
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            engine.client.close()
+
+
+__all__ = ["EnginePool", "PooledEngine"]
@@ -0,0 +1,159 @@
+"""Wire format and socket location shared by the daemon and its thin client.
+
+This module only uses the standard library so the thin client stays cheap to
+import.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping
+
+SOCKET_ENV = "CAMCTL_DAEMON_SOCKET"
+DAEMON_ENV = "CAMCTL_DAEMON"
+
+MAX_FRAME_BYTES = 256 * 1024 * 1024
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30 * 60.0
+
+# Environment variables a forwarded command may read from the client; the
+# rest of the daemon's environment stays its own.
+FORWARDED_ENV_PREFIXES = ("CAMCTL_",)
+FORWARDED_ENV = frozenset(
+    {
+        "COLORTERM",
+        "COLUMNS",
+        "FORCE_COLOR",
+        "LINES",
+        "NO_COLOR",
+        "TERM",
+        "TTY_COMPATIBLE",
+        "TZ",
+        "XDG_CACHE_HOME",
+        "XDG_CONFIG_HOME",
+    }
+)
+
+_HEADER = struct.Struct("!I")
+
+
+class ProtocolError(RuntimeError):
+    """Raised when a peer sends a malformed or truncated frame."""
+
+
+class UnsafeSocketError(RuntimeError):
+    """Raised when the socket directory could be used by another user."""
+
+
+def socket_path() -> Path:
+    """
+    Return the daemon socket path.
+
+    `CAMCTL_DAEMON_SOCKET` wins, then `$XDG_RUNTIME_DIR/camctl/daemon.sock`,
+    then a per-user directory under the system temp dir.
+    """
+    override = os.getenv(SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    runtime = os.getenv("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "camctl" / "daemon.sock"
+    return Path(tempfile.gettempdir()) / f"camctl-{os.getuid()}" / "daemon.sock"
+
+
+def check_socket_directory(path: Path) -> None:
+    """
+    Refuse a socket directory that anyone but the current user can enter.
+
+    Whoever can write to the directory can put their own socket in place
+    and receive forwarded commands and their environment, so both sides
+    require a real directory owned by this user with mode 0700.
+
+    Raises:
+        UnsafeSocketError: When `path` is missing, not a directory, owned by
+            someone else or open to other users.
+    """
+    try:
+        info = os.lstat(path)
+    except OSError as exc:
+        raise UnsafeSocketError(f"Cannot use daemon socket directory {path}: {exc}") from exc
+    if not stat.S_ISDIR(info.st_mode):
+        raise UnsafeSocketError(f"Daemon socket directory {path} is not a directory.")
+    if info.st_uid != os.getuid():
+        raise UnsafeSocketError(f"Daemon socket directory {path} is owned by another user.")
+    mode = stat.S_IMODE(info.st_mode)
+    if mode != 0o700:
+        raise UnsafeSocketError(
+            f"Daemon socket directory {path} has mode {mode:o}; it must be 700."
+        )
+
+
+def forwarded_environment(environ: Mapping[str, str]) -> dict[str, str]:
+    """Return the variables of `environ` that forwarded commands may read."""
+    return {name: value for name, value in environ.items() if is_forwarded_env(name)}
+
+
+def is_forwarded_env(name: str) -> bool:
+    """Return whether a forwarded command reads `name` from the client's environment."""
+    return name in FORWARDED_ENV or name.startswith(FORWARDED_ENV_PREFIXES)
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message."""
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any] | None:
+    """Receive one message; returns None when the peer closed the connection cleanly."""
+    header = _recv_exact(sock, _HEADER.size, allow_eof=True)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"Frame of {length} bytes exceeds the {MAX_FRAME_BYTES} byte limit.")
+    body = _recv_exact(sock, length)
+    try:
+        message = json.loads(body)
+    except ValueError as exc:
+        raise ProtocolError(f"Invalid JSON frame: {exc}") from exc
+    if not isinstance(message, dict):
+        raise ProtocolError("Frames must contain a JSON object.")
+    return message
+
+
+def _recv_exact(sock: socket.socket, size: int, *, allow_eof: bool = False) -> bytes | None:
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1024 * 1024))
+        if not chunk:
+            if allow_eof and remaining == size:
+                return None
+            raise ProtocolError("Connection closed in the middle of a frame.")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+__all__ = [
+    "DAEMON_ENV",
+    "DEFAULT_IDLE_TIMEOUT_SECONDS",
+    "FORWARDED_ENV",
+    "FORWARDED_ENV_PREFIXES",
+    "MAX_FRAME_BYTES",
+    "ProtocolError",
+    "SOCKET_ENV",
+    "UnsafeSocketError",
+    "check_socket_directory",
+    "forwarded_environment",
+    "is_forwarded_env",
+    "recv_message",
+    "send_message",
+    "socket_path",
+]
@@ -0,0 +1,305 @@
+"""Unix socket server that runs forwarded camctl commands in a warm process."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import os
+import socketserver
+import sys
+import threading
+import time
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Sequence
+
+import click
+import httpx
+import typer
+
+from camctl.console.app import app, print_unreachable
+from camctl.console.context import use_engine_pool
+from camctl.daemon.pool import EnginePool
+from camctl.daemon.protocol import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ProtocolError,
+    check_socket_directory,
+    forwarded_environment,
+    is_forwarded_env,
+    recv_message,
+    send_message,
+    socket_path,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class DaemonStats:
+    """Counters reported by `camctl daemon status`."""
+
+    started_at: float = field(default_factory=time.time)
+    commands: int = 0
+    failures: int = 0
+    busy_seconds: float = 0.0
+    last_activity: float = field(default_factory=time.monotonic)
+
+    def record(self, exit_code: int, elapsed: float) -> None:
+        self.commands += 1
+        self.failures += exit_code != 0
+        self.busy_seconds += elapsed
+        self.last_activity = time.monotonic()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "commands": self.commands,
+            "failures": self.failures,
+            "mean_command_seconds": (
+                round(self.busy_seconds / self.commands, 4) if self.commands else None
+            ),
+        }
+
+
+class CommandRunner:
+    """
+    Run CLI command lines in-process and capture their output.
+
+    Commands share process-wide state (stdout, the environment and the
+    working directory), so they run one at a time; each command can still
+    use its own worker threads.
+
+    Only the client's variables listed in `camctl.daemon.protocol` replace
+    the daemon's own; everything else, such as `PATH` or variables used by
+    `${VAR}` placeholders in the config file, comes from the environment
+    the daemon was started in.
+    """
+
+    def __init__(self, command: click.Command) -> None:
+        self._command = command
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+        tty: bool = False,
+        columns: int | None = None,
+    ) -> dict[str, Any]:
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        overrides = dict(os.environ)
+        if env is not None:
+            overrides = {
+                name: value for name, value in os.environ.items() if not is_forwarded_env(name)
+            }
+            overrides.update(forwarded_environment(env))
+        if tty:
+            overrides["FORCE_COLOR"] = "1"
+            overrides.pop("TTY_COMPATIBLE", None)
+        else:
+            overrides["TTY_COMPATIBLE"] = "0"
+            overrides.pop("FORCE_COLOR", None)
+        if columns:
+            overrides["COLUMNS"] = str(columns)
+
+        with self._lock:
+            with _environment(overrides), _working_directory(cwd):
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    _reset_console()
+                    exit_code = self._invoke(list(argv))
+            _reset_console()
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _invoke(self, argv: list[str]) -> int:
+        try:
+            self._command.main(args=argv, prog_name="camctl", standalone_mode=True)
+        except SystemExit as exc:
+            code = exc.code
+            if code is None:
+                return 0
+            if isinstance(code, int):
+                return code
+            print(code, file=sys.stderr)
+            return 1
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            print_unreachable()
+            return 1
+        except Exception as exc:
+            logger.exception("Forwarded command failed: %s", argv)
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        return 0
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Socket server answering `run`, `status` and `shutdown` requests."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, runner: CommandRunner, pool: EnginePool) -> None:
+        self.path = path
+        self.runner = runner
+        self.pool = pool
+        self.stats = DaemonStats()
+        self.stop_requested = threading.Event()
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        check_socket_directory(path.parent)
+        if path.exists():
+            path.unlink()
+        # Bind with a umask that leaves the socket 0600 from the moment it exists.
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def status(self) -> dict[str, Any]:
+        return {**self.stats.to_dict(), "socket": str(self.path), "engines": self.pool.base_urls()}
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        try:
+            request = recv_message(self.request)
+        except (OSError, ProtocolError) as exc:
+            logger.warning("Dropping malformed request: %s", exc)
+            return
+        if request is None:
+            return
+        op = request.get("op")
+        if op == "run":
+            started = time.perf_counter()
+            reply = self.server.runner.run(
+                request.get("argv") or [],
+                cwd=request.get("cwd"),
+                env=request.get("env"),
+                tty=bool(request.get("tty")),
+                columns=request.get("columns"),
+            )
+            self.server.stats.record(reply["exit_code"], time.perf_counter() - started)
+        elif op == "status":
+            reply = self.server.status()
+        elif op == "shutdown":
+            reply = {"stopping": True, **self.server.status()}
+            self.server.stop_requested.set()
+        else:
+            reply = {"error": f"Unknown operation {op!r}."}
+        try:
+            send_message(self.request, reply)
+        except OSError as exc:
+            logger.warning("Client went away before the reply was sent: %s", exc)
+
+
+def serve(
+    path: Path | None = None,
+    *,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    command: click.Command | None = None,
+) -> None:
+    """
+    Serve forwarded commands until shut down or idle for `idle_timeout` seconds.
+
+    While serving, `CLIContext.build_engine` hands out pooled engines, so
+    connections to each engine stay open between commands.
+    """
+    if command is None:
+        command = typer.main.get_command(app)
+
+    pool = EnginePool()
+    use_engine_pool(pool)
+    server = DaemonServer(path or socket_path(), CommandRunner(command), pool)
+    thread = threading.Thread(target=server.serve_forever, name="camctl-daemon", daemon=True)
+    thread.start()
+    logger.info("camctl daemon %s listening on %s", os.getpid(), server.path)
+    try:
+        while not server.stop_requested.wait(1.0):
+            idle = time.monotonic() - server.stats.last_activity
+            if idle_timeout and idle > idle_timeout:
+                logger.info("Idle for %.0fs; shutting down.", idle)
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+        use_engine_pool(None)
+        pool.close()
+
+
+def _reset_console() -> None:
+    # Rich picks its color system and width when a console is created, so the
+    # shared console is rebuilt for each command's terminal and environment.
+    display = sys.modules.get("camctl.console.display")
+    if display is not None:
+        display.reset_console()
+
+
+@contextmanager
+def _environment(values: Mapping[str, str]) -> Iterator[None]:
+    previous = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(previous)
+
+
+@contextmanager
+def _working_directory(path: str | None) -> Iterator[None]:
+    if not path:
+        yield
+        return
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the daemon in the foreground (used by `camctl daemon start`)."""
+    parser = argparse.ArgumentParser(prog="python -m camctl.daemon.server")
+    parser.add_argument("--socket", type=Path, default=None)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT_SECONDS)
+    args = parser.parse_args(argv)
+    # Commands reconfigure the root logger for their own output, so the
+    # daemon logs through a dedicated handler on the original stderr.
+    handler = logging.StreamHandler(sys.__stderr__)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    serve(args.socket, idle_timeout=args.idle_timeout)
+
+
+__all__ = [
+    "CommandRunner",
+    "DEFAULT_IDLE_TIMEOUT_SECONDS",
+    "DaemonServer",
+    "DaemonStats",
+    "main",
+    "serve",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Local copies of engine tasks and process instances: the SQLite mirror and watchers."""
+
+from .query import UnsupportedFilterError
+from .store import LocalStore, SyncState, mirror_path
+from .syncer import SyncReport, sync_processes, sync_tasks
+from .watch import ProcessWatcher, TaskWatcher, WatchEvent, snapshot_events
+
+__all__ = [
+    "LocalStore",
+    "ProcessWatcher",
+    "SyncReport",
+    "SyncState",
+    "TaskWatcher",
+    "UnsupportedFilterError",
+    "WatchEvent",
+    "mirror_path",
+    "snapshot_events",
+    "sync_processes",
+    "sync_tasks",
+]
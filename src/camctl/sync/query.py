@@ -0,0 +1,212 @@
+"""Translate CLI filter keyword arguments into SQL for the local mirror."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+
+class UnsupportedFilterError(ValueError):
+    """Raised when a filter cannot be evaluated against the local mirror."""
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self.names = list(names)
+        options = ", ".join(f"--{name.replace('_', '-')}" for name in self.names)
+        super().__init__(f"Not supported with --local: {options}.")
+
+
+@dataclass(frozen=True)
+class FilterRule:
+    """How one filter field maps onto a mirror column."""
+
+    column: str
+    op: str
+
+
+_COMPARISONS = {
+    "eq": "=",
+    "ne": "!=",
+    "gt": ">",
+    "lt": "<",
+    "ge": ">=",
+    "le": "<=",
+    "like": "LIKE",
+    "not_like": "NOT LIKE",
+}
+
+TASK_FILTER_RULES: dict[str, FilterRule] = {
+    "task_id": FilterRule("id", "eq"),
+    "task_id_in": FilterRule("id", "in"),
+    "process_instance_id": FilterRule("process_instance_id", "eq"),
+    "process_instance_id_in": FilterRule("process_instance_id", "in"),
+    "process_definition_id": FilterRule("process_definition_id", "eq"),
+    "execution_id": FilterRule("execution_id", "eq"),
+    "case_instance_id": FilterRule("case_instance_id", "eq"),
+    "case_definition_id": FilterRule("case_definition_id", "eq"),
+    "case_execution_id": FilterRule("case_execution_id", "eq"),
+    "tenant_id_in": FilterRule("tenant_id", "in"),
+    "without_tenant_id": FilterRule("tenant_id", "null"),
+    "assignee": FilterRule("assignee", "eq"),
+    "assignee_like": FilterRule("assignee", "like"),
+    "assignee_in": FilterRule("assignee", "in"),
+    "assignee_not_in": FilterRule("assignee", "not_in"),
+    "owner": FilterRule("owner", "eq"),
+    "assigned": FilterRule("assignee", "not_null"),
+    "unassigned": FilterRule("assignee", "null"),
+    "task_definition_key": FilterRule("task_definition_key", "eq"),
+    "task_definition_key_in": FilterRule("task_definition_key", "in"),
+    "task_definition_key_like": FilterRule("task_definition_key", "like"),
+    "name": FilterRule("name", "eq"),
+    "name_not_equal": FilterRule("name", "ne"),
+    "name_like": FilterRule("name", "like"),
+    "name_not_like": FilterRule("name", "not_like"),
+    "description": FilterRule("description", "eq"),
+    "description_like": FilterRule("description", "like"),
+    "priority": FilterRule("priority", "eq"),
+    "max_priority": FilterRule("priority", "le"),
+    "min_priority": FilterRule("priority", "ge"),
+    "due_date": FilterRule("due", "eq"),
+    "due_after": FilterRule("due", "gt"),
+    "due_before": FilterRule("due", "lt"),
+    "without_due_date": FilterRule("due", "null"),
+    "follow_up_date": FilterRule("follow_up", "eq"),
+    "follow_up_after": FilterRule("follow_up", "gt"),
+    "follow_up_before": FilterRule("follow_up", "lt"),
+    "follow_up_before_or_not_existent": FilterRule("follow_up", "lt_or_null"),
+    "created_on": FilterRule("created", "eq"),
+    "created_after": FilterRule("created", "gt"),
+    "created_before": FilterRule("created", "lt"),
+    "updated_after": FilterRule("last_updated", "gt"),
+    "delegation_state": FilterRule("delegation_state", "eq"),
+    "parent_task_id": FilterRule("parent_task_id", "eq"),
+    "active": FilterRule("suspended", "false"),
+    "suspended": FilterRule("suspended", "true"),
+}
+
+PROCESS_FILTER_RULES: dict[str, FilterRule] = {
+    "process_instance_ids": FilterRule("id", "in"),
+    "business_key": FilterRule("business_key", "eq"),
+    "business_key_like": FilterRule("business_key", "like"),
+    "case_instance_id": FilterRule("case_instance_id", "eq"),
+    "process_definition_id": FilterRule("definition_id", "eq"),
+    "process_definition_key": FilterRule("definition_key", "eq"),
+    "process_definition_key_in": FilterRule("definition_key", "in"),
+    "process_definition_key_not_in": FilterRule("definition_key", "not_in"),
+    "tenant_id_in": FilterRule("tenant_id", "in"),
+    "without_tenant_id": FilterRule("tenant_id", "null"),
+    "active": FilterRule("suspended", "false"),
+    "suspended": FilterRule("suspended", "true"),
+}
+
+TASK_SORT_COLUMNS: dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "nameCaseInsensitive": "name COLLATE NOCASE",
+    "description": "description",
+    "assignee": "assignee",
+    "created": "created",
+    "lastUpdated": "last_updated",
+    "dueDate": "due",
+    "followUpDate": "follow_up",
+    "priority": "priority",
+    "instanceId": "process_instance_id",
+    "executionId": "execution_id",
+    "processDefinitionId": "process_definition_id",
+    "caseInstanceId": "case_instance_id",
+    "caseExecutionId": "case_execution_id",
+    "tenantId": "tenant_id",
+}
+
+PROCESS_SORT_COLUMNS: dict[str, str] = {
+    "instanceId": "id",
+    "definitionId": "definition_id",
+    "definitionKey": "definition_key",
+    "businessKey": "business_key",
+    "tenantId": "tenant_id",
+}
+
+
+def build_where(
+    filters: Mapping[str, Any],
+    rules: Mapping[str, FilterRule],
+) -> tuple[str, list[Any]]:
+    """
+    Build a SQL WHERE clause (without the keyword) and its parameters.
+
+    `filters` holds the keyword arguments produced by the CLI filter builders.
+    Like filters use SQL wildcards exactly as the engine does.
+
+    Raises:
+        UnsupportedFilterError: If any filter has no local equivalent.
+    """
+    unsupported = sorted(name for name in filters if name not in rules)
+    if unsupported:
+        raise UnsupportedFilterError(unsupported)
+
+    clauses: list[str] = []
+    params: list[Any] = []
+    for name, value in filters.items():
+        rule = rules[name]
+        column = rule.column
+        if rule.op in ("null", "not_null", "true", "false"):
+            if not value:
+                continue
+            clauses.append(
+                {
+                    "null": f"{column} IS NULL",
+                    "not_null": f"{column} IS NOT NULL",
+                    "true": f"{column} = 1",
+                    "false": f"{column} = 0",
+                }[rule.op]
+            )
+        elif rule.op in ("in", "not_in"):
+            items = _split_list(value)
+            placeholders = ", ".join("?" for _ in items) or "NULL"
+            keyword = "IN" if rule.op == "in" else "NOT IN"
+            clauses.append(f"{column} {keyword} ({placeholders})")
+            params.extend(items)
+        elif rule.op == "lt_or_null":
+            clauses.append(f"({column} < ? OR {column} IS NULL)")
+            params.append(value)
+        else:
+            clauses.append(f"{column} {_COMPARISONS[rule.op]} ?")
+            params.append(value)
+    return " AND ".join(clauses) or "1 = 1", params
+
+
+def build_order(
+    sort_by: str | None,
+    sort_order: str | None,
+    columns: Mapping[str, str],
+) -> str:
+    """Build an ORDER BY expression, always ending with the id for stable paging."""
+    if not sort_by:
+        return "id ASC"
+    column = columns.get(sort_by)
+    if column is None:
+        raise ValueError(
+            f"Unsupported --sort-by for --local: {sort_by}. "
+            f"Choose from {', '.join(sorted(columns))}."
+        )
+    direction = "DESC" if (sort_order or "asc").lower() == "desc" else "ASC"
+    return f"{column} {direction}, id ASC"
+
+
+def _split_list(value: Any) -> list[Any]:
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, Sequence):
+        return list(value)
+    return [value]
+
+
+__all__ = [
+    "FilterRule",
+    "PROCESS_FILTER_RULES",
+    "PROCESS_SORT_COLUMNS",
+    "TASK_FILTER_RULES",
+    "TASK_SORT_COLUMNS",
+    "UnsupportedFilterError",
+    "build_order",
+    "build_where",
+]
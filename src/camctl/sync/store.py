@@ -0,0 +1,400 @@
+"""SQLite-backed local mirror of engine tasks and process instances."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Self, Sequence
+
+from camctl.api.camunda.resources.processes import ProcessInstance
+from camctl.api.camunda.resources.tasks import Task
+from camctl.config.paths import cache_dir, engine_slug
+
+from .query import (
+    PROCESS_FILTER_RULES,
+    PROCESS_SORT_COLUMNS,
+    TASK_FILTER_RULES,
+    TASK_SORT_COLUMNS,
+    build_order,
+    build_where,
+)
+
+SCHEMA_VERSION = 1
+
+_TASK_COLUMNS = (
+    "id",
+    "name",
+    "assignee",
+    "owner",
+    "created",
+    "due",
+    "follow_up",
+    "last_updated",
+    "delegation_state",
+    "description",
+    "execution_id",
+    "parent_task_id",
+    "priority",
+    "process_definition_id",
+    "process_instance_id",
+    "case_definition_id",
+    "case_execution_id",
+    "case_instance_id",
+    "task_definition_key",
+    "tenant_id",
+    "suspended",
+)
+
+_PROCESS_COLUMNS = (
+    "id",
+    "definition_id",
+    "definition_key",
+    "business_key",
+    "case_instance_id",
+    "ended",
+    "suspended",
+    "tenant_id",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS tasks (
+    {", ".join(f"{name} {'INTEGER' if name in ('priority', 'suspended') else 'TEXT'}" for name in _TASK_COLUMNS)},
+    raw TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks (assignee);
+CREATE INDEX IF NOT EXISTS idx_tasks_process_instance ON tasks (process_instance_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_process_definition ON tasks (process_definition_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_definition_key ON tasks (task_definition_key);
+CREATE INDEX IF NOT EXISTS idx_tasks_tenant ON tasks (tenant_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created);
+CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks (due);
+CREATE INDEX IF NOT EXISTS idx_tasks_last_updated ON tasks (last_updated);
+
+CREATE TABLE IF NOT EXISTS processes (
+    {", ".join(f"{name} {'INTEGER' if name in ('ended', 'suspended') else 'TEXT'}" for name in _PROCESS_COLUMNS)},
+    raw TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS idx_processes_business_key ON processes (business_key);
+CREATE INDEX IF NOT EXISTS idx_processes_definition_id ON processes (definition_id);
+CREATE INDEX IF NOT EXISTS idx_processes_definition_key ON processes (definition_key);
+CREATE INDEX IF NOT EXISTS idx_processes_tenant ON processes (tenant_id);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    base_url TEXT,
+    watermark TEXT,
+    mode TEXT,
+    synced_at TEXT NOT NULL
+);
+"""
+
+_TABLES = {"tasks": _TASK_COLUMNS, "processes": _PROCESS_COLUMNS}
+_FLAG_COLUMNS = ("ended", "suspended")
+
+
+@dataclass(kw_only=True)
+class SyncState:
+    """Bookkeeping for the last sync of one mirrored resource."""
+
+    resource: str
+    base_url: str | None = None
+    watermark: str | None = None
+    mode: str | None = None
+    synced_at: str | None = None
+
+
+def mirror_path(base_url: str) -> Path:
+    """Return the mirror database path for an engine base URL."""
+    return cache_dir() / "mirror" / f"{engine_slug(base_url)}.sqlite3"
+
+
+class LocalStore:
+    """
+    Local SQLite mirror with indexed task and process instance tables.
+
+    Each row keeps the full JSON payload next to the indexed columns, so
+    records read back from the mirror match what the engine returned.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    @classmethod
+    def open_existing(cls, path: Path) -> Self:
+        """Open a mirror that must already exist."""
+        if not path.exists():
+            raise FileNotFoundError(f"No local mirror at {path}; run `camctl sync` first.")
+        return cls(path)
+
+    def upsert_tasks(self, tasks: Iterable[Task]) -> int:
+        """Insert or update tasks; returns the number of rows actually changed."""
+        return self._upsert("tasks", (_task_row(task) for task in tasks if task.id))
+
+    def upsert_processes(self, processes: Iterable[ProcessInstance]) -> int:
+        """Insert or update process instances; returns the number of rows changed."""
+        return self._upsert(
+            "processes",
+            (_process_row(proc) for proc in processes if proc.id),
+        )
+
+    def ids(self, table: str) -> list[str]:
+        """Return every mirrored id of a table."""
+        self._check_table(table)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT id FROM {table} ORDER BY id").fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, table: str, ids: Sequence[str]) -> int:
+        """Delete rows by id; returns the number of rows removed."""
+        self._check_table(table)
+        if not ids:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                f"DELETE FROM {table} WHERE id = ?",
+                [(item,) for item in ids],
+            )
+        return cursor.rowcount
+
+    def delete_missing(self, table: str, keep: set[str]) -> int:
+        """Delete every row whose id is not in `keep`."""
+        return self.delete(table, [item for item in self.ids(table) if item not in keep])
+
+    def task_watermark(self) -> str | None:
+        """Return the newest created/lastUpdated timestamp among mirrored tasks."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(created), MAX(last_updated) FROM tasks"
+            ).fetchone()
+        values = [value for value in row if value]
+        return max(values) if values else None
+
+    def count_tasks(self, filters: Mapping[str, Any] | None = None) -> int:
+        """Count mirrored tasks matching CLI filter keyword arguments."""
+        return self._count("tasks", filters or {}, TASK_FILTER_RULES)
+
+    def count_processes(self, filters: Mapping[str, Any] | None = None) -> int:
+        """Count mirrored process instances matching CLI filter keyword arguments."""
+        return self._count("processes", filters or {}, PROCESS_FILTER_RULES)
+
+    def count_tasks_by(
+        self,
+        column: str,
+        filters: Mapping[str, Any] | None = None,
+    ) -> dict[Any, int]:
+        """Count mirrored tasks matching CLI filters per value of one column."""
+        return self._count_by("tasks", column, filters or {}, TASK_FILTER_RULES)
+
+    def count_processes_by(
+        self,
+        column: str,
+        filters: Mapping[str, Any] | None = None,
+    ) -> dict[Any, int]:
+        """Count mirrored process instances matching CLI filters per column value."""
+        return self._count_by("processes", column, filters or {}, PROCESS_FILTER_RULES)
+
+    def query_tasks(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        first_result: int | None = None,
+        max_results: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+    ) -> list[Task]:
+        """Query mirrored tasks with CLI filters, engine-style sorting and paging."""
+        rows = self._select(
+            "tasks",
+            filters or {},
+            TASK_FILTER_RULES,
+            build_order(sort_by, sort_order, TASK_SORT_COLUMNS),
+            first_result,
+            max_results,
+        )
+        return [Task.from_dict(row) for row in rows]
+
+    def query_processes(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        first_result: int | None = None,
+        max_results: int | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+    ) -> list[ProcessInstance]:
+        """Query mirrored process instances with CLI filters, sorting and paging."""
+        rows = self._select(
+            "processes",
+            filters or {},
+            PROCESS_FILTER_RULES,
+            build_order(sort_by, sort_order, PROCESS_SORT_COLUMNS),
+            first_result,
+            max_results,
+        )
+        return [ProcessInstance.from_dict(row) for row in rows]
+
+    def get_state(self, resource: str) -> SyncState | None:
+        """Return the sync bookkeeping for a resource, if it was ever synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT resource, base_url, watermark, mode, synced_at "
+                "FROM sync_state WHERE resource = ?",
+                (resource,),
+            ).fetchone()
+        if row is None:
+            return None
+        resource, base_url, watermark, mode, synced_at = row
+        return SyncState(
+            resource=resource,
+            base_url=base_url,
+            watermark=watermark,
+            mode=mode,
+            synced_at=synced_at,
+        )
+
+    def set_state(self, state: SyncState) -> None:
+        """Persist sync bookkeeping for a resource."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (resource, base_url, watermark, mode, synced_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (resource) DO UPDATE SET base_url = excluded.base_url, "
+                "watermark = excluded.watermark, mode = excluded.mode, "
+                "synced_at = excluded.synced_at",
+                (
+                    state.resource,
+                    state.base_url,
+                    state.watermark,
+                    state.mode,
+                    state.synced_at or _now(),
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _upsert(self, table: str, rows: Iterator[dict[str, Any]]) -> int:
+        columns = (*_TABLES[table], "raw", "synced_at")
+        updates = ", ".join(f"{name} = excluded.{name}" for name in columns if name != "id")
+        statement = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates} "
+            f"WHERE {table}.raw IS NOT excluded.raw"
+        )
+        synced_at = _now()
+        values = [
+            tuple(row.get(name) for name in _TABLES[table]) + (row["raw"], synced_at)
+            for row in rows
+        ]
+        if not values:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(statement, values)
+        return cursor.rowcount
+
+    def _count(
+        self,
+        table: str,
+        filters: Mapping[str, Any],
+        rules: Mapping[str, Any],
+    ) -> int:
+        where, params = build_where(filters, rules)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE {where}",
+                params,
+            ).fetchone()
+        return int(row[0])
+
+    def _count_by(
+        self,
+        table: str,
+        column: str,
+        filters: Mapping[str, Any],
+        rules: Mapping[str, Any],
+    ) -> dict[Any, int]:
+        if column not in _TABLES[table] or column == "id":
+            raise ValueError(f"Cannot group mirrored {table} by {column!r}.")
+        where, params = build_where(filters, rules)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, COUNT(*) FROM {table} WHERE {where} GROUP BY {column}",
+                params,
+            ).fetchall()
+        if column in _FLAG_COLUMNS:
+            return {None if value is None else bool(value): count for value, count in rows}
+        return {value: count for value, count in rows}
+
+    def _select(
+        self,
+        table: str,
+        filters: Mapping[str, Any],
+        rules: Mapping[str, Any],
+        order: str,
+        first_result: int | None,
+        max_results: int | None,
+    ) -> list[dict[str, Any]]:
+        where, params = build_where(filters, rules)
+        statement = f"SELECT raw FROM {table} WHERE {where} ORDER BY {order}"
+        if max_results is not None or first_result:
+            statement += " LIMIT ? OFFSET ?"
+            params = [*params, -1 if max_results is None else max_results, first_result or 0]
+        with self._lock:
+            rows = self._conn.execute(statement, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _check_table(table: str) -> None:
+        if table not in _TABLES:
+            raise ValueError(f"Unknown mirror table {table!r}.")
+
+
+def _task_row(task: Task) -> dict[str, Any]:
+    row: dict[str, Any] = {name: getattr(task, name, None) for name in _TASK_COLUMNS}
+    row["suspended"] = None if task.suspended is None else int(task.suspended)
+    row["raw"] = _raw_json(task.to_dict())
+    return row
+
+
+def _process_row(proc: ProcessInstance) -> dict[str, Any]:
+    row: dict[str, Any] = {name: getattr(proc, name, None) for name in _PROCESS_COLUMNS}
+    for flag in ("ended", "suspended"):
+        value = row[flag]
+        row[flag] = None if value is None else int(value)
+    row["raw"] = _raw_json(proc.to_dict())
+    return row
+
+
+def _raw_json(payload: Mapping[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+__all__ = ["LocalStore", "SCHEMA_VERSION", "SyncState", "mirror_path"]
@@ -0,0 +1,198 @@
+"""In-memory watchers that poll the engine and report what changed."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterable, Mapping
+
+from camctl.api.camunda.engine import CamundaEngine
+from camctl.api.camunda.resources.processes import ProcessFilterParams, ProcessInstance
+from camctl.api.camunda.resources.tasks import Task, TaskFilterParams, TaskListParams
+from camctl.utils import changed_fields, diff_snapshots
+
+from .syncer import batched, with_overlap
+
+Snapshot = dict[str, dict[str, Any]]
+
+
+@dataclass(kw_only=True)
+class WatchEvent:
+    """One record that appeared, changed or disappeared between polls."""
+
+    kind: str
+    id: str
+    record: Mapping[str, Any]
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "id": self.id,
+            "record": dict(self.record),
+            "changes": {name: list(values) for name, values in self.changes.items()},
+        }
+
+
+def snapshot_events(previous: Snapshot, current: Snapshot) -> list[WatchEvent]:
+    """Describe the difference between two snapshots as watch events."""
+    diff = diff_snapshots(previous, current)
+    events = [WatchEvent(kind="inserted", id=key, record=current[key]) for key in diff.inserted]
+    events.extend(
+        WatchEvent(
+            kind="updated",
+            id=key,
+            record=current[key],
+            changes=changed_fields(previous[key], current[key]),
+        )
+        for key in diff.updated
+    )
+    events.extend(WatchEvent(kind="removed", id=key, record=previous[key]) for key in diff.removed)
+    return events
+
+
+class TaskWatcher:
+    """
+    Keep an in-memory snapshot of the tasks matching `filters` up to date.
+
+    After the initial load each poll costs one count plus two
+    `createdAfter`/`updatedAfter` queries from the newest timestamp seen,
+    which usually return nothing. Removals (completed tasks, or tasks that no
+    longer match the filters) show up as a count mismatch and are confirmed by
+    re-querying the snapshot ids in `taskIdIn` chunks. Filters that already use
+    those parameters, or an empty snapshot without a cursor, fall back to a
+    full reload diffed against the snapshot.
+    """
+
+    def __init__(
+        self,
+        engine: CamundaEngine,
+        *,
+        filters: TaskFilterParams | None = None,
+        page_size: int = 500,
+        chunk_size: int = 100,
+    ) -> None:
+        self._engine = engine
+        self._filters = filters or TaskFilterParams()
+        self._page_size = page_size
+        self._chunk_size = chunk_size
+        self._cursor: str | None = None
+        self._delta = all(
+            getattr(self._filters, name) is None
+            for name in ("created_after", "updated_after", "task_id_in")
+        )
+        self.snapshot: Snapshot = {}
+
+    def load(self) -> int:
+        """Load the initial snapshot and return the number of tasks in it."""
+        self.snapshot = self._fetch_all()
+        return len(self.snapshot)
+
+    def poll(self) -> list[WatchEvent]:
+        """Fetch what changed since the last poll and update the snapshot."""
+        if not self._delta or self._cursor is None:
+            return self._reload()
+
+        total = self._engine.tasks.count(params=self._filters)
+        since = with_overlap(self._cursor)
+        fresh: Snapshot = {}
+        for delta in (
+            replace(self._filters, created_after=since),
+            replace(self._filters, updated_after=since),
+        ):
+            tasks = self._engine.tasks.iterate(params=delta, page_size=self._page_size)
+            fresh.update(self._records(tasks))
+        current = {**self.snapshot, **fresh}
+
+        if total < len(current):
+            current = self._drop_missing(current)
+        if total != len(current):
+            return self._reload()
+        return self._apply(current)
+
+    def _reload(self) -> list[WatchEvent]:
+        return self._apply(self._fetch_all())
+
+    def _apply(self, current: Snapshot) -> list[WatchEvent]:
+        events = snapshot_events(self.snapshot, current)
+        self.snapshot = current
+        return events
+
+    def _fetch_all(self) -> Snapshot:
+        tasks = self._engine.tasks.iterate(params=self._filters, page_size=self._page_size)
+        return self._records(tasks)
+
+    def _drop_missing(self, current: Snapshot) -> Snapshot:
+        alive: set[str] = set()
+        for chunk in batched(current, self._chunk_size):
+            params = TaskListParams.from_filters(
+                self._filters,
+                task_id_in=",".join(chunk),
+                max_results=len(chunk),
+            )
+            alive.update(str(task.id) for task in self._engine.tasks.list(params=params).items)
+        return {key: record for key, record in current.items() if key in alive}
+
+    def _records(self, tasks: Iterable[Task]) -> Snapshot:
+        records: Snapshot = {}
+        for task in tasks:
+            if not task.id:
+                continue
+            records[str(task.id)] = task.to_dict()
+            for stamp in (task.created, task.last_updated):
+                if stamp and (self._cursor is None or stamp > self._cursor):
+                    self._cursor = stamp
+        return records
+
+
+class ProcessWatcher:
+    """
+    Keep an in-memory snapshot of the process instances matching `filters`.
+
+    The runtime API has no update timestamp, so each poll starts with a cheap
+    count and only reloads the instances when the count moved, or every
+    `full_every` polls to catch state changes such as suspension.
+    """
+
+    def __init__(
+        self,
+        engine: CamundaEngine,
+        *,
+        filters: ProcessFilterParams | None = None,
+        page_size: int = 500,
+        full_every: int = 5,
+    ) -> None:
+        self._engine = engine
+        self._filters = filters
+        self._page_size = page_size
+        self._full_every = max(1, full_every)
+        self._polls = 0
+        self.snapshot: Snapshot = {}
+
+    def load(self) -> int:
+        """Load the initial snapshot and return the number of instances in it."""
+        self.snapshot = self._fetch_all()
+        return len(self.snapshot)
+
+    def poll(self) -> list[WatchEvent]:
+        """Reload when the count changed (or on the periodic full poll) and diff."""
+        self._polls += 1
+        if self._polls % self._full_every:
+            if self._engine.processes.count(params=self._filters) == len(self.snapshot):
+                return []
+        current = self._fetch_all()
+        events = snapshot_events(self.snapshot, current)
+        self.snapshot = current
+        return events
+
+    def _fetch_all(self) -> Snapshot:
+        return {
+            str(proc.id): proc.to_dict()
+            for proc in self._iterate()
+            if proc.id
+        }
+
+    def _iterate(self) -> Iterable[ProcessInstance]:
+        return self._engine.processes.iterate(params=self._filters, page_size=self._page_size)
+
+
+__all__ = ["ProcessWatcher", "TaskWatcher", "WatchEvent", "snapshot_events"]
@@ -0,0 +1,32 @@
+"""Offline stand-ins for the Camunda engine, for tests, benchmarks and load tests.
+
+`FakeEngine` answers REST requests from in-memory state; use
+`FakeEngine.engine()` for an in-process client or `FakeEngineServer` (or
+`python -m camctl.testing`) to serve it over HTTP.
+"""
+
+from .fake_engine import (
+    FakeEngine,
+    FakeEngineError,
+    FakeEngineTransport,
+    Faults,
+    LatencyModel,
+    fixed_latency,
+    lognormal_latency,
+    parse_latency,
+    uniform_latency,
+)
+from .fake_server import FakeEngineServer
+
+__all__ = [
+    "FakeEngine",
+    "FakeEngineError",
+    "FakeEngineServer",
+    "FakeEngineTransport",
+    "Faults",
+    "LatencyModel",
+    "fixed_latency",
+    "lognormal_latency",
+    "parse_latency",
+    "uniform_latency",
+]
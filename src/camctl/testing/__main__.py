@@ -0,0 +1,6 @@
+"""Module entrypoint for `python -m camctl.testing` (serves the fake engine)."""
+
+from camctl.testing.fake_server import main
+
+if __name__ == "__main__":
+    main()
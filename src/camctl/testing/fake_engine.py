@@ -0,0 +1,906 @@
+"""Stateful, in-process stand-in for the Camunda engine REST API.
+
+`FakeEngine` keeps process instances, tasks and variables in memory and
+answers the endpoints camctl uses (lists with filters, sorting and paging,
+counts, variables, complete, cancel and start) with engine-shaped JSON.
+Plug it into a client with `FakeEngineTransport` (see `FakeEngine.engine`)
+or serve it over HTTP with `python -m camctl.testing`. Latency and faults
+are injected per request so load tests see realistic response times and
+failure rates without a real engine.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+import httpx
+
+from camctl.api.camunda import CamundaClient, CamundaEngine
+from camctl.api.camunda.common.query import parse_variable_filters
+
+LatencyModel = Callable[[random.Random], float]
+"""Returns the simulated server time of one request, in seconds."""
+
+DEFAULT_BASE_PATH = "/engine-rest"
+
+_DEFINITION_KEYS = ("invoice", "order-fulfilment", "onboarding", "claims", "kyc-review")
+_TASK_NAMES = ("Review invoice", "Approve order", "Check documents", "Call customer", "Escalate")
+_USERS = ("alice", "bob", "carol", "dave", "erin", None)
+_GROUPS = ("accounting", "sales", "management", "support")
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_TASK_FIELDS = (
+    "id",
+    "name",
+    "assignee",
+    "owner",
+    "created",
+    "lastUpdated",
+    "due",
+    "followUp",
+    "delegationState",
+    "description",
+    "executionId",
+    "parentTaskId",
+    "priority",
+    "processDefinitionId",
+    "processInstanceId",
+    "caseExecutionId",
+    "caseDefinitionId",
+    "caseInstanceId",
+    "taskDefinitionKey",
+    "suspended",
+    "formKey",
+    "camundaFormRef",
+    "tenantId",
+    "taskState",
+)
+_PROCESS_FIELDS = (
+    "links",
+    "id",
+    "definitionId",
+    "definitionKey",
+    "businessKey",
+    "caseInstanceId",
+    "ended",
+    "suspended",
+    "tenantId",
+)
+
+
+def fixed_latency(ms: float) -> LatencyModel:
+    return lambda rng: ms / 1000.0
+
+
+def uniform_latency(low_ms: float, high_ms: float) -> LatencyModel:
+    return lambda rng: rng.uniform(low_ms, high_ms) / 1000.0
+
+
+def lognormal_latency(median_ms: float, sigma: float = 0.5) -> LatencyModel:
+    """Long-tailed latency: `median_ms` at p50, roughly `median * e^(2.33 sigma)` at p99."""
+    if median_ms <= 0:
+        return fixed_latency(0.0)
+    mu = math.log(median_ms)
+    return lambda rng: rng.lognormvariate(mu, sigma) / 1000.0
+
+
+def parse_latency(spec: str) -> LatencyModel:
+    """
+    Parse a latency spec: `20` (fixed ms), `uniform:5:50` or `lognormal:20:0.5`.
+
+    Raises ValueError for anything else.
+    """
+    kind, *args = [part.strip() for part in spec.split(":")]
+    try:
+        if not args:
+            return fixed_latency(float(kind))
+        values = [float(arg) for arg in args]
+    except ValueError as exc:
+        raise ValueError(f"Invalid latency {spec!r}; numbers expected.") from exc
+    if kind == "fixed" and len(values) == 1:
+        return fixed_latency(values[0])
+    if kind == "uniform" and len(values) == 2:
+        return uniform_latency(*values)
+    if kind == "lognormal" and len(values) in (1, 2):
+        return lognormal_latency(*values)
+    raise ValueError(
+        f"Invalid latency {spec!r}; use MS, fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA."
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class Faults:
+    """
+    Per-request failure injection.
+
+    `error_rate` of requests get an `error_status` response and
+    `disconnect_rate` of requests are dropped without a response. Faults are
+    drawn before the request is handled, so a failed write changes nothing.
+    """
+
+    error_rate: float = 0.0
+    error_status: int = 503
+    disconnect_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.error_rate + self.disconnect_rate <= 1.0:
+            raise ValueError("error_rate + disconnect_rate must be between 0 and 1")
+
+
+class FakeEngineError(Exception):
+    """An error the fake answers with a Camunda error payload."""
+
+    def __init__(
+        self, status_code: int, message: str, *, error_type: str = "InvalidRequestException"
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_type = error_type
+
+    def payload(self) -> dict[str, Any]:
+        return {"type": self.error_type, "message": str(self), "code": None}
+
+
+class FakeEngine:
+    """
+    In-memory Camunda engine.
+
+    Each process instance starts with one task and has `steps` tasks in
+    total: completing a task merges its variables into the instance and
+    either creates the next task or ends the instance, which removes it (and
+    its variables) from the runtime API, as the real engine does. Cancelling
+    removes the instance and its tasks. All state changes hold one lock, so
+    the engine can be shared by concurrent clients.
+
+    `requests` counts handled requests by `METHOD route`, for assertions
+    and load reports.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyModel | None = None,
+        faults: Faults | None = None,
+        seed: int | None = None,
+        base_path: str = DEFAULT_BASE_PATH,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.latency = latency
+        self.faults = faults or Faults()
+        self.base_path = "/" + base_path.strip("/") if base_path.strip("/") else ""
+        self.requests: Counter[str] = Counter()
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._processes: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, dict[str, Any]] = {}
+        self._variables: dict[str, dict[str, dict[str, Any]]] = {}
+        self._local_variables: dict[str, dict[str, dict[str, Any]]] = {}
+        self._steps: dict[str, int] = {}
+
+    # -- dataset -----------------------------------------------------------
+
+    @classmethod
+    def with_dataset(
+        cls,
+        *,
+        processes: int = 100,
+        steps: int = 1,
+        variables: int = 5,
+        seed: int | None = 42,
+        **options: Any,
+    ) -> FakeEngine:
+        """Create an engine holding `processes` running instances, one open task each."""
+        engine = cls(seed=seed, **options)
+        engine.populate(processes=processes, steps=steps, variables=variables)
+        return engine
+
+    def populate(self, *, processes: int, steps: int = 1, variables: int = 5) -> list[str]:
+        """Start `processes` instances with `variables` generated variables each."""
+        rng = self._rng
+        started = []
+        for index in range(processes):
+            values = {
+                "amount": round(rng.uniform(1, 10_000), 2),
+                "approved": rng.random() < 0.5,
+                "customer": f"customer-{rng.randrange(1000):03d}",
+                "priority": rng.choice((25, 50, 75)),
+                "region": rng.choice(("eu", "us", "apac")),
+            }
+            for extra in range(5, variables):
+                values[f"var{extra}"] = f"value-{rng.randrange(10**6)}"
+            process = self.start_process(
+                rng.choice(_DEFINITION_KEYS),
+                business_key=f"BK-{index:06d}",
+                variables=dict(list(values.items())[:variables]),
+                steps=steps,
+            )
+            started.append(process["id"])
+        return started
+
+    def start_process(
+        self,
+        key: str,
+        *,
+        business_key: str | None = None,
+        variables: Mapping[str, Any] | None = None,
+        tenant_id: str | None = None,
+        steps: int = 1,
+    ) -> dict[str, Any]:
+        """Start an instance of definition `key` and create its first task."""
+        with self._lock:
+            process_id = self._uuid()
+            process = {
+                "links": [],
+                "id": process_id,
+                "definitionId": f"{key}:1:{self._uuid()}",
+                "definitionKey": key,
+                "businessKey": business_key,
+                "caseInstanceId": None,
+                "ended": False,
+                "suspended": False,
+                "tenantId": tenant_id,
+            }
+            self._processes[process_id] = process
+            self._variables[process_id] = {
+                name: _typed_value(value) for name, value in (variables or {}).items()
+            }
+            self._steps[process_id] = max(1, steps)
+            self._create_task(process)
+            return dict(process)
+
+    def _create_task(self, process: Mapping[str, Any]) -> dict[str, Any]:
+        rng = self._rng
+        step = self._steps[process["id"]]
+        key = process["definitionKey"]
+        created = _timestamp(_EPOCH + timedelta(seconds=rng.randrange(365 * 24 * 3600)))
+        task = {
+            "id": self._uuid(),
+            "name": rng.choice(_TASK_NAMES),
+            "assignee": rng.choice(_USERS),
+            "owner": None,
+            "created": created,
+            "lastUpdated": created,
+            "due": None,
+            "followUp": None,
+            "delegationState": None,
+            "description": None,
+            "executionId": process["id"],
+            "parentTaskId": None,
+            "priority": rng.choice((25, 50, 75)),
+            "processDefinitionId": process["definitionId"],
+            "processInstanceId": process["id"],
+            "caseExecutionId": None,
+            "caseDefinitionId": None,
+            "caseInstanceId": None,
+            "taskDefinitionKey": f"{key}-task-{step}",
+            "suspended": False,
+            "formKey": None,
+            "camundaFormRef": None,
+            "tenantId": process["tenantId"],
+            "taskState": "Created",
+            # Not part of the task payload; used by filters and reports.
+            "processDefinitionKey": key,
+            "processInstanceBusinessKey": process["businessKey"],
+            "candidateGroups": [rng.choice(_GROUPS)],
+        }
+        self._tasks[task["id"]] = task
+        self._local_variables[task["id"]] = {}
+        return task
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    @property
+    def task_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._tasks)
+
+    @property
+    def process_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._processes)
+
+    # -- clients -----------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Base URL clients use for the in-process transport."""
+        return f"http://fake-engine{self.base_path}"
+
+    def transport(self) -> FakeEngineTransport:
+        return FakeEngineTransport(self)
+
+    def engine(self, **options: Any) -> CamundaEngine:
+        """Return a `CamundaEngine` whose requests are answered by this fake."""
+        client = httpx.Client(transport=self.transport())
+        return CamundaEngine(CamundaClient(base_url=self.url, client=client, **options))
+
+    # -- request handling --------------------------------------------------
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+    ) -> tuple[int, Any] | None:
+        """
+        Answer one request after the simulated latency and faults.
+
+        Returns `(status, payload)`, where a None payload means an empty body,
+        or None when the request should be dropped without a response.
+        """
+        if self.latency is not None:
+            delay = self.latency(self._rng)
+            if delay > 0:
+                self._sleep(delay)
+        faults = self.faults
+        if faults.error_rate or faults.disconnect_rate:
+            draw = self._rng.random()
+            if draw < faults.error_rate:
+                return faults.error_status, {
+                    "type": "ServiceUnavailableException",
+                    "message": "Injected failure.",
+                    "code": None,
+                }
+            if draw < faults.error_rate + faults.disconnect_rate:
+                return None
+        return self.handle(method, path, query, body)
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+    ) -> tuple[int, Any]:
+        """Route a request without latency or faults and return `(status, payload)`."""
+        relative = path
+        if self.base_path and relative.startswith(self.base_path + "/"):
+            relative = relative[len(self.base_path) :]
+        relative = relative.strip("/")
+        for route_method, pattern, name, handler in _ROUTES:
+            if route_method != method.upper():
+                continue
+            match = pattern.fullmatch(relative)
+            if match is None:
+                continue
+            with self._lock:
+                self.requests[f"{route_method} {name}"] += 1
+                try:
+                    return handler(self, query, body, **match.groupdict())
+                except FakeEngineError as exc:
+                    return exc.status_code, exc.payload()
+        return 404, FakeEngineError(404, f"No route for {method} {path}").payload()
+
+    # -- tasks -------------------------------------------------------------
+
+    def _task(self, task_id: str) -> dict[str, Any]:
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise FakeEngineError(404, f"No matching task with id {task_id}")
+        return task
+
+    def _list_tasks(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        tasks = self._query(self._tasks.values(), query, body, _TASK_FILTERS, _TASK_SORTS)
+        return 200, [_project(task, _TASK_FIELDS) for task in _page(tasks, query)]
+
+    def _count_tasks(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        tasks = self._query(self._tasks.values(), query, body, _TASK_FILTERS, _TASK_SORTS)
+        return 200, {"count": len(tasks)}
+
+    def _count_by_group(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        counts: Counter[str | None] = Counter()
+        for task in self._tasks.values():
+            for group in task["candidateGroups"] or [None]:
+                counts[group] += 1
+        return 200, [
+            {"groupName": group, "taskCount": count}
+            for group, count in sorted(counts.items(), key=lambda item: item[0] or "")
+        ]
+
+    def _get_task(self, query: Mapping[str, str], body: Any, *, task_id: str):
+        return 200, _project(self._task(task_id), _TASK_FIELDS)
+
+    def _complete_task(self, query: Mapping[str, str], body: Any, *, task_id: str):
+        task = self._task(task_id)
+        process_id = task["processInstanceId"]
+        variables = self._variables[process_id]
+        for name, value in ((body or {}).get("variables") or {}).items():
+            variables[name] = _typed_value(value)
+        result = dict(variables) if (body or {}).get("withVariablesInReturn") else None
+        del self._tasks[task_id]
+        del self._local_variables[task_id]
+        self._steps[process_id] -= 1
+        if self._steps[process_id] > 0:
+            self._create_task(self._processes[process_id])
+        else:
+            self._end_process(process_id)
+        return (200, result) if result is not None else (204, None)
+
+    def _task_scope(self, task_id: str, local: bool) -> dict[str, dict[str, Any]]:
+        task = self._task(task_id)
+        if local:
+            return self._local_variables[task_id]
+        return self._variables[task["processInstanceId"]]
+
+    def _visible_variables(self, task_id: str, local: bool) -> dict[str, dict[str, Any]]:
+        scope = self._task_scope(task_id, local)
+        return scope if local else {**scope, **self._local_variables[task_id]}
+
+    def _task_variables(self, query, body, *, task_id: str, local: bool):
+        return 200, _variables_payload(self._visible_variables(task_id, local))
+
+    def _modify_task_variables(self, query, body, *, task_id: str, local: bool):
+        _modify(self._task_scope(task_id, local), body)
+        return 204, None
+
+    def _task_variable(self, query, body, *, task_id: str, name: str, local: bool):
+        return 200, _variable(self._visible_variables(task_id, local), name, f"task {task_id}")
+
+    def _put_task_variable(self, query, body, *, task_id: str, name: str, local: bool):
+        self._task_scope(task_id, local)[name] = _typed_value(body or {})
+        return 204, None
+
+    def _delete_task_variable(self, query, body, *, task_id: str, name: str, local: bool):
+        self._task_scope(task_id, local).pop(name, None)
+        return 204, None
+
+    # -- processes ---------------------------------------------------------
+
+    def _process(self, process_id: str) -> dict[str, Any]:
+        process = self._processes.get(process_id)
+        if process is None:
+            raise FakeEngineError(
+                404, f"Process instance with id {process_id} does not exist"
+            )
+        return process
+
+    def _end_process(self, process_id: str) -> None:
+        for task_id in [
+            task_id
+            for task_id, task in self._tasks.items()
+            if task["processInstanceId"] == process_id
+        ]:
+            del self._tasks[task_id]
+            del self._local_variables[task_id]
+        del self._processes[process_id]
+        del self._variables[process_id]
+        del self._steps[process_id]
+
+    def _list_processes(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        processes = self._query(
+            self._processes.values(), query, body, _PROCESS_FILTERS, _PROCESS_SORTS
+        )
+        return 200, [_project(process, _PROCESS_FIELDS) for process in _page(processes, query)]
+
+    def _count_processes(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        processes = self._query(
+            self._processes.values(), query, body, _PROCESS_FILTERS, _PROCESS_SORTS
+        )
+        return 200, {"count": len(processes)}
+
+    def _get_process(self, query, body, *, process_id: str):
+        return 200, _project(self._process(process_id), _PROCESS_FIELDS)
+
+    def _cancel_process(self, query, body, *, process_id: str):
+        self._process(process_id)
+        self._end_process(process_id)
+        return 204, None
+
+    def _process_variables(self, query, body, *, process_id: str):
+        self._process(process_id)
+        return 200, _variables_payload(self._variables[process_id])
+
+    def _modify_process_variables(self, query, body, *, process_id: str):
+        self._process(process_id)
+        _modify(self._variables[process_id], body)
+        return 204, None
+
+    def _variable_instances(self, query: Mapping[str, str], body: Any) -> tuple[int, Any]:
+        body = body or {}
+        ids = body.get("processInstanceIdIn")
+        names = set(body.get("variableNameIn") or [])
+        if body.get("variableName"):
+            names.add(body["variableName"])
+        items = []
+        for process_id in sorted(ids if ids is not None else self._variables):
+            for name, value in sorted(self._variables.get(process_id, {}).items()):
+                if names and name not in names:
+                    continue
+                items.append(
+                    {
+                        **value,
+                        "id": f"{process_id}:{name}",
+                        "name": name,
+                        "processInstanceId": process_id,
+                        "executionId": process_id,
+                        "activityInstanceId": process_id,
+                        "taskId": None,
+                        "tenantId": self._processes[process_id]["tenantId"],
+                        "errorMessage": None,
+                    }
+                )
+        return 200, _page(items, query)
+
+    def _start(self, query, body, *, key: str, tenant_id: str | None = None):
+        body = body or {}
+        process = self.start_process(
+            key,
+            business_key=body.get("businessKey"),
+            variables=body.get("variables"),
+            tenant_id=tenant_id,
+        )
+        if body.get("withVariablesInReturn"):
+            process["variables"] = _variables_payload(self._variables[process["id"]])
+        return 200, _project(process, (*_PROCESS_FIELDS, "variables"))
+
+    # -- queries -----------------------------------------------------------
+
+    def _query(
+        self,
+        records: Iterable[dict[str, Any]],
+        query: Mapping[str, str],
+        body: Any,
+        filters: Mapping[str, Callable[[Any], Callable[[dict[str, Any]], bool]]],
+        sorts: Mapping[str, str],
+    ) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {
+            key: value for key, value in query.items() if key not in _PAGINATION_KEYS
+        }
+        if isinstance(body, Mapping):
+            params.update(body)
+        predicates = []
+        for key, value in params.items():
+            if value is None or key in ("sortBy", "sortOrder", "sorting"):
+                continue
+            if key in ("processVariables", "variables"):
+                predicates.append(self._variable_predicate(value))
+            elif key in filters:
+                predicates.append(filters[key](value))
+        matched = [record for record in records if all(test(record) for test in predicates)]
+        sorting = params.get("sorting") or (
+            [{"sortBy": params["sortBy"], "sortOrder": params.get("sortOrder", "asc")}]
+            if params.get("sortBy")
+            else []
+        )
+        for item in reversed(sorting):
+            field = sorts.get(item.get("sortBy"))
+            if field is None:
+                raise FakeEngineError(
+                    400, f"Cannot set query parameter 'sortBy' to value {item.get('sortBy')!r}"
+                )
+            matched.sort(
+                key=lambda record: _sort_key(record.get(field)),
+                reverse=item.get("sortOrder") == "desc",
+            )
+        return matched
+
+    def _variable_predicate(self, value: Any) -> Callable[[dict[str, Any]], bool]:
+        expressions = parse_variable_filters(value) if isinstance(value, str) else list(value)
+
+        def test(record: dict[str, Any]) -> bool:
+            process_id = record.get("processInstanceId") or record["id"]
+            variables = self._variables.get(process_id, {})
+            for expression in expressions:
+                stored = variables.get(expression["name"])
+                if stored is None or not _compare(
+                    stored["value"], expression["operator"], expression["value"]
+                ):
+                    return False
+            return True
+
+        return test
+
+
+class FakeEngineTransport(httpx.BaseTransport):
+    """httpx transport that answers requests from a `FakeEngine` in-process."""
+
+    def __init__(self, engine: FakeEngine) -> None:
+        self.engine = engine
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        content = request.read()
+        body = json.loads(content) if content else None
+        result = self.engine.respond(
+            request.method, request.url.path, dict(request.url.params), body
+        )
+        if result is None:
+            raise httpx.RemoteProtocolError(
+                "Server disconnected without sending a response.", request=request
+            )
+        status, payload = result
+        if payload is None:
+            return httpx.Response(status, request=request)
+        return httpx.Response(status, json=payload, request=request)
+
+
+_PAGINATION_KEYS = ("firstResult", "maxResults")
+
+
+def _page(records: Sequence[Any], query: Mapping[str, str]) -> list[Any]:
+    first = int(query.get("firstResult") or 0)
+    size = query.get("maxResults")
+    return list(records[first : first + int(size)] if size is not None else records[first:])
+
+
+def _project(record: Mapping[str, Any], keys: Sequence[str]) -> dict[str, Any]:
+    return {key: record[key] for key in keys if key in record}
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _values(value: Any) -> set[str]:
+    items = value.split(",") if isinstance(value, str) else value
+    return {str(item).strip() for item in items}
+
+
+def _like(pattern: str) -> re.Pattern[str]:
+    return re.compile(".*".join(re.escape(part) for part in str(pattern).split("%")), re.DOTALL)
+
+
+def _equals(field: str):
+    return lambda value: lambda record: _text(record.get(field)) == _text(value)
+
+
+def _within(field: str, *, negate: bool = False):
+    def build(value: Any) -> Callable[[dict[str, Any]], bool]:
+        wanted = _values(value)
+        return lambda record: (_text(record.get(field)) in wanted) != negate
+
+    return build
+
+
+def _matching(field: str):
+    def build(value: Any) -> Callable[[dict[str, Any]], bool]:
+        pattern = _like(value)
+        return lambda record: record.get(field) is not None and bool(
+            pattern.fullmatch(str(record[field]))
+        )
+
+    return build
+
+
+def _flag(test: Callable[[dict[str, Any]], bool]):
+    def build(value: Any) -> Callable[[dict[str, Any]], bool]:
+        if _text(value) == "false":
+            return lambda record: True
+        return test
+
+    return build
+
+
+def _bound(field: str, compare: Callable[[Any, Any], bool]):
+    return lambda value: lambda record: record.get(field) is not None and compare(
+        record[field], int(value)
+    )
+
+
+def _in_group(value: Any) -> Callable[[dict[str, Any]], bool]:
+    wanted = _values(value)
+    return lambda record: bool(wanted.intersection(record.get("candidateGroups") or ()))
+
+
+_TASK_FILTERS: dict[str, Callable[[Any], Callable[[dict[str, Any]], bool]]] = {
+    "taskId": _equals("id"),
+    "taskIdIn": _within("id"),
+    "processInstanceId": _equals("processInstanceId"),
+    "processInstanceIdIn": _within("processInstanceId"),
+    "processInstanceBusinessKey": _equals("processInstanceBusinessKey"),
+    "processInstanceBusinessKeyIn": _within("processInstanceBusinessKey"),
+    "processInstanceBusinessKeyLike": _matching("processInstanceBusinessKey"),
+    "processDefinitionId": _equals("processDefinitionId"),
+    "processDefinitionKey": _equals("processDefinitionKey"),
+    "processDefinitionKeyIn": _within("processDefinitionKey"),
+    "executionId": _equals("executionId"),
+    "tenantIdIn": _within("tenantId"),
+    "withoutTenantId": _flag(lambda record: record.get("tenantId") is None),
+    "assignee": _equals("assignee"),
+    "assigneeIn": _within("assignee"),
+    "assigneeLike": _matching("assignee"),
+    "assigned": _flag(lambda record: record.get("assignee") is not None),
+    "unassigned": _flag(lambda record: record.get("assignee") is None),
+    "owner": _equals("owner"),
+    "candidateGroup": _in_group,
+    "candidateGroups": _in_group,
+    "withCandidateGroups": _flag(lambda record: bool(record.get("candidateGroups"))),
+    "withoutCandidateGroups": _flag(lambda record: not record.get("candidateGroups")),
+    "taskDefinitionKey": _equals("taskDefinitionKey"),
+    "taskDefinitionKeyIn": _within("taskDefinitionKey"),
+    "taskDefinitionKeyLike": _matching("taskDefinitionKey"),
+    "name": _equals("name"),
+    "nameLike": _matching("name"),
+    "priority": _equals("priority"),
+    "minPriority": _bound("priority", lambda actual, limit: actual >= limit),
+    "maxPriority": _bound("priority", lambda actual, limit: actual <= limit),
+    "active": _flag(lambda record: not record.get("suspended")),
+    "suspended": _flag(lambda record: bool(record.get("suspended"))),
+}
+
+_PROCESS_FILTERS: dict[str, Callable[[Any], Callable[[dict[str, Any]], bool]]] = {
+    "processInstanceIds": _within("id"),
+    "businessKey": _equals("businessKey"),
+    "businessKeyLike": _matching("businessKey"),
+    "processDefinitionId": _equals("definitionId"),
+    "processDefinitionKey": _equals("definitionKey"),
+    "processDefinitionKeyIn": _within("definitionKey"),
+    "processDefinitionKeyNotIn": _within("definitionKey", negate=True),
+    "tenantIdIn": _within("tenantId"),
+    "withoutTenantId": _flag(lambda record: record.get("tenantId") is None),
+    "active": _flag(lambda record: not record.get("suspended")),
+    "suspended": _flag(lambda record: bool(record.get("suspended"))),
+}
+
+_TASK_SORTS = {
+    "id": "id",
+    "name": "name",
+    "assignee": "assignee",
+    "created": "created",
+    "lastUpdated": "lastUpdated",
+    "dueDate": "due",
+    "followUpDate": "followUp",
+    "priority": "priority",
+    "instanceId": "processInstanceId",
+    "executionId": "executionId",
+    "taskDefinitionKey": "taskDefinitionKey",
+}
+
+_PROCESS_SORTS = {
+    "instanceId": "id",
+    "definitionId": "definitionId",
+    "definitionKey": "definitionKey",
+    "businessKey": "businessKey",
+    "tenantId": "tenantId",
+}
+
+
+def _sort_key(value: Any) -> tuple[bool, Any]:
+    return (value is None, value if value is not None else "")
+
+
+def _compare(actual: Any, operator: str, expected: Any) -> bool:
+    if operator == "like":
+        return bool(_like(str(expected)).fullmatch(str(actual)))
+    if isinstance(expected, str) and not isinstance(actual, str):
+        # GET filters carry strings; compare them as the stored type.
+        try:
+            expected = (
+                expected.lower() == "true" if isinstance(actual, bool) else type(actual)(expected)
+            )
+        except (TypeError, ValueError):
+            return False
+    try:
+        return {
+            "eq": lambda: actual == expected,
+            "neq": lambda: actual != expected,
+            "gt": lambda: actual > expected,
+            "gteq": lambda: actual >= expected,
+            "lt": lambda: actual < expected,
+            "lteq": lambda: actual <= expected,
+        }[operator]()
+    except KeyError:
+        raise FakeEngineError(400, f"Invalid variable comparator specified: {operator}") from None
+    except TypeError:
+        return False
+
+
+def _typed_value(value: Any) -> dict[str, Any]:
+    """Return a stored variable from a `{value, type, valueInfo}` payload or a plain value."""
+    if isinstance(value, Mapping) and "value" in value:
+        return {
+            "type": value.get("type") or _variable_type(value["value"]),
+            "value": value["value"],
+            "valueInfo": dict(value.get("valueInfo") or {}),
+        }
+    return {"type": _variable_type(value), "value": value, "valueInfo": {}}
+
+
+def _variable_type(value: Any) -> str:
+    if value is None:
+        return "Null"
+    if isinstance(value, bool):
+        return "Boolean"
+    if isinstance(value, int):
+        return "Integer" if -(2**31) <= value < 2**31 else "Long"
+    if isinstance(value, float):
+        return "Double"
+    if isinstance(value, str):
+        return "String"
+    return "Json"
+
+
+def _variables_payload(scope: Mapping[str, dict[str, Any]]) -> dict[str, Any]:
+    return {name: dict(value) for name, value in scope.items()}
+
+
+def _variable(scope: Mapping[str, dict[str, Any]], name: str, owner: str) -> dict[str, Any]:
+    if name not in scope:
+        raise FakeEngineError(404, f"variable {name} not found in {owner}")
+    return dict(scope[name])
+
+
+def _modify(scope: dict[str, dict[str, Any]], body: Any) -> None:
+    body = body or {}
+    for name, value in (body.get("modifications") or {}).items():
+        scope[name] = _typed_value(value)
+    for name in body.get("deletions") or ():
+        scope.pop(name, None)
+
+
+def _route(method: str, template: str, handler: Callable[..., tuple[int, Any]], **bound: Any):
+    pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)
+    if bound:
+        handler = functools.partial(handler, **bound)
+    return method, re.compile(pattern), template, handler
+
+
+def _variable_routes(template: str, *, local: bool):
+    return [
+        _route("GET", template, FakeEngine._task_variables, local=local),
+        _route("POST", template, FakeEngine._modify_task_variables, local=local),
+        _route("GET", template + "/{name}", FakeEngine._task_variable, local=local),
+        _route("PUT", template + "/{name}", FakeEngine._put_task_variable, local=local),
+        _route("DELETE", template + "/{name}", FakeEngine._delete_task_variable, local=local),
+    ]
+
+
+_ROUTES = [
+    _route("GET", "task", FakeEngine._list_tasks),
+    _route("POST", "task", FakeEngine._list_tasks),
+    _route("GET", "task/count", FakeEngine._count_tasks),
+    _route("POST", "task/count", FakeEngine._count_tasks),
+    _route("GET", "task/report/candidate-group-count", FakeEngine._count_by_group),
+    _route("GET", "task/{task_id}", FakeEngine._get_task),
+    _route("POST", "task/{task_id}/complete", FakeEngine._complete_task),
+    *_variable_routes("task/{task_id}/variables", local=False),
+    *_variable_routes("task/{task_id}/localVariables", local=True),
+    _route("GET", "process-instance", FakeEngine._list_processes),
+    _route("POST", "process-instance", FakeEngine._list_processes),
+    _route("GET", "process-instance/count", FakeEngine._count_processes),
+    _route("POST", "process-instance/count", FakeEngine._count_processes),
+    _route("GET", "process-instance/{process_id}", FakeEngine._get_process),
+    _route("DELETE", "process-instance/{process_id}", FakeEngine._cancel_process),
+    _route("GET", "process-instance/{process_id}/variables", FakeEngine._process_variables),
+    _route(
+        "POST", "process-instance/{process_id}/variables", FakeEngine._modify_process_variables
+    ),
+    _route("POST", "variable-instance", FakeEngine._variable_instances),
+    _route("POST", "process-definition/key/{key}/start", FakeEngine._start),
+    _route("POST", "process-definition/key/{key}/tenant-id/{tenant_id}/start", FakeEngine._start),
+]
+
+
+__all__ = [
+    "DEFAULT_BASE_PATH",
+    "FakeEngine",
+    "FakeEngineError",
+    "FakeEngineTransport",
+    "Faults",
+    "LatencyModel",
+    "fixed_latency",
+    "lognormal_latency",
+    "parse_latency",
+    "uniform_latency",
+]
@@ -0,0 +1,169 @@
+"""Serve a `FakeEngine` over HTTP for load tests against a real socket."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+from camctl.testing.fake_engine import FakeEngine, Faults, parse_latency
+
+DEFAULT_PORT = 8080
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, like the engine's servlet container, so clients reuse connections.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every response.
+    disable_nagle_algorithm = True
+    server: _FakeHTTPServer
+
+    def do_GET(self) -> None:
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    def do_DELETE(self) -> None:
+        self._dispatch()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        content = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(content) if content else None
+        except ValueError:
+            self._send(400, {"type": "InvalidRequestException", "message": "Invalid JSON body."})
+            return
+        query = dict(parse_qsl(url.query))
+        result = self.server.engine.respond(self.command, url.path, query, body)
+        if result is None:
+            self.close_connection = True
+            return
+        self._send(*result)
+
+    def _send(self, status: int, payload: Any) -> None:
+        content = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], engine: FakeEngine) -> None:
+        super().__init__(address, _Handler)
+        self.engine = engine
+
+
+class FakeEngineServer:
+    """
+    HTTP server answering from a `FakeEngine`, one thread per connection.
+
+    Use it as a context manager to serve on a background thread; `port=0`
+    picks a free port, and `url` is the base URL to point clients at.
+    """
+
+    def __init__(self, engine: FakeEngine, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.engine = engine
+        self._server = _FakeHTTPServer((host, port), engine)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.engine.base_path}"
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-engine",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run a fake engine in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m camctl.testing",
+        description="Serve an in-memory Camunda engine REST API for offline load tests.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--processes", type=int, default=1000, help="Running instances to create.")
+    parser.add_argument("--steps", type=int, default=1, help="Tasks per instance before it ends.")
+    parser.add_argument("--variables", type=int, default=5, help="Variables per instance.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--latency",
+        default="0",
+        help="MS, fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA.",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    try:
+        latency = parse_latency(args.latency)
+        faults = Faults(
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            disconnect_rate=args.disconnect_rate,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    engine = FakeEngine.with_dataset(
+        processes=args.processes,
+        steps=args.steps,
+        variables=args.variables,
+        seed=args.seed,
+        latency=latency,
+        faults=faults,
+    )
+    server = FakeEngineServer(engine, host=args.host, port=args.port)
+    print(f"Fake engine serving {args.processes} instances at {server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+__all__ = ["DEFAULT_PORT", "FakeEngineServer", "main"]
@@ -0,0 +1,275 @@
+"""Lightweight tracing: nested spans written to a Chrome trace file.
+
+Tracing is off until a `Tracer` is activated with `use_tracer` (the CLI
+does this for `--trace FILE`). While it is active:
+
+- `span(name, **attributes)` times a block as a child of the current span,
+- `traced` does the same for every call of a function,
+- `bind` carries the current span into a worker thread, so work submitted
+  to a thread pool shows up under the span that submitted it, with the
+  time it spent queued,
+- `traceparent` returns a W3C trace context header for the current span,
+  so engine-side traces can be joined to ours.
+
+The active tracer and current span live in context variables, so
+concurrent commands (for example in the daemon) trace independently.
+When no tracer is active every helper is a cheap no-op.
+
+`Tracer.write_chrome_trace` writes the Trace Event Format JSON read by
+chrome://tracing, Perfetto (ui.perfetto.dev) and speedscope; each event
+carries its trace, span and parent ids in `args`. No collector is needed.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_SPANS = 100_000
+
+_tracer: ContextVar[Tracer | None] = ContextVar("camctl_tracer", default=None)
+_span: ContextVar[Span | None] = ContextVar("camctl_span", default=None)
+
+
+@dataclass(kw_only=True)
+class Span:
+    """One timed operation; times are nanoseconds since the Unix epoch."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int
+    end_ns: int | None = None
+    thread_id: int = field(default_factory=threading.get_ident)
+    thread_name: str = field(default_factory=lambda: threading.current_thread().name)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or self.start_ns) - self.start_ns
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ns": self.duration_ns,
+            "thread": self.thread_name,
+            "attributes": self.attributes,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class Tracer:
+    """
+    Collects finished spans of one trace in memory.
+
+    Spans beyond `max_spans` are counted in `dropped` instead of kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        trace_id: str | None = None,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        clock_ns: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._clock_ns = clock_ns
+        # Span times come from a monotonic clock anchored to the wall clock once.
+        self._offset_ns = time.time_ns() - clock_ns()
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def now_ns(self) -> int:
+        return self._clock_ns() + self._offset_ns
+
+    def start(self, name: str, *, parent: Span | None = None, **attributes: Any) -> Span:
+        """Create a span; it is recorded once `finish` is called."""
+        return Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=self.now_ns(),
+            attributes=attributes,
+        )
+
+    def finish(self, span: Span) -> None:
+        span.end_ns = self.now_ns()
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the spans in Chrome's Trace Event Format."""
+        pid = os.getpid()
+        spans = sorted(self.spans, key=lambda span: span.start_ns)
+        threads: dict[int, str] = {}
+        events: list[dict[str, Any]] = []
+        for span in spans:
+            threads.setdefault(span.thread_id, span.thread_name)
+            args: dict[str, Any] = {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **span.attributes,
+            }
+            if span.error is not None:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(" ", 1)[0].split(".", 1)[0],
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        for thread_id, thread_name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+        document = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id, "dropped_spans": self.dropped},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document, default=str), encoding="utf-8")
+
+
+def use_tracer(tracer: Tracer | None) -> None:
+    """Activate `tracer` (or turn tracing off) for the current context."""
+    _tracer.set(tracer)
+    _span.set(None)
+
+
+def active_tracer() -> Tracer | None:
+    return _tracer.get()
+
+
+def current_span() -> Span | None:
+    return _span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Time the block as a child of the current span; yields None when off."""
+    tracer = _tracer.get()
+    if tracer is None:
+        yield None
+        return
+    current = tracer.start(name, parent=_span.get(), **attributes)
+    token = _span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = type(exc).__name__
+        raise
+    finally:
+        _span.reset(token)
+        tracer.finish(current)
+
+
+def traced(func: F) -> F:
+    """Trace every call of `func` as a span named after its qualified name."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _tracer.get() is None:
+            return func(*args, **kwargs)
+        with span(name):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def bind(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """
+    Return `func` wrapped to run in a span under the current span.
+
+    Call `bind` where work is submitted and run the result on another
+    thread: the span records how long the call waited (`queued_ms`) before
+    a worker picked it up. Returns `func` unchanged when tracing is off.
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        return func
+    parent = _span.get()
+    submitted = tracer.now_ns()
+
+    @functools.wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        tracer_token = _tracer.set(tracer)
+        span_token = _span.set(parent)
+        try:
+            queued_ms = (tracer.now_ns() - submitted) / 1e6
+            with span(name, queued_ms=round(queued_ms, 3)):
+                return func(*args, **kwargs)
+        finally:
+            _span.reset(span_token)
+            _tracer.reset(tracer_token)
+
+    return run
+
+
+def traceparent() -> str | None:
+    """Return the W3C `traceparent` header value for the current span."""
+    current = _span.get()
+    if current is None or _tracer.get() is None:
+        return None
+    return f"00-{current.trace_id}-{current.span_id}-01"
+
+
+__all__ = [
+    "DEFAULT_MAX_SPANS",
+    "Span",
+    "Tracer",
+    "active_tracer",
+    "bind",
+    "current_span",
+    "span",
+    "traced",
+    "traceparent",
+    "use_tracer",
+]
@@ -1,14 +1,31 @@
-"""Utility helpers for CLI input parsing and concurrency."""
+"""Utility helpers for CLI input parsing, record files, downloads, concurrency, polling and stats."""
 
-from .concurrency import gather
+from .concurrency import gather, gather_iter
+from .files import write_chunks_atomic
 from .ids import load_id_file, parse_id_list
-from .serialization import dumps_json, normalize, write_json
+from .polling import AdaptiveInterval, SnapshotDiff, changed_fields, diff_snapshots
+from .records import count_records, iter_records
+from .serialization import JsonLinesWriter, dumps_json, normalize, write_json
+from .stats import latency_histogram, percentile, summarize_latencies, throughput
 
 __all__ = [
+    "AdaptiveInterval",
+    "JsonLinesWriter",
+    "SnapshotDiff",
+    "changed_fields",
+    "count_records",
+    "diff_snapshots",
     "dumps_json",
     "gather",
+    "gather_iter",
+    "iter_records",
+    "latency_histogram",
     "load_id_file",
     "normalize",
     "parse_id_list",
+    "percentile",
+    "summarize_latencies",
+    "throughput",
+    "write_chunks_atomic",
     "write_json",
 ]
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Iterable, TypeVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from camctl.tracing import bind, span
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
+def _with_callbacks(
+    func: Callable[[T], R],
+    on_start: Callable[[T], None] | None,
+    on_complete: Callable[[T, R | Exception], None] | None,
+) -> Callable[[T], R]:
+    def _run(item: T) -> R:
+        if on_start:
+            on_start(item)
+        try:
+            result = func(item)
+        except Exception as exc:
+            if on_complete:
+                on_complete(item, exc)
+            raise
+        if on_complete:
+            on_complete(item, result)
+        return result
+
+    return _run
+
+
 def gather(
     func: Callable[[T], R],
     items: Iterable[T],
@@ -29,6 +52,9 @@ def gather(
 
     Returns:
         Results in the same order as the input items.
+
+    When tracing is on, the call is a `gather` span and each item a
+    `gather.task` span under it, recording how long the item was queued.
     """
     item_list = list(items)
     if not item_list:
@@ -36,21 +62,14 @@ def gather(
 
     results: list[R | Exception] = [None for _ in item_list]  # type: ignore[list-item]
 
-    def _run(item: T) -> R:
-        if on_start:
-            on_start(item)
-        try:
-            result = func(item)
-        except Exception as exc:
-            if on_complete:
-                on_complete(item, exc)
-            raise
-        if on_complete:
-            on_complete(item, result)
-        return result
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    _run = _with_callbacks(func, on_start, on_complete)
+    with (
+        span("gather", items=len(item_list), max_workers=max_workers),
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
         future_map = {
-            executor.submit(_run, item): index for index, item in enumerate(item_list)
+            executor.submit(bind(_run, "gather.task"), item): index
+            for index, item in enumerate(item_list)
         }
         for future in as_completed(future_map):
             index = future_map[future]
@@ -62,3 +81,66 @@ def gather(
                 else:
                     raise
     return results
+
+
+def gather_iter(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int = 8,
+    max_pending: int | None = None,
+    return_exceptions: bool = False,
+    on_start: Callable[[T], None] | None = None,
+    on_complete: Callable[[T, R | Exception], None] | None = None,
+) -> Iterator[R | Exception]:
+    """
+    Run a function for each item concurrently, yielding results as they finish.
+
+    Items are pulled lazily from the iterable, so a producer such as a paged
+    API query can feed the workers without materializing the whole input.
+
+    Args:
+        func: Callable applied to each item.
+        items: Input items to process; consumed on demand.
+        max_workers: Maximum number of worker threads.
+        max_pending: Maximum number of submitted but unfinished items
+            (defaults to twice `max_workers`).
+        return_exceptions: When True, yield exceptions instead of raising.
+
+    Yields:
+        Results in completion order.
+
+    When tracing is on, each item is a `gather.task` span under the span
+    that was current when it was submitted.
+    """
+    pending_limit = max_pending or max_workers * 2
+    if pending_limit < 1:
+        raise ValueError("max_pending must be >= 1")
+
+    _run = _with_callbacks(func, on_start, on_complete)
+    source = iter(items)
+    exhausted = False
+    pending: set[Future[R]] = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while not exhausted and len(pending) < pending_limit:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(bind(_run, "gather.task"), item))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    yield future.result()
+                except Exception as exc:
+                    if return_exceptions:
+                        yield exc
+                    else:
+                        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
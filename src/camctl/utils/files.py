@@ -0,0 +1,50 @@
+"""File helpers for writing downloaded content safely."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+
+def write_chunks_atomic(chunks: Iterable[bytes], destination: Path) -> int:
+    """
+    Write byte chunks to `destination` through a temporary sibling file.
+
+    Chunks are written as they arrive, so memory use stays bounded by the chunk
+    size. The destination is only replaced once every chunk has been written;
+    on failure the temporary file is removed and any existing file is kept.
+
+    Returns:
+        The number of bytes written.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_name = tempfile.mkstemp(
+        prefix=f".{destination.name}.",
+        suffix=".part",
+        dir=destination.parent,
+    )
+    written = 0
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+                written += len(chunk)
+        # mkstemp creates the file as 0600; give it the mode open() would have.
+        os.chmod(temp_name, 0o666 & ~_current_umask())
+        os.replace(temp_name, destination)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _current_umask() -> int:
+    # The umask can only be read by setting it.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+__all__ = ["write_chunks_atomic"]
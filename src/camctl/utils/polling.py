@@ -0,0 +1,81 @@
+"""Snapshot diffing and adaptive intervals for polling loops."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+
+@dataclass(kw_only=True)
+class SnapshotDiff:
+    """Keys inserted, updated and removed between two snapshots."""
+
+    inserted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.removed)
+
+
+def diff_snapshots(
+    previous: Mapping[str, Any],
+    current: Mapping[str, Any],
+) -> SnapshotDiff:
+    """Compare two `{key: record}` snapshots; keys keep the order of each snapshot."""
+    diff = SnapshotDiff()
+    for key, record in current.items():
+        if key not in previous:
+            diff.inserted.append(key)
+        elif previous[key] != record:
+            diff.updated.append(key)
+    diff.removed = [key for key in previous if key not in current]
+    return diff
+
+
+def changed_fields(
+    before: Mapping[str, Any],
+    after: Mapping[str, Any],
+) -> dict[str, tuple[Any, Any]]:
+    """Return `{field: (old, new)}` for every field whose value differs."""
+    return {
+        name: (before.get(name), after.get(name))
+        for name in sorted(set(before) | set(after))
+        if before.get(name) != after.get(name)
+    }
+
+
+@dataclass(kw_only=True)
+class AdaptiveInterval:
+    """
+    Poll interval that backs off while nothing changes.
+
+    Every idle poll multiplies the interval by `factor` up to `maximum`; any
+    change snaps it back to `minimum`, so bursts are followed closely and
+    quiet periods cost few requests.
+    """
+
+    minimum: float
+    maximum: float
+    factor: float = 2.0
+    current: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.minimum <= 0:
+            raise ValueError("minimum interval must be positive")
+        if self.maximum < self.minimum:
+            raise ValueError("maximum interval must be at least the minimum")
+        if self.factor < 1:
+            raise ValueError("backoff factor must be at least 1")
+        self.current = self.minimum
+
+    def record(self, changed: bool) -> float:
+        """Update the interval after a poll and return the delay before the next one."""
+        if changed:
+            self.current = self.minimum
+        else:
+            self.current = min(self.maximum, self.current * self.factor)
+        return self.current
+
+
+__all__ = ["AdaptiveInterval", "SnapshotDiff", "changed_fields", "diff_snapshots"]
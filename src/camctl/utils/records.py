@@ -0,0 +1,62 @@
+"""Streaming readers for NDJSON and CSV record files used by batch commands."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+_CSV_SUFFIXES = {".csv"}
+
+
+def iter_records(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Yield mapping records from a file without loading it into memory.
+
+    Files ending in `.csv` are read with a header row; empty cells are
+    dropped so defaults apply. Any other file is read as JSON lines with one
+    object per line; blank lines are skipped.
+    """
+    if path.suffix.lower() in _CSV_SUFFIXES:
+        yield from _iter_csv(path)
+    else:
+        yield from _iter_json_lines(path)
+
+
+def count_records(path: Path) -> int:
+    """
+    Count the records in a file, validating each one along the way.
+
+    Batch commands call this before doing any work so a malformed line fails
+    fast instead of aborting halfway through a run.
+    """
+    return sum(1 for _ in iter_records(path))
+
+
+def _iter_csv(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            yield {
+                key.strip(): value
+                for key, value in row.items()
+                if key and value not in (None, "")
+            }
+
+
+def _iter_json_lines(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}.") from exc
+            if not isinstance(record, dict):
+                raise ValueError(f"Line {line_number} of {path} must be a JSON object.")
+            yield record
+
+
+__all__ = ["count_records", "iter_records"]
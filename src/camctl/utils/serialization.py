@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 from camctl.api.camunda.common import Resource
 
@@ -34,3 +35,30 @@ def normalize(payload: Any) -> Any:
     if isinstance(payload, tuple):
         return [normalize(item) for item in payload]
     return payload
+
+
+class JsonLinesWriter:
+    """Append normalized records to a file as JSON lines, flushing each one."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record: Any) -> None:
+        """Write a single record and flush it to disk."""
+        line = json.dumps(normalize(record), ensure_ascii=True, separators=(",", ":"))
+        with self._lock:
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        """Close the underlying file handle."""
+        self._handle.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,185 @@
+"""Latency and throughput statistics helpers."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from typing import Any, Iterable, Sequence
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000
+)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Return the `q`-th percentile of pre-sorted values using the nearest rank.
+
+    Args:
+        sorted_values: Values sorted in ascending order.
+        q: Percentile between 0 and 100.
+    """
+    if not sorted_values:
+        raise ValueError("percentile requires at least one value")
+    if not 0.0 <= q <= 100.0:
+        raise ValueError("q must be between 0 and 100")
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def percentile_key(q: float) -> str:
+    """Return the summary key for a percentile, for example `p99` or `p99.9`."""
+    return f"p{q:g}"
+
+
+def summarize_latencies(
+    samples: Iterable[float],
+    *,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> dict[str, Any]:
+    """
+    Summarize latency samples (in milliseconds) into count, min/max/mean and percentiles.
+
+    Returns a mapping with zeroed statistics when there are no samples.
+    """
+    ordered = sorted(samples)
+    summary: dict[str, Any] = {"count": len(ordered)}
+    if not ordered:
+        summary.update({"min": 0.0, "max": 0.0, "mean": 0.0})
+        summary.update({percentile_key(q): 0.0 for q in percentiles})
+        return summary
+    summary["min"] = ordered[0]
+    summary["max"] = ordered[-1]
+    summary["mean"] = sum(ordered) / len(ordered)
+    for q in percentiles:
+        summary[percentile_key(q)] = percentile(ordered, q)
+    return summary
+
+
+def latency_histogram(
+    samples: Iterable[float],
+    *,
+    bounds: Sequence[float] = LATENCY_BUCKETS_MS,
+) -> list[tuple[float | None, int]]:
+    """
+    Count latency samples (in milliseconds) per bucket.
+
+    Returns `(upper_bound, count)` pairs for each of the ascending `bounds`,
+    where a bucket holds samples above the previous bound and up to its own,
+    followed by `(None, count)` for samples above the last bound.
+    """
+    counts = [0] * (len(bounds) + 1)
+    for sample in samples:
+        counts[bisect.bisect_left(bounds, sample)] += 1
+    return list(zip([*bounds, None], counts))
+
+
+class Histogram:
+    """
+    Streaming latency histogram (in milliseconds) with bounded relative error.
+
+    In the style of HdrHistogram, samples are counted at microsecond
+    resolution in log-linear buckets: exact below 128 µs, then 64 buckets per
+    power of two. Memory stays small however many samples are recorded, and
+    every percentile is within about 1.6% of the exact nearest-rank value.
+    """
+
+    _SUB_BUCKET_BITS = 7
+    _HALF = 1 << (_SUB_BUCKET_BITS - 1)
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample; negative values count as zero."""
+        value_ms = max(value_ms, 0.0)
+        index = self._index(round(value_ms * 1000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.min = value_ms if not self.count else min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+        self.count += 1
+        self.total += value_ms
+
+    def merge(self, other: Histogram) -> None:
+        """Add every sample of `other` to this histogram."""
+        if not other.count:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, q: float) -> float:
+        """Return the `q`-th percentile (0-100), or 0.0 when empty."""
+        if not 0.0 <= q <= 100.0:
+            raise ValueError("q must be between 0 and 100")
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        if rank == self.count:
+            return self.max
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                low, high = self._bounds(index)
+                return min(max((low + high) / 2000, self.min), self.max)
+        return self.max
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict[str, Any]:
+        """Summarize like `summarize_latencies`."""
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+        }
+        for q in percentiles:
+            summary[percentile_key(q)] = self.percentile(q)
+        return summary
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < 2 * cls._HALF:
+            return micros
+        shift = micros.bit_length() - cls._SUB_BUCKET_BITS
+        return cls._HALF * shift + (micros >> shift)
+
+    @classmethod
+    def _bounds(cls, index: int) -> tuple[int, int]:
+        if index < 2 * cls._HALF:
+            return index, index
+        shift = index // cls._HALF - 1
+        top = index - cls._HALF * shift
+        return top << shift, ((top + 1) << shift) - 1
+
+
+def throughput(count: int, elapsed_seconds: float) -> float:
+    """Return operations per second, or 0.0 when no time has elapsed."""
+    if elapsed_seconds <= 0:
+        return 0.0
+    return count / elapsed_seconds
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "Histogram",
+    "LATENCY_BUCKETS_MS",
+    "latency_histogram",
+    "percentile",
+    "percentile_key",
+    "summarize_latencies",
+    "throughput",
+]
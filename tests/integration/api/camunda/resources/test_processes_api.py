@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
+from camctl.api.camunda.common import VariableModificationRequest, VariablePayload
 from camctl.api.camunda.resources.processes.api import ProcessesAPI
+from camctl.api.camunda.resources.processes.models import (
+    ProcessFilterParams,
+    ProcessStartRequest,
+)
 from tests.integration.conftest import make_response
 
 
@@ -71,6 +78,27 @@ class TestProcessesCount:
         assert api.count() == 15
 
 
+class TestProcessesPostQuery:
+    def test_long_count_switches_to_post(self, processes_api):
+        api, set_handler = processes_api
+        captured = {}
+
+        def handler(req):
+            captured["method"] = req.method
+            captured["path"] = req.url.path
+            captured["body"] = json.loads(req.content)
+            return make_response(200, json_body={"count": 7})
+
+        set_handler(handler)
+        ids = ",".join(f"{index:036d}" for index in range(100))
+        count = api.count(params=ProcessFilterParams(process_instance_ids=ids, active=True))
+        assert count == 7
+        assert captured["method"] == "POST"
+        assert captured["path"].endswith("/process-instance/count")
+        assert len(captured["body"]["processInstanceIds"]) == 100
+        assert captured["body"]["active"] is True
+
+
 class TestProcessesVariables:
     def test_success(self, processes_api):
         api, set_handler = processes_api
@@ -116,3 +144,163 @@ class TestProcessesCancel:
         }))
         result = api.cancel("nonexistent")
         assert result is None
+
+
+class TestProcessesIterate:
+    @staticmethod
+    def _paged_handler(ids, captured):
+        def handler(req):
+            captured.append(dict(req.url.params))
+            if req.url.path.endswith("/count"):
+                return make_response(200, json_body={"count": len(ids)})
+            first = int(req.url.params["firstResult"])
+            size = int(req.url.params["maxResults"])
+            return make_response(200, json_body=[{"id": i} for i in ids[first:first + size]])
+
+        return handler
+
+    def test_forward_pages(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+        set_handler(self._paged_handler([f"p{i}" for i in range(5)], captured))
+        ids = [proc.id for proc in api.iterate(page_size=2)]
+        assert ids == ["p0", "p1", "p2", "p3", "p4"]
+        assert [c["firstResult"] for c in captured] == ["0", "2", "4"]
+        assert captured[0]["sortBy"] == "instanceId"
+
+    def test_reverse_pages_use_count(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+        set_handler(self._paged_handler([f"p{i}" for i in range(5)], captured))
+        ids = [proc.id for proc in api.iterate(page_size=2, reverse=True)]
+        assert ids == ["p4", "p2", "p3", "p0", "p1"]
+        assert [c.get("firstResult") for c in captured] == [None, "4", "2", "0"]
+
+    def test_carries_filters(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+        set_handler(self._paged_handler([], captured))
+        list(api.iterate(params=ProcessFilterParams(business_key="INV-1")))
+        assert captured[0]["businessKey"] == "INV-1"
+
+
+class TestProcessesStart:
+    def test_posts_to_key_endpoint(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(200, json_body={"id": "pi-1", "definitionId": "d1"})
+
+        set_handler(handler)
+        result = api.start(
+            "invoice",
+            payload=ProcessStartRequest(business_key="INV-1", variables={"a": {"value": 1}}),
+        )
+        assert captured[0].url.path.endswith("/process-definition/key/invoice/start")
+        assert b'"businessKey"' in captured[0].content
+        assert result.process_instance_id == "pi-1"
+
+    def test_tenant_moves_to_path(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(200, json_body={"id": "pi-2"})
+
+        set_handler(handler)
+        api.start("invoice", payload=ProcessStartRequest(tenant_id="t1"))
+        assert captured[0].url.path.endswith(
+            "/process-definition/key/invoice/tenant-id/t1/start"
+        )
+        assert b"tenantId" not in captured[0].content
+
+
+class TestProcessesModifyVariables:
+    def test_posts_modifications(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(204)
+
+        set_handler(handler)
+        api.modify_variables(
+            "p1",
+            payload=VariableModificationRequest(
+                modifications={"a": VariablePayload(value=1)},
+                deletions=["b"],
+            ),
+        )
+        assert captured[0].method == "POST"
+        assert captured[0].url.path.endswith("/process-instance/p1/variables")
+        assert json.loads(captured[0].content) == {
+            "modifications": {"a": {"value": 1}},
+            "deletions": ["b"],
+        }
+
+
+class TestProcessesBulkVariables:
+    @staticmethod
+    def _handler(captured):
+        def handler(req):
+            body = json.loads(req.content)
+            captured.append((dict(req.url.params), body))
+            rows = []
+            for pid in body["processInstanceIdIn"]:
+                rows.append({"name": "a", "value": 1, "processInstanceId": pid, "executionId": pid})
+                rows.append({"name": "b", "value": 2, "processInstanceId": pid, "executionId": "child"})
+            first = int(req.url.params["firstResult"])
+            size = int(req.url.params["maxResults"])
+            return make_response(200, json_body=rows[first:first + size])
+
+        return handler
+
+    def test_chunks_and_regroups(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+        set_handler(self._handler(captured))
+        result = api.bulk_variables(["p1", "p2", "p3"], chunk_size=2, page_size=3)
+        assert list(result) == ["p1", "p2", "p3"]
+        assert {pid: list(v) for pid, v in result.items()} == {
+            "p1": ["a"],
+            "p2": ["a"],
+            "p3": ["a"],
+        }
+        assert [body["processInstanceIdIn"] for _, body in captured] == [
+            ["p1", "p2"],
+            ["p1", "p2"],
+            ["p3"],
+        ]
+        assert [params["firstResult"] for params, _ in captured] == ["0", "3", "0"]
+
+    def test_unknown_ids_map_to_empty(self, processes_api):
+        api, set_handler = processes_api
+        set_handler(lambda req: make_response(200, json_body=[]))
+        assert api.bulk_variables(["missing"]) == {"missing": {}}
+
+    def test_deserialize_values_param(self, processes_api):
+        api, set_handler = processes_api
+        captured = []
+        set_handler(self._handler(captured))
+        api.bulk_variables(["p1"], deserialize_values=False)
+        assert captured[0][0]["deserializeValues"] == "false"
+
+
+class TestProcessesDownloadVariable:
+    def test_writes_content(self, processes_api, tmp_path):
+        api, set_handler = processes_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(200, text="payload")
+
+        set_handler(handler)
+        destination = tmp_path / "nested" / "out.bin"
+        assert api.download_variable("p1", "doc", destination) == len(b"payload")
+        assert destination.read_bytes() == b"payload"
+        assert captured[0].url.path.endswith("/process-instance/p1/variables/doc/data")
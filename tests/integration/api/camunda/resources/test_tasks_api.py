@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from camctl.api.camunda.resources.tasks.api import TasksAPI
 from camctl.api.camunda.resources.tasks.models import (
     TaskCompletionRequest,
+    TaskFilterParams,
     TaskListParams,
     TaskVariableModificationRequest,
     TaskVariablePayload,
@@ -87,6 +90,79 @@ class TestTasksCount:
         set_handler(lambda req: make_response(200, json_body={"count": 42}))
         assert api.count() == 42
 
+    def test_sums_chunked_id_lists(self, tasks_api, monkeypatch):
+        api, set_handler = tasks_api
+        monkeypatch.setattr(api, "MAX_IN_LIST", 2)
+        bodies = []
+
+        def handler(req):
+            bodies.append(json.loads(req.content))
+            return make_response(200, json_body={"count": len(bodies[-1]["taskIdIn"])})
+
+        set_handler(handler)
+        monkeypatch.setattr(api, "MAX_QUERY_LENGTH", 0)
+        assert api.count(params=TaskFilterParams(task_id_in="a,b,c")) == 3
+        assert [body["taskIdIn"] for body in bodies] == [["a", "b"], ["c"]]
+
+
+class TestTasksPostQuery:
+    def test_short_queries_use_get(self, tasks_api):
+        api, set_handler = tasks_api
+        methods = []
+
+        def handler(req):
+            methods.append(req.method)
+            return make_response(200, json_body=[])
+
+        set_handler(handler)
+        api.list(params=TaskListParams(task_id_in="a,b"))
+        assert methods == ["GET"]
+
+    def test_long_queries_switch_to_post(self, tasks_api):
+        api, set_handler = tasks_api
+        captured = {}
+
+        def handler(req):
+            captured["method"] = req.method
+            captured["path"] = req.url.path
+            captured["params"] = dict(req.url.params)
+            captured["body"] = json.loads(req.content)
+            return make_response(200, json_body=[{"id": "t1"}])
+
+        set_handler(handler)
+        ids = ",".join(f"{index:036d}" for index in range(100))
+        page = api.list(
+            params=TaskListParams(
+                task_id_in=ids,
+                process_variables="status_eq_open",
+                sort_by="created",
+                sort_order="desc",
+                max_results=10,
+            )
+        )
+        assert page.items[0].id == "t1"
+        assert captured["method"] == "POST"
+        assert captured["path"].endswith("/task")
+        assert captured["params"] == {"maxResults": "10"}
+        assert len(captured["body"]["taskIdIn"]) == 100
+        assert captured["body"]["processVariables"] == [
+            {"name": "status", "operator": "eq", "value": "open"}
+        ]
+        assert captured["body"]["sorting"] == [{"sortBy": "created", "sortOrder": "desc"}]
+
+    def test_chunked_list_concatenates(self, tasks_api, monkeypatch):
+        api, set_handler = tasks_api
+        monkeypatch.setattr(api, "MAX_IN_LIST", 2)
+
+        def handler(req):
+            ids = req.url.params["taskIdIn"].split(",")
+            return make_response(200, json_body=[{"id": task_id} for task_id in ids])
+
+        set_handler(handler)
+        page = api.list(params=TaskListParams(task_id_in="a,b,c"))
+        assert [task.id for task in page.items] == ["a", "b", "c"]
+        assert [item["id"] for item in page.raw["items"]] == ["a", "b", "c"]
+
 
 class TestTasksVariables:
     def test_list_variables(self, tasks_api):
@@ -154,3 +230,64 @@ class TestTasksModifyVariables:
         api.modify_variables("task-1", payload=payload)
         assert captured["method"] == "POST"
         assert "task-1/variables" in captured["url"]
+
+
+class TestTasksIterate:
+    def test_reverse_pages_complete_safely(self, tasks_api):
+        api, set_handler = tasks_api
+        live = [f"t{i}" for i in range(5)]
+        captured = []
+
+        def handler(req):
+            captured.append(dict(req.url.params))
+            if req.url.path.endswith("/count"):
+                return make_response(200, json_body={"count": len(live)})
+            first = int(req.url.params["firstResult"])
+            size = int(req.url.params["maxResults"])
+            return make_response(200, json_body=[{"id": i} for i in live[first:first + size]])
+
+        set_handler(handler)
+        seen = []
+        for task in api.iterate(params=TaskFilterParams(assignee="john"), page_size=2, reverse=True):
+            seen.append(task.id)
+            live.remove(task.id)
+
+        assert sorted(seen) == ["t0", "t1", "t2", "t3", "t4"]
+        assert all(c["assignee"] == "john" for c in captured)
+        assert captured[1]["sortBy"] == "id"
+
+
+class TestTasksDownloadVariable:
+    def test_writes_content(self, tasks_api, tmp_path):
+        api, set_handler = tasks_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(200, text="binary-content")
+
+        set_handler(handler)
+        destination = tmp_path / "out.bin"
+        written = api.download_variable("t1", "file", destination, chunk_size=4)
+        assert written == len(b"binary-content")
+        assert destination.read_bytes() == b"binary-content"
+        assert captured[0].url.path.endswith("/task/t1/variables/file/data")
+
+    def test_local_variable_path(self, tasks_api, tmp_path):
+        api, set_handler = tasks_api
+        captured = []
+
+        def handler(req):
+            captured.append(req)
+            return make_response(200, text="x")
+
+        set_handler(handler)
+        api.download_local_variable("t1", "file", tmp_path / "out.bin")
+        assert captured[0].url.path.endswith("/task/t1/localVariables/file/data")
+
+    def test_not_found_writes_nothing(self, tasks_api, tmp_path):
+        api, set_handler = tasks_api
+        set_handler(lambda req: make_response(404, json_body={"type": "x", "message": "gone"}))
+        destination = tmp_path / "out.bin"
+        assert api.download_variable("t1", "file", destination) is None
+        assert list(tmp_path.iterdir()) == []
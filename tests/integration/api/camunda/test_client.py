@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+from http import HTTPMethod
 
+import httpx
 import pytest
 
 from camctl.api.camunda.errors import CamundaAPIError
@@ -115,3 +117,57 @@ class TestCircuitBreakerIntegration:
         # Should still work (not open)
         set_handler(lambda req: make_response(200, json_body=[]))
         client.get("task")
+
+
+class TestStreaming:
+    def test_stream_yields_unread_body(self, camunda_client):
+        client, set_handler = camunda_client
+        set_handler(lambda req: make_response(200, text="abcdef"))
+
+        with client.stream(HTTPMethod.GET, "task/t1/variables/file/data") as response:
+            chunks = list(response.iter_bytes(2))
+
+        assert b"".join(chunks) == b"abcdef"
+
+    def test_stream_error_raises_structured_error(self, camunda_client):
+        client, set_handler = camunda_client
+        set_handler(lambda req: make_response(
+            404, json_body={"type": "InvalidRequestException", "message": "missing"}
+        ))
+
+        with pytest.raises(CamundaAPIError) as exc_info:
+            with client.stream(HTTPMethod.GET, "task/t1/variables/file/data"):
+                pass
+
+        assert exc_info.value.status_code == 404
+        assert "missing" in str(exc_info.value)
+
+    def test_stream_5xx_counts_toward_breaker(self, camunda_client):
+        client, set_handler = camunda_client
+        set_handler(lambda req: make_response(500, json_body={"error": "fail"}))
+
+        for _ in range(5):
+            with pytest.raises(CamundaAPIError):
+                with client.stream(HTTPMethod.GET, "task"):
+                    pass
+
+        with pytest.raises(CircuitBreakerOpenError):
+            client.get("task")
+
+    def test_stream_body_failures_count_toward_breaker(self, camunda_client):
+        client, set_handler = camunda_client
+
+        class DroppedStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"partial"
+                raise httpx.ReadError("connection lost")
+
+        set_handler(lambda req: httpx.Response(200, stream=DroppedStream()))
+
+        for _ in range(5):
+            with pytest.raises(httpx.ReadError):
+                with client.stream(HTTPMethod.GET, "task/t1/variables/file/data") as response:
+                    response.read()
+
+        with pytest.raises(CircuitBreakerOpenError):
+            client.get("task")
@@ -64,6 +64,8 @@ def camunda_client(mock_transport):
     camunda.timeout = 10.0
     camunda._serializer = SnakeToCamelSerializer()
     camunda._circuit_breaker = CircuitBreaker()
+    camunda._timings = None
+    camunda._metrics = None
     camunda._owns_client = True
     camunda._client = client
     camunda._default_headers = {}
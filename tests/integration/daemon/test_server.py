@@ -0,0 +1,144 @@
+"""Integration tests for the daemon serving commands over a Unix socket."""
+
+from __future__ import annotations
+
+import os
+import stat
+import threading
+
+import click
+import pytest
+
+from camctl.console import display
+from camctl.daemon.client import forward, request
+from camctl.daemon.pool import EnginePool
+from camctl.daemon.protocol import UnsafeSocketError
+from camctl.daemon.server import CommandRunner, DaemonServer, serve
+
+
+@click.command()
+@click.argument("words", nargs=-1)
+@click.option("--fail", is_flag=True)
+def echo(words: tuple[str, ...], fail: bool) -> None:
+    click.echo(" ".join(words))
+    click.echo(f"cwd={os.getcwd()}", err=True)
+    click.echo(f"color={os.getenv('FORCE_COLOR', '-')}", err=True)
+    if fail:
+        raise SystemExit(3)
+
+
+@click.command()
+@click.argument("names", nargs=-1)
+def show(names: tuple[str, ...]) -> None:
+    for name in names:
+        click.echo(f"{name}={os.getenv(name, '-')}")
+    click.echo(f"color_system={display._console.color_system}")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = tmp_path / "d.sock"
+    thread = threading.Thread(
+        target=serve, args=(path,), kwargs={"command": echo, "idle_timeout": 0}, daemon=True
+    )
+    thread.start()
+    for _ in range(200):
+        if request({"op": "status"}, path=path, timeout=1.0) is not None:
+            break
+        threading.Event().wait(0.01)
+    yield path
+    request({"op": "shutdown"}, path=path, timeout=1.0)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+class TestDaemonServer:
+    def test_forward_captures_output(self, daemon, tmp_path):
+        reply = forward(["hello", "world"], path=daemon, timeout=5.0)
+        assert reply is not None
+        assert reply.exit_code == 0
+        assert reply.stdout == "hello world\n"
+        assert f"cwd={os.getcwd()}" in reply.stderr
+
+    def test_exit_code_is_returned(self, daemon):
+        reply = forward(["--fail", "x"], path=daemon, timeout=5.0)
+        assert reply is not None
+        assert reply.exit_code == 3
+
+    def test_usage_error(self, daemon):
+        reply = forward(["--bogus"], path=daemon, timeout=5.0)
+        assert reply is not None
+        assert reply.exit_code == 2
+        assert "No such option" in reply.stderr
+
+    def test_status_counts_commands(self, daemon):
+        forward(["a"], path=daemon, timeout=5.0)
+        forward(["--fail"], path=daemon, timeout=5.0)
+        status = request({"op": "status"}, path=daemon, timeout=5.0)
+        assert status["pid"] == os.getpid()
+        assert status["commands"] == 2
+        assert status["failures"] == 1
+
+    def test_environment_is_restored(self, daemon):
+        before = dict(os.environ)
+        forward(["a"], path=daemon, timeout=5.0)
+        assert dict(os.environ) == before
+
+    def test_unknown_operation(self, daemon):
+        assert "error" in request({"op": "nope"}, path=daemon, timeout=5.0)
+
+    def test_shutdown_removes_socket(self, daemon):
+        assert request({"op": "shutdown"}, path=daemon, timeout=5.0)["stopping"] is True
+        for _ in range(300):
+            if not daemon.exists():
+                break
+            threading.Event().wait(0.01)
+        assert not daemon.exists()
+
+
+class TestEnginePool:
+    def test_lease_reuses_engines(self):
+        pool = EnginePool()
+        first = pool.lease(None)
+        with first as engine:
+            assert engine is first
+        assert pool.lease(None) is first
+        assert not first.client._client.is_closed
+        pool.close()
+        assert first.client._client.is_closed
+        assert pool.base_urls() == []
+
+    def test_socket_is_private(self, daemon):
+        assert stat.S_IMODE(daemon.stat().st_mode) == 0o600
+
+
+class TestCommandRunner:
+    def test_only_command_variables_come_from_the_client(self, monkeypatch):
+        monkeypatch.setenv("CAMCTL_ENGINE", "daemon")
+        monkeypatch.setenv("DAEMON_ONLY", "kept")
+        reply = CommandRunner(show).run(
+            ["CAMCTL_ENGINE", "DAEMON_ONLY", "CLIENT_SECRET", "CAMCTL_CONFIG"],
+            env={"CAMCTL_CONFIG": "/tmp/c.yaml", "CLIENT_SECRET": "x", "DAEMON_ONLY": "y"},
+        )
+        assert reply["stdout"].splitlines()[:4] == [
+            "CAMCTL_ENGINE=-",
+            "DAEMON_ONLY=kept",
+            "CLIENT_SECRET=-",
+            "CAMCTL_CONFIG=/tmp/c.yaml",
+        ]
+
+    def test_console_follows_each_command_terminal(self):
+        runner = CommandRunner(show)
+        colored = runner.run([], env={}, tty=True)["stdout"]
+        plain = runner.run([], env={}, tty=False)["stdout"]
+        assert colored != "color_system=None\n"
+        assert plain == "color_system=None\n"
+
+
+def test_refuses_a_shared_socket_directory(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+    with pytest.raises(UnsafeSocketError):
+        DaemonServer(shared / "d.sock", CommandRunner(echo), EnginePool())
+    assert not (shared / "d.sock").exists()
@@ -0,0 +1,61 @@
+"""Fixtures backing the sync tests with an in-memory engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.api.camunda.engine import CamundaEngine
+from camctl.sync import LocalStore
+from tests.integration.conftest import make_response
+
+
+class EngineState:
+    """Minimal in-memory task and process instance endpoints."""
+
+    def __init__(self) -> None:
+        self.tasks: dict[str, dict] = {}
+        self.processes: dict[str, dict] = {}
+        self.requests: list[tuple[str, dict]] = []
+
+    def handle(self, request):
+        path = request.url.path.rsplit("engine-rest/", 1)[-1]
+        params = dict(request.url.params)
+        self.requests.append((path, params))
+        if path.startswith("task"):
+            items = self._filter_tasks(params)
+        else:
+            items = sorted(self.processes.values(), key=lambda p: p["id"])
+        if path.endswith("/count"):
+            return make_response(200, json_body={"count": len(items)})
+        first = int(params.get("firstResult", 0))
+        size = int(params.get("maxResults", len(items) or 1))
+        return make_response(200, json_body=items[first:first + size])
+
+    def _filter_tasks(self, params):
+        items = sorted(self.tasks.values(), key=lambda t: t["id"])
+        if "taskIdIn" in params:
+            wanted = set(params["taskIdIn"].split(","))
+            items = [t for t in items if t["id"] in wanted]
+        if "createdAfter" in params:
+            items = [t for t in items if t["created"] > params["createdAfter"]]
+        if "updatedAfter" in params:
+            items = [t for t in items if (t.get("lastUpdated") or "") > params["updatedAfter"]]
+        return items
+
+
+def task_payload(task_id: str, created: str, **fields) -> dict:
+    return {"id": task_id, "name": task_id, "created": created, "suspended": False, **fields}
+
+
+@pytest.fixture
+def engine_state(camunda_client):
+    client, set_handler = camunda_client
+    state = EngineState()
+    set_handler(state.handle)
+    return CamundaEngine(client), state
+
+
+@pytest.fixture
+def store(tmp_path):
+    with LocalStore(tmp_path / "mirror.sqlite3") as local:
+        yield local
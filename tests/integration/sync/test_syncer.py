@@ -0,0 +1,86 @@
+"""Integration tests for syncing the local mirror against a mock engine."""
+
+from __future__ import annotations
+
+from camctl.sync import sync_processes, sync_tasks
+from tests.integration.sync.conftest import task_payload
+
+
+class TestSyncTasks:
+    def test_first_sync_is_full(self, engine_state, store):
+        engine, state = engine_state
+        for index in range(5):
+            state.tasks[f"t{index}"] = task_payload(f"t{index}", f"2024-01-0{index + 1}T00:00:00.000+0000")
+        report = sync_tasks(engine, store, page_size=2)
+        assert report.mode == "full"
+        assert (report.fetched, report.changed, report.total) == (5, 5, 5)
+        assert store.get_state("tasks").watermark == "2024-01-05T00:00:00.000+0000"
+
+    def test_delta_fetches_only_recent_changes(self, engine_state, store):
+        engine, state = engine_state
+        for index in range(5):
+            state.tasks[f"t{index}"] = task_payload(f"t{index}", f"2024-01-0{index + 1}T00:00:00.000+0000")
+        sync_tasks(engine, store)
+        state.tasks["t9"] = task_payload("t9", "2024-01-09T00:00:00.000+0000")
+        state.tasks["t0"]["assignee"] = "demo"
+        state.tasks["t0"]["lastUpdated"] = "2024-01-10T00:00:00.000+0000"
+        state.requests.clear()
+
+        report = sync_tasks(engine, store)
+
+        assert report.mode == "delta"
+        # t4 sits inside the overlap window, so it is fetched again but unchanged.
+        assert report.fetched == 3
+        assert report.changed == 2
+        assert report.total == 6
+        assert store.count_tasks({"assignee": "demo"}) == 1
+        listed = [params for path, params in state.requests if path == "task"]
+        assert all("createdAfter" in params or "updatedAfter" in params for params in listed)
+
+    def test_delta_removes_tombstones(self, engine_state, store):
+        engine, state = engine_state
+        for index in range(4):
+            state.tasks[f"t{index}"] = task_payload(f"t{index}", f"2024-01-0{index + 1}T00:00:00.000+0000")
+        sync_tasks(engine, store)
+        del state.tasks["t1"]
+        del state.tasks["t2"]
+
+        report = sync_tasks(engine, store, chunk_size=3)
+
+        assert report.mode == "delta"
+        assert report.removed == 2
+        assert store.ids("tasks") == ["t0", "t3"]
+
+    def test_delta_falls_back_to_full_on_drift(self, engine_state, store):
+        engine, state = engine_state
+        state.tasks["t1"] = task_payload("t1", "2024-01-05T00:00:00.000+0000")
+        sync_tasks(engine, store)
+        # Created long before the watermark, so the delta queries miss it.
+        state.tasks["t0"] = task_payload("t0", "2023-01-01T00:00:00.000+0000")
+
+        report = sync_tasks(engine, store)
+
+        assert report.mode == "full (drift)"
+        assert store.ids("tasks") == ["t0", "t1"]
+
+    def test_full_flag(self, engine_state, store):
+        engine, state = engine_state
+        state.tasks["t1"] = task_payload("t1", "2024-01-05T00:00:00.000+0000")
+        sync_tasks(engine, store)
+        assert sync_tasks(engine, store, full=True).mode == "full"
+
+
+class TestSyncProcesses:
+    def test_writes_changes_and_removes_missing(self, engine_state, store):
+        engine, state = engine_state
+        for index in range(3):
+            state.processes[f"p{index}"] = {"id": f"p{index}", "suspended": False}
+        first = sync_processes(engine, store, page_size=2)
+        assert (first.fetched, first.changed, first.total) == (3, 3, 3)
+
+        state.processes["p0"]["suspended"] = True
+        del state.processes["p2"]
+        second = sync_processes(engine, store)
+
+        assert (second.changed, second.removed, second.total) == (1, 1, 2)
+        assert store.count_processes({"suspended": True}) == 1
@@ -0,0 +1,79 @@
+"""Integration tests for the in-memory task and process watchers."""
+
+from __future__ import annotations
+
+from camctl.api.camunda.resources.tasks import TaskFilterParams
+from camctl.sync import ProcessWatcher, TaskWatcher
+from tests.integration.sync.conftest import task_payload
+
+
+def _kinds(events):
+    return sorted((event.kind, event.id) for event in events)
+
+
+class TestTaskWatcher:
+    def test_reports_inserts_updates_and_removals(self, engine_state):
+        engine, state = engine_state
+        state.tasks["t1"] = task_payload("t1", "2024-01-01T00:00:00.000+0000")
+        state.tasks["t2"] = task_payload("t2", "2024-01-02T00:00:00.000+0000")
+        watcher = TaskWatcher(engine)
+        assert watcher.load() == 2
+
+        state.tasks["t3"] = task_payload("t3", "2024-01-03T00:00:00.000+0000")
+        state.tasks["t1"]["assignee"] = "demo"
+        state.tasks["t1"]["lastUpdated"] = "2024-01-04T00:00:00.000+0000"
+        del state.tasks["t2"]
+        events = watcher.poll()
+
+        assert _kinds(events) == [("inserted", "t3"), ("removed", "t2"), ("updated", "t1")]
+        [update] = [event for event in events if event.kind == "updated"]
+        assert update.changes["assignee"] == (None, "demo")
+        assert sorted(watcher.snapshot) == ["t1", "t3"]
+
+    def test_quiet_poll_uses_delta_queries(self, engine_state):
+        engine, state = engine_state
+        state.tasks["t1"] = task_payload("t1", "2024-01-01T00:00:00.000+0000")
+        watcher = TaskWatcher(engine)
+        watcher.load()
+        state.requests.clear()
+
+        # The overlap window returns t1 again, but it is unchanged.
+        assert watcher.poll() == []
+        listed = [params for path, params in state.requests if path == "task"]
+        assert len(listed) == 2
+        assert all("createdAfter" in params or "updatedAfter" in params for params in listed)
+
+    def test_task_leaving_filter_is_removed(self, engine_state):
+        engine, state = engine_state
+        state.tasks["t1"] = task_payload("t1", "2024-01-01T00:00:00.000+0000", assignee="demo")
+        watcher = TaskWatcher(engine, filters=TaskFilterParams(task_id_in="t1,t2"))
+        watcher.load()
+        state.tasks["t2"] = task_payload("t2", "2023-01-01T00:00:00.000+0000")
+        del state.tasks["t1"]
+
+        assert _kinds(watcher.poll()) == [("inserted", "t2"), ("removed", "t1")]
+
+
+class TestProcessWatcher:
+    def test_count_precheck_skips_reload(self, engine_state):
+        engine, state = engine_state
+        state.processes["p1"] = {"id": "p1", "suspended": False}
+        watcher = ProcessWatcher(engine, full_every=3)
+        watcher.load()
+        state.requests.clear()
+
+        assert watcher.poll() == []
+        assert [path for path, _ in state.requests] == ["process-instance/count"]
+
+        state.processes["p2"] = {"id": "p2", "suspended": False}
+        assert _kinds(watcher.poll()) == [("inserted", "p2")]
+
+    def test_periodic_full_poll_catches_updates(self, engine_state):
+        engine, state = engine_state
+        state.processes["p1"] = {"id": "p1", "suspended": False}
+        watcher = ProcessWatcher(engine, full_every=2)
+        watcher.load()
+        state.processes["p1"]["suspended"] = True
+
+        assert watcher.poll() == []
+        assert _kinds(watcher.poll()) == [("updated", "p1")]
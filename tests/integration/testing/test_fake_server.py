@@ -0,0 +1,65 @@
+"""Integration tests for the fake engine served over HTTP."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from camctl.api.camunda import CamundaClient, CamundaEngine
+from camctl.api.camunda.resources.tasks import TaskCompletionRequest, TaskListParams
+from camctl.console.loadgen import LoadTarget, run_load
+from camctl.testing import FakeEngine, FakeEngineServer, Faults
+
+
+@pytest.fixture
+def fake():
+    return FakeEngine.with_dataset(processes=30, seed=11)
+
+
+@pytest.fixture
+def engine(fake):
+    with FakeEngineServer(fake) as server:
+        with CamundaEngine(CamundaClient(base_url=server.url)) as engine:
+            yield engine
+
+
+class TestFakeEngineServer:
+    def test_list_get_and_complete(self, engine, fake):
+        page = engine.tasks.list(params=TaskListParams(first_result=0, max_results=10))
+        assert len(page.items) == 10
+        task_id = page.items[0].id
+        assert engine.tasks.get(task_id).id == task_id
+        assert engine.tasks.complete(task_id, payload=TaskCompletionRequest()) is None
+        assert engine.tasks.count() == 29
+        assert fake.requests["POST task/{task_id}/complete"] == 1
+
+    def test_invalid_json_body(self, fake):
+        with FakeEngineServer(fake) as server:
+            response = httpx.post(
+                f"{server.url}/task",
+                content=b"{",
+                headers={"content-type": "application/json"},
+            )
+        assert response.status_code == 400
+
+    def test_disconnects_reach_the_client(self):
+        fake = FakeEngine(faults=Faults(disconnect_rate=1.0))
+        with FakeEngineServer(fake) as server:
+            with CamundaEngine(CamundaClient(base_url=server.url)) as engine:
+                with pytest.raises(httpx.RemoteProtocolError):
+                    engine.tasks.count()
+
+    def test_load_run(self, engine, fake):
+        target = LoadTarget(task_ids=fake.task_ids)
+        report = run_load(
+            engine,
+            {"tasks.list": 1.0, "tasks.get": 1.0, "tasks.complete": 1.0},
+            target,
+            concurrency=4,
+            requests=40,
+            seed=2,
+        )
+        assert report.overall().requests == 40
+        assert report.overall().error_count == 0
+        completed = report.operations["tasks.complete"].requests
+        assert engine.tasks.count() == 30 - completed
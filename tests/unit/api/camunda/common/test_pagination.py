@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from camctl.api.camunda.common.pagination import Page, PaginationInfo, SortInfo
+import pytest
+
+from camctl.api.camunda.common.pagination import (
+    Page,
+    PaginationInfo,
+    SortInfo,
+    iter_paged,
+    page_offsets,
+)
 from camctl.api.camunda.common.resource import Resource
 
 
@@ -124,3 +132,54 @@ class TestPage:
         data = {}
         page = Page.from_dict(data, item_parser=Resource.from_dict)
         assert len(page.items) == 0
+
+
+class TestPageOffsets:
+    def test_forward(self):
+        assert list(page_offsets(1050, 500)) == [0, 500, 1000]
+
+    def test_reverse(self):
+        assert list(page_offsets(1050, 500, reverse=True)) == [1000, 500, 0]
+
+    def test_exact_multiple(self):
+        assert list(page_offsets(1000, 500)) == [0, 500]
+
+    def test_empty(self):
+        assert list(page_offsets(0, 100)) == []
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            page_offsets(10, 0)
+
+
+class TestIterPaged:
+    @staticmethod
+    def _fetcher(items, calls):
+        def fetch(first_result, max_results):
+            calls.append(first_result)
+            return items[first_result:first_result + max_results]
+
+        return fetch
+
+    def test_forward_stops_on_short_page(self):
+        calls = []
+        result = list(iter_paged(self._fetcher(list(range(5)), calls), page_size=2))
+        assert result == [0, 1, 2, 3, 4]
+        assert calls == [0, 2, 4]
+
+    def test_forward_exact_multiple_fetches_empty_page(self):
+        calls = []
+        result = list(iter_paged(self._fetcher(list(range(4)), calls), page_size=2))
+        assert result == [0, 1, 2, 3]
+        assert calls == [0, 2, 4]
+
+    def test_reverse_walks_from_tail(self):
+        calls = []
+        fetch = self._fetcher(list(range(5)), calls)
+        result = list(iter_paged(fetch, page_size=2, total=5, reverse=True))
+        assert result == [4, 2, 3, 0, 1]
+        assert calls == [4, 2, 0]
+
+    def test_reverse_requires_total(self):
+        with pytest.raises(ValueError, match="total"):
+            list(iter_paged(lambda first, size: [], page_size=2, reverse=True))
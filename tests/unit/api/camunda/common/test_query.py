@@ -0,0 +1,80 @@
+"""Tests for translating GET filter queries into POST query bodies."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.api.camunda.common import QuerySpec, parse_variable_filters, query_length
+
+SPEC = QuerySpec(
+    list_fields=frozenset({"taskIdIn", "tenantIdIn"}),
+    variable_fields=frozenset({"processVariables"}),
+    chunk_fields=frozenset({"taskIdIn"}),
+)
+
+
+class TestQueryLength:
+    def test_matches_encoded_query_string(self):
+        assert query_length({"assignee": "demo", "active": True}) == len(
+            "assignee=demo&active=true"
+        )
+
+    def test_skips_none(self):
+        assert query_length({"assignee": None}) == 0
+
+
+class TestParseVariableFilters:
+    def test_parses_expressions(self):
+        assert parse_variable_filters("status_eq_open, amount_gteq_10") == [
+            {"name": "status", "operator": "eq", "value": "open"},
+            {"name": "amount", "operator": "gteq", "value": "10"},
+        ]
+
+    def test_value_may_contain_underscores(self):
+        assert parse_variable_filters("key_like_a_b%")[0]["value"] == "a_b%"
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="name_operator_value"):
+            parse_variable_filters("status")
+
+
+class TestToBody:
+    def test_converts_lists_variables_and_sorting(self):
+        body, query = SPEC.to_body(
+            {
+                "taskIdIn": "a,b",
+                "tenantIdIn": "t1",
+                "processVariables": "status_eq_open",
+                "assignee": "demo",
+                "active": True,
+                "sortBy": "created",
+                "sortOrder": "desc",
+                "firstResult": 10,
+                "maxResults": 5,
+            }
+        )
+        assert body == {
+            "taskIdIn": ["a", "b"],
+            "tenantIdIn": ["t1"],
+            "processVariables": [{"name": "status", "operator": "eq", "value": "open"}],
+            "assignee": "demo",
+            "active": True,
+            "sorting": [{"sortBy": "created", "sortOrder": "desc"}],
+        }
+        assert query == {"firstResult": 10, "maxResults": 5}
+
+
+class TestSplit:
+    def test_small_lists_are_not_split(self):
+        params = {"taskIdIn": "a,b"}
+        assert SPEC.split(params, 2) == [params]
+
+    def test_splits_long_id_lists(self):
+        chunks = SPEC.split({"taskIdIn": "a,b,c,d,e", "assignee": "demo"}, 2)
+        assert [chunk["taskIdIn"] for chunk in chunks] == ["a,b", "c,d", "e"]
+        assert all(chunk["assignee"] == "demo" for chunk in chunks)
+
+    @pytest.mark.parametrize("key", ["firstResult", "maxResults", "sortBy"])
+    def test_paginated_or_sorted_queries_are_not_split(self, key):
+        params = {"taskIdIn": "a,b,c", key: 1}
+        assert SPEC.split(params, 1) == [params]
@@ -1,12 +1,15 @@
-"""Tests for Variable, VariablePayload, and VariableModificationRequest."""
+"""Tests for variable models and diff_variables."""
 
 from __future__ import annotations
 
 from camctl.api.camunda.common.variables import (
     Variable,
+    VariableInstance,
+    VariableInstanceQuery,
     VariableModificationRequest,
     VariablePayload,
     VariableValueInfo,
+    diff_variables,
 )
 
 
@@ -100,3 +103,97 @@ class TestVariableModificationRequest:
         d = mod.to_api_dict()
         assert "modifications" not in d
         assert "deletions" not in d
+
+
+class TestVariableInstance:
+    def test_process_scoped(self):
+        v = VariableInstance.from_dict({
+            "name": "a",
+            "value": 1,
+            "processInstanceId": "p1",
+            "executionId": "p1",
+        })
+        assert v.is_process_scoped
+        assert v.value == 1
+
+    def test_child_execution_not_process_scoped(self):
+        v = VariableInstance.from_dict({"processInstanceId": "p1", "executionId": "e1"})
+        assert not v.is_process_scoped
+
+    def test_task_local_not_process_scoped(self):
+        v = VariableInstance.from_dict({
+            "processInstanceId": "p1",
+            "executionId": "p1",
+            "taskId": "t1",
+        })
+        assert not v.is_process_scoped
+
+
+class TestVariableInstanceQuery:
+    def test_to_api_dict(self):
+        query = VariableInstanceQuery(process_instance_id_in=["p1", "p2"])
+        assert query.to_api_dict() == {"processInstanceIdIn": ["p1", "p2"]}
+
+
+class TestDiffVariables:
+    @staticmethod
+    def _current():
+        return {
+            "count": Variable.from_dict({"value": 1, "type": "Integer"}),
+            "flag": Variable.from_dict({"value": True, "type": "Boolean"}),
+            "doc": Variable.from_dict({
+                "value": "{}",
+                "type": "Object",
+                "valueInfo": {"objectTypeName": "java.util.HashMap"},
+            }),
+        }
+
+    def test_drops_unchanged_and_missing_deletions(self):
+        diff = diff_variables(
+            self._current(),
+            {"count": VariablePayload(value=1), "new": VariablePayload(value="x")},
+            ["flag", "absent"],
+        )
+        assert diff.request.to_api_dict() == {
+            "modifications": {"new": {"value": "x"}},
+            "deletions": ["flag"],
+        }
+        assert diff.unchanged == ["count"]
+        assert diff.missing_deletions == ["absent"]
+        assert diff.bytes_saved > 0
+
+    def test_type_change_is_not_a_noop(self):
+        diff = diff_variables(
+            self._current(),
+            {"count": VariablePayload(value=1, type="Long")},
+        )
+        assert list(diff.request.modifications) == ["count"]
+
+    def test_bool_does_not_match_integer(self):
+        diff = diff_variables(
+            {"count": Variable.from_dict({"value": 1, "type": "Boolean"})},
+            {"count": VariablePayload(value=True)},
+        )
+        assert diff.unchanged == []
+        diff = diff_variables(self._current(), {"count": VariablePayload(value=True)})
+        assert diff.unchanged == []
+
+    def test_value_info_compared_when_given(self):
+        same = VariablePayload(
+            value="{}",
+            type="Object",
+            value_info={"objectTypeName": "java.util.HashMap"},
+        )
+        other = VariablePayload(
+            value="{}",
+            type="Object",
+            value_info={"objectTypeName": "java.util.TreeMap"},
+        )
+        assert diff_variables(self._current(), {"doc": same}).is_empty
+        assert not diff_variables(self._current(), {"doc": other}).is_empty
+
+    def test_empty_diff_has_zero_minimal_bytes(self):
+        diff = diff_variables(self._current(), {"flag": VariablePayload(value=True)})
+        assert diff.is_empty
+        assert diff.minimal_bytes == 0
+        assert diff.bytes_saved == diff.requested_bytes
@@ -0,0 +1,164 @@
+"""Tests for recording and replaying HTTP traffic."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from camctl.api.http.cassette import (
+    REDACTED,
+    Cassette,
+    CassetteMissError,
+    RecordingTransport,
+    Redactor,
+    ReplayTransport,
+)
+
+
+def engine_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/count"):
+        return httpx.Response(200, json={"count": int(request.url.params.get("n", "1"))})
+    if request.url.path.endswith("/down"):
+        raise httpx.ConnectError("refused", request=request)
+    if request.url.path.endswith("/file"):
+        headers = {"content-type": "application/octet-stream"}
+        return httpx.Response(200, content=b"\xff\x00", headers=headers)
+    return httpx.Response(200, json={"echo": json.loads(request.content or b"null"), "token": "t"})
+
+
+@pytest.fixture
+def recorder():
+    ticks = iter(range(100))
+    return RecordingTransport(httpx.MockTransport(engine_handler), clock=lambda: next(ticks) * 0.01)
+
+
+def record(recorder: RecordingTransport) -> None:
+    with httpx.Client(transport=recorder, base_url="http://engine") as client:
+        client.get("/task/count", params={"n": 3, "accessToken": "secret"})
+        client.get("/task/count", params={"n": 4})
+        client.post("/task", json={"password": "hunter2", "maxResults": 5})
+        client.get("/file")
+        with pytest.raises(httpx.ConnectError):
+            client.get("/down")
+
+
+class TestRedactor:
+    def test_query_and_nested_json(self):
+        redactor = Redactor()
+        url = redactor.url(httpx.URL("http://h/x?apiKey=1&page=2"))
+        assert url == f"http://h/x?apiKey={REDACTED.replace('*', '%2A')}&page=2"
+        assert redactor.json({"a": [{"Authorization": "x", "b": 1}]}) == {
+            "a": [{"Authorization": REDACTED, "b": 1}]
+        }
+
+    def test_sensitive_variable_names(self):
+        redactor = Redactor()
+        variables = [
+            {"name": "password", "value": "hunter2", "type": "String"},
+            {"name": "amount", "value": 5, "type": "Integer"},
+        ]
+        assert redactor.json({"variables": variables}) == {
+            "variables": [
+                {"name": "password", "value": REDACTED, "type": "String"},
+                {"name": "amount", "value": 5, "type": "Integer"},
+            ]
+        }
+
+    def test_custom_pattern(self):
+        assert Redactor(pattern="ssn").is_sensitive("customerSSN")
+        assert not Redactor(pattern="ssn").is_sensitive("password")
+
+
+class TestRecordingTransport:
+    def test_records_requests_responses_and_errors(self, recorder):
+        record(recorder)
+        interactions = recorder.cassette.interactions
+        assert [item.method for item in interactions] == ["GET", "GET", "POST", "GET", "GET"]
+        first = interactions[0]
+        assert "accessToken=%2A%2A%2A" in first.url
+        assert first.response_body == {"json": {"count": 3}}
+        assert first.started == 0.0
+        assert first.elapsed == pytest.approx(0.01)
+        post = interactions[2]
+        assert post.request_body == {"json": {"password": REDACTED, "maxResults": 5}}
+        assert post.response_body["json"]["token"] == REDACTED
+        assert interactions[3].response_body == {"base64": "/wA="}
+        assert interactions[4].error == "ConnectError"
+
+    @pytest.mark.parametrize("name", ["traffic.jsonl", "traffic.jsonl.gz"])
+    def test_save_and_load(self, recorder, tmp_path, name):
+        record(recorder)
+        path = tmp_path / name
+        recorder.cassette.save(path)
+        loaded = Cassette.load(path)
+        assert [item.to_dict() for item in loaded.interactions] == [
+            item.to_dict() for item in recorder.cassette.interactions
+        ]
+
+    def test_compressed_responses_are_decoded_once(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=gzip.compress(b'{"count": 7}'),
+                headers={"content-type": "application/json", "content-encoding": "gzip"},
+            )
+
+        recorder = RecordingTransport(httpx.MockTransport(handler))
+        with httpx.Client(transport=recorder, base_url="http://engine") as client:
+            assert client.get("/task/count").json() == {"count": 7}
+        assert recorder.cassette.interactions[0].response_body == {"json": {"count": 7}}
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.jsonl"
+        path.write_text('{"something": 1}\n')
+        with pytest.raises(ValueError, match="not a version 1 cassette"):
+            Cassette.load(path)
+
+
+class TestReplayTransport:
+    @pytest.fixture
+    def client(self, recorder):
+        record(recorder)
+        slept = []
+        replay = ReplayTransport(recorder.cassette, speed=2.0, sleep=slept.append)
+        with httpx.Client(transport=replay, base_url="http://engine") as client:
+            client.slept = slept
+            yield client
+
+    def test_matches_on_query_and_body(self, client):
+        # Query order and redacted values do not matter.
+        response = client.get("/task/count", params={"accessToken": "other", "n": 3})
+        assert response.json() == {"count": 3}
+        assert client.get("/task/count", params={"n": 4}).json() == {"count": 4}
+        response = client.post("/task", json={"password": "different", "maxResults": 5})
+        assert response.json()["echo"]["maxResults"] == 5
+        assert client.get("/file").content == b"\xff\x00"
+
+    def test_scales_recorded_time(self, client):
+        client.get("/task/count", params={"n": 4})
+        assert client.slept == [pytest.approx(0.005)]
+
+    def test_repeats_last_response(self, client):
+        client.get("/task/count", params={"n": 4})
+        assert client.get("/task/count", params={"n": 4}).json() == {"count": 4}
+
+    def test_replays_transport_errors(self, client):
+        with pytest.raises(httpx.ConnectError):
+            client.get("/down")
+
+    def test_miss(self, client):
+        with pytest.raises(CassetteMissError, match="No recorded response for GET"):
+            client.get("/task/count", params={"n": 5})
+        with pytest.raises(CassetteMissError):
+            client.post("/task", json={"maxResults": 6})
+
+    def test_strict_mode(self, recorder):
+        record(recorder)
+        replay = ReplayTransport(recorder.cassette, speed=0, repeat_last=False)
+        with httpx.Client(transport=replay, base_url="http://engine") as client:
+            client.get("/file")
+            with pytest.raises(CassetteMissError):
+                client.get("/file")
@@ -69,6 +69,29 @@ class TestCircuitBreakerOpen:
             cb.before_request()
         assert exc_info.value.retry_after_seconds > 0
 
+    def test_counts_trips(self):
+        cb = CircuitBreaker(failure_threshold=1)
+        assert cb.trips == 0
+        cb.record_failure()
+        cb.record_success()
+        cb.record_failure()
+        assert cb.trips == 2
+
+    def test_reports_state_changes(self):
+        changes = []
+        cb = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout_seconds=0.01,
+            on_state_change=lambda old, new: changes.append((old, new)),
+        )
+        cb.record_success()
+        cb.record_failure()
+        with patch("camctl.api.http.circuit_breaker.monotonic") as mock_time:
+            mock_time.return_value = cb._opened_at + 1.0
+            cb.before_request()
+        cb.record_success()
+        assert changes == [("closed", "open"), ("open", "half-open"), ("half-open", "closed")]
+
 
 class TestCircuitBreakerHalfOpen:
     def test_transitions_to_half_open_after_timeout(self):
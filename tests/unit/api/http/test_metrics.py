@@ -0,0 +1,162 @@
+"""Tests for client-side Prometheus metrics."""
+
+from __future__ import annotations
+
+import threading
+from http import HTTPMethod
+
+import httpx
+import pytest
+
+from camctl.api.camunda import CamundaClient
+from camctl.api.http import CircuitBreaker, CircuitBreakerOpenError
+from camctl.api.http.metrics import (
+    CONTENT_TYPE,
+    ClientMetrics,
+    MetricsRegistry,
+    MetricsServer,
+    write_textfile,
+)
+
+
+def sample_lines(registry: MetricsRegistry) -> list[str]:
+    return [line for line in registry.render().splitlines() if not line.startswith("#")]
+
+
+class TestRegistry:
+    def test_counter_sums_threads(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+
+        def work() -> None:
+            for _ in range(1000):
+                counter.labels("a").inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.labels(kind="a").inc(0.5)
+        assert counter.labels("a").value == 4000.5
+        # Rows of finished threads are folded in and still counted.
+        assert sample_lines(registry) == ['jobs_total{kind="a"} 4000.5']
+
+    def test_render_format(self):
+        registry = MetricsRegistry()
+        registry.gauge("up", "Whether\nthe client is up.").set(1)
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        assert registry.render().splitlines() == [
+            "# HELP up Whether\\nthe client is up.",
+            "# TYPE up gauge",
+            "up 1",
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 3.65",
+            "latency_seconds_count 4",
+        ]
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors.", ("message",)).labels('say "hi"\\').inc()
+        assert sample_lines(registry) == ['errors_total{message="say \\"hi\\"\\\\"} 1']
+
+    def test_registration(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs.")
+        assert registry.counter("jobs_total", "Jobs.") is counter
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("jobs_total", "Jobs.")
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("extra")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+
+class TestClientMetrics:
+    def test_requests_errors_and_breaker(self):
+        responses = iter([200, 503])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = next(responses, None)
+            if status is None:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(status, json={})
+
+        metrics = ClientMetrics()
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = CamundaClient(
+            transport=httpx.MockTransport(handler), circuit_breaker=breaker, metrics=metrics
+        )
+        client.get("task/abc-1")
+        client.get("task/count", allow_error=True)
+        with pytest.raises(httpx.ConnectError):
+            client.get("task")
+        with pytest.raises(CircuitBreakerOpenError):
+            client.get("task")
+
+        assert client.metrics is metrics
+        lines = sample_lines(metrics.registry)
+        target = client.base_url
+        assert set(lines) >= {
+            'camctl_http_requests_total{method="GET",endpoint="task/{id}",status="200"} 1',
+            'camctl_http_requests_total{method="GET",endpoint="task/count",status="503"} 1',
+            'camctl_http_requests_total{method="GET",endpoint="task",status="error"} 1',
+            'camctl_http_requests_total{method="GET",endpoint="task",status="rejected"} 1',
+            'camctl_http_request_duration_seconds_count{method="GET",endpoint="task/{id}"} 1',
+            f'camctl_circuit_breaker_transitions_total{{target="{target}",from="closed",to="open"}}'
+            " 1",
+            f'camctl_circuit_breaker_state{{target="{target}",state="open"}} 1',
+            f'camctl_http_pool_connections{{target="{target}",state="active"}} 0',
+        }
+
+    def test_stream_body_failure_is_one_error(self):
+        class DroppedStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"partial"
+                raise httpx.ReadError("connection lost")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=DroppedStream())
+
+        metrics = ClientMetrics()
+        client = CamundaClient(transport=httpx.MockTransport(handler), metrics=metrics)
+        with pytest.raises(httpx.ReadError):
+            with client.stream(HTTPMethod.GET, "task/t1/variables/file/data") as response:
+                response.read()
+        requests = [line for line in sample_lines(metrics.registry) if "requests_total" in line]
+        assert requests == [
+            'camctl_http_requests_total{method="GET",endpoint="task/{id}/variables/file/data",'
+            'status="error"} 1'
+        ]
+
+    def test_cache_lookups(self):
+        metrics = ClientMetrics()
+        metrics.cache_lookup(hit=True)
+        metrics.cache_lookup(hit=False)
+        metrics.cache_lookup(hit=True)
+        assert metrics.cache_requests.labels("hit").value == 2
+
+
+class TestExport:
+    def test_textfile(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs.").inc()
+        path = tmp_path / "collector" / "camctl.prom"
+        write_textfile(registry, path)
+        assert path.read_text() == registry.render()
+
+    def test_server(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs.").inc(3)
+        with MetricsServer(registry) as server:
+            response = httpx.get(server.url)
+            missing = httpx.get(server.url.replace("/metrics", "/other"))
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "jobs_total 3" in response.text
+        assert missing.status_code == 404
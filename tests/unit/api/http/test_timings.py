@@ -0,0 +1,118 @@
+"""Tests for per-request phase timings."""
+
+from __future__ import annotations
+
+import itertools
+
+import httpx
+import pytest
+
+from camctl.api.camunda import CamundaClient, CamundaEngine
+from camctl.api.http.timings import (
+    TOTAL,
+    TimingCollector,
+    current_timing,
+    endpoint_template,
+    phase,
+)
+from camctl.testing import FakeEngine, FakeEngineServer
+
+
+def ticking_clock(step: float = 0.001):
+    ticks = itertools.count()
+    return lambda: next(ticks) * step
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("task", "task"),
+        ("/task/4f2a-11ee/variables/", "task/{id}/variables"),
+        ("process-instance/42?deserializeValues=false", "process-instance/{id}"),
+        ("process-definition/key/invoice/start", "process-definition/key/invoice/start"),
+    ],
+)
+def test_endpoint_template(path, expected):
+    assert endpoint_template(path) == expected
+
+
+class TestCollector:
+    def test_trace_events_become_phases(self):
+        collector = TimingCollector(clock=ticking_clock())
+        timing = collector.start("GET", "task/1")
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "http11.send_request_headers.started",
+            "http11.send_request_body.complete",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.started",
+            "http11.receive_response_body.complete",
+        ):
+            timing.trace(event, {})
+        timing.finish()
+        histograms = collector.histograms()["GET task/{id}"]
+        assert {name: histogram.total for name, histogram in histograms.items()} == {
+            "queue": pytest.approx(1.0),
+            "connect": pytest.approx(1.0),
+            "send": pytest.approx(1.0),
+            "wait": pytest.approx(1.0),
+            "read": pytest.approx(1.0),
+            TOTAL: pytest.approx(8.0),
+        }
+
+    def test_nested_phases_count_once(self):
+        collector = TimingCollector(clock=ticking_clock())
+        collector.start("GET", "task").finish()
+        with phase("parse"):
+            with phase("parse"):
+                pass
+        assert current_timing().phases["parse"] == pytest.approx(0.001)
+
+    def test_next_request_commits_the_previous_one(self):
+        collector = TimingCollector()
+        first = collector.start("GET", "task")
+        first.finish()
+        collector.start("GET", "task/count").finish()
+        with phase("decode"):
+            pass
+        assert "decode" not in first.phases
+        assert collector.histograms()["GET task/count"]["decode"].count == 1
+
+    def test_phase_without_collector_is_a_no_op(self):
+        collector = TimingCollector()
+        collector.start("GET", "task").finish()
+        collector.histograms()
+        with phase("decode"):
+            pass
+        assert "decode" not in current_timing().phases
+
+
+def test_client_times_requests_against_a_real_socket():
+    collector = TimingCollector()
+    with FakeEngineServer(FakeEngine.with_dataset(processes=3)) as server:
+        client = CamundaClient(base_url=server.url, timings=collector)
+        engine = CamundaEngine(client)
+        engine.tasks.list()
+        engine.tasks.count()
+        task_id = engine.tasks.list().items[0].id
+        engine.tasks.get(task_id)
+        client.close()
+    histograms = collector.histograms()
+    assert client.timings is collector
+    assert set(histograms) == {"GET task", "GET task/count", "GET task/{id}"}
+    listing = histograms["GET task"]
+    assert listing[TOTAL].count == 2
+    assert {"queue", "send", "wait", "read", "decode", "parse"} <= set(listing)
+    assert listing["connect"].count == 1
+
+
+def test_transport_errors_are_timed():
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    collector = TimingCollector()
+    client = CamundaClient(transport=httpx.MockTransport(refuse), timings=collector)
+    with pytest.raises(httpx.ConnectError):
+        client.get("task")
+    assert collector.histograms()["GET task"][TOTAL].count == 1
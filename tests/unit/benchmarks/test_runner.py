@@ -0,0 +1,116 @@
+"""Tests for the benchmark runner, result files and comparisons."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.__main__ import load_modules, main
+from benchmarks.runner import (
+    REGISTRY,
+    Benchmark,
+    BenchmarkResult,
+    RunOptions,
+    SuiteResult,
+    compare,
+    format_seconds,
+    regressions,
+    run_benchmark,
+    select,
+)
+
+
+def _result(name: str, median: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name, items=10, loops=1, repeats=1, min=median, median=median, mean=median, stdev=0.0
+    )
+
+
+class TestRunBenchmark:
+    def test_calls_setup_once_and_times_the_returned_callable(self):
+        calls = {"setup": 0, "run": 0}
+
+        def factory():
+            calls["setup"] += 1
+
+            def run():
+                calls["run"] += 1
+
+            return run
+
+        bench = Benchmark(name="demo", factory=factory, items=4)
+        result = run_benchmark(bench, RunOptions(min_time=0.0, repeats=3))
+        assert calls["setup"] == 1
+        assert calls["run"] == 1 + 1 + 3  # warm-up, calibration, repeats
+        assert result.items == 4
+        assert result.min <= result.median
+        assert result.to_dict()["per_item_ns"] == pytest.approx(result.median / 4 * 1e9, rel=1e-3)
+
+    def test_loops_double_until_min_time(self):
+        bench = Benchmark(name="demo", factory=lambda: (lambda: None))
+        result = run_benchmark(bench, RunOptions(min_time=0.001, repeats=1, max_loops=64))
+        assert result.loops in (1, 2, 4, 8, 16, 32, 64)
+
+
+class TestSuiteResult:
+    def test_round_trip(self, tmp_path):
+        suite = SuiteResult(results=[_result("a", 0.5)], git_commit="abc123")
+        path = tmp_path / "results.json"
+        suite.save(path)
+        loaded = SuiteResult.load(path)
+        assert loaded.git_commit == "abc123"
+        assert loaded.results == suite.results
+
+    def test_rejects_unknown_schema(self):
+        with pytest.raises(ValueError):
+            SuiteResult.from_dict({"schema": 99, "benchmarks": {}})
+
+
+class TestCompare:
+    def test_ratios_and_regressions(self):
+        baseline = SuiteResult(
+            results=[_result("a", 1.0), _result("b", 1.0), _result("gone", 1.0)]
+        )
+        current = SuiteResult(
+            results=[_result("a", 1.5), _result("b", 0.9), _result("new", 1.0)]
+        )
+        comparisons = {item.name: item for item in compare(baseline, current)}
+        assert comparisons["a"].ratio == pytest.approx(1.5)
+        assert comparisons["gone"].current is None
+        assert comparisons["new"].ratio is None
+        assert [item.name for item in regressions(comparisons.values(), 1.2)] == ["a"]
+
+
+class TestSuite:
+    def test_modules_register_the_documented_hot_paths(self):
+        load_modules()
+        names = set(REGISTRY)
+        assert {
+            "resources.task_from_dict",
+            "resources.task_page_from_dict",
+            "serialization.snake_to_camel_task_list_params",
+            "serialization.dumps_json_task_page",
+            "concurrency.gather_noop",
+            "display.print_tasks",
+        } <= names
+        assert [bench.name for bench in select(["gather"])] == [
+            "concurrency.gather_iter_noop",
+            "concurrency.gather_noop",
+        ]
+
+    def test_quick_run_writes_results(self, tmp_path, capsys):
+        output = tmp_path / "run.json"
+        assert main(["-k", "snake_to_camel", "--quick", "-o", str(output)]) == 0
+        suite = SuiteResult.load(output)
+        assert [result.name for result in suite.results] == [
+            "serialization.snake_to_camel_task_list_params"
+        ]
+        argv = ["-k", "snake_to_camel", "--quick", "--no-save", "--compare", str(output)]
+        assert main([*argv, "--threshold", "1000"]) == 0
+        assert "ratio" in capsys.readouterr().out
+
+
+def test_format_seconds():
+    assert format_seconds(1.5) == "1.50 s"
+    assert format_seconds(0.0025) == "2.50 ms"
+    assert format_seconds(2e-7) == "200 ns"
+    assert format_seconds(None) == "-"
@@ -0,0 +1,72 @@
+"""Tests for the on-disk query result cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.cache import QueryCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with QueryCache(tmp_path / "queries.sqlite3") as store:
+        yield store
+
+
+class TestCacheKey:
+    def test_param_order_does_not_matter(self):
+        a = cache_key("http://e/", "tasks.count", {"assignee": "demo", "active": True})
+        b = cache_key("http://e", "tasks.count", {"active": True, "assignee": "demo"})
+        assert a == b
+
+    def test_distinguishes_engine_query_and_params(self):
+        base = cache_key("http://e", "tasks.count", {"assignee": "demo"})
+        assert base != cache_key("http://other", "tasks.count", {"assignee": "demo"})
+        assert base != cache_key("http://e", "tasks.list", {"assignee": "demo"})
+        assert base != cache_key("http://e", "tasks.count", {"assignee": "bob"})
+
+
+class TestQueryCache:
+    def test_round_trip(self, cache):
+        cache.set("k", {"items": [{"id": "t1"}]}, ttl=60)
+        entry = cache.get("k")
+        assert entry.value == {"items": [{"id": "t1"}]}
+        assert entry.age_seconds >= 0
+
+    def test_missing(self, cache):
+        assert cache.get("nope") is None
+
+    def test_expired_entries_are_dropped(self, cache, monkeypatch):
+        cache.set("k", 42, ttl=10)
+        now = cache.get("k").created_at
+        monkeypatch.setattr("camctl.cache.store.time.time", lambda: now + 11)
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_zero_ttl_is_not_stored(self, cache):
+        cache.set("k", 1, ttl=0)
+        assert cache.get("k") is None
+
+    def test_evicts_least_recently_read(self, tmp_path, monkeypatch):
+        clock = iter(range(100, 200))
+        monkeypatch.setattr("camctl.cache.store.time.time", lambda: next(clock))
+        with QueryCache(tmp_path / "q.sqlite3", max_entries=2) as cache:
+            cache.set("a", 1, ttl=1000)
+            cache.set("b", 2, ttl=1000)
+            assert cache.get("a").value == 1
+            cache.set("c", 3, ttl=1000)
+            assert cache.get("b") is None
+            assert cache.get("a").value == 1
+            assert cache.get("c").value == 3
+
+    def test_evicts_by_size(self, tmp_path):
+        with QueryCache(tmp_path / "q.sqlite3", max_bytes=200) as cache:
+            for index in range(10):
+                cache.set(f"k{index}", "x" * index + str(list(range(40))), ttl=60)
+            assert cache.stats()["bytes"] <= 200
+            assert cache.get("k9") is not None
+
+    def test_clear(self, cache):
+        cache.set("a", 1, ttl=60)
+        assert cache.clear() == 1
+        assert cache.stats() == {"entries": 0, "bytes": 0}
@@ -0,0 +1,42 @@
+"""Tests for cache directory and config file resolution."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from camctl.config.paths import CACHE_DIR_ENV, CONFIG_ENV, cache_dir, config_file, engine_slug
+
+
+class TestCacheDir:
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+        assert cache_dir() == tmp_path / "cache"
+
+    def test_xdg_cache_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert cache_dir() == tmp_path / "camctl"
+
+    def test_home_fallback(self, monkeypatch):
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        assert cache_dir() == Path.home() / ".cache" / "camctl"
+
+
+class TestConfigFile:
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(CONFIG_ENV, str(tmp_path / "camctl.yaml"))
+        assert config_file() == tmp_path / "camctl.yaml"
+
+    def test_xdg_config_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(CONFIG_ENV, raising=False)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        assert config_file() == tmp_path / "camctl" / "config.yaml"
+
+
+class TestEngineSlug:
+    def test_stable_and_distinct(self):
+        a = engine_slug("http://a/engine-rest/")
+        assert a == engine_slug("http://a/engine-rest/")
+        assert a != engine_slug("http://b/engine-rest/")
+        assert len(a) == 16
@@ -42,6 +42,34 @@ class TestFromMapping:
             Settings.from_mapping({"scopes": 42})
 
 
+class TestEngines:
+    def test_no_engines(self):
+        s = Settings.from_mapping({})
+        assert s.engines == {}
+        assert s.default_engine is None
+
+    def test_url_and_mapping_profiles(self):
+        s = Settings.from_mapping({
+            "engines": {
+                "eu": "https://eu.example/engine-rest",
+                "us": {"base_url": "https://us.example/engine-rest", "timeout": 30},
+            },
+            "default_engine": "eu",
+        })
+        assert s.engines["eu"].base_url == "https://eu.example/engine-rest"
+        assert s.engines["eu"].timeout == 10.0
+        assert s.engines["us"].timeout == 30.0
+        assert s.default_engine == "eu"
+
+    def test_invalid_profile(self):
+        with pytest.raises(ValueError, match="base_url"):
+            Settings.from_mapping({"engines": {"eu": {"timeout": 5}}})
+
+    def test_unknown_default(self):
+        with pytest.raises(ValueError, match="not defined"):
+            Settings.from_mapping({"engines": {"eu": "http://eu"}, "default_engine": "us"})
+
+
 class TestFromYaml:
     def test_basic_yaml(self, tmp_path):
         config = tmp_path / "config.yaml"
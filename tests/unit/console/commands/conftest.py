@@ -0,0 +1,33 @@
+"""Fixtures for running CLI commands against the fake engine."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import Result
+from typer.testing import CliRunner
+
+from camctl.console.app import app
+from camctl.testing import FakeEngine, FakeEngineServer
+
+
+@pytest.fixture
+def server():
+    with FakeEngineServer(FakeEngine.with_dataset(processes=4)) as server:
+        yield server
+
+
+@pytest.fixture
+def config(tmp_path, server):
+    path = tmp_path / "config.yaml"
+    path.write_text(f"engines:\n  fake:\n    base_url: {server.url}\ndefault_engine: fake\n")
+    return path
+
+
+@pytest.fixture
+def camctl(config):
+    """Run the CLI against the fake engine and return the click result."""
+
+    def invoke(*args: str, input: str | None = None) -> Result:
+        return CliRunner().invoke(app, ["--config", str(config), *args], input=input)
+
+    return invoke
@@ -0,0 +1,19 @@
+"""Tests for `camctl processes cancel`."""
+
+from __future__ import annotations
+
+
+class TestProcessesCancel:
+    def test_cancel_by_ids(self, server, camctl):
+        first, second, *rest = server.engine.process_ids
+        result = camctl("processes", "cancel", "--ids", f"{first},{second}")
+        assert result.exit_code == 0, result.output
+        assert "Parsed 2 process IDs from --ids" in result.output
+        assert server.engine.process_ids == rest
+
+    def test_ids_and_filters_are_exclusive(self, server, camctl):
+        first = server.engine.process_ids[0]
+        result = camctl("processes", "cancel", "--ids", first, "--business-key", "x")
+        assert result.exit_code == 2
+        assert "Provide exactly one of --ids, --file, or process filters." in result.output
+        assert len(server.engine.process_ids) == 4
@@ -0,0 +1,31 @@
+"""Tests for `camctl processes count`."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from camctl.config.paths import CACHE_DIR_ENV
+
+
+@pytest.fixture
+def synced(tmp_path, monkeypatch, camctl):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    result = camctl("sync", "--no-tasks")
+    assert result.exit_code == 0, result.output
+
+
+class TestProcessesCount:
+    def test_local_count(self, server, camctl, synced):
+        result = camctl("processes", "count", "--local", "--raw")
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == {"count": len(server.engine.process_ids)}
+
+    def test_local_group_by_matches_the_engine(self, camctl, synced):
+        args = ["processes", "count", "--group-by", "definition_key", "--raw"]
+        remote = camctl(*args)
+        local = camctl(*args, "--local")
+        assert local.exit_code == 0, local.output
+        assert json.loads(local.output)["strategy"] == "local"
+        assert json.loads(local.output)["groups"] == json.loads(remote.output)["groups"]
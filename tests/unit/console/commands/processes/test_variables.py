@@ -0,0 +1,19 @@
+"""Tests for `camctl processes variables`."""
+
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from camctl.console.app import app
+
+
+def test_bulk_raw_output_is_plain_json(server, config):
+    ids = server.engine.process_ids[:2]
+    result = CliRunner().invoke(
+        app,
+        ["--config", str(config), "processes", "variables", "--ids", ",".join(ids), "--raw"],
+    )
+    assert result.exit_code == 0, result.output
+    assert sorted(json.loads(result.output)) == sorted(ids)
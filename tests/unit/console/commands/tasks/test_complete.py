@@ -0,0 +1,164 @@
+"""Tests for `camctl tasks complete` in batch mode."""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+
+from camctl.console.commands.tasks.complete import build_completion
+from camctl.testing import FakeEngine, FakeEngineServer
+
+SHARED = json.dumps({"region": {"value": "moon"}, "approved": {"value": True}})
+
+
+@pytest.fixture
+def server():
+    # Two steps per instance: completing a task creates the next one, which
+    # still matches filters on the process.
+    with FakeEngineServer(FakeEngine.with_dataset(processes=8, steps=2)) as server:
+        yield server
+
+
+def process_of(fake: FakeEngine, task_id: str) -> str:
+    return fake._tasks[task_id]["processInstanceId"]
+
+
+class TestTasksComplete:
+    def test_ids_use_the_shared_variables(self, server, camctl):
+        fake = server.engine
+        first, second, *_ = fake.task_ids
+        processes = [process_of(fake, first), process_of(fake, second)]
+        result = camctl(
+            "tasks", "complete", "--ids", f"{first},{second}", "--variables", SHARED
+        )
+        assert result.exit_code == 0, result.output
+        assert first not in fake.task_ids and second not in fake.task_ids
+        for process_id in processes:
+            assert fake._variables[process_id]["region"]["value"] == "moon"
+            assert fake._variables[process_id]["approved"]["value"] is True
+
+    def test_record_variables_override_shared_ones(self, tmp_path, server, camctl):
+        fake = server.engine
+        first, second, *_ = fake.task_ids
+        processes = [process_of(fake, first), process_of(fake, second)]
+        path = tmp_path / "records.ndjson"
+        path.write_text(
+            json.dumps({"task_id": first, "variables": {"region": {"value": "mars"}}})
+            + "\n"
+            + json.dumps({"task_id": second})
+            + "\n",
+            encoding="utf-8",
+        )
+        result = camctl("tasks", "complete", "--file", str(path), "--variables", SHARED)
+        assert result.exit_code == 0, result.output
+        assert "Found 2 completion record(s)" in result.output
+        overridden, shared = (fake._variables[process_id] for process_id in processes)
+        assert overridden["region"]["value"] == "mars"
+        assert overridden["approved"]["value"] is True
+        assert shared["region"]["value"] == "moon"
+
+    def test_csv_records_carry_json_variables(self, tmp_path, server, camctl):
+        fake = server.engine
+        task_id = fake.task_ids[0]
+        process_id = process_of(fake, task_id)
+        path = tmp_path / "records.csv"
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["task_id", "variables", "comment"])
+            writer.writerow([task_id, json.dumps({"region": {"value": "mars"}}), "done"])
+        result = camctl("tasks", "complete", "--file", str(path), "--variables", SHARED)
+        assert result.exit_code == 0, result.output
+        assert task_id not in fake.task_ids
+        assert fake._variables[process_id]["region"]["value"] == "mars"
+
+    def test_sources_are_exclusive(self, tmp_path, server, camctl):
+        first = server.engine.task_ids[0]
+        path = tmp_path / "records.ndjson"
+        path.write_text(json.dumps({"task_id": first}) + "\n", encoding="utf-8")
+        before = server.engine.task_ids
+        for args in (
+            ["--ids", first, "--file", str(path)],
+            ["--ids", first, "--process-instance-business-key-like", "BK-%"],
+            [first, "--ids", first],
+        ):
+            result = camctl("tasks", "complete", *args)
+            assert result.exit_code == 2, args
+            assert "Provide exactly one of TASK_ID" in result.output
+        assert server.engine.task_ids == before
+
+    def test_invalid_record_fails_before_any_completion(self, tmp_path, server, camctl):
+        first = server.engine.task_ids[0]
+        path = tmp_path / "records.ndjson"
+        path.write_text(json.dumps({"task_id": first}) + "\nnot json\n", encoding="utf-8")
+        before = server.engine.task_ids
+        result = camctl("tasks", "complete", "--file", str(path))
+        assert result.exit_code == 2
+        assert "Invalid JSON on line 2" in result.output
+        assert server.engine.task_ids == before
+        assert server.engine.requests["POST task/{task_id}/complete"] == 0
+
+    def test_filter_mode_confirms_the_count(self, server, camctl):
+        before = server.engine.task_ids
+        args = ["tasks", "complete", "--process-instance-business-key-like", "BK-%"]
+        declined = camctl(*args, input="n\n")
+        assert declined.exit_code == 1
+        assert "8 task(s) match the filters." in declined.output
+        assert "Complete 8 task(s)?" in declined.output
+        assert server.engine.task_ids == before
+
+        accepted = camctl(*args, input="y\n")
+        assert accepted.exit_code == 0, accepted.output
+        assert not set(before) & set(server.engine.task_ids)
+
+    def test_filter_mode_without_matches_does_not_prompt(self, server, camctl):
+        result = camctl(
+            "tasks", "complete", "--process-instance-business-key", "missing", "--yes"
+        )
+        assert result.exit_code == 0, result.output
+        assert "0 task(s) match the filters." in result.output
+        assert "Complete" not in result.output
+
+    def test_filter_mode_completes_the_matching_snapshot(self, server, camctl):
+        # Each completion creates a new matching task; with one task per page
+        # that shifts the pages, so only the snapshot taken up front is safe.
+        before = server.engine.task_ids
+        result = camctl(
+            "tasks",
+            "complete",
+            "--process-instance-business-key-like",
+            "BK-%",
+            "--page-size",
+            "1",
+            "--max-workers",
+            "1",
+            "--yes",
+        )
+        assert result.exit_code == 0, result.output
+        after = server.engine.task_ids
+        assert not set(before) & set(after)
+        assert len(after) == len(before)
+        assert server.engine.requests["POST task/{task_id}/complete"] == len(before)
+
+
+class TestBuildCompletion:
+    def test_record_values_override_the_defaults(self):
+        record = {"task_id": " t1 ", "variables": '{"a": 2}', "comment": "record"}
+        task_id, request = build_completion(record, {"a": 1, "b": 1}, "shared")
+        assert task_id == "t1"
+        assert request.variables == {"a": 2, "b": 1}
+        assert request.comment == "record"
+
+    def test_defaults_apply_when_the_record_has_none(self):
+        _, request = build_completion({"taskId": "t1"}, {"a": 1}, "shared")
+        assert request.variables == {"a": 1}
+        assert request.comment == "shared"
+
+    @pytest.mark.parametrize(
+        "record",
+        [{"variables": {}}, {"task_id": "t1", "variables": [1]}],
+    )
+    def test_invalid_records(self, record):
+        with pytest.raises(ValueError):
+            build_completion(record, {}, None)
@@ -0,0 +1,42 @@
+"""Tests for `camctl counts`."""
+
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from camctl.console.app import app
+
+
+def run_counts(tmp_path, config, spec: str):
+    path = tmp_path / "spec.yaml"
+    path.write_text(spec, encoding="utf-8")
+    return CliRunner().invoke(
+        app, ["--config", str(config), "counts", "--spec", str(path), "--raw"]
+    )
+
+
+def test_all_queries_succeed(tmp_path, config):
+    result = run_counts(tmp_path, config, "queries:\n  all:\n    resource: processes\n")
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["results"][0]["count"] == 4
+
+
+def test_a_failed_query_exits_with_status_1(tmp_path, config):
+    result = run_counts(
+        tmp_path,
+        config,
+        """
+queries:
+  all:
+    resource: processes
+  broken:
+    resource: processes
+    filters: {variables: amount_bogus_5}
+""",
+    )
+    assert result.exit_code == 1
+    ok, broken = json.loads(result.output)["results"]
+    assert ok["count"] == 4
+    assert "Invalid variable comparator" in broken["error"]
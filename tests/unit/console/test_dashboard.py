@@ -0,0 +1,77 @@
+"""Tests for dashboard count specs and concurrent execution."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from camctl.api.camunda.resources.processes import ProcessFilterParams
+from camctl.api.camunda.resources.tasks import TaskFilterParams
+from camctl.console.dashboard import CountQuery, load_count_spec, run_counts
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "dashboard.yaml"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestLoadCountSpec:
+    def test_parses_queries(self, tmp_path):
+        path = _write(
+            tmp_path,
+            """
+queries:
+  ops:
+    filters:
+      candidate-group: ops
+      assignee_in: [a, b]
+  orders:
+    resource: processes
+    filters: {process_definition_key: order, suspended: true}
+""",
+        )
+        ops, orders = load_count_spec(path)
+        assert ops.resource == "tasks"
+        assert ops.filters == TaskFilterParams(candidate_group="ops", assignee_in="a,b")
+        assert orders.filters == ProcessFilterParams(
+            process_definition_key="order", suspended=True
+        )
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("[]", "queries"),
+            ("queries: {}", "does not define"),
+            ("queries: {x: {resource: jobs}}", "unknown resource"),
+            ("queries: {x: {filters: {sort_by: id}}}", "unknown tasks filter"),
+        ],
+    )
+    def test_rejects_invalid_specs(self, tmp_path, text, message):
+        with pytest.raises(ValueError, match=message):
+            load_count_spec(_write(tmp_path, text))
+
+
+class TestRunCounts:
+    def test_runs_all_and_keeps_failures(self):
+        def count_tasks(*, params):
+            if params.assignee == "boom":
+                raise RuntimeError("kaboom")
+            return 3
+
+        engine = SimpleNamespace(
+            tasks=SimpleNamespace(count=count_tasks),
+            processes=SimpleNamespace(count=lambda *, params: 7),
+        )
+        queries = [
+            CountQuery(name="ok", resource="tasks", filters=TaskFilterParams()),
+            CountQuery(name="bad", resource="tasks", filters=TaskFilterParams(assignee="boom")),
+            CountQuery(name="procs", resource="processes", filters=ProcessFilterParams()),
+        ]
+        results = run_counts(engine, queries, max_workers=2)
+        assert [(r.name, r.count, r.error) for r in results] == [
+            ("ok", 3, None),
+            ("bad", None, "kaboom"),
+            ("procs", 7, None),
+        ]
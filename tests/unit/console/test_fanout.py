@@ -0,0 +1,103 @@
+"""Tests for engine profile selection and concurrent fan-out."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.resources.tasks import Task
+from camctl.config import Settings
+from camctl.console.context import CLIContext
+from camctl.console.fanout import fan_out, merge_pages, merged_payload
+
+
+@pytest.fixture
+def context():
+    settings = Settings.from_mapping(
+        {
+            "engines": {"eu": "http://eu/engine-rest", "us": "http://us/engine-rest"},
+            "default_engine": "eu",
+        }
+    )
+    return CLIContext(authority="test", settings=settings)
+
+
+class TestCLIContext:
+    def test_profile_precedence(self, context):
+        assert context.engine_profile().name == "eu"
+        context.engine = "us"
+        assert context.engine_profile().name == "us"
+        assert context.engine_profile("eu").name == "eu"
+
+    def test_no_profiles_means_default_engine(self):
+        assert CLIContext(authority="test").engine_profile() is None
+
+    def test_engine_names(self, context):
+        assert context.engine_names("us, eu") == ["us", "eu"]
+        assert context.engine_names("all") == ["eu", "us"]
+        with pytest.raises(typer.BadParameter, match="Unknown engine 'apac'"):
+            context.engine_names("eu,apac")
+
+    def test_build_engine_uses_profile(self, context):
+        with context.build_engine("us") as engine:
+            assert engine.client.base_url.startswith("http://us/engine-rest")
+
+    def test_record_then_replay(self, tmp_path):
+        from camctl.testing import FakeEngine, FakeEngineServer
+
+        cassette = tmp_path / "run.jsonl.gz"
+        with FakeEngineServer(FakeEngine.with_dataset(processes=3)) as server:
+            settings = Settings.from_mapping({"engines": {"fake": server.url}})
+            recording = CLIContext(authority="test", settings=settings, record=cassette)
+            with recording.build_engine("fake") as engine:
+                assert engine.tasks.count() == 3
+            recording.save_recording()
+
+        replaying = CLIContext(authority="test", settings=settings, replay=cassette)
+        assert replaying.http_transport() is replaying.http_transport()
+        with replaying.build_engine("fake") as engine:
+            assert engine.tasks.count() == 3
+
+    def test_replay_missing_cassette(self, context, tmp_path):
+        context.replay = tmp_path / "missing.jsonl"
+        with pytest.raises(typer.BadParameter, match="Cannot load cassette"):
+            context.build_engine()
+
+
+class FakeContext:
+    @contextmanager
+    def build_engine(self, name):
+        yield SimpleNamespace(name=name, client=SimpleNamespace(base_url=f"http://{name}"))
+
+
+class TestFanOut:
+    def test_collects_values_and_failures(self):
+        def func(engine):
+            if engine.name == "down":
+                raise ConnectionError("refused")
+            return len(engine.name)
+
+        results = fan_out(FakeContext(), ["eu", "down", "apac"], func)
+        assert [(r.engine, r.value, r.error) for r in results] == [
+            ("eu", 2, None),
+            ("down", None, "refused"),
+            ("apac", 4, None),
+        ]
+        assert results[0].base_url == "http://eu"
+        payload = merged_payload(results, lambda count: {"count": count}, count=6)
+        assert payload["count"] == 6
+        assert payload["engines"][0]["count"] == 2
+        assert "count" not in payload["engines"][1]
+
+    def test_merge_pages_tags_engines(self):
+        def func(engine):
+            return Page(items=[Task.from_dict({"id": f"{engine.name}-{i}"}) for i in range(2)])
+
+        results = fan_out(FakeContext(), ["eu", "us"], func)
+        page, engines = merge_pages(results)
+        assert [task.id for task in page.items] == ["eu-0", "eu-1", "us-0", "us-1"]
+        assert engines == ["eu", "eu", "us", "us"]
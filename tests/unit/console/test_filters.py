@@ -0,0 +1,31 @@
+"""Tests for shared CLI filter option helpers."""
+
+from __future__ import annotations
+
+from camctl.console.commands.processes.filters import build_process_filter_kwargs
+from camctl.console.commands.tasks.filters import build_task_filter_kwargs
+
+
+class TestBuildTaskFilterKwargs:
+    def test_unset_flags_are_dropped(self):
+        kwargs = build_task_filter_kwargs(
+            {"assignee": "john", "active": False, "unassigned": False, "name": None}
+        )
+        assert kwargs == {"assignee": "john"}
+
+    def test_set_flags_are_kept(self):
+        assert build_task_filter_kwargs({"active": True}) == {"active": True}
+
+    def test_ignores_unknown_names(self):
+        assert build_task_filter_kwargs({"output": "x.json"}) == {}
+
+
+class TestBuildProcessFilterKwargs:
+    def test_unset_flags_are_dropped(self):
+        kwargs = build_process_filter_kwargs(
+            {"business_key": "INV-1", "active": False, "with_incident": False}
+        )
+        assert kwargs == {"business_key": "INV-1"}
+
+    def test_set_flags_are_kept(self):
+        assert build_process_filter_kwargs({"suspended": True}) == {"suspended": True}
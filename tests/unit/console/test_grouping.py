@@ -0,0 +1,129 @@
+"""Tests for client-side group-by aggregation of counts."""
+
+from __future__ import annotations
+
+import pytest
+import typer
+
+from camctl.api.camunda.resources.processes import ProcessFilterParams
+from camctl.api.camunda.resources.tasks import Task, TaskFilterParams
+from camctl.console.grouping import (
+    PROCESS_GROUP_COLUMNS,
+    STRATEGY_COUNT,
+    STRATEGY_SCAN,
+    TASK_GROUP_COLUMNS,
+    GroupCounts,
+    count_groups,
+    known_values,
+    resolve_group_column,
+    resolve_group_option,
+)
+
+
+def _tasks(*assignees):
+    return [
+        Task.from_dict({"id": f"t{index}", "assignee": assignee})
+        for index, assignee in enumerate(assignees)
+    ]
+
+
+def _unexpected(_params):
+    raise AssertionError("unexpected call")
+
+
+class TestKnownValues:
+    def test_explicit_values_win(self):
+        filters = TaskFilterParams(assignee_in="a,b")
+        assert known_values(TASK_GROUP_COLUMNS["assignee"], filters, ["x,y", "z"]) == [
+            "x",
+            "y",
+            "z",
+        ]
+
+    def test_in_filter_values(self):
+        filters = TaskFilterParams(assignee_in="a, b")
+        assert known_values(TASK_GROUP_COLUMNS["assignee"], filters) == ["a", "b"]
+
+    def test_fixed_and_unknown(self):
+        filters = TaskFilterParams()
+        assert known_values(TASK_GROUP_COLUMNS["suspended"], filters) == ["true", "false"]
+        assert known_values(TASK_GROUP_COLUMNS["owner"], filters) is None
+
+
+class TestResolve:
+    def test_normalizes_names(self):
+        assert resolve_group_column("Task-Definition-Key", TASK_GROUP_COLUMNS).attribute == (
+            "task_definition_key"
+        )
+
+    def test_unknown_column(self):
+        with pytest.raises(ValueError, match="Choose from"):
+            resolve_group_column("variables", TASK_GROUP_COLUMNS)
+
+    def test_option_rejects_bad_values(self):
+        with pytest.raises(typer.BadParameter):
+            resolve_group_option("priority", TASK_GROUP_COLUMNS, ["high"])
+
+
+class TestCountGroups:
+    def test_counts_per_value(self):
+        seen = []
+
+        def count(params):
+            seen.append(params)
+            return {"a": 3, "b": 1}[params.assignee]
+
+        result = count_groups(
+            TASK_GROUP_COLUMNS["assignee"],
+            TaskFilterParams(assignee_in="a,b", name_like="%x%"),
+            count=count,
+            scan=_unexpected,
+        )
+        assert result.strategy == STRATEGY_COUNT
+        assert result.groups == {"a": 3, "b": 1}
+        assert all(params.assignee_in is None for params in seen)
+        assert all(params.name_like == "%x%" for params in seen)
+
+    def test_flag_column_uses_active_and_suspended(self):
+        def count(params):
+            return 2 if params.suspended else 5
+
+        result = count_groups(
+            PROCESS_GROUP_COLUMNS["suspended"],
+            ProcessFilterParams(),
+            count=count,
+            scan=_unexpected,
+        )
+        assert result.groups == {True: 2, False: 5}
+
+    def test_scans_when_values_unknown(self):
+        result = count_groups(
+            TASK_GROUP_COLUMNS["assignee"],
+            TaskFilterParams(),
+            count=_unexpected,
+            scan=lambda _params: iter(_tasks("a", "b", "a", None)),
+        )
+        assert result.strategy == STRATEGY_SCAN
+        assert result.groups == {"a": 2, "b": 1, None: 1}
+        assert result.total == 4
+
+    def test_scans_when_too_many_values(self):
+        result = count_groups(
+            TASK_GROUP_COLUMNS["assignee"],
+            TaskFilterParams(),
+            count=_unexpected,
+            scan=lambda _params: iter(_tasks("a", "c")),
+            values=["a,b"],
+            max_per_value=1,
+        )
+        assert result.strategy == STRATEGY_SCAN
+        assert result.groups == {"a": 1, "b": 0}
+
+
+class TestGroupCounts:
+    def test_round_trip_sorted(self):
+        result = GroupCounts(column="assignee", strategy="scan", groups={"b": 1, None: 4, "a": 1})
+        data = result.to_dict()
+        assert data["total"] == 6
+        assert [item["value"] for item in data["groups"]] == [None, "a", "b"]
+        assert GroupCounts.from_dict(data) == result
@@ -0,0 +1,81 @@
+"""Tests for lazily imported command groups."""
+
+from __future__ import annotations
+
+import click
+import typer
+from typer.testing import CliRunner
+
+from camctl.console.app import app
+from camctl.console.lazy import LazyCommand, LazyGroup, lazy_typer
+
+
+def _walk(group: LazyGroup, path: tuple[str, ...] = ()):
+    for spec in group.lazy_commands.values():
+        command = group.get_command(None, spec.name)
+        yield path + (spec.name,), spec, command
+        if isinstance(command, LazyGroup):
+            yield from _walk(command, path + (spec.name,))
+
+
+class TestCamctlRegistry:
+    def test_every_lazy_command_loads_with_its_summary(self):
+        root = typer.main.get_command(app)
+        seen = []
+        for path, spec, command in _walk(root):
+            assert command is not None, path
+            assert command.name == spec.name
+            assert (command.short_help or command.help).startswith(spec.help), path
+            seen.append(" ".join(path))
+        assert "tasks variables local modify" in seen
+        assert "processes modify-variables" in seen
+
+    def test_listing_uses_registry_order(self):
+        root = typer.main.get_command(app)
+        assert root.list_commands(click.Context(root)) == [
+            "sync",
+            "counts",
+            "bench",
+            "tasks",
+            "processes",
+            "daemon",
+        ]
+
+
+class TestLazyGroup:
+    def _app(self, calls: list[str]) -> typer.Typer:
+        sub = lazy_typer(
+            [LazyCommand(name="ping", target="tests.unit.console.test_lazy:ping", help="Ping.")],
+            no_args_is_help=True,
+        )
+
+        @sub.callback()
+        def main() -> None:
+            calls.append("callback")
+
+        return sub
+
+    def test_invokes_function_target(self):
+        calls: list[str] = []
+        result = CliRunner().invoke(self._app(calls), ["ping", "--times", "2"])
+        assert result.exit_code == 0
+        assert result.output == "pong\npong\n"
+        assert calls == ["callback"]
+
+    def test_help_lists_summary_without_loading(self):
+        sub = self._app([])
+        result = CliRunner().invoke(sub, ["--help"])
+        assert result.exit_code == 0
+        assert "Ping." in result.output
+        assert not sub.registered_commands
+
+    def test_unknown_command_suggests_lazy_names(self):
+        result = CliRunner().invoke(self._app([]), ["pnig"])
+        assert result.exit_code == 2
+        assert "Did you mean 'ping'?" in result.output
+
+
+def ping(times: int = typer.Option(1, "--times")) -> None:
+    """Print pong."""
+    for _ in range(times):
+        typer.echo("pong")
@@ -0,0 +1,199 @@
+"""Tests for the engine load generator."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from camctl.api.camunda.common import Page
+from camctl.api.camunda.errors import CamundaAPIError
+from camctl.api.camunda.resources.processes import ProcessInstance
+from camctl.api.camunda.resources.tasks import Task
+from camctl.api.http import CircuitBreaker, CircuitBreakerOpenError
+from camctl.console.loadgen import (
+    LoadTarget,
+    SampleExhaustedError,
+    error_kind,
+    histogram_table,
+    operations_table,
+    parse_mix,
+    run_load,
+    sample_target,
+)
+
+
+class FakeTasks:
+    def __init__(self, ids):
+        self.ids = ids
+        self.completed = []
+
+    def list(self, *, params):
+        items = [Task(id=task_id) for task_id in self.ids[: params.max_results]]
+        return Page(items=items)
+
+    def count(self):
+        return len(self.ids)
+
+    def get(self, task_id):
+        if task_id == "missing":
+            raise CamundaAPIError(status_code=404)
+        return Task(id=task_id)
+
+    def complete(self, task_id, *, payload):
+        self.completed.append(task_id)
+
+
+class FakeProcesses:
+    def list(self, *, params):
+        return Page(items=[ProcessInstance(id="p1"), ProcessInstance(id="p2")])
+
+    def count(self):
+        raise httpx.ConnectError("refused")
+
+
+def make_engine(task_ids=("t1", "t2", "t3"), breaker=None):
+    return SimpleNamespace(
+        tasks=FakeTasks(list(task_ids)),
+        processes=FakeProcesses(),
+        client=SimpleNamespace(circuit_breaker=breaker),
+    )
+
+
+class TestParseMix:
+    def test_weights(self):
+        assert parse_mix("tasks.list=3, tasks.count") == {"tasks.list": 3.0, "tasks.count": 1.0}
+
+    def test_repeated_names_add_up(self):
+        assert parse_mix("tasks.list=1,tasks.list=2") == {"tasks.list": 3.0}
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            ("tasks.delete", "Unknown operation 'tasks.delete'"),
+            ("tasks.list=x", "Invalid weight"),
+            ("tasks.list=0", "must be positive"),
+            (" , ", "at least one operation"),
+        ],
+    )
+    def test_invalid(self, value, message):
+        with pytest.raises(ValueError, match=message):
+            parse_mix(value)
+
+
+class TestErrorKind:
+    def test_kinds(self):
+        request = httpx.Request("GET", "http://engine/task")
+        assert error_kind(CircuitBreakerOpenError(retry_after_seconds=1.0)) == "breaker open"
+        assert error_kind(CamundaAPIError(status_code=503)) == "HTTP 503"
+        assert error_kind(httpx.ReadTimeout("slow", request=request)) == "timeout"
+        assert error_kind(httpx.ConnectError("refused", request=request)) == "connection"
+        assert error_kind(KeyError("x")) == "KeyError"
+
+
+class TestLoadTarget:
+    def test_take_task_removes_ids(self):
+        target = LoadTarget(task_ids=["t1"])
+        assert target.take_task() == "t1"
+        with pytest.raises(SampleExhaustedError):
+            target.take_task()
+
+    def test_sample_only_what_the_mix_needs(self):
+        engine = make_engine()
+        target = sample_target(engine, {"tasks.get": 1.0}, sample=2, page_size=10)
+        assert target.task_ids == ["t1", "t2"]
+        assert target.process_ids == []
+        assert target.page_size == 10
+
+
+class TestRunLoad:
+    def test_request_budget(self):
+        engine = make_engine()
+        seen = []
+        report = run_load(
+            engine,
+            {"tasks.list": 1.0, "tasks.count": 1.0},
+            LoadTarget(),
+            concurrency=3,
+            requests=20,
+            seed=1,
+            on_request=lambda name, error: seen.append((name, error)),
+        )
+        assert sum(stats.requests for stats in report.operations.values()) == 20
+        assert len(seen) == 20
+        assert report.overall().error_count == 0
+
+    def test_errors_grouped_by_kind(self):
+        engine = make_engine()
+        target = LoadTarget(task_ids=["missing"])
+        report = run_load(
+            engine,
+            {"tasks.get": 1.0, "processes.count": 1.0},
+            target,
+            concurrency=2,
+            requests=10,
+            seed=3,
+        )
+        errors = report.overall().errors
+        assert sum(errors.values()) == 10
+        assert set(errors) <= {"HTTP 404", "connection"}
+
+    def test_completed_tasks_are_not_reused(self):
+        engine = make_engine(task_ids=("t1", "t2"))
+        target = LoadTarget(task_ids=["t1", "t2"])
+        report = run_load(engine, {"tasks.complete": 1.0}, target, concurrency=2, requests=3)
+        assert sorted(engine.tasks.completed) == ["t1", "t2"]
+        assert report.operations["tasks.complete"].errors == {"SampleExhaustedError": 1}
+
+    def test_rate_schedule_measures_from_slot(self):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        report = run_load(
+            make_engine(),
+            {"tasks.count": 1.0},
+            LoadTarget(),
+            concurrency=1,
+            duration=1.0,
+            rps=10,
+            clock=lambda: now[0],
+            sleep=sleep,
+        )
+        assert report.operations["tasks.count"].requests == 10
+        assert report.elapsed_seconds == pytest.approx(0.9)
+
+    def test_breaker_trips(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        engine = make_engine(breaker=breaker)
+        engine.processes.count = lambda: breaker.record_failure()
+        report = run_load(engine, {"processes.count": 1.0}, LoadTarget(), concurrency=1, requests=2)
+        assert report.breaker_trips == 2
+
+    def test_requires_a_limit(self):
+        with pytest.raises(ValueError):
+            run_load(make_engine(), {"tasks.count": 1.0}, LoadTarget(), concurrency=1)
+
+
+class TestReport:
+    def test_to_dict_and_tables(self):
+        report = run_load(
+            make_engine(),
+            {"tasks.count": 1.0, "processes.count": 1.0},
+            LoadTarget(),
+            concurrency=1,
+            requests=8,
+            seed=5,
+        )
+        data = report.to_dict()
+        assert data["summary"]["requests"] == 8
+        assert set(data["summary"]["latency_ms"]) >= {"p50", "p90", "p99", "p99.9", "max"}
+        assert sum(bucket["count"] for bucket in data["histogram_ms"]) == 8
+        assert data["histogram_ms"][-1]["le"] is None
+        processes = data["operations"]["processes.count"]
+        assert processes["errors"] == processes["requests"]
+        assert processes["error_kinds"] == {"connection": processes["errors"]}
+        assert operations_table(report).row_count == 2
+        assert histogram_table(report).row_count >= 1
@@ -0,0 +1,178 @@
+"""Tests for the CLI logging pipeline."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+from http import HTTPMethod
+
+import httpx
+import pytest
+
+from camctl.api.camunda import CamundaClient
+from camctl.console.logging import (
+    JsonFormatter,
+    LogFormat,
+    SamplingFilter,
+    configure_logging,
+    stop_logging,
+)
+from camctl.tracing import Tracer, span, use_tracer
+from camctl.utils.concurrency import gather
+
+logger = logging.getLogger("camctl.tests")
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    stop_logging()
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    logging.captureWarnings(False)
+
+
+def make_record(message: str = "hello %s", *args, **extra) -> logging.LogRecord:
+    record = logger.makeRecord(logger.name, logging.DEBUG, __file__, 10, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestJsonFormatter:
+    def test_fields_and_extras(self):
+        line = JsonFormatter().format(make_record("hello %s", "world", request_id=7))
+        data = json.loads(line)
+        assert data["message"] == "hello world"
+        assert data["level"] == "DEBUG"
+        assert data["logger"] == "camctl.tests"
+        assert data["request_id"] == 7
+        assert data["time"].endswith("Z")
+
+    def test_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logger.makeRecord(
+                logger.name, logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+        data = json.loads(JsonFormatter().format(record))
+        assert "ValueError: boom" in data["exception"]
+
+
+class TestSamplingFilter:
+    def test_keeps_a_fraction_per_call_site(self):
+        sampler = SamplingFilter(0.25)
+        kept = [sampler.filter(make_record()) for _ in range(8)]
+        assert kept == [True, False, False, False, True, False, False, False]
+        other = logger.makeRecord(logger.name, logging.DEBUG, __file__, 20, "other", None, None)
+        assert sampler.filter(other)
+
+    def test_zero_keeps_the_first_record(self):
+        sampler = SamplingFilter(0.0)
+        assert [sampler.filter(make_record()) for _ in range(3)] == [True, False, False]
+
+    def test_higher_levels_always_pass(self):
+        sampler = SamplingFilter(0.0)
+        record = make_record()
+        record.levelno = logging.INFO
+        assert all(sampler.filter(record) for _ in range(3))
+
+    def test_rejects_invalid_rates(self):
+        with pytest.raises(ValueError):
+            SamplingFilter(1.5)
+
+
+class TestConfigureLogging:
+    def test_worker_threads_log_through_the_queue(self, tmp_path):
+        path = tmp_path / "camctl.jsonl"
+        configure_logging(2, log_format=LogFormat.JSON, log_file=path)
+        gather(lambda n: logger.debug("item %d", n, extra={"item": n}), range(20))
+        stop_logging()
+        lines = read_lines(path)
+        assert sorted(line["item"] for line in lines) == list(range(20))
+        assert {line["thread"] for line in lines} != {"MainThread"}
+
+    def test_logging_continues_after_stop(self, tmp_path):
+        path = tmp_path / "camctl.log"
+        configure_logging(1, log_file=path)
+        logger.info("queued")
+        stop_logging()
+        logger.info("direct")
+        logging.getLogger("other").info("not camctl")
+        lines = path.read_text().splitlines()
+        assert [line.rsplit(": ", 1)[1] for line in lines] == ["queued", "direct"]
+
+    def test_sampling(self, tmp_path):
+        path = tmp_path / "camctl.jsonl"
+        configure_logging(2, log_format=LogFormat.JSON, log_file=path, sample_rate=0.5)
+        for n in range(10):
+            logger.debug("tick %d", n)
+        stop_logging()
+        assert [line["message"] for line in read_lines(path)] == [
+            f"tick {n}" for n in range(0, 10, 2)
+        ]
+
+    def test_records_carry_the_current_span(self, tmp_path):
+        path = tmp_path / "camctl.jsonl"
+        configure_logging(2, log_format=LogFormat.JSON, log_file=path)
+        tracer = Tracer()
+        use_tracer(tracer)
+        try:
+            with span("command") as current:
+                logger.debug("inside")
+        finally:
+            use_tracer(None)
+        stop_logging()
+        (line,) = read_lines(path)
+        assert line["trace_id"] == tracer.trace_id
+        assert line["span_id"] == current.span_id
+
+    def test_client_requests_are_logged_with_fields(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/down"):
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(204)
+
+        path = tmp_path / "camctl.jsonl"
+        configure_logging(2, log_format=LogFormat.JSON, log_file=path)
+        client = CamundaClient(transport=httpx.MockTransport(handler))
+        client.get("task/count")
+        with pytest.raises(httpx.ConnectError):
+            client.get("down")
+        stop_logging()
+        ok, failed = [line for line in read_lines(path) if line["logger"].startswith("camctl")]
+        assert ok["status_code"] == 204
+        assert ok["method"] == "GET"
+        assert ok["url"].endswith("/task/count")
+        assert ok["duration_ms"] >= 0
+        assert failed["error"] == "ConnectError"
+        assert failed["request_id"] > ok["request_id"]
+
+    def test_streamed_requests_are_logged_once(self, tmp_path):
+        class DroppedStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"partial"
+                raise httpx.ReadError("connection lost")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=DroppedStream())
+
+        path = tmp_path / "camctl.jsonl"
+        configure_logging(2, log_format=LogFormat.JSON, log_file=path)
+        client = CamundaClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(httpx.ReadError):
+            with client.stream(HTTPMethod.GET, "task/t1/variables/file/data") as response:
+                response.read()
+        stop_logging()
+        (line,) = [line for line in read_lines(path) if line["logger"].startswith("camctl")]
+        assert line["error"] == "ReadError"
@@ -0,0 +1,31 @@
+"""Tests for opening the local mirror from CLI commands."""
+
+from __future__ import annotations
+
+import pytest
+import typer
+
+from camctl.config import Settings
+from camctl.config.paths import CACHE_DIR_ENV
+from camctl.console.context import CLIContext
+from camctl.console.mirror import open_mirror
+from camctl.sync import LocalStore, mirror_path
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+
+
+def test_opens_the_mirror_of_the_selected_engine():
+    settings = Settings.from_mapping({"engines": {"eu": "http://eu/engine-rest"}})
+    LocalStore(mirror_path("http://eu/engine-rest")).close()
+    context = CLIContext(authority="test", settings=settings, engine="eu")
+    context.build_engine = None  # opening the mirror must not build an engine
+    with open_mirror(context) as store:
+        assert store.path == mirror_path("http://eu/engine-rest")
+
+
+def test_missing_mirror_is_a_cli_error():
+    with pytest.raises(typer.BadParameter, match="run `camctl sync` first"):
+        open_mirror(CLIContext(authority="test"))
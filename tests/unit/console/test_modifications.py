@@ -0,0 +1,104 @@
+"""Tests for batch variable modification helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.api.camunda.common import Variable, VariableModificationRequest, VariablePayload
+from camctl.console.modifications import (
+    VariableChanges,
+    coalesce_records,
+    modify_with_diff,
+    record_changes,
+)
+
+
+class TestVariableChanges:
+    def test_modification_cancels_earlier_deletion(self):
+        changes = VariableChanges()
+        changes.update(deletions=["a"])
+        changes.update({"a": VariablePayload(value=1)})
+        assert changes.deletions == []
+        assert changes.modifications["a"].value == 1
+
+    def test_deletion_cancels_earlier_modification(self):
+        changes = VariableChanges()
+        changes.update({"a": VariablePayload(value=1)})
+        changes.update(deletions=["a", "a"])
+        assert changes.modifications == {}
+        assert changes.deletions == ["a"]
+
+    def test_to_request_omits_empty_parts(self):
+        changes = VariableChanges()
+        changes.update(deletions=["a"])
+        request = changes.to_request()
+        assert request.modifications is None
+        assert request.to_api_dict() == {"deletions": ["a"]}
+
+
+class TestRecordChanges:
+    def test_single_variable_form(self):
+        changes = record_changes({"name": "a", "value": 1, "type": "Integer"})
+        assert changes.modifications["a"].type == "Integer"
+
+    def test_csv_strings(self):
+        changes = record_changes(
+            {"modifications": '{"a": {"value": "x"}}', "deletions": "b, c"}
+        )
+        assert list(changes.modifications) == ["a"]
+        assert changes.deletions == ["b", "c"]
+
+    def test_missing_value_raises(self):
+        with pytest.raises(ValueError, match="value key"):
+            record_changes({"name": "a"})
+
+
+class TestCoalesceRecords:
+    def test_groups_records_per_target(self):
+        base = VariableChanges()
+        base.update(deletions=["z"])
+        grouped = coalesce_records(
+            [
+                {"task_id": "t1", "name": "a", "value": 1},
+                {"id": "t2", "deletions": ["a"]},
+                {"task_id": "t1", "name": "b", "value": 2},
+            ],
+            id_keys=("task_id", "id"),
+            base=base,
+        )
+        assert list(grouped) == ["t1", "t2"]
+        assert sorted(grouped["t1"].modifications) == ["a", "b"]
+        assert grouped["t1"].deletions == ["z"]
+        assert grouped["t2"].deletions == ["z", "a"]
+        assert base.deletions == ["z"]
+
+    def test_missing_target_raises(self):
+        with pytest.raises(ValueError, match="record 1"):
+            coalesce_records([{"name": "a", "value": 1}], id_keys=("task_id",))
+
+
+class TestModifyWithDiff:
+    def test_sends_only_changes(self):
+        sent = []
+        fields = modify_with_diff(
+            lambda target: {"a": Variable.from_dict({"value": 1, "type": "Integer"})},
+            lambda target, request: sent.append((target, request.to_api_dict())),
+            "t1",
+            VariableModificationRequest(
+                modifications={"a": VariablePayload(value=1), "b": VariablePayload(value=2)},
+            ),
+        )
+        assert sent == [("t1", {"modifications": {"b": {"value": 2}}})]
+        assert fields["modified"] == ["b"]
+        assert fields["unchanged"] == ["a"]
+
+    def test_skips_request_when_nothing_changes(self):
+        sent = []
+        fields = modify_with_diff(
+            lambda target: {},
+            lambda target, request: sent.append(target),
+            "t1",
+            VariableModificationRequest(deletions=["missing"]),
+        )
+        assert sent == []
+        assert fields["deleted"] == []
@@ -0,0 +1,70 @@
+"""Tests for `--profile` CPU and memory profiling."""
+
+from __future__ import annotations
+
+import pstats
+
+import pytest
+
+from camctl.console.profiling import Profiler, ProfileMode
+from camctl.utils.concurrency import gather
+
+
+def busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def profiled(mode: ProfileMode, func, *args) -> Profiler:
+    profiler = Profiler(mode, limit=10)
+    profiler.start()
+    try:
+        func(*args)
+    finally:
+        profiler.stop()
+    assert not profiler.running
+    return profiler
+
+
+class TestCpu:
+    def test_report_includes_worker_threads(self):
+        profiler = profiled(ProfileMode.CPU, gather, busy, [20_000] * 3)
+        report = profiler.report()
+        assert report.startswith("CPU profile of ")
+        assert "functions by cumulative time" in report
+        assert "functions by own time" in report
+        assert "(busy)" in report
+
+    @pytest.mark.parametrize("name", ["cpu.pstats", "cpu.prof"])
+    def test_save_pstats(self, tmp_path, name):
+        profiler = profiled(ProfileMode.CPU, busy, 1000)
+        path = tmp_path / name
+        profiler.save(path)
+        functions = {function for _, _, function in pstats.Stats(str(path)).stats}
+        assert "busy" in functions
+
+    def test_save_text_report(self, tmp_path):
+        profiler = profiled(ProfileMode.CPU, busy, 1000)
+        path = tmp_path / "reports" / "cpu.txt"
+        profiler.save(path)
+        assert "(busy)" in path.read_text()
+
+
+class TestMemory:
+    def test_reports_allocation_sites(self):
+        kept: list[bytearray] = []
+
+        def allocate() -> None:
+            kept.extend(bytearray(4096) for _ in range(64))
+
+        profiler = profiled(ProfileMode.MEM, allocate)
+        report = profiler.report()
+        assert report.startswith("Peak traced memory: ")
+        assert __file__ in report.splitlines()[4]
+
+    def test_pstats_output_is_rejected(self, tmp_path):
+        profiler = profiled(ProfileMode.MEM, busy, 10)
+        with pytest.raises(ValueError, match="CPU profiles only"):
+            profiler.save(tmp_path / "mem.pstats")
+
+    def test_report_before_start(self):
+        assert Profiler(ProfileMode.MEM).report() == "No memory profile was taken.\n"
@@ -0,0 +1,87 @@
+"""Tests for serving CLI queries through the query cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from camctl.api.camunda.resources.tasks import TaskFilterParams
+from camctl.api.http import ClientMetrics
+from camctl.config.paths import CACHE_DIR_ENV
+from camctl.console.query_cache import cached_query
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    return SimpleNamespace(client=SimpleNamespace(base_url="http://engine/engine-rest"))
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class TestCachedQuery:
+    def test_disabled_always_fetches(self, engine):
+        fetch = Counter()
+        for _ in range(2):
+            result = cached_query(engine, "tasks.count", None, fetch, enabled=False, ttl=60)
+        assert result.value == 2
+        assert not result.from_cache
+
+    def test_hit_reuses_result(self, engine):
+        fetch = Counter()
+        params = TaskFilterParams(assignee="demo")
+        first = cached_query(engine, "tasks.count", params, fetch, enabled=True, ttl=60)
+        second = cached_query(
+            engine, "tasks.count", TaskFilterParams(assignee="demo"), fetch, enabled=True, ttl=60
+        )
+        assert (first.value, second.value) == (1, 1)
+        assert second.from_cache
+        assert fetch.calls == 1
+
+    def test_different_filters_miss(self, engine):
+        fetch = Counter()
+        cached_query(engine, "tasks.count", TaskFilterParams(assignee="a"), fetch, enabled=True, ttl=60)
+        cached_query(engine, "tasks.count", TaskFilterParams(assignee="b"), fetch, enabled=True, ttl=60)
+        assert fetch.calls == 2
+
+    def test_refresh_bypasses_and_updates(self, engine):
+        fetch = Counter()
+        cached_query(engine, "tasks.count", None, fetch, enabled=True, ttl=60)
+        refreshed = cached_query(
+            engine, "tasks.count", None, fetch, enabled=False, refresh=True, ttl=60
+        )
+        assert refreshed.value == 2
+        assert not refreshed.from_cache
+        assert cached_query(engine, "tasks.count", None, fetch, enabled=True, ttl=60).value == 2
+
+    def test_encode_decode(self, engine):
+        result = cached_query(
+            engine,
+            "tasks.list",
+            None,
+            lambda: ("a", "b"),
+            enabled=True,
+            ttl=60,
+            encode=list,
+            decode=tuple,
+        )
+        again = cached_query(
+            engine, "tasks.list", None, lambda: None, enabled=True, ttl=60, decode=tuple
+        )
+        assert result.value == again.value == ("a", "b")
+
+    def test_lookups_are_counted(self, engine):
+        engine.client.metrics = ClientMetrics()
+        for _ in range(3):
+            cached_query(engine, "tasks.count", None, Counter(), enabled=True, ttl=60)
+        cached_query(engine, "tasks.count", None, Counter(), enabled=False, refresh=True, ttl=60)
+        requests = engine.client.metrics.cache_requests
+        assert (requests.labels("hit").value, requests.labels("miss").value) == (2, 1)
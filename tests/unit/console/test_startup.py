@@ -0,0 +1,108 @@
+"""Import-time budget for the CLI entry points.
+
+Each check runs in a fresh interpreter with `python -X importtime` so the
+modules loaded by other tests do not hide regressions.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+# Microseconds spent in camctl's own modules (excluding third-party
+# imports) while importing the CLI app; about 15 ms on a developer laptop.
+CAMCTL_SELF_BUDGET_US = 50_000
+
+HEAVY_MODULES = ("httpx", "yaml", "rich.console", "camctl.api", "camctl.console.display")
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    pythonpath = os.pathsep.join(filter(None, [str(SRC), os.getenv("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+        timeout=60,
+    )
+
+
+def import_times(code: str) -> dict[str, tuple[int, int]]:
+    """Run `code` with -X importtime and return {module: (self_us, cumulative_us)}."""
+    result = run_python(code, "-X", "importtime")
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[12:].split("|"))
+        if self_us.isdigit():
+            times[name] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def modules_after(argv: list[str]) -> set[str]:
+    """Run the CLI with `argv` and return the modules loaded afterwards.
+
+    Lazy groups import a command's module only when the command runs, so
+    this checks `sys.modules` after a full invocation rather than timing the
+    import of `camctl.console.app`.
+    """
+    result = run_python(
+        "import sys\n"
+        "from camctl.console.app import app\n"
+        "try:\n"
+        f"    app({argv!r}, prog_name='camctl')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    return set(result.stdout.splitlines())
+
+
+def loaded(modules: Iterable[str], prefix: str) -> list[str]:
+    return [name for name in modules if name == prefix or name.startswith(prefix + ".")]
+
+
+class TestStartup:
+    def test_app_import_skips_heavy_modules(self):
+        times = import_times("import camctl.console.app")
+        assert "camctl.console.app" in times
+        for module in HEAVY_MODULES:
+            assert not loaded(times, module), f"{module} imported at startup"
+        assert not loaded(times, "camctl.console.commands")
+
+    def test_app_import_budget(self):
+        times = import_times("import camctl.console.app")
+        spent = sum(self_us for name, (self_us, _) in times.items() if name.startswith("camctl"))
+        assert spent <= CAMCTL_SELF_BUDGET_US, f"camctl modules took {spent} us to import"
+
+    def test_thin_client_is_stdlib_only(self):
+        times = import_times("import camctl.daemon.client")
+        for module in ("typer", "click", "rich", "httpx", "yaml"):
+            assert not loaded(times, module), f"{module} imported by the thin client"
+
+    @pytest.mark.parametrize(
+        ("argv", "expected", "unexpected"),
+        [
+            (["tasks", "--help"], [], ["camctl.console.commands.tasks.get"]),
+            (
+                ["tasks", "get", "--help"],
+                ["camctl.console.commands.tasks.get"],
+                ["camctl.console.commands.tasks.list", "camctl.console.commands.processes"],
+            ),
+        ],
+    )
+    def test_commands_load_on_demand(self, argv, expected, unexpected):
+        modules = modules_after(argv)
+        assert "camctl.console.app" in modules
+        for module in expected:
+            assert module in modules
+        for module in unexpected:
+            assert not loaded(modules, module), f"{module} imported for {argv}"
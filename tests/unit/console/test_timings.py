@@ -0,0 +1,21 @@
+"""Tests for the --timings breakdown table."""
+
+from __future__ import annotations
+
+from camctl.api.http.timings import TimingCollector
+from camctl.console.timings import timings_table
+
+
+def test_table_shows_only_measured_phases():
+    collector = TimingCollector()
+    for path in ("task/1", "task/2", "task/count"):
+        timing = collector.start("GET", path)
+        timing.phases["wait"] = 0.004
+        timing.finish()
+    table = timings_table(collector)
+    headers = [column.header for column in table.columns]
+    assert headers == ["Endpoint", "Reqs", "wait", "p50", "p99", "Max"]
+    assert list(table.columns[0].cells) == ["GET task/count", "GET task/{id}"]
+    assert list(table.columns[1].cells) == ["1", "2"]
+    assert list(table.columns[2].cells) == ["4.0", "4.0"]
+    assert table.columns[1].footer == "3"
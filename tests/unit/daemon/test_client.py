@@ -0,0 +1,125 @@
+"""Tests for deciding which command lines the thin client forwards."""
+
+from __future__ import annotations
+
+import click
+import pytest
+import typer
+
+from camctl.console.app import app
+from camctl.daemon import client
+from camctl.daemon.client import (
+    GLOBAL_VALUE_OPTIONS,
+    command_path,
+    forward,
+    request,
+    should_forward,
+)
+from camctl.daemon.protocol import DAEMON_ENV, UnsafeSocketError
+
+
+class TestCommandPath:
+    def test_plain_command(self):
+        assert command_path(["tasks", "list", "--assignee", "me"]) == ("tasks", "list")
+
+    def test_skips_global_options(self):
+        argv = ["-vv", "--engine", "prod", "--profile", "cpu", "processes", "count"]
+        assert command_path(argv) == ("processes", "count")
+
+    @pytest.mark.parametrize("option", sorted(GLOBAL_VALUE_OPTIONS))
+    def test_skips_every_global_option_value(self, option):
+        assert command_path([option, "value", "tasks", "list"]) == ("tasks", "list")
+
+    def test_global_value_options_match_the_app(self):
+        params = typer.main.get_command(app).params
+        expected = {
+            name
+            for param in params
+            if isinstance(param, click.Option) and not param.is_flag and not param.count
+            for name in param.opts
+        }
+        assert GLOBAL_VALUE_OPTIONS == expected
+
+    def test_stops_at_first_command_option(self):
+        assert command_path(["tasks", "--help", "list"]) == ("tasks",)
+
+
+class TestShouldForward:
+    @pytest.fixture(autouse=True)
+    def _enabled(self, monkeypatch):
+        monkeypatch.delenv(DAEMON_ENV, raising=False)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["tasks", "list"],
+            ["-e", "prod", "tasks", "count", "--assignee", "me"],
+            ["processes", "get", "abc"],
+            ["tasks", "variables", "local", "get", "t1", "name"],
+        ],
+    )
+    def test_read_commands(self, argv):
+        assert should_forward(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["tasks", "claim", "t1"],
+            ["sync"],
+            ["daemon", "status"],
+            ["tasks", "list", "--help"],
+            ["tasks", "get", "-"],
+            ["--profile", "cpu", "tasks", "list"],
+            ["--profile=mem", "processes", "count"],
+        ],
+    )
+    def test_other_commands_run_locally(self, argv):
+        assert not should_forward(argv)
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv(DAEMON_ENV, "0")
+        assert not should_forward(["tasks", "list"])
+
+
+class TestNoDaemon:
+    def test_request_without_socket(self, tmp_path):
+        assert request({"op": "status"}, path=tmp_path / "missing.sock") is None
+
+    def test_forward_without_socket(self, tmp_path):
+        assert forward(["tasks", "list"], path=tmp_path / "missing.sock") is None
+
+
+class TestSocketChecks:
+    def test_request_refuses_a_shared_directory(self, tmp_path):
+        tmp_path.chmod(0o755)
+        (tmp_path / "d.sock").touch()
+        with pytest.raises(UnsafeSocketError):
+            request({"op": "status"}, path=tmp_path / "d.sock")
+
+    def test_main_runs_locally_instead(self, monkeypatch, capsys):
+        def unsafe(argv):
+            raise UnsafeSocketError("shared directory")
+
+        monkeypatch.delenv(DAEMON_ENV, raising=False)
+        monkeypatch.setattr(client, "forward", unsafe)
+        with pytest.raises(SystemExit) as exc_info:
+            client.main(["tasks", "list", "--bogus"])
+        assert exc_info.value.code == 2
+        assert "Not using the camctl daemon: shared directory" in capsys.readouterr().err
+
+
+def test_forward_sends_only_the_command_environment(monkeypatch):
+    sent = {}
+
+    def capture(message, **kwargs):
+        sent.update(message)
+        return None
+
+    monkeypatch.setattr(client, "request", capture)
+    monkeypatch.setenv("CAMCTL_ENGINE", "prod")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    forward(["tasks", "list"])
+    assert sent["env"]["CAMCTL_ENGINE"] == "prod"
+    assert "AWS_SECRET_ACCESS_KEY" not in sent["env"]
+    assert "PATH" not in sent["env"]
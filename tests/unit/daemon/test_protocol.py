@@ -0,0 +1,119 @@
+"""Tests for the daemon wire format and socket location."""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+
+import pytest
+
+from camctl.daemon.protocol import (
+    MAX_FRAME_BYTES,
+    SOCKET_ENV,
+    ProtocolError,
+    UnsafeSocketError,
+    check_socket_directory,
+    forwarded_environment,
+    recv_message,
+    send_message,
+    socket_path,
+)
+
+
+@pytest.fixture
+def pair():
+    left, right = socket.socketpair()
+    yield left, right
+    left.close()
+    right.close()
+
+
+class TestFraming:
+    def test_round_trip(self, pair):
+        left, right = pair
+        send_message(left, {"op": "run", "argv": ["tasks", "list"]})
+        assert recv_message(right) == {"op": "run", "argv": ["tasks", "list"]}
+
+    def test_clean_close_returns_none(self, pair):
+        left, right = pair
+        left.close()
+        assert recv_message(right) is None
+
+    def test_truncated_frame(self, pair):
+        left, right = pair
+        left.sendall(struct.pack("!I", 10) + b"{}")
+        left.close()
+        with pytest.raises(ProtocolError):
+            recv_message(right)
+
+    def test_oversized_frame(self, pair):
+        left, right = pair
+        left.sendall(struct.pack("!I", MAX_FRAME_BYTES + 1))
+        with pytest.raises(ProtocolError):
+            recv_message(right)
+
+    def test_non_object_frame(self, pair):
+        left, right = pair
+        left.sendall(struct.pack("!I", 2) + b"[]")
+        with pytest.raises(ProtocolError):
+            recv_message(right)
+
+
+class TestSocketPath:
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "d.sock"))
+        assert socket_path() == tmp_path / "d.sock"
+
+    def test_runtime_dir(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(SOCKET_ENV, raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert socket_path() == tmp_path / "camctl" / "daemon.sock"
+
+    def test_temp_fallback_is_per_user(self, monkeypatch):
+        monkeypatch.delenv(SOCKET_ENV, raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        path = socket_path()
+        assert path.name == "daemon.sock"
+        assert path.parent.name == f"camctl-{os.getuid()}"
+
+
+class TestCheckSocketDirectory:
+    def test_private_directory(self, tmp_path):
+        tmp_path.chmod(0o700)
+        check_socket_directory(tmp_path)
+
+    @pytest.mark.parametrize("mode", [0o755, 0o770, 0o1777])
+    def test_shared_directory_is_refused(self, tmp_path, mode):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(mode)
+        with pytest.raises(UnsafeSocketError, match="must be 700"):
+            check_socket_directory(shared)
+
+    def test_symlink_is_refused(self, tmp_path):
+        target = tmp_path / "real"
+        target.mkdir(mode=0o700)
+        link = tmp_path / "link"
+        link.symlink_to(target)
+        with pytest.raises(UnsafeSocketError, match="not a directory"):
+            check_socket_directory(link)
+
+    def test_missing_directory(self, tmp_path):
+        with pytest.raises(UnsafeSocketError):
+            check_socket_directory(tmp_path / "missing")
+
+
+def test_forwarded_environment():
+    environ = {
+        "CAMCTL_CONFIG": "/etc/camctl.yaml",
+        "COLUMNS": "120",
+        "NO_COLOR": "1",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+        "PATH": "/usr/bin",
+    }
+    assert forwarded_environment(environ) == {
+        "CAMCTL_CONFIG": "/etc/camctl.yaml",
+        "COLUMNS": "120",
+        "NO_COLOR": "1",
+    }
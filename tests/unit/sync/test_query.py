@@ -0,0 +1,62 @@
+"""Tests for translating CLI filters into mirror SQL."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.sync.query import (
+    TASK_FILTER_RULES,
+    TASK_SORT_COLUMNS,
+    UnsupportedFilterError,
+    build_order,
+    build_where,
+)
+
+
+class TestBuildWhere:
+    def test_empty(self):
+        assert build_where({}, TASK_FILTER_RULES) == ("1 = 1", [])
+
+    def test_comparisons(self):
+        sql, params = build_where(
+            {"assignee": "demo", "min_priority": 50, "name_like": "Rev%"},
+            TASK_FILTER_RULES,
+        )
+        assert sql == "assignee = ? AND priority >= ? AND name LIKE ?"
+        assert params == ["demo", 50, "Rev%"]
+
+    def test_in_accepts_comma_separated(self):
+        sql, params = build_where({"task_id_in": "a, b,,c"}, TASK_FILTER_RULES)
+        assert sql == "id IN (?, ?, ?)"
+        assert params == ["a", "b", "c"]
+
+    def test_flags_only_apply_when_set(self):
+        sql, params = build_where(
+            {"unassigned": True, "active": True, "suspended": False},
+            TASK_FILTER_RULES,
+        )
+        assert sql == "assignee IS NULL AND suspended = 0"
+        assert params == []
+
+    def test_lt_or_null(self):
+        sql, params = build_where(
+            {"follow_up_before_or_not_existent": "2024-01-01"}, TASK_FILTER_RULES
+        )
+        assert sql == "(follow_up < ? OR follow_up IS NULL)"
+        assert params == ["2024-01-01"]
+
+    def test_unsupported_filters(self):
+        with pytest.raises(UnsupportedFilterError, match="--candidate-group"):
+            build_where({"candidate_group": "ops"}, TASK_FILTER_RULES)
+
+
+class TestBuildOrder:
+    def test_default_orders_by_id(self):
+        assert build_order(None, None, TASK_SORT_COLUMNS) == "id ASC"
+
+    def test_sort_with_tiebreaker(self):
+        assert build_order("created", "desc", TASK_SORT_COLUMNS) == "created DESC, id ASC"
+
+    def test_unknown_sort(self):
+        with pytest.raises(ValueError, match="Unsupported --sort-by"):
+            build_order("bogus", "asc", TASK_SORT_COLUMNS)
@@ -0,0 +1,113 @@
+"""Tests for the local SQLite mirror store."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.api.camunda.resources.processes import ProcessInstance
+from camctl.api.camunda.resources.tasks import Task
+from camctl.sync import LocalStore, SyncState, UnsupportedFilterError
+
+
+def _task(task_id: str, **fields) -> Task:
+    data = {
+        "id": task_id,
+        "name": fields.pop("name", f"Task {task_id}"),
+        "created": fields.pop("created", "2024-01-01T00:00:00.000+0000"),
+        "suspended": False,
+    }
+    data.update(fields)
+    return Task.from_dict(data)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with LocalStore(tmp_path / "mirror.sqlite3") as local:
+        yield local
+
+
+class TestLocalStore:
+    def test_open_existing_requires_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="camctl sync"):
+            LocalStore.open_existing(tmp_path / "missing.sqlite3")
+
+    def test_upsert_counts_only_changes(self, store):
+        assert store.upsert_tasks([_task("a"), _task("b")]) == 2
+        assert store.upsert_tasks([_task("a"), _task("b")]) == 0
+        assert store.upsert_tasks([_task("a", assignee="demo"), _task("b")]) == 1
+        assert store.count_tasks() == 2
+
+    def test_round_trips_payload(self, store):
+        store.upsert_tasks([_task("a", assignee="demo", priority=70)])
+        [task] = store.query_tasks()
+        assert task.id == "a"
+        assert task.assignee == "demo"
+        assert task.priority == 70
+
+    def test_filters_sorting_and_paging(self, store):
+        store.upsert_tasks(
+            [
+                _task("a", assignee="demo", priority=10),
+                _task("b", assignee="demo", priority=90),
+                _task("c", priority=50),
+            ]
+        )
+        assert store.count_tasks({"assignee": "demo"}) == 2
+        assert store.count_tasks({"unassigned": True}) == 1
+        ordered = store.query_tasks(sort_by="priority", sort_order="desc")
+        assert [task.id for task in ordered] == ["b", "c", "a"]
+        page = store.query_tasks(first_result=1, max_results=1)
+        assert [task.id for task in page] == ["b"]
+
+    def test_count_by(self, store):
+        store.upsert_tasks(
+            [
+                _task("a", assignee="demo"),
+                _task("b", assignee="demo", suspended=True),
+                _task("c"),
+            ]
+        )
+        assert store.count_tasks_by("assignee") == {"demo": 2, None: 1}
+        assert store.count_tasks_by("suspended", {"assignee": "demo"}) == {False: 1, True: 1}
+        with pytest.raises(ValueError, match="Cannot group"):
+            store.count_tasks_by("raw")
+
+    def test_unsupported_filter(self, store):
+        with pytest.raises(UnsupportedFilterError):
+            store.count_tasks({"candidate_group": "ops"})
+
+    def test_delete_missing(self, store):
+        store.upsert_tasks([_task("a"), _task("b"), _task("c")])
+        assert store.delete_missing("tasks", {"b"}) == 2
+        assert store.ids("tasks") == ["b"]
+
+    def test_task_watermark(self, store):
+        assert store.task_watermark() is None
+        store.upsert_tasks(
+            [
+                _task("a", created="2024-01-02T00:00:00.000+0000"),
+                _task(
+                    "b",
+                    created="2024-01-01T00:00:00.000+0000",
+                    lastUpdated="2024-01-03T00:00:00.000+0000",
+                ),
+            ]
+        )
+        assert store.task_watermark() == "2024-01-03T00:00:00.000+0000"
+
+    def test_processes(self, store):
+        procs = [
+            ProcessInstance.from_dict({"id": "p1", "definitionId": "order:1", "suspended": False}),
+            ProcessInstance.from_dict({"id": "p2", "definitionId": "order:1", "suspended": True}),
+        ]
+        assert store.upsert_processes(procs) == 2
+        assert store.count_processes({"suspended": True}) == 1
+        assert [p.id for p in store.query_processes({"process_instance_ids": "p2"})] == ["p2"]
+
+    def test_state(self, store):
+        assert store.get_state("tasks") is None
+        store.set_state(SyncState(resource="tasks", watermark="w", mode="full"))
+        state = store.get_state("tasks")
+        assert state.watermark == "w"
+        assert state.mode == "full"
+        assert state.synced_at
@@ -0,0 +1,21 @@
+"""Tests for the sync helpers shared with the watchers."""
+
+from __future__ import annotations
+
+from camctl.sync.syncer import batched, with_overlap
+
+
+class TestWithOverlap:
+    def test_moves_back_keeping_the_engine_format(self):
+        assert with_overlap("2024-01-01T00:00:30.250+0000") == "2023-12-31T23:59:30.250+0000"
+
+    def test_unparseable_watermark_is_kept(self):
+        assert with_overlap("yesterday") == "yesterday"
+
+
+class TestBatched:
+    def test_last_batch_is_short(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_empty(self):
+        assert list(batched([], 3)) == []
@@ -0,0 +1,152 @@
+"""Tests for tracing spans and the Chrome trace exporter."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+
+import httpx
+import pytest
+
+from camctl.api.camunda import CamundaClient, CamundaEngine
+from camctl.tracing import (
+    Tracer,
+    active_tracer,
+    bind,
+    current_span,
+    span,
+    traced,
+    traceparent,
+    use_tracer,
+)
+from camctl.utils.concurrency import gather
+
+
+@pytest.fixture
+def tracer():
+    ticks = itertools.count()
+    tracer = Tracer(clock_ns=lambda: next(ticks) * 1_000_000)
+    use_tracer(tracer)
+    yield tracer
+    use_tracer(None)
+
+
+def by_name(tracer: Tracer) -> dict:
+    return {span.name: span for span in tracer.spans}
+
+
+def test_helpers_are_no_ops_without_a_tracer():
+    assert active_tracer() is None
+    with span("idle") as current:
+        assert current is None
+    assert traceparent() is None
+    func = lambda: 1  # noqa: E731
+    assert bind(func, "task") is func
+
+
+def test_spans_nest(tracer):
+    with span("outer", kind="test") as outer:
+        with span("inner") as inner:
+            assert current_span() is inner
+        assert current_span() is outer
+    assert current_span() is None
+    spans = by_name(tracer)
+    assert spans["outer"].parent_id is None
+    assert spans["inner"].parent_id == spans["outer"].span_id
+    assert spans["outer"].attributes == {"kind": "test"}
+    assert spans["outer"].duration_ns == 3_000_000
+    assert {span.trace_id for span in spans.values()} == {tracer.trace_id}
+
+
+def test_errors_are_recorded(tracer):
+    with pytest.raises(KeyError):
+        with span("failing"):
+            raise KeyError("x")
+    assert by_name(tracer)["failing"].error == "KeyError"
+
+
+def test_traced_uses_the_qualified_name(tracer):
+    class Service:
+        @traced
+        def fetch(self, value):
+            return value * 2
+
+    assert Service().fetch(2) == 4
+    assert [span.name for span in tracer.spans] == [
+        "test_traced_uses_the_qualified_name.<locals>.Service.fetch"
+    ]
+
+
+def test_bind_carries_the_span_to_other_threads(tracer):
+    with span("submit"):
+        task = bind(lambda: current_span(), "worker")
+        worker = threading.Thread(target=task)
+        worker.start()
+        worker.join()
+    spans = by_name(tracer)
+    assert spans["worker"].parent_id == spans["submit"].span_id
+    assert spans["worker"].thread_id != spans["submit"].thread_id
+    assert spans["worker"].attributes["queued_ms"] == 1.0
+
+
+def test_gather_tasks_are_children_of_the_gather_span(tracer):
+    with span("command"):
+        assert gather(lambda x: x + 1, [1, 2, 3], max_workers=2) == [2, 3, 4]
+    spans = tracer.spans
+    gathered = next(span for span in spans if span.name == "gather")
+    tasks = [span for span in spans if span.name == "gather.task"]
+    assert gathered.attributes == {"items": 3, "max_workers": 2}
+    assert len(tasks) == 3
+    assert {task.parent_id for task in tasks} == {gathered.span_id}
+
+
+def test_traceparent(tracer):
+    with span("request") as current:
+        assert traceparent() == f"00-{tracer.trace_id}-{current.span_id}-01"
+    assert len(tracer.trace_id) == 32
+    assert len(current.span_id) == 16
+
+
+def test_max_spans(tracer):
+    tracer.max_spans = 2
+    for _ in range(3):
+        with span("s"):
+            pass
+    assert len(tracer.spans) == 2
+    assert tracer.dropped == 1
+
+
+def test_write_chrome_trace(tracer, tmp_path):
+    with span("outer"):
+        with span("inner", size=3):
+            pass
+    path = tmp_path / "out" / "trace.json"
+    tracer.write_chrome_trace(path)
+    document = json.loads(path.read_text())
+    events = document["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == ["outer", "inner"]
+    inner = complete[1]
+    assert inner["dur"] == 1000.0
+    assert inner["args"]["size"] == 3
+    assert inner["args"]["parent_id"] == complete[0]["args"]["span_id"]
+    metadata = [event for event in events if event["ph"] == "M"]
+    assert metadata[0]["args"]["name"] == threading.current_thread().name
+    assert document["otherData"] == {"trace_id": tracer.trace_id, "dropped_spans": 0}
+
+
+def test_client_requests_are_traced_and_propagated(tracer):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("traceparent"))
+        return httpx.Response(200, json={"count": 7})
+
+    engine = CamundaEngine(CamundaClient(transport=httpx.MockTransport(handler)))
+    assert engine.tasks.count() == 7
+    spans = by_name(tracer)
+    request = spans["HTTP GET task/count"]
+    assert request.parent_id == spans["TasksAPI.count"].span_id
+    assert request.attributes["http.status_code"] == 200
+    assert seen == [f"00-{tracer.trace_id}-{request.span_id}-01"]
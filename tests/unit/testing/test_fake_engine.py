@@ -0,0 +1,174 @@
+"""Tests for the in-memory fake Camunda engine."""
+
+from __future__ import annotations
+
+import random
+
+import httpx
+import pytest
+
+from camctl.api.camunda.common import VariableModificationRequest, VariablePayload
+from camctl.api.camunda.errors import CamundaAPIError
+from camctl.api.camunda.resources.processes import ProcessFilterParams, ProcessStartRequest
+from camctl.api.camunda.resources.tasks import (
+    TaskCompletionRequest,
+    TaskFilterParams,
+    TaskListParams,
+)
+from camctl.testing import FakeEngine, Faults, parse_latency
+
+
+@pytest.fixture
+def fake():
+    return FakeEngine.with_dataset(processes=20, steps=2, seed=7)
+
+
+@pytest.fixture
+def engine(fake):
+    return fake.engine()
+
+
+class TestParseLatency:
+    def test_specs(self):
+        rng = random.Random(1)
+        assert parse_latency("20")(rng) == 0.02
+        assert parse_latency("fixed:5")(rng) == 0.005
+        assert 0.005 <= parse_latency("uniform:5:50")(rng) <= 0.05
+        samples = sorted(parse_latency("lognormal:20:0.5")(rng) for _ in range(2001))
+        assert samples[1000] == pytest.approx(0.02, rel=0.1)
+
+    @pytest.mark.parametrize("spec", ["fast", "uniform:5", "gamma:1:2", "uniform:a:b"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError, match="Invalid latency"):
+            parse_latency(spec)
+
+
+class TestRouting:
+    def test_unknown_route(self, fake):
+        status, payload = fake.handle("GET", "/engine-rest/deployment", {}, None)
+        assert status == 404
+        assert payload["type"] == "InvalidRequestException"
+
+    def test_requests_are_counted_by_route(self, fake):
+        task_id = fake.task_ids[0]
+        fake.handle("GET", f"/engine-rest/task/{task_id}", {}, None)
+        fake.handle("GET", "/engine-rest/task/count", {}, None)
+        assert fake.requests["GET task/{task_id}"] == 1
+        assert fake.requests["GET task/count"] == 1
+
+    def test_unknown_sort_is_rejected(self, fake):
+        status, _ = fake.handle("GET", "/engine-rest/task", {"sortBy": "colour"}, None)
+        assert status == 400
+
+
+class TestTasks:
+    def test_list_pages_and_sorts(self, engine, fake):
+        page = engine.tasks.list(
+            params=TaskListParams(first_result=5, max_results=5, sort_by="id", sort_order="asc")
+        )
+        assert [task.id for task in page.items] == sorted(fake.task_ids)[5:10]
+        assert all(task.process_instance_id for task in page.items)
+
+    def test_iterate_reverse_sees_every_task(self, engine):
+        tasks = list(engine.tasks.iterate(page_size=3, reverse=True))
+        assert len({task.id for task in tasks}) == 20
+
+    def test_filters(self, engine, fake):
+        assignees = [task["assignee"] for task in fake._tasks.values()]
+        alice = TaskFilterParams(assignee="alice")
+        assert engine.tasks.count(params=alice) == assignees.count("alice")
+        unassigned = TaskFilterParams(unassigned=True)
+        assert engine.tasks.count(params=unassigned) == assignees.count(None)
+        some = fake.task_ids[:3]
+        assert engine.tasks.count(params=TaskFilterParams(task_id_in=",".join(some))) == 3
+
+    def test_process_variable_filter(self, engine, fake):
+        expected = sum(
+            1
+            for task in fake._tasks.values()
+            if fake._variables[task["processInstanceId"]]["region"]["value"] == "eu"
+        )
+        params = TaskFilterParams(process_variables="region_eq_eu")
+        assert engine.tasks.count(params=params) == expected
+
+    def test_get_missing_returns_none(self, engine):
+        assert engine.tasks.get("missing") is None
+
+    def test_complete_advances_then_ends_the_instance(self, engine, fake):
+        task = engine.tasks.get(fake.task_ids[0])
+        process_id = task.process_instance_id
+        payload = TaskCompletionRequest(variables={"ok": {"value": 1}})
+        engine.tasks.complete(task.id, payload=payload)
+        assert engine.tasks.get(task.id) is None
+        page = engine.tasks.list(params=TaskListParams(process_instance_id=process_id))
+        (next_task,) = page.items
+        assert engine.tasks.list_variables(next_task.id)["ok"].type == "Integer"
+
+        engine.tasks.complete(next_task.id, payload=TaskCompletionRequest())
+        assert engine.processes.get(process_id) is None
+        assert engine.processes.count() == 19
+
+    def test_complete_missing_returns_none(self, engine):
+        assert engine.tasks.complete("missing", payload=TaskCompletionRequest()) is None
+
+    def test_local_variables_are_separate(self, engine, fake):
+        task_id = fake.task_ids[0]
+        engine.tasks.modify_local_variables(
+            task_id,
+            payload=VariableModificationRequest(modifications={"note": VariablePayload(value="x")}),
+        )
+        assert set(engine.tasks.list_local_variables(task_id)) == {"note"}
+        assert "note" in engine.tasks.list_variables(task_id)
+        assert "note" not in engine.processes.variables(fake._tasks[task_id]["processInstanceId"])
+
+    def test_count_by_candidate_group(self, engine):
+        counts = engine.tasks.count_by_candidate_group()
+        assert sum(item.task_count for item in counts) == 20
+
+
+class TestProcesses:
+    def test_cancel_removes_tasks(self, engine, fake):
+        process_id = fake.process_ids[0]
+        assert engine.processes.cancel(process_id) is None
+        assert engine.processes.get(process_id) is None
+        assert engine.tasks.count(params=TaskFilterParams(process_instance_id=process_id)) == 0
+        with pytest.raises(CamundaAPIError) as exc_info:
+            engine.processes.modify_variables(process_id, payload=None)
+        assert exc_info.value.status_code == 404
+
+    def test_start(self, engine):
+        result = engine.processes.start(
+            "invoice",
+            payload=ProcessStartRequest(business_key="BK-new", variables={"a": {"value": 1}}),
+        )
+        process = engine.processes.get(result.process_instance_id)
+        assert process.business_key == "BK-new"
+        assert engine.processes.variables(process.id)["a"].value == 1
+        assert engine.processes.count(params=ProcessFilterParams(business_key="BK-new")) == 1
+
+    def test_bulk_variables(self, engine, fake):
+        process_ids = fake.process_ids[:4]
+        variables = engine.processes.bulk_variables(process_ids, chunk_size=3, page_size=7)
+        assert set(variables) == set(process_ids)
+        assert all(len(values) == 5 for values in variables.values())
+
+
+class TestFaults:
+    def test_injected_errors_and_disconnects(self):
+        fake = FakeEngine.with_dataset(
+            processes=1, faults=Faults(error_rate=0.5, disconnect_rate=0.5), seed=3
+        )
+        engine = fake.engine()
+        with pytest.raises((CamundaAPIError, httpx.RemoteProtocolError)):
+            engine.tasks.count()
+        assert not fake.requests
+
+    def test_rates_must_fit(self):
+        with pytest.raises(ValueError):
+            Faults(error_rate=0.8, disconnect_rate=0.4)
+
+    def test_latency_is_slept(self):
+        slept = []
+        fake = FakeEngine(latency=parse_latency("15"), sleep=slept.append)
+        fake.respond("GET", "/engine-rest/task/count", {}, None)
+        assert slept == [0.015]
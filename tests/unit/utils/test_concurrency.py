@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from camctl.utils.concurrency import gather
+from camctl.utils.concurrency import gather, gather_iter
 
 
 class TestGather:
@@ -75,3 +75,62 @@ class TestGather:
 
         results = gather(slow_func, [1, 2, 3, 4, 5], max_workers=5)
         assert results == [1, 2, 3, 4, 5]
+
+
+class TestGatherIter:
+    def test_yields_all_results(self):
+        results = list(gather_iter(lambda x: x * 2, [1, 2, 3, 4, 5]))
+        assert sorted(results) == [2, 4, 6, 8, 10]
+
+    def test_empty_input(self):
+        assert list(gather_iter(lambda x: x, [])) == []
+
+    def test_consumes_input_lazily(self):
+        pulled = []
+
+        def source():
+            for item in range(100):
+                pulled.append(item)
+                yield item
+
+        results = gather_iter(lambda x: x, source(), max_workers=2, max_pending=4)
+        next(results)
+        assert len(pulled) <= 5
+        results.close()
+
+    def test_exception_propagation(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("boom")
+            return x
+
+        with pytest.raises(ValueError, match="boom"):
+            list(gather_iter(fail, [1, 2, 3, 4]))
+
+    def test_return_exceptions(self):
+        def fail(x):
+            if x == 2:
+                raise ValueError("boom")
+            return x * 10
+
+        results = list(gather_iter(fail, [1, 2, 3], return_exceptions=True))
+        assert sorted(r for r in results if isinstance(r, int)) == [10, 30]
+        assert sum(isinstance(r, ValueError) for r in results) == 1
+
+    def test_callbacks(self):
+        started = []
+        completed = []
+        list(
+            gather_iter(
+                lambda x: x + 1,
+                [1, 2],
+                on_start=started.append,
+                on_complete=lambda item, result: completed.append((item, result)),
+            )
+        )
+        assert sorted(started) == [1, 2]
+        assert sorted(completed) == [(1, 2), (2, 3)]
+
+    def test_invalid_max_pending(self):
+        with pytest.raises(ValueError):
+            list(gather_iter(lambda x: x, [1], max_pending=-1))
@@ -0,0 +1,41 @@
+"""Tests for atomic chunked file writes."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from camctl.utils.files import write_chunks_atomic
+
+
+class TestWriteChunksAtomic:
+    def test_writes_chunks(self, tmp_path):
+        destination = tmp_path / "sub" / "out.bin"
+        written = write_chunks_atomic([b"ab", b"", b"cd"], destination)
+        assert written == 4
+        assert destination.read_bytes() == b"abcd"
+        assert [p.name for p in destination.parent.iterdir()] == ["out.bin"]
+
+    def test_mode_follows_umask(self, tmp_path):
+        destination = tmp_path / "out.bin"
+        previous = os.umask(0o027)
+        try:
+            write_chunks_atomic([b"data"], destination)
+        finally:
+            os.umask(previous)
+        assert destination.stat().st_mode & 0o777 == 0o640
+
+    def test_failure_keeps_existing_file(self, tmp_path):
+        destination = tmp_path / "out.bin"
+        destination.write_bytes(b"original")
+
+        def chunks():
+            yield b"partial"
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            write_chunks_atomic(chunks(), destination)
+
+        assert destination.read_bytes() == b"original"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.bin"]
@@ -0,0 +1,53 @@
+"""Tests for snapshot diffing and adaptive poll intervals."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.utils import AdaptiveInterval, changed_fields, diff_snapshots
+
+
+class TestDiffSnapshots:
+    def test_inserted_updated_removed(self):
+        previous = {"a": {"v": 1}, "b": {"v": 2}, "c": {"v": 3}}
+        current = {"a": {"v": 1}, "b": {"v": 20}, "d": {"v": 4}}
+        diff = diff_snapshots(previous, current)
+        assert diff.inserted == ["d"]
+        assert diff.updated == ["b"]
+        assert diff.removed == ["c"]
+        assert diff
+
+    def test_identical(self):
+        assert not diff_snapshots({"a": 1}, {"a": 1})
+
+
+class TestChangedFields:
+    def test_reports_old_and_new(self):
+        before = {"assignee": None, "name": "Review", "priority": 50}
+        after = {"assignee": "demo", "name": "Review"}
+        assert changed_fields(before, after) == {
+            "assignee": (None, "demo"),
+            "priority": (50, None),
+        }
+
+
+class TestAdaptiveInterval:
+    def test_backs_off_and_resets(self):
+        interval = AdaptiveInterval(minimum=1, maximum=5)
+        assert interval.current == 1
+        assert interval.record(False) == 2
+        assert interval.record(False) == 4
+        assert interval.record(False) == 5
+        assert interval.record(True) == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"minimum": 0, "maximum": 1},
+            {"minimum": 2, "maximum": 1},
+            {"minimum": 1, "maximum": 2, "factor": 0.5},
+        ],
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveInterval(**kwargs)
@@ -0,0 +1,55 @@
+"""Tests for NDJSON and CSV record readers."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.utils.records import count_records, iter_records
+
+
+class TestIterRecords:
+    def test_json_lines(self, tmp_path):
+        f = tmp_path / "records.ndjson"
+        f.write_text('{"task_id": "t1", "variables": {"a": 1}}\n\n{"task_id": "t2"}\n')
+        assert list(iter_records(f)) == [
+            {"task_id": "t1", "variables": {"a": 1}},
+            {"task_id": "t2"},
+        ]
+
+    def test_csv_drops_empty_cells(self, tmp_path):
+        f = tmp_path / "records.csv"
+        f.write_text('task_id,variables,comment\nt1,"{""a"": 1}",done\nt2,,\n')
+        assert list(iter_records(f)) == [
+            {"task_id": "t1", "variables": '{"a": 1}', "comment": "done"},
+            {"task_id": "t2"},
+        ]
+
+    def test_invalid_json_line(self, tmp_path):
+        f = tmp_path / "records.ndjson"
+        f.write_text('{"task_id": "t1"}\nnot json\n')
+        with pytest.raises(ValueError, match="line 2"):
+            list(iter_records(f))
+
+    def test_non_object_line(self, tmp_path):
+        f = tmp_path / "records.jsonl"
+        f.write_text("[1, 2]\n")
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            list(iter_records(f))
+
+
+class TestCountRecords:
+    def test_counts_json_lines(self, tmp_path):
+        f = tmp_path / "records.ndjson"
+        f.write_text('{"a": 1}\n\n{"a": 2}\n')
+        assert count_records(f) == 2
+
+    def test_counts_csv_rows(self, tmp_path):
+        f = tmp_path / "records.csv"
+        f.write_text("task_id\nt1\nt2\nt3\n")
+        assert count_records(f) == 3
+
+    def test_validates_records(self, tmp_path):
+        f = tmp_path / "records.ndjson"
+        f.write_text("oops\n")
+        with pytest.raises(ValueError):
+            count_records(f)
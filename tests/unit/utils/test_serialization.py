@@ -6,7 +6,7 @@ import json
 from dataclasses import dataclass
 
 from camctl.api.camunda.common.resource import Resource
-from camctl.utils.serialization import dumps_json, normalize
+from camctl.utils.serialization import JsonLinesWriter, dumps_json, normalize
 
 
 class TestNormalize:
@@ -69,3 +69,17 @@ class TestDumpsJson:
         result = dumps_json(r)
         parsed = json.loads(result)
         assert parsed["name"] == "test"
+
+
+class TestJsonLinesWriter:
+    def test_appends_compact_lines(self, tmp_path):
+        path = tmp_path / "journal" / "out.ndjson"
+        with JsonLinesWriter(path) as writer:
+            writer.write({"id": "a", "status": "ok"})
+            writer.write({"id": "b", "status": "error"})
+        with JsonLinesWriter(path) as writer:
+            writer.write({"id": "c"})
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["a", "b", "c"]
+        assert " " not in lines[0]
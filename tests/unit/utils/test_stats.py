@@ -0,0 +1,106 @@
+"""Tests for latency and throughput statistics helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from camctl.utils.stats import (
+    Histogram,
+    latency_histogram,
+    percentile,
+    percentile_key,
+    summarize_latencies,
+    throughput,
+)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile(values, 0) == 1
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+    def test_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            percentile([1.0], 101)
+
+    def test_key_format(self):
+        assert percentile_key(99) == "p99"
+        assert percentile_key(99.9) == "p99.9"
+
+
+class TestSummarizeLatencies:
+    def test_summary(self):
+        summary = summarize_latencies([3.0, 1.0, 2.0, 4.0])
+        assert summary["count"] == 4
+        assert summary["min"] == 1.0
+        assert summary["max"] == 4.0
+        assert summary["mean"] == 2.5
+        assert summary["p50"] == 2.0
+        assert summary["p99"] == 4.0
+
+    def test_empty(self):
+        summary = summarize_latencies([], percentiles=(99.9,))
+        assert summary == {"count": 0, "min": 0.0, "max": 0.0, "mean": 0.0, "p99.9": 0.0}
+
+
+class TestLatencyHistogram:
+    def test_buckets_are_upper_inclusive(self):
+        histogram = latency_histogram([0.5, 1.0, 1.5, 5.0, 50.0], bounds=(1, 5, 10))
+        assert histogram == [(1, 2), (5, 2), (10, 0), (None, 1)]
+
+    def test_empty(self):
+        assert latency_histogram([], bounds=(1,)) == [(1, 0), (None, 0)]
+
+
+class TestHistogram:
+    def test_small_values_are_exact(self):
+        histogram = Histogram()
+        for value in (0.001, 0.05, 0.1):
+            histogram.record(value)
+        assert histogram.percentile(50) == pytest.approx(0.05)
+        assert histogram.count == 3
+        assert histogram.min == 0.001
+
+    def test_percentiles_within_relative_error(self):
+        values = [1.0 + i * 0.37 for i in range(10_000)]
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+        for q in (50, 90, 99, 99.9):
+            assert histogram.percentile(q) == pytest.approx(percentile(values, q), rel=0.016)
+        assert histogram.percentile(100) == values[-1]
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(5.0)
+        second.record(1.0)
+        second.record(500.0)
+        first.merge(second)
+        assert first.summary(percentiles=(50,)) == {
+            "count": 3,
+            "min": 1.0,
+            "max": 500.0,
+            "mean": pytest.approx(506 / 3),
+            "p50": pytest.approx(5.0, rel=0.016),
+        }
+
+    def test_empty(self):
+        assert Histogram().percentile(99) == 0.0
+        with pytest.raises(ValueError):
+            Histogram().percentile(101)
+
+
+class TestThroughput:
+    def test_rate(self):
+        assert throughput(100, 4.0) == 25.0
+
+    def test_zero_elapsed(self):
+        assert throughput(10, 0.0) == 0.0